@@ -0,0 +1,156 @@
+'''asyncio interface to ZIO files and subbook text (Python 3 only)
+
+Blocking file I/O and text parsing run in a bounded thread pool, so the
+event loop stays responsive. Concurrent reads of the same page from
+different coroutines are coalesced into a single read.
+'''
+import asyncio
+import functools
+import logging
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+from .zio import _copy_into, _buffer_size
+
+
+logger = logging.getLogger(__name__)
+
+default_max_workers = 8
+
+_executor = None
+_async_files = weakref.WeakKeyDictionary()
+
+
+def get_executor():
+    '''The executor used for blocking reads, created on first use'''
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=default_max_workers)
+    return _executor
+
+
+def set_executor(executor):
+    '''Replace the executor used for blocking reads'''
+    global _executor
+    _executor = executor
+
+
+async def _run(executor, fcn, *args, **kwargs):
+    loop = asyncio.get_event_loop()
+    if executor is None:
+        executor = get_executor()
+    return await loop.run_in_executor(executor,
+                                      functools.partial(fcn, *args, **kwargs))
+
+
+class AsyncZioFile(object):
+    '''Awaitable positional reads of a ZIO handler
+
+    Parameters
+    ----------
+    zio_file : ZioFileBase
+        Handler to read from; reads use its positional API, so it may be
+        shared with synchronous readers
+    executor : concurrent.futures.Executor, optional
+        Defaults to the module executor (see `get_executor`)
+    '''
+    page_size = 2048
+
+    def __init__(self, zio_file, executor=None):
+        self._zio = zio_file
+        self._executor = executor
+        self._pending = {}
+
+    @property
+    def zio_file(self):
+        return self._zio
+
+    async def read_page(self, index):
+        '''Read a page, sharing the read with concurrent requests for it'''
+        try:
+            future = self._pending[index]
+        except KeyError:
+            future = asyncio.ensure_future(
+                _run(self._executor, self._zio.read_at,
+                     index * self.page_size, self.page_size))
+            self._pending[index] = future
+            future.add_done_callback(
+                lambda fut: self._pending.pop(index, None))
+
+        # one waiter being cancelled must not cancel the read for the others
+        return await asyncio.shield(future)
+
+    async def read_at(self, pos, nbytes):
+        if nbytes <= 0:
+            return b''
+
+        first = pos // self.page_size
+        last = (pos + nbytes - 1) // self.page_size
+        pages = await asyncio.gather(*(self.read_page(index)
+                                       for index in range(first, last + 1)))
+        offset = pos - first * self.page_size
+        return b''.join(pages)[offset:offset + nbytes]
+
+    async def readinto_at(self, pos, buf):
+        data = await self.read_at(pos, _buffer_size(buf))
+        return _copy_into(buf, data)
+
+    async def prefetch(self, pos, nbytes):
+        await _run(self._executor, self._zio.prefetch, pos, nbytes)
+
+
+def async_zio_file(zio_file):
+    '''The shared AsyncZioFile of a handler'''
+    try:
+        return _async_files[zio_file]
+    except KeyError:
+        _async_files[zio_file] = afile = AsyncZioFile(zio_file)
+        return afile
+
+
+async def read_text(text, location=None, search=None, executor=None,
+                    **kwargs):
+    '''Read subbook text without blocking the event loop
+
+    Takes the same arguments as `SubbookText.read`.
+
+    Returns
+    -------
+    sections : list
+        The sections `SubbookText.read` would have yielded
+    '''
+    if location is not None:
+        pos = location
+    elif search is not None:
+        pos = text._search_page_position(search)
+    else:
+        pos = None
+
+    if pos is not None:
+        # warm the first page, coalescing with other readers of it
+        afile = async_zio_file(text._zio)
+        await afile.read_page(pos // afile.page_size)
+
+    def read_all():
+        return list(text.read(location=location, search=search, **kwargs))
+
+    return await _run(executor, read_all)
+
+
+async def read_subbook(subbook, location=None, executor=None, **kwargs):
+    '''Read subbook text, opening the text in the executor if needed
+
+    Takes the same arguments as `Subbook.read`.
+
+    Returns
+    -------
+    sections : list
+        The sections `Subbook.read` would have yielded
+    '''
+    # the first access opens and indexes the text file
+    text = await _run(executor, getattr, subbook, 'text')
+    if text is None:
+        raise ValueError('No text in this subbbook')
+
+    return await read_text(text, location=location, executor=executor,
+                           **kwargs)
@@ -0,0 +1,187 @@
+'''Cold-start benchmark
+
+Each run starts a fresh interpreter and times, separately:
+
+    import : ``import eb.book`` (including codec registration)
+    open   : ``Book(path)``
+    text   : opening and indexing the text of one subbook
+    read   : the first ``Subbook.read`` (all sections consumed)
+
+Results are printed as a table and can be saved as JSON, then compared
+against a previous run (e.g., one from another commit)::
+
+    python -m eb.bench path/to/book --repeat 10 --output new.json \
+        --compare old.json
+'''
+from __future__ import print_function
+import os
+import sys
+import json
+import argparse
+import platform
+import subprocess
+
+
+STAGES = ('import', 'open', 'text', 'read')
+
+# Run in a fresh interpreter; importing eb.bench would import eb.book first
+_CHILD_CODE = '''
+import json
+import sys
+import timeit
+
+timer = timeit.default_timer
+path, subbook, search = sys.argv[1], int(sys.argv[2]), sys.argv[3]
+times = {}
+
+start = timer()
+import eb.book
+times['import'] = timer() - start
+
+start = timer()
+book = eb.book.Book(path)
+times['open'] = timer() - start
+
+start = timer()
+sb = book.subbooks[subbook]
+sb.text
+times['text'] = timer() - start
+
+start = timer()
+if search in sb.searches:
+    sections = list(sb.read(search=search))
+else:
+    sections = list(sb.read(location=0))
+times['read'] = timer() - start
+
+print(json.dumps(times))
+'''
+
+
+def _median(values):
+    values = sorted(values)
+    mid = len(values) // 2
+    if len(values) % 2:
+        return values[mid]
+    return (values[mid - 1] + values[mid]) / 2.0
+
+
+def run_once(path, subbook=0, search='text', python=None):
+    '''Time each stage in a fresh interpreter
+
+    Returns
+    -------
+    times : dict
+        Seconds spent in each stage
+    '''
+    if python is None:
+        python = sys.executable
+
+    # make the child import this copy of eb
+    package_root = os.path.dirname(os.path.dirname(os.path.abspath(
+        __file__)))
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(
+        [package_root] + [p for p in [env.get('PYTHONPATH')] if p])
+
+    output = subprocess.check_output(
+        [python, '-c', _CHILD_CODE, path, str(subbook), search], env=env)
+    return json.loads(output.decode('utf-8').strip().splitlines()[-1])
+
+
+def _git_revision():
+    try:
+        with open(os.devnull, 'w') as devnull:
+            rev = subprocess.check_output(
+                ['git', 'rev-parse', '--short', 'HEAD'],
+                cwd=os.path.dirname(os.path.abspath(__file__)),
+                stderr=devnull)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return rev.decode('ascii').strip()
+
+
+def run(path, subbook=0, search='text', repeat=5, python=None):
+    '''Run the benchmark several times, summarizing each stage
+
+    Returns
+    -------
+    results : dict
+        Run information and per-stage 'min', 'median', 'max' and 'runs'
+        (in seconds), suitable for saving as JSON
+    '''
+    runs = [run_once(path, subbook=subbook, search=search, python=python)
+            for i in range(repeat)]
+
+    stages = {}
+    for stage in STAGES:
+        times = [times[stage] for times in runs]
+        stages[stage] = dict(min=min(times), median=_median(times),
+                             max=max(times), runs=times)
+
+    return dict(book=os.path.abspath(path), subbook=subbook, search=search,
+                repeat=repeat, python=platform.python_version(),
+                revision=_git_revision(), stages=stages)
+
+
+def report(results, baseline=None, f=sys.stdout):
+    '''Print results, optionally with the change of medians from a baseline
+    '''
+    print('{} (subbook {}, python {}, revision {}, {} runs)'.format(
+          results['book'], results['subbook'], results['python'],
+          results['revision'], results['repeat']), file=f)
+
+    header = '{:<8} {:>10} {:>10} {:>10}'.format('stage', 'min ms',
+                                                 'median ms', 'max ms')
+    if baseline is not None:
+        header += ' {:>12} {:>8}'.format('baseline ms', 'change')
+    print(header, file=f)
+
+    for stage in STAGES:
+        stats = results['stages'][stage]
+        line = '{:<8} {:>10.2f} {:>10.2f} {:>10.2f}'.format(
+            stage, stats['min'] * 1e3, stats['median'] * 1e3,
+            stats['max'] * 1e3)
+
+        if baseline is not None and stage in baseline['stages']:
+            base = baseline['stages'][stage]['median']
+            change = (stats['median'] - base) / base if base else 0.0
+            line += ' {:>12.2f} {:>+7.1f}%'.format(base * 1e3, change * 100)
+        print(line, file=f)
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(
+        description='Time importing eb, opening a book and the first read')
+    parser.add_argument('book', help='Root directory of the book')
+    parser.add_argument('--subbook', type=int, default=0,
+                        help='Subbook to read (default: 0)')
+    parser.add_argument('--search', default='text',
+                        help='Search method to read from (default: text)')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='Number of runs (default: 5)')
+    parser.add_argument('--python', default=None,
+                        help='Interpreter to benchmark (default: this one)')
+    parser.add_argument('--output', help='Save results as JSON')
+    parser.add_argument('--compare', help='JSON results to compare against')
+    args = parser.parse_args(args)
+
+    results = run(args.book, subbook=args.subbook, search=args.search,
+                  repeat=args.repeat, python=args.python)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'rt') as f:
+            baseline = json.load(f)
+
+    report(results, baseline=baseline)
+
+    if args.output:
+        with open(args.output, 'wt') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+    return results
+
+
+if __name__ == '__main__':
+    main()
@@ -1,10 +1,19 @@
 from __future__ import print_function
 import os
 import logging
+import threading
+
+import six
+
+try:
+    from collections.abc import Sequence
+except ImportError:
+    from collections import Sequence
 
 from .errors import ZioFileNotFoundError
 from .zio import (get_zio_language, get_zio_catalog)
-from .util import fix_path_case
+from .util import (fix_path_case, directory_index)
+from .metadata import MetadataCache
 from .text import SubbookText
 
 logger = logging.getLogger(__name__)
@@ -23,13 +32,14 @@ class Subbook(object):
 
     def __init__(self, book, idx, title=None, directory=None, index_page=None,
                  narrow_fonts=None, wide_fonts=None, resources=None,
-                 text_filename=None, named_paths=None):
-        print('Subbook', idx, title, 'index page', index_page)
+                 text_filename=None, text_zio_type=None, named_paths=None):
+        logger.debug('Subbook %d %s (index page %s)', idx, title, index_page)
 
         if named_paths is not None:
             self._named_paths.update(named_paths)
 
         self._book = book
+        self._idx = idx
 
         self._path = fix_path_case(self._book._path, directory)
         self._index_page = index_page
@@ -43,17 +53,38 @@ class Subbook(object):
             self._resources = resources
             logger.warning('TODO: resources')
 
-        if self.stream_data_only:
-            self._text_filename = None
-            self.text = None
-        else:
-            self._text_filename = text_filename
+        self._text_filename = text_filename
+        self._text_zio_type = text_zio_type
+        self._text = None
+        self._text_lock = threading.Lock()
+        self._reset_searches()
+
+    @property
+    def text(self):
+        '''Text of the subbook, opened and indexed on first access'''
+        if self._text is None and not self.stream_data_only:
+            with self._text_lock:
+                if self._text is None and self._text_filename is not None:
+                    self._text = self._load_text()
+        return self._text
+
+    def _load_text(self):
+        data_path = fix_path_case(self._path, self._named_paths['data'])
+        text = SubbookText(self, data_path, self._text_filename,
+                           zio_type=self._text_zio_type)
+        if self._book.prefetch:
+            text.prefetch(self._book.prefetch_searches)
+        return text
+
+    @property
+    def searches(self):
+        '''Search methods of the subbook, keyed by search type'''
+        self.text
+        return self._searches
 
-            self._data_path = fix_path_case(self._path,
-                                            self._named_paths['data'])
-            if self._text_filename is not None:
-                self.text = SubbookText(self, self._data_path,
-                                        self._text_filename)
+    @property
+    def title(self):
+        return self._title
 
     @property
     def appendix(self):
@@ -67,7 +98,7 @@ class Subbook(object):
     def stream_data_only(self):
         return (self._index_page == 0)
 
-    def _set_search(self, key, search):
+    def _set_search(self, key, search, text=None):
         if isinstance(key, str):
             logger.debug('Search added %s=%s', key, search)
             if key == 'multi':
@@ -85,7 +116,10 @@ class Subbook(object):
                              key, subkey, search)
 
                 if key == 'sebxa_zip':
-                    self.text._set_sebxa(subkey, **search)
+                    # called while the text is being indexed
+                    if text is None:
+                        text = self.text
+                    text._set_sebxa(subkey, **search)
                 else:
                     if subkey is not None:
                         key = (key, subkey)
@@ -102,17 +136,143 @@ class Subbook(object):
 
         return self.text.read(location=location, **kwargs)
 
+    def read_async(self, location=None, **kwargs):
+        '''Coroutine variant of `read`, returning a list of sections
+
+        The text is opened in the executor, not on the calling event loop.
+        Requires Python 3; see `eb.aio`.
+        '''
+        from . import aio
+        return aio.read_subbook(self, location=location, **kwargs)
+
+
+class _LazySubbooks(Sequence):
+    '''Read-only sequence of subbooks, created from catalog info on access
+
+    Subbooks which fail to be created are logged and show up as None, as
+    they would have on an eager open.
+    '''
+
+    def __init__(self, book, infos):
+        self._book = book
+        self._infos = list(infos)
+        self._subbooks = [None] * len(self._infos)
+        self._created = [False] * len(self._infos)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._infos)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return tuple(self[i] for i in range(*idx.indices(len(self))))
+
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError('subbook index out of range')
+
+        if not self._created[idx]:
+            with self._lock:
+                if not self._created[idx]:
+                    self._subbooks[idx] = self._create(idx)
+                    self._created[idx] = True
+        return self._subbooks[idx]
+
+    def _create(self, idx):
+        try:
+            return Subbook(self._book, idx, **self._infos[idx])
+        except Exception as ex:
+            logger.error('Subbook %d of %d creation failed', idx + 1,
+                         len(self), exc_info=ex)
+
+    def __repr__(self):
+        return '<{} of {} ({} created)>'.format(
+            self.__class__.__name__, len(self), sum(self._created))
+
 
 class Book(object):
+    '''An EB or EPWING book
+
+    Parameters
+    ----------
+    path : str
+        Root directory of the book (containing CATALOG or CATALOGS)
+    prefetch : bool or iterable, optional
+        Open the text of each subbook and read ahead its search index pages
+        in the background on open. Either True for all search methods, or
+        the search keys to prefetch (e.g., ('word_asis', 'endword_asis')).
+    materialize_dir : str, optional
+        Decompress compressed text files once, in the background, into this
+        directory and read the plain copies from then on.
+    metadata_cache : str or MetadataCache, optional
+        Keep what is parsed on open (encoding, catalog and search methods)
+        in this cache directory, and reuse it while the files are unchanged.
+    '''
     _default_encoding = 'jisx0208'
 
-    def __init__(self, path):
+    def __init__(self, path, prefetch=False, materialize_dir=None,
+                 metadata_cache=None):
         self._path = path
-
-        self._load_language()
-        self._load_catalog()
+        if prefetch and prefetch is not True:
+            # shared by all subbooks, so an iterator must not be consumed
+            prefetch = frozenset(prefetch)
+        self._prefetch = prefetch
+        self._materialize_dir = materialize_dir
+        self._metadata = None
+
+        # list the book tree once; path resolution then uses the listings
+        directory_index.scan(self._path)
+
+        if isinstance(metadata_cache, six.string_types):
+            metadata_cache = MetadataCache(metadata_cache)
+
+        if metadata_cache is not None:
+            self._metadata = metadata_cache.load(self._path)
+
+        if self._metadata is not None:
+            self._encoding = self._metadata['encoding']
+            self._book_type = self._metadata['book_type']
+            self._subbooks = _LazySubbooks(self, self._metadata['subbooks'])
+        else:
+            self._load_language()
+            self._load_catalog()
+
+            if metadata_cache is not None:
+                self._metadata = metadata_cache.create(
+                    self._path, self._metadata_files,
+                    encoding=self._encoding, book_type=self._book_type,
+                    subbooks=self._catalog._subbooks)
+                metadata_cache.save(self._metadata)
+
+        self._prefetch_thread = None
+        if self._prefetch:
+            self._prefetch_thread = self._start_prefetch()
+
+    def _start_prefetch(self):
+        '''Open the text of each subbook in a daemon thread
+
+        Opening the text starts the prefetch of its search pages.
+        '''
+        def load_texts():
+            for subbook in self._subbooks:
+                if subbook is None:
+                    continue
+
+                try:
+                    subbook.text
+                except Exception as ex:
+                    logger.warning('Unable to open the text of %s',
+                                   subbook.title, exc_info=ex)
+
+        thread = threading.Thread(target=load_texts,
+                                  name='prefetch-{}'.format(self._path))
+        thread.daemon = True
+        thread.start()
+        return thread
 
     def _load_language(self):
+        self._metadata_files = []
         try:
             zlang = get_zio_language(self, self._path)
         except ZioFileNotFoundError:
@@ -121,6 +281,7 @@ class Book(object):
             self._encoding = self._default_encoding
         else:
             self._encoding = zlang.encoding
+            self._metadata_files.append(zlang._f.filename)
 
     def _load_catalog(self):
         try:
@@ -128,24 +289,49 @@ class Book(object):
         except ZioFileNotFoundError:
             raise
 
-        def create_subbook(i, info):
-            try:
-                return Subbook(self, i, **info)
-            except Exception as ex:
-                logger.error('Subbook %d of %d creation failed', i + 1,
-                             len(catalog._subbooks), exc_info=ex)
+        self._book_type = catalog.book_type
+        self._metadata_files.append(catalog._f.filename)
+        self._subbooks = _LazySubbooks(self, catalog._subbooks)
 
-        self._subbooks = [create_subbook(i, subbook)
-                          for i, subbook in enumerate(catalog._subbooks)]
+    @property
+    def metadata(self):
+        '''Cached metadata of the book (None without a metadata cache)'''
+        return self._metadata
 
     @property
     def subbooks(self):
-        return tuple(self._subbooks)
+        '''Subbooks of the book, each created on first access'''
+        return self._subbooks
+
+    @property
+    def subbook_titles(self):
+        '''Titles of the subbooks, from the catalog'''
+        return [info.get('title') for info in self._subbooks._infos]
+
+    def invalidate_directory_cache(self):
+        '''Forget cached directory listings of this book's tree'''
+        directory_index.invalidate(self._path)
 
     @property
     def encoding(self):
         return self._encoding
 
+    @property
+    def prefetch(self):
+        return bool(self._prefetch)
+
+    @property
+    def materialize_dir(self):
+        '''Directory for decompressed copies of text files (or None)'''
+        return self._materialize_dir
+
+    @property
+    def prefetch_searches(self):
+        '''Search keys to prefetch (None for all)'''
+        if self._prefetch is True:
+            return None
+        return self._prefetch
+
     @property
     def is_epwing(self):
         return self.type_ == 'epwing'
@@ -156,7 +342,7 @@ class Book(object):
 
     @property
     def type_(self):
-        return self._catalog.book_type
+        return self._book_type
 
 
 def test_all(base_path):
@@ -1,4 +1,3 @@
-from .jisx0208 import jisx0208
 from .codec import register as creg
 
 
@@ -1,30 +1,342 @@
 from __future__ import print_function
-import struct
 import codecs
+import importlib
+import threading
 import six
 import logging
 
 
-from .jisx0208 import jisx0208 as jisx0208_map
-
 logger = logging.getLogger(__name__)
 
+# Placeholder for unassigned code points in decode tables
+UNDEFINED = u'\ufffd'
+# Substitute for unencodable characters with errors='replace' (geta mark)
+GETA = u'\u3013'
+
+# Bytes of the GL (0x21-0x7e) range, and a map shifting bytes to GR
+_GL_BYTES = bytes(bytearray(range(0x21, 0x7f)))
+_TO_GR = bytes(bytearray(b | 0x80 for b in range(256)))
+
+
+def load_table(name):
+    '''Load a generated 94x94 decode table by module name'''
+    module = importlib.import_module('.' + name, __package__)
+    return getattr(module, name)
+
+
+def _table_codes(table, assigned=True):
+    '''GR codes (as byte pairs) of the (un)assigned characters of a table'''
+    return [bytes(bytearray((row + 0xa1, cell + 0xa1)))
+            for row in range(94) for cell in range(94)
+            if (table[row * 94 + cell] != UNDEFINED) == assigned]
+
 
 class CharmapCodec(object):
-    def __init__(self, decode_map, encode_map=None):
-        self.decode_map = decode_map
-        self.encode_map = encode_map
+    '''Codec for a 94x94 double-byte character set
+
+    The decode table is a string indexed by (row - 1) * 94 + (cell - 1),
+    loaded on first use.
+
+    Runs of whole characters are decoded in a single call into a builtin
+    codec: given `gr_codec` (e.g., 'euc_jp' for JIS X 0208), the bytes are
+    shifted to GR and decoded by it, with the few characters it maps
+    differently replaced afterwards. On first use the table is checked
+    against that codec, which is only used if it agrees. Otherwise the
+    input is read as UTF-16-BE, turning each byte pair into the code point
+    of the same value, and mapped with `str.translate`. Input with
+    unassigned or invalid characters takes a per-character path, which
+    reports (or handles) errors at their position.
+
+    Encoding uses `codecs.charmap_encode` over a reverse table built from
+    the decode table (unless `encode_map` is given), falling back to a
+    per-character path for errors. 'replace' substitutes the geta mark, as
+    there is no question mark in the character set.
+    '''
+
+    def __init__(self, table_name, encode_map=None, name=None,
+                 gr_codec=None):
+        self.table_name = table_name
+        self._encode_map = encode_map
+        self.name = table_name if name is None else name
+        self.gr_codec = gr_codec
+        self._decode_table = None
+        self._translate_table = None
+        self._gr_fixups = None
+        self._lock = threading.Lock()
+
+    @property
+    def decode_table(self):
+        if self._decode_table is None:
+            with self._lock:
+                if self._decode_table is None:
+                    logger.debug('Loading decode table %s', self.table_name)
+                    self._decode_table = load_table(self.table_name)
+        return self._decode_table
+
+    @property
+    def translate_table(self):
+        '''Decode table indexed by the 16-bit code itself'''
+        if self._translate_table is None:
+            decode_table = self.decode_table
+            table = [UNDEFINED] * 0x10000
+            for row in range(94):
+                start = ((row + 0x21) << 8) | 0x21
+                table[start:start + 94] = decode_table[row * 94:
+                                                       (row + 1) * 94]
+            self._translate_table = u''.join(table)
+        return self._translate_table
+
+    @property
+    def gr_fixups(self):
+        '''(codec char, table char) pairs to replace after GR decoding
+
+        None if there is no GR codec or it does not agree with the table.
+        '''
+        if self._gr_fixups is None:
+            self._gr_fixups = self._check_gr_codec()
+        return self._gr_fixups or None
+
+    def _check_gr_codec(self):
+        if self.gr_codec is None:
+            return False
+
+        table = self.decode_table
+        chars = u''.join(ch for ch in table if ch != UNDEFINED)
+        unassigned = _table_codes(table, assigned=False)
+        try:
+            decoded = b''.join(_table_codes(table)).decode(self.gr_codec)
+            # each unassigned code must fail on its own, leaving only the
+            # separators
+            rejected = (b'\n'.join(unassigned).decode(self.gr_codec, 'ignore')
+                        == u'\n' * (len(unassigned) - 1))
+        except (LookupError, UnicodeDecodeError):
+            decoded, rejected = None, False
+
+        if decoded is None or len(decoded) != len(chars) or not rejected:
+            logger.debug('Codec %s does not match table %s', self.gr_codec,
+                         self.table_name)
+            return False
+
+        fixups = sorted(set((a, b) for a, b in zip(decoded, chars) if a != b))
+        if any(a in chars for a, b in fixups):
+            # a replacement would clash with a correctly decoded character
+            logger.debug('Codec %s does not match table %s', self.gr_codec,
+                         self.table_name)
+            return False
+
+        return fixups
+
+    def _decode_run(self, run):
+        '''Decode whole characters at C speed; None on any error'''
+        fixups = self.gr_fixups
+        try:
+            if fixups is not None and not run.translate(None, _GL_BYTES):
+                text = run.translate(_TO_GR).decode(self.gr_codec)
+                for codec_char, char in fixups:
+                    text = text.replace(codec_char, char)
+            else:
+                text = run.decode('utf-16-be').translate(
+                    self.translate_table)
+        except UnicodeDecodeError:
+            return None
+
+        if len(text) != len(run) // 2 or UNDEFINED in text:
+            return None
+        return text
+
+    @property
+    def encode_map(self):
+        '''{code point: 2-byte code}, built from the decode table'''
+        if self._encode_map is None:
+            table = self.decode_table
+            self._encode_map = dict(
+                (ord(char), bytes(bytearray((row + 0x21, cell + 0x21))))
+                for row in range(94) for cell in range(94)
+                for char in (table[row * 94 + cell], )
+                if char != UNDEFINED)
+        return self._encode_map
 
     def encode(self, input, errors='strict'):
-        raise NotImplementedError()
+        try:
+            return codecs.charmap_encode(input, 'strict', self.encode_map)
+        except UnicodeEncodeError:
+            return self._encode_chars(input, errors), len(input)
+
+    def _encode_chars(self, input, errors):
+        encoded = []
+        pos = 0
+        while pos < len(input):
+            code = self._encode_char(input[pos])
+            if code is not None:
+                encoded.append(code)
+                pos += 1
+                continue
+
+            error = UnicodeEncodeError(self.name, input, pos, pos + 1,
+                                       'character maps to <undefined>')
+            if errors == 'replace':
+                replacement, pos = GETA, pos + 1
+            else:
+                replacement, pos = codecs.lookup_error(errors)(error)
+
+            if isinstance(replacement, bytes):
+                encoded.append(replacement)
+                continue
+
+            for char in replacement:
+                code = self._encode_char(char)
+                if code is None:
+                    raise error
+                encoded.append(code)
+        return b''.join(encoded)
+
+    def _encode_char(self, char):
+        '''Encode a single character, returning None if unassigned'''
+        return self.encode_map.get(ord(char))
+
+    def decode(self, input, errors='strict'):
+        return self.decode_partial(input, errors=errors, final=True)
+
+    def decode_partial(self, input, errors='strict', final=False):
+        '''Decode, leaving a trailing odd byte unconsumed unless final
+
+        Returns
+        -------
+        (text, consumed) : (str, int)
+        '''
+        if len(input) == 2:
+            # a single character, as read by the text reader; looking it up
+            # directly is quicker than a run decode
+            char = self._decode_char(six.indexbytes(input, 0),
+                                     six.indexbytes(input, 1))
+            if char is not None:
+                return char, 2
+
+        input = bytes(input)
+        end = len(input) & ~1
+        text = self._decode_run(input[:end])
+        if text is None:
+            text = self._decode_chars(input, end, errors)
+
+        if end != len(input) and final:
+            text += self._handle_error(input, end, len(input), errors,
+                                       'incomplete multibyte sequence')
+            end = len(input)
+
+        return text, end
+
+    def _decode_chars(self, input, end, errors):
+        chars = []
+        for pos in range(0, end, 2):
+            char = self._decode_char(six.indexbytes(input, pos),
+                                     six.indexbytes(input, pos + 1))
+            if char is None:
+                char = self._handle_error(input, pos, pos + 2, errors,
+                                          'unassigned character')
+            chars.append(char)
+        return u''.join(chars)
+
+    def _decode_char(self, byte1, byte2):
+        '''Decode a single character, returning None if unassigned'''
+        row, cell = byte1 - 0x21, byte2 - 0x21
+        if 0 <= row < 94 and 0 <= cell < 94:
+            char = self.decode_table[row * 94 + cell]
+            if char != UNDEFINED:
+                return char
+        return None
+
+    def _handle_error(self, input, start, end, errors, reason):
+        error = UnicodeDecodeError(self.name, input, start, end, reason)
+        replacement, pos = codecs.lookup_error(errors)(error)
+        if pos != end:
+            # resuming elsewhere is not supported for a fixed-width charset
+            raise error
+        return replacement
+
+
+class Gb2312CharmapCodec(CharmapCodec):
+    '''JIS X 0208 mixed with GB 2312
+
+    Characters with a second byte in GR (0xa1-0xfe) are GB 2312, decoded
+    from (byte1 | 0x80, byte2).
+    '''
+
+    def _decode_run(self, run):
+        data = bytearray(run)
+        if not data or max(data[1::2]) < 0x80:
+            return super(Gb2312CharmapCodec, self)._decode_run(run)
+
+        # split into runs of JIS and GB characters
+        chunks = []
+        start = 0
+        for pos in range(2, len(data) + 2, 2):
+            if pos < len(data) and ((data[pos + 1] ^ data[start + 1]) &
+                                    0x80) == 0:
+                continue
+
+            if data[start + 1] & 0x80:
+                chunk = data[start:pos]
+                chunk[0::2] = bytearray(b | 0x80 for b in chunk[0::2])
+                text = self._decode_gb(bytes(chunk))
+            else:
+                text = super(Gb2312CharmapCodec, self)._decode_run(
+                    bytes(data[start:pos]))
+
+            if text is None:
+                return None
+            chunks.append(text)
+            start = pos
+
+        return u''.join(chunks)
+
+    def _decode_gb(self, data):
+        try:
+            text = data.decode('gb2312')
+        except UnicodeDecodeError:
+            return None
+
+        if len(text) != len(data) // 2:
+            return None
+        return text
+
+    def _encode_char(self, char):
+        code = super(Gb2312CharmapCodec, self)._encode_char(char)
+        if code is None:
+            try:
+                code = bytearray(char.encode('gb2312'))
+            except UnicodeEncodeError:
+                return None
+
+            if len(code) != 2:
+                return None
+            code[0] &= 0x7f
+            code = bytes(code)
+        return code
+
+    def _decode_char(self, byte1, byte2):
+        if byte2 & 0x80:
+            return self._decode_gb(bytes(bytearray((byte1 | 0x80, byte2))))
+        return super(Gb2312CharmapCodec, self)._decode_char(byte1, byte2)
+
+
+class IncrementalDecoder(codecs.BufferedIncrementalDecoder):
+    '''Incremental decoder, keeping a split character for the next chunk'''
+    codec = None
+
+    def _buffer_decode(self, input, errors, final):
+        return self.codec.decode_partial(input, errors=errors, final=final)
+
+
+class StreamReader(codecs.StreamReader):
+    codec = None
 
     def decode(self, input, errors='strict'):
-        n_char = len(input) // 2
-        encoded = struct.unpack('>' + 'H' * n_char, input)
-        return u''.join(self.decode_map[ch] for ch in encoded), 0
+        return self.codec.decode_partial(input, errors=errors, final=False)
 
 
-codec_info = {'jisx0208': (jisx0208_map, None),
+codec_info = {'jisx0208': (CharmapCodec, 'jisx0208', None, 'euc_jp'),
+              'jisx0208-gb2312': (Gb2312CharmapCodec, 'jisx0208', None,
+                                  'euc_jp'),
               }
 
 
@@ -33,21 +345,26 @@ _codecs = {}
 
 def find_codecs(encoding):
     try:
-        charmap = _codecs[encoding]
+        charmap = _codecs[encoding.replace('_', '-')]
     except KeyError:
         return None
 
-    return codecs.CodecInfo(name=encoding,
-                            encode=charmap.encode,
-                            decode=charmap.decode,
-                            )
+    return codecs.CodecInfo(
+        name=charmap.name,
+        encode=charmap.encode,
+        decode=charmap.decode,
+        incrementaldecoder=type('IncrementalDecoder', (IncrementalDecoder, ),
+                                dict(codec=charmap)),
+        streamreader=type('StreamReader', (StreamReader, ),
+                          dict(codec=charmap)),
+    )
 
 
 def register():
     codecs.register(find_codecs)
 
-    for name, (decode, encode) in codec_info.items():
+    for name, (cls, table_name, encode, gr_codec) in codec_info.items():
         if name in _codecs:
             continue
 
-        _codecs[name] = CharmapCodec(decode, encode)
+        _codecs[name] = cls(table_name, encode, name=name, gr_codec=gr_codec)
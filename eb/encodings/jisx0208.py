@@ -1,6881 +1,851 @@
-jisx0208 = {
-    0x2121: u"\u3000",
-    0x2122: u"\u3001",
-    0x2123: u"\u3002",
-    0x2124: u"\uFF0C",
-    0x2125: u"\uFF0E",
-    0x2126: u"\u30FB",
-    0x2127: u"\uFF1A",
-    0x2128: u"\uFF1B",
-    0x2129: u"\uFF1F",
-    0x212A: u"\uFF01",
-    0x212B: u"\u309B",
-    0x212C: u"\u309C",
-    0x212D: u"\u00B4",
-    0x212E: u"\uFF40",
-    0x212F: u"\u00A8",
-    0x2130: u"\uFF3E",
-    0x2131: u"\uFFE3",
-    0x2132: u"\uFF3F",
-    0x2133: u"\u30FD",
-    0x2134: u"\u30FE",
-    0x2135: u"\u309D",
-    0x2136: u"\u309E",
-    0x2137: u"\u3003",
-    0x2138: u"\u4EDD",
-    0x2139: u"\u3005",
-    0x213A: u"\u3006",
-    0x213B: u"\u3007",
-    0x213C: u"\u30FC",
-    0x213D: u"\u2015",
-    0x213E: u"\u2010",
-    0x213F: u"\uFF0F",
-    0x2140: u"\u005C",
-    0x2141: u"\u301C",
-    0x2142: u"\u2016",
-    0x2143: u"\uFF5C",
-    0x2144: u"\u2026",
-    0x2145: u"\u2025",
-    0x2146: u"\u2018",
-    0x2147: u"\u2019",
-    0x2148: u"\u201C",
-    0x2149: u"\u201D",
-    0x214A: u"\uFF08",
-    0x214B: u"\uFF09",
-    0x214C: u"\u3014",
-    0x214D: u"\u3015",
-    0x214E: u"\uFF3B",
-    0x214F: u"\uFF3D",
-    0x2150: u"\uFF5B",
-    0x2151: u"\uFF5D",
-    0x2152: u"\u3008",
-    0x2153: u"\u3009",
-    0x2154: u"\u300A",
-    0x2155: u"\u300B",
-    0x2156: u"\u300C",
-    0x2157: u"\u300D",
-    0x2158: u"\u300E",
-    0x2159: u"\u300F",
-    0x215A: u"\u3010",
-    0x215B: u"\u3011",
-    0x215C: u"\uFF0B",
-    0x215D: u"\u2212",
-    0x215E: u"\u00B1",
-    0x215F: u"\u00D7",
-    0x2160: u"\u00F7",
-    0x2161: u"\uFF1D",
-    0x2162: u"\u2260",
-    0x2163: u"\uFF1C",
-    0x2164: u"\uFF1E",
-    0x2165: u"\u2266",
-    0x2166: u"\u2267",
-    0x2167: u"\u221E",
-    0x2168: u"\u2234",
-    0x2169: u"\u2642",
-    0x216A: u"\u2640",
-    0x216B: u"\u00B0",
-    0x216C: u"\u2032",
-    0x216D: u"\u2033",
-    0x216E: u"\u2103",
-    0x216F: u"\uFFE5",
-    0x2170: u"\uFF04",
-    0x2171: u"\u00A2",
-    0x2172: u"\u00A3",
-    0x2173: u"\uFF05",
-    0x2174: u"\uFF03",
-    0x2175: u"\uFF06",
-    0x2176: u"\uFF0A",
-    0x2177: u"\uFF20",
-    0x2178: u"\u00A7",
-    0x2179: u"\u2606",
-    0x217A: u"\u2605",
-    0x217B: u"\u25CB",
-    0x217C: u"\u25CF",
-    0x217D: u"\u25CE",
-    0x217E: u"\u25C7",
-    0x2221: u"\u25C6",
-    0x2222: u"\u25A1",
-    0x2223: u"\u25A0",
-    0x2224: u"\u25B3",
-    0x2225: u"\u25B2",
-    0x2226: u"\u25BD",
-    0x2227: u"\u25BC",
-    0x2228: u"\u203B",
-    0x2229: u"\u3012",
-    0x222A: u"\u2192",
-    0x222B: u"\u2190",
-    0x222C: u"\u2191",
-    0x222D: u"\u2193",
-    0x222E: u"\u3013",
-    0x223A: u"\u2208",
-    0x223B: u"\u220B",
-    0x223C: u"\u2286",
-    0x223D: u"\u2287",
-    0x223E: u"\u2282",
-    0x223F: u"\u2283",
-    0x2240: u"\u222A",
-    0x2241: u"\u2229",
-    0x224A: u"\u2227",
-    0x224B: u"\u2228",
-    0x224C: u"\u00AC",
-    0x224D: u"\u21D2",
-    0x224E: u"\u21D4",
-    0x224F: u"\u2200",
-    0x2250: u"\u2203",
-    0x225C: u"\u2220",
-    0x225D: u"\u22A5",
-    0x225E: u"\u2312",
-    0x225F: u"\u2202",
-    0x2260: u"\u2207",
-    0x2261: u"\u2261",
-    0x2262: u"\u2252",
-    0x2263: u"\u226A",
-    0x2264: u"\u226B",
-    0x2265: u"\u221A",
-    0x2266: u"\u223D",
-    0x2267: u"\u221D",
-    0x2268: u"\u2235",
-    0x2269: u"\u222B",
-    0x226A: u"\u222C",
-    0x2272: u"\u212B",
-    0x2273: u"\u2030",
-    0x2274: u"\u266F",
-    0x2275: u"\u266D",
-    0x2276: u"\u266A",
-    0x2277: u"\u2020",
-    0x2278: u"\u2021",
-    0x2279: u"\u00B6",
-    0x227E: u"\u25EF",
-    0x2330: u"\uFF10",
-    0x2331: u"\uFF11",
-    0x2332: u"\uFF12",
-    0x2333: u"\uFF13",
-    0x2334: u"\uFF14",
-    0x2335: u"\uFF15",
-    0x2336: u"\uFF16",
-    0x2337: u"\uFF17",
-    0x2338: u"\uFF18",
-    0x2339: u"\uFF19",
-    0x2341: u"\uFF21",
-    0x2342: u"\uFF22",
-    0x2343: u"\uFF23",
-    0x2344: u"\uFF24",
-    0x2345: u"\uFF25",
-    0x2346: u"\uFF26",
-    0x2347: u"\uFF27",
-    0x2348: u"\uFF28",
-    0x2349: u"\uFF29",
-    0x234A: u"\uFF2A",
-    0x234B: u"\uFF2B",
-    0x234C: u"\uFF2C",
-    0x234D: u"\uFF2D",
-    0x234E: u"\uFF2E",
-    0x234F: u"\uFF2F",
-    0x2350: u"\uFF30",
-    0x2351: u"\uFF31",
-    0x2352: u"\uFF32",
-    0x2353: u"\uFF33",
-    0x2354: u"\uFF34",
-    0x2355: u"\uFF35",
-    0x2356: u"\uFF36",
-    0x2357: u"\uFF37",
-    0x2358: u"\uFF38",
-    0x2359: u"\uFF39",
-    0x235A: u"\uFF3A",
-    0x2361: u"\uFF41",
-    0x2362: u"\uFF42",
-    0x2363: u"\uFF43",
-    0x2364: u"\uFF44",
-    0x2365: u"\uFF45",
-    0x2366: u"\uFF46",
-    0x2367: u"\uFF47",
-    0x2368: u"\uFF48",
-    0x2369: u"\uFF49",
-    0x236A: u"\uFF4A",
-    0x236B: u"\uFF4B",
-    0x236C: u"\uFF4C",
-    0x236D: u"\uFF4D",
-    0x236E: u"\uFF4E",
-    0x236F: u"\uFF4F",
-    0x2370: u"\uFF50",
-    0x2371: u"\uFF51",
-    0x2372: u"\uFF52",
-    0x2373: u"\uFF53",
-    0x2374: u"\uFF54",
-    0x2375: u"\uFF55",
-    0x2376: u"\uFF56",
-    0x2377: u"\uFF57",
-    0x2378: u"\uFF58",
-    0x2379: u"\uFF59",
-    0x237A: u"\uFF5A",
-    0x2421: u"\u3041",
-    0x2422: u"\u3042",
-    0x2423: u"\u3043",
-    0x2424: u"\u3044",
-    0x2425: u"\u3045",
-    0x2426: u"\u3046",
-    0x2427: u"\u3047",
-    0x2428: u"\u3048",
-    0x2429: u"\u3049",
-    0x242A: u"\u304A",
-    0x242B: u"\u304B",
-    0x242C: u"\u304C",
-    0x242D: u"\u304D",
-    0x242E: u"\u304E",
-    0x242F: u"\u304F",
-    0x2430: u"\u3050",
-    0x2431: u"\u3051",
-    0x2432: u"\u3052",
-    0x2433: u"\u3053",
-    0x2434: u"\u3054",
-    0x2435: u"\u3055",
-    0x2436: u"\u3056",
-    0x2437: u"\u3057",
-    0x2438: u"\u3058",
-    0x2439: u"\u3059",
-    0x243A: u"\u305A",
-    0x243B: u"\u305B",
-    0x243C: u"\u305C",
-    0x243D: u"\u305D",
-    0x243E: u"\u305E",
-    0x243F: u"\u305F",
-    0x2440: u"\u3060",
-    0x2441: u"\u3061",
-    0x2442: u"\u3062",
-    0x2443: u"\u3063",
-    0x2444: u"\u3064",
-    0x2445: u"\u3065",
-    0x2446: u"\u3066",
-    0x2447: u"\u3067",
-    0x2448: u"\u3068",
-    0x2449: u"\u3069",
-    0x244A: u"\u306A",
-    0x244B: u"\u306B",
-    0x244C: u"\u306C",
-    0x244D: u"\u306D",
-    0x244E: u"\u306E",
-    0x244F: u"\u306F",
-    0x2450: u"\u3070",
-    0x2451: u"\u3071",
-    0x2452: u"\u3072",
-    0x2453: u"\u3073",
-    0x2454: u"\u3074",
-    0x2455: u"\u3075",
-    0x2456: u"\u3076",
-    0x2457: u"\u3077",
-    0x2458: u"\u3078",
-    0x2459: u"\u3079",
-    0x245A: u"\u307A",
-    0x245B: u"\u307B",
-    0x245C: u"\u307C",
-    0x245D: u"\u307D",
-    0x245E: u"\u307E",
-    0x245F: u"\u307F",
-    0x2460: u"\u3080",
-    0x2461: u"\u3081",
-    0x2462: u"\u3082",
-    0x2463: u"\u3083",
-    0x2464: u"\u3084",
-    0x2465: u"\u3085",
-    0x2466: u"\u3086",
-    0x2467: u"\u3087",
-    0x2468: u"\u3088",
-    0x2469: u"\u3089",
-    0x246A: u"\u308A",
-    0x246B: u"\u308B",
-    0x246C: u"\u308C",
-    0x246D: u"\u308D",
-    0x246E: u"\u308E",
-    0x246F: u"\u308F",
-    0x2470: u"\u3090",
-    0x2471: u"\u3091",
-    0x2472: u"\u3092",
-    0x2473: u"\u3093",
-    0x2521: u"\u30A1",
-    0x2522: u"\u30A2",
-    0x2523: u"\u30A3",
-    0x2524: u"\u30A4",
-    0x2525: u"\u30A5",
-    0x2526: u"\u30A6",
-    0x2527: u"\u30A7",
-    0x2528: u"\u30A8",
-    0x2529: u"\u30A9",
-    0x252A: u"\u30AA",
-    0x252B: u"\u30AB",
-    0x252C: u"\u30AC",
-    0x252D: u"\u30AD",
-    0x252E: u"\u30AE",
-    0x252F: u"\u30AF",
-    0x2530: u"\u30B0",
-    0x2531: u"\u30B1",
-    0x2532: u"\u30B2",
-    0x2533: u"\u30B3",
-    0x2534: u"\u30B4",
-    0x2535: u"\u30B5",
-    0x2536: u"\u30B6",
-    0x2537: u"\u30B7",
-    0x2538: u"\u30B8",
-    0x2539: u"\u30B9",
-    0x253A: u"\u30BA",
-    0x253B: u"\u30BB",
-    0x253C: u"\u30BC",
-    0x253D: u"\u30BD",
-    0x253E: u"\u30BE",
-    0x253F: u"\u30BF",
-    0x2540: u"\u30C0",
-    0x2541: u"\u30C1",
-    0x2542: u"\u30C2",
-    0x2543: u"\u30C3",
-    0x2544: u"\u30C4",
-    0x2545: u"\u30C5",
-    0x2546: u"\u30C6",
-    0x2547: u"\u30C7",
-    0x2548: u"\u30C8",
-    0x2549: u"\u30C9",
-    0x254A: u"\u30CA",
-    0x254B: u"\u30CB",
-    0x254C: u"\u30CC",
-    0x254D: u"\u30CD",
-    0x254E: u"\u30CE",
-    0x254F: u"\u30CF",
-    0x2550: u"\u30D0",
-    0x2551: u"\u30D1",
-    0x2552: u"\u30D2",
-    0x2553: u"\u30D3",
-    0x2554: u"\u30D4",
-    0x2555: u"\u30D5",
-    0x2556: u"\u30D6",
-    0x2557: u"\u30D7",
-    0x2558: u"\u30D8",
-    0x2559: u"\u30D9",
-    0x255A: u"\u30DA",
-    0x255B: u"\u30DB",
-    0x255C: u"\u30DC",
-    0x255D: u"\u30DD",
-    0x255E: u"\u30DE",
-    0x255F: u"\u30DF",
-    0x2560: u"\u30E0",
-    0x2561: u"\u30E1",
-    0x2562: u"\u30E2",
-    0x2563: u"\u30E3",
-    0x2564: u"\u30E4",
-    0x2565: u"\u30E5",
-    0x2566: u"\u30E6",
-    0x2567: u"\u30E7",
-    0x2568: u"\u30E8",
-    0x2569: u"\u30E9",
-    0x256A: u"\u30EA",
-    0x256B: u"\u30EB",
-    0x256C: u"\u30EC",
-    0x256D: u"\u30ED",
-    0x256E: u"\u30EE",
-    0x256F: u"\u30EF",
-    0x2570: u"\u30F0",
-    0x2571: u"\u30F1",
-    0x2572: u"\u30F2",
-    0x2573: u"\u30F3",
-    0x2574: u"\u30F4",
-    0x2575: u"\u30F5",
-    0x2576: u"\u30F6",
-    0x2621: u"\u0391",
-    0x2622: u"\u0392",
-    0x2623: u"\u0393",
-    0x2624: u"\u0394",
-    0x2625: u"\u0395",
-    0x2626: u"\u0396",
-    0x2627: u"\u0397",
-    0x2628: u"\u0398",
-    0x2629: u"\u0399",
-    0x262A: u"\u039A",
-    0x262B: u"\u039B",
-    0x262C: u"\u039C",
-    0x262D: u"\u039D",
-    0x262E: u"\u039E",
-    0x262F: u"\u039F",
-    0x2630: u"\u03A0",
-    0x2631: u"\u03A1",
-    0x2632: u"\u03A3",
-    0x2633: u"\u03A4",
-    0x2634: u"\u03A5",
-    0x2635: u"\u03A6",
-    0x2636: u"\u03A7",
-    0x2637: u"\u03A8",
-    0x2638: u"\u03A9",
-    0x2641: u"\u03B1",
-    0x2642: u"\u03B2",
-    0x2643: u"\u03B3",
-    0x2644: u"\u03B4",
-    0x2645: u"\u03B5",
-    0x2646: u"\u03B6",
-    0x2647: u"\u03B7",
-    0x2648: u"\u03B8",
-    0x2649: u"\u03B9",
-    0x264A: u"\u03BA",
-    0x264B: u"\u03BB",
-    0x264C: u"\u03BC",
-    0x264D: u"\u03BD",
-    0x264E: u"\u03BE",
-    0x264F: u"\u03BF",
-    0x2650: u"\u03C0",
-    0x2651: u"\u03C1",
-    0x2652: u"\u03C3",
-    0x2653: u"\u03C4",
-    0x2654: u"\u03C5",
-    0x2655: u"\u03C6",
-    0x2656: u"\u03C7",
-    0x2657: u"\u03C8",
-    0x2658: u"\u03C9",
-    0x2721: u"\u0410",
-    0x2722: u"\u0411",
-    0x2723: u"\u0412",
-    0x2724: u"\u0413",
-    0x2725: u"\u0414",
-    0x2726: u"\u0415",
-    0x2727: u"\u0401",
-    0x2728: u"\u0416",
-    0x2729: u"\u0417",
-    0x272A: u"\u0418",
-    0x272B: u"\u0419",
-    0x272C: u"\u041A",
-    0x272D: u"\u041B",
-    0x272E: u"\u041C",
-    0x272F: u"\u041D",
-    0x2730: u"\u041E",
-    0x2731: u"\u041F",
-    0x2732: u"\u0420",
-    0x2733: u"\u0421",
-    0x2734: u"\u0422",
-    0x2735: u"\u0423",
-    0x2736: u"\u0424",
-    0x2737: u"\u0425",
-    0x2738: u"\u0426",
-    0x2739: u"\u0427",
-    0x273A: u"\u0428",
-    0x273B: u"\u0429",
-    0x273C: u"\u042A",
-    0x273D: u"\u042B",
-    0x273E: u"\u042C",
-    0x273F: u"\u042D",
-    0x2740: u"\u042E",
-    0x2741: u"\u042F",
-    0x2751: u"\u0430",
-    0x2752: u"\u0431",
-    0x2753: u"\u0432",
-    0x2754: u"\u0433",
-    0x2755: u"\u0434",
-    0x2756: u"\u0435",
-    0x2757: u"\u0451",
-    0x2758: u"\u0436",
-    0x2759: u"\u0437",
-    0x275A: u"\u0438",
-    0x275B: u"\u0439",
-    0x275C: u"\u043A",
-    0x275D: u"\u043B",
-    0x275E: u"\u043C",
-    0x275F: u"\u043D",
-    0x2760: u"\u043E",
-    0x2761: u"\u043F",
-    0x2762: u"\u0440",
-    0x2763: u"\u0441",
-    0x2764: u"\u0442",
-    0x2765: u"\u0443",
-    0x2766: u"\u0444",
-    0x2767: u"\u0445",
-    0x2768: u"\u0446",
-    0x2769: u"\u0447",
-    0x276A: u"\u0448",
-    0x276B: u"\u0449",
-    0x276C: u"\u044A",
-    0x276D: u"\u044B",
-    0x276E: u"\u044C",
-    0x276F: u"\u044D",
-    0x2770: u"\u044E",
-    0x2771: u"\u044F",
-    0x2821: u"\u2500",
-    0x2822: u"\u2502",
-    0x2823: u"\u250C",
-    0x2824: u"\u2510",
-    0x2825: u"\u2518",
-    0x2826: u"\u2514",
-    0x2827: u"\u251C",
-    0x2828: u"\u252C",
-    0x2829: u"\u2524",
-    0x282A: u"\u2534",
-    0x282B: u"\u253C",
-    0x282C: u"\u2501",
-    0x282D: u"\u2503",
-    0x282E: u"\u250F",
-    0x282F: u"\u2513",
-    0x2830: u"\u251B",
-    0x2831: u"\u2517",
-    0x2832: u"\u2523",
-    0x2833: u"\u2533",
-    0x2834: u"\u252B",
-    0x2835: u"\u253B",
-    0x2836: u"\u254B",
-    0x2837: u"\u2520",
-    0x2838: u"\u252F",
-    0x2839: u"\u2528",
-    0x283A: u"\u2537",
-    0x283B: u"\u253F",
-    0x283C: u"\u251D",
-    0x283D: u"\u2530",
-    0x283E: u"\u2525",
-    0x283F: u"\u2538",
-    0x2840: u"\u2542",
-    0x3021: u"\u4E9C",
-    0x3022: u"\u5516",
-    0x3023: u"\u5A03",
-    0x3024: u"\u963F",
-    0x3025: u"\u54C0",
-    0x3026: u"\u611B",
-    0x3027: u"\u6328",
-    0x3028: u"\u59F6",
-    0x3029: u"\u9022",
-    0x302A: u"\u8475",
-    0x302B: u"\u831C",
-    0x302C: u"\u7A50",
-    0x302D: u"\u60AA",
-    0x302E: u"\u63E1",
-    0x302F: u"\u6E25",
-    0x3030: u"\u65ED",
-    0x3031: u"\u8466",
-    0x3032: u"\u82A6",
-    0x3033: u"\u9BF5",
-    0x3034: u"\u6893",
-    0x3035: u"\u5727",
-    0x3036: u"\u65A1",
-    0x3037: u"\u6271",
-    0x3038: u"\u5B9B",
-    0x3039: u"\u59D0",
-    0x303A: u"\u867B",
-    0x303B: u"\u98F4",
-    0x303C: u"\u7D62",
-    0x303D: u"\u7DBE",
-    0x303E: u"\u9B8E",
-    0x303F: u"\u6216",
-    0x3040: u"\u7C9F",
-    0x3041: u"\u88B7",
-    0x3042: u"\u5B89",
-    0x3043: u"\u5EB5",
-    0x3044: u"\u6309",
-    0x3045: u"\u6697",
-    0x3046: u"\u6848",
-    0x3047: u"\u95C7",
-    0x3048: u"\u978D",
-    0x3049: u"\u674F",
-    0x304A: u"\u4EE5",
-    0x304B: u"\u4F0A",
-    0x304C: u"\u4F4D",
-    0x304D: u"\u4F9D",
-    0x304E: u"\u5049",
-    0x304F: u"\u56F2",
-    0x3050: u"\u5937",
-    0x3051: u"\u59D4",
-    0x3052: u"\u5A01",
-    0x3053: u"\u5C09",
-    0x3054: u"\u60DF",
-    0x3055: u"\u610F",
-    0x3056: u"\u6170",
-    0x3057: u"\u6613",
-    0x3058: u"\u6905",
-    0x3059: u"\u70BA",
-    0x305A: u"\u754F",
-    0x305B: u"\u7570",
-    0x305C: u"\u79FB",
-    0x305D: u"\u7DAD",
-    0x305E: u"\u7DEF",
-    0x305F: u"\u80C3",
-    0x3060: u"\u840E",
-    0x3061: u"\u8863",
-    0x3062: u"\u8B02",
-    0x3063: u"\u9055",
-    0x3064: u"\u907A",
-    0x3065: u"\u533B",
-    0x3066: u"\u4E95",
-    0x3067: u"\u4EA5",
-    0x3068: u"\u57DF",
-    0x3069: u"\u80B2",
-    0x306A: u"\u90C1",
-    0x306B: u"\u78EF",
-    0x306C: u"\u4E00",
-    0x306D: u"\u58F1",
-    0x306E: u"\u6EA2",
-    0x306F: u"\u9038",
-    0x3070: u"\u7A32",
-    0x3071: u"\u8328",
-    0x3072: u"\u828B",
-    0x3073: u"\u9C2F",
-    0x3074: u"\u5141",
-    0x3075: u"\u5370",
-    0x3076: u"\u54BD",
-    0x3077: u"\u54E1",
-    0x3078: u"\u56E0",
-    0x3079: u"\u59FB",
-    0x307A: u"\u5F15",
-    0x307B: u"\u98F2",
-    0x307C: u"\u6DEB",
-    0x307D: u"\u80E4",
-    0x307E: u"\u852D",
-    0x3121: u"\u9662",
-    0x3122: u"\u9670",
-    0x3123: u"\u96A0",
-    0x3124: u"\u97FB",
-    0x3125: u"\u540B",
-    0x3126: u"\u53F3",
-    0x3127: u"\u5B87",
-    0x3128: u"\u70CF",
-    0x3129: u"\u7FBD",
-    0x312A: u"\u8FC2",
-    0x312B: u"\u96E8",
-    0x312C: u"\u536F",
-    0x312D: u"\u9D5C",
-    0x312E: u"\u7ABA",
-    0x312F: u"\u4E11",
-    0x3130: u"\u7893",
-    0x3131: u"\u81FC",
-    0x3132: u"\u6E26",
-    0x3133: u"\u5618",
-    0x3134: u"\u5504",
-    0x3135: u"\u6B1D",
-    0x3136: u"\u851A",
-    0x3137: u"\u9C3B",
-    0x3138: u"\u59E5",
-    0x3139: u"\u53A9",
-    0x313A: u"\u6D66",
-    0x313B: u"\u74DC",
-    0x313C: u"\u958F",
-    0x313D: u"\u5642",
-    0x313E: u"\u4E91",
-    0x313F: u"\u904B",
-    0x3140: u"\u96F2",
-    0x3141: u"\u834F",
-    0x3142: u"\u990C",
-    0x3143: u"\u53E1",
-    0x3144: u"\u55B6",
-    0x3145: u"\u5B30",
-    0x3146: u"\u5F71",
-    0x3147: u"\u6620",
-    0x3148: u"\u66F3",
-    0x3149: u"\u6804",
-    0x314A: u"\u6C38",
-    0x314B: u"\u6CF3",
-    0x314C: u"\u6D29",
-    0x314D: u"\u745B",
-    0x314E: u"\u76C8",
-    0x314F: u"\u7A4E",
-    0x3150: u"\u9834",
-    0x3151: u"\u82F1",
-    0x3152: u"\u885B",
-    0x3153: u"\u8A60",
-    0x3154: u"\u92ED",
-    0x3155: u"\u6DB2",
-    0x3156: u"\u75AB",
-    0x3157: u"\u76CA",
-    0x3158: u"\u99C5",
-    0x3159: u"\u60A6",
-    0x315A: u"\u8B01",
-    0x315B: u"\u8D8A",
-    0x315C: u"\u95B2",
-    0x315D: u"\u698E",
-    0x315E: u"\u53AD",
-    0x315F: u"\u5186",
-    0x3160: u"\u5712",
-    0x3161: u"\u5830",
-    0x3162: u"\u5944",
-    0x3163: u"\u5BB4",
-    0x3164: u"\u5EF6",
-    0x3165: u"\u6028",
-    0x3166: u"\u63A9",
-    0x3167: u"\u63F4",
-    0x3168: u"\u6CBF",
-    0x3169: u"\u6F14",
-    0x316A: u"\u708E",
-    0x316B: u"\u7114",
-    0x316C: u"\u7159",
-    0x316D: u"\u71D5",
-    0x316E: u"\u733F",
-    0x316F: u"\u7E01",
-    0x3170: u"\u8276",
-    0x3171: u"\u82D1",
-    0x3172: u"\u8597",
-    0x3173: u"\u9060",
-    0x3174: u"\u925B",
-    0x3175: u"\u9D1B",
-    0x3176: u"\u5869",
-    0x3177: u"\u65BC",
-    0x3178: u"\u6C5A",
-    0x3179: u"\u7525",
-    0x317A: u"\u51F9",
-    0x317B: u"\u592E",
-    0x317C: u"\u5965",
-    0x317D: u"\u5F80",
-    0x317E: u"\u5FDC",
-    0x3221: u"\u62BC",
-    0x3222: u"\u65FA",
-    0x3223: u"\u6A2A",
-    0x3224: u"\u6B27",
-    0x3225: u"\u6BB4",
-    0x3226: u"\u738B",
-    0x3227: u"\u7FC1",
-    0x3228: u"\u8956",
-    0x3229: u"\u9D2C",
-    0x322A: u"\u9D0E",
-    0x322B: u"\u9EC4",
-    0x322C: u"\u5CA1",
-    0x322D: u"\u6C96",
-    0x322E: u"\u837B",
-    0x322F: u"\u5104",
-    0x3230: u"\u5C4B",
-    0x3231: u"\u61B6",
-    0x3232: u"\u81C6",
-    0x3233: u"\u6876",
-    0x3234: u"\u7261",
-    0x3235: u"\u4E59",
-    0x3236: u"\u4FFA",
-    0x3237: u"\u5378",
-    0x3238: u"\u6069",
-    0x3239: u"\u6E29",
-    0x323A: u"\u7A4F",
-    0x323B: u"\u97F3",
-    0x323C: u"\u4E0B",
-    0x323D: u"\u5316",
-    0x323E: u"\u4EEE",
-    0x323F: u"\u4F55",
-    0x3240: u"\u4F3D",
-    0x3241: u"\u4FA1",
-    0x3242: u"\u4F73",
-    0x3243: u"\u52A0",
-    0x3244: u"\u53EF",
-    0x3245: u"\u5609",
-    0x3246: u"\u590F",
-    0x3247: u"\u5AC1",
-    0x3248: u"\u5BB6",
-    0x3249: u"\u5BE1",
-    0x324A: u"\u79D1",
-    0x324B: u"\u6687",
-    0x324C: u"\u679C",
-    0x324D: u"\u67B6",
-    0x324E: u"\u6B4C",
-    0x324F: u"\u6CB3",
-    0x3250: u"\u706B",
-    0x3251: u"\u73C2",
-    0x3252: u"\u798D",
-    0x3253: u"\u79BE",
-    0x3254: u"\u7A3C",
-    0x3255: u"\u7B87",
-    0x3256: u"\u82B1",
-    0x3257: u"\u82DB",
-    0x3258: u"\u8304",
-    0x3259: u"\u8377",
-    0x325A: u"\u83EF",
-    0x325B: u"\u83D3",
-    0x325C: u"\u8766",
-    0x325D: u"\u8AB2",
-    0x325E: u"\u5629",
-    0x325F: u"\u8CA8",
-    0x3260: u"\u8FE6",
-    0x3261: u"\u904E",
-    0x3262: u"\u971E",
-    0x3263: u"\u868A",
-    0x3264: u"\u4FC4",
-    0x3265: u"\u5CE8",
-    0x3266: u"\u6211",
-    0x3267: u"\u7259",
-    0x3268: u"\u753B",
-    0x3269: u"\u81E5",
-    0x326A: u"\u82BD",
-    0x326B: u"\u86FE",
-    0x326C: u"\u8CC0",
-    0x326D: u"\u96C5",
-    0x326E: u"\u9913",
-    0x326F: u"\u99D5",
-    0x3270: u"\u4ECB",
-    0x3271: u"\u4F1A",
-    0x3272: u"\u89E3",
-    0x3273: u"\u56DE",
-    0x3274: u"\u584A",
-    0x3275: u"\u58CA",
-    0x3276: u"\u5EFB",
-    0x3277: u"\u5FEB",
-    0x3278: u"\u602A",
-    0x3279: u"\u6094",
-    0x327A: u"\u6062",
-    0x327B: u"\u61D0",
-    0x327C: u"\u6212",
-    0x327D: u"\u62D0",
-    0x327E: u"\u6539",
-    0x3321: u"\u9B41",
-    0x3322: u"\u6666",
-    0x3323: u"\u68B0",
-    0x3324: u"\u6D77",
-    0x3325: u"\u7070",
-    0x3326: u"\u754C",
-    0x3327: u"\u7686",
-    0x3328: u"\u7D75",
-    0x3329: u"\u82A5",
-    0x332A: u"\u87F9",
-    0x332B: u"\u958B",
-    0x332C: u"\u968E",
-    0x332D: u"\u8C9D",
-    0x332E: u"\u51F1",
-    0x332F: u"\u52BE",
-    0x3330: u"\u5916",
-    0x3331: u"\u54B3",
-    0x3332: u"\u5BB3",
-    0x3333: u"\u5D16",
-    0x3334: u"\u6168",
-    0x3335: u"\u6982",
-    0x3336: u"\u6DAF",
-    0x3337: u"\u788D",
-    0x3338: u"\u84CB",
-    0x3339: u"\u8857",
-    0x333A: u"\u8A72",
-    0x333B: u"\u93A7",
-    0x333C: u"\u9AB8",
-    0x333D: u"\u6D6C",
-    0x333E: u"\u99A8",
-    0x333F: u"\u86D9",
-    0x3340: u"\u57A3",
-    0x3341: u"\u67FF",
-    0x3342: u"\u86CE",
-    0x3343: u"\u920E",
-    0x3344: u"\u5283",
-    0x3345: u"\u5687",
-    0x3346: u"\u5404",
-    0x3347: u"\u5ED3",
-    0x3348: u"\u62E1",
-    0x3349: u"\u64B9",
-    0x334A: u"\u683C",
-    0x334B: u"\u6838",
-    0x334C: u"\u6BBB",
-    0x334D: u"\u7372",
-    0x334E: u"\u78BA",
-    0x334F: u"\u7A6B",
-    0x3350: u"\u899A",
-    0x3351: u"\u89D2",
-    0x3352: u"\u8D6B",
-    0x3353: u"\u8F03",
-    0x3354: u"\u90ED",
-    0x3355: u"\u95A3",
-    0x3356: u"\u9694",
-    0x3357: u"\u9769",
-    0x3358: u"\u5B66",
-    0x3359: u"\u5CB3",
-    0x335A: u"\u697D",
-    0x335B: u"\u984D",
-    0x335C: u"\u984E",
-    0x335D: u"\u639B",
-    0x335E: u"\u7B20",
-    0x335F: u"\u6A2B",
-    0x3360: u"\u6A7F",
-    0x3361: u"\u68B6",
-    0x3362: u"\u9C0D",
-    0x3363: u"\u6F5F",
-    0x3364: u"\u5272",
-    0x3365: u"\u559D",
-    0x3366: u"\u6070",
-    0x3367: u"\u62EC",
-    0x3368: u"\u6D3B",
-    0x3369: u"\u6E07",
-    0x336A: u"\u6ED1",
-    0x336B: u"\u845B",
-    0x336C: u"\u8910",
-    0x336D: u"\u8F44",
-    0x336E: u"\u4E14",
-    0x336F: u"\u9C39",
-    0x3370: u"\u53F6",
-    0x3371: u"\u691B",
-    0x3372: u"\u6A3A",
-    0x3373: u"\u9784",
-    0x3374: u"\u682A",
-    0x3375: u"\u515C",
-    0x3376: u"\u7AC3",
-    0x3377: u"\u84B2",
-    0x3378: u"\u91DC",
-    0x3379: u"\u938C",
-    0x337A: u"\u565B",
-    0x337B: u"\u9D28",
-    0x337C: u"\u6822",
-    0x337D: u"\u8305",
-    0x337E: u"\u8431",
-    0x3421: u"\u7CA5",
-    0x3422: u"\u5208",
-    0x3423: u"\u82C5",
-    0x3424: u"\u74E6",
-    0x3425: u"\u4E7E",
-    0x3426: u"\u4F83",
-    0x3427: u"\u51A0",
-    0x3428: u"\u5BD2",
-    0x3429: u"\u520A",
-    0x342A: u"\u52D8",
-    0x342B: u"\u52E7",
-    0x342C: u"\u5DFB",
-    0x342D: u"\u559A",
-    0x342E: u"\u582A",
-    0x342F: u"\u59E6",
-    0x3430: u"\u5B8C",
-    0x3431: u"\u5B98",
-    0x3432: u"\u5BDB",
-    0x3433: u"\u5E72",
-    0x3434: u"\u5E79",
-    0x3435: u"\u60A3",
-    0x3436: u"\u611F",
-    0x3437: u"\u6163",
-    0x3438: u"\u61BE",
-    0x3439: u"\u63DB",
-    0x343A: u"\u6562",
-    0x343B: u"\u67D1",
-    0x343C: u"\u6853",
-    0x343D: u"\u68FA",
-    0x343E: u"\u6B3E",
-    0x343F: u"\u6B53",
-    0x3440: u"\u6C57",
-    0x3441: u"\u6F22",
-    0x3442: u"\u6F97",
-    0x3443: u"\u6F45",
-    0x3444: u"\u74B0",
-    0x3445: u"\u7518",
-    0x3446: u"\u76E3",
-    0x3447: u"\u770B",
-    0x3448: u"\u7AFF",
-    0x3449: u"\u7BA1",
-    0x344A: u"\u7C21",
-    0x344B: u"\u7DE9",
-    0x344C: u"\u7F36",
-    0x344D: u"\u7FF0",
-    0x344E: u"\u809D",
-    0x344F: u"\u8266",
-    0x3450: u"\u839E",
-    0x3451: u"\u89B3",
-    0x3452: u"\u8ACC",
-    0x3453: u"\u8CAB",
-    0x3454: u"\u9084",
-    0x3455: u"\u9451",
-    0x3456: u"\u9593",
-    0x3457: u"\u9591",
-    0x3458: u"\u95A2",
-    0x3459: u"\u9665",
-    0x345A: u"\u97D3",
-    0x345B: u"\u9928",
-    0x345C: u"\u8218",
-    0x345D: u"\u4E38",
-    0x345E: u"\u542B",
-    0x345F: u"\u5CB8",
-    0x3460: u"\u5DCC",
-    0x3461: u"\u73A9",
-    0x3462: u"\u764C",
-    0x3463: u"\u773C",
-    0x3464: u"\u5CA9",
-    0x3465: u"\u7FEB",
-    0x3466: u"\u8D0B",
-    0x3467: u"\u96C1",
-    0x3468: u"\u9811",
-    0x3469: u"\u9854",
-    0x346A: u"\u9858",
-    0x346B: u"\u4F01",
-    0x346C: u"\u4F0E",
-    0x346D: u"\u5371",
-    0x346E: u"\u559C",
-    0x346F: u"\u5668",
-    0x3470: u"\u57FA",
-    0x3471: u"\u5947",
-    0x3472: u"\u5B09",
-    0x3473: u"\u5BC4",
-    0x3474: u"\u5C90",
-    0x3475: u"\u5E0C",
-    0x3476: u"\u5E7E",
-    0x3477: u"\u5FCC",
-    0x3478: u"\u63EE",
-    0x3479: u"\u673A",
-    0x347A: u"\u65D7",
-    0x347B: u"\u65E2",
-    0x347C: u"\u671F",
-    0x347D: u"\u68CB",
-    0x347E: u"\u68C4",
-    0x3521: u"\u6A5F",
-    0x3522: u"\u5E30",
-    0x3523: u"\u6BC5",
-    0x3524: u"\u6C17",
-    0x3525: u"\u6C7D",
-    0x3526: u"\u757F",
-    0x3527: u"\u7948",
-    0x3528: u"\u5B63",
-    0x3529: u"\u7A00",
-    0x352A: u"\u7D00",
-    0x352B: u"\u5FBD",
-    0x352C: u"\u898F",
-    0x352D: u"\u8A18",
-    0x352E: u"\u8CB4",
-    0x352F: u"\u8D77",
-    0x3530: u"\u8ECC",
-    0x3531: u"\u8F1D",
-    0x3532: u"\u98E2",
-    0x3533: u"\u9A0E",
-    0x3534: u"\u9B3C",
-    0x3535: u"\u4E80",
-    0x3536: u"\u507D",
-    0x3537: u"\u5100",
-    0x3538: u"\u5993",
-    0x3539: u"\u5B9C",
-    0x353A: u"\u622F",
-    0x353B: u"\u6280",
-    0x353C: u"\u64EC",
-    0x353D: u"\u6B3A",
-    0x353E: u"\u72A0",
-    0x353F: u"\u7591",
-    0x3540: u"\u7947",
-    0x3541: u"\u7FA9",
-    0x3542: u"\u87FB",
-    0x3543: u"\u8ABC",
-    0x3544: u"\u8B70",
-    0x3545: u"\u63AC",
-    0x3546: u"\u83CA",
-    0x3547: u"\u97A0",
-    0x3548: u"\u5409",
-    0x3549: u"\u5403",
-    0x354A: u"\u55AB",
-    0x354B: u"\u6854",
-    0x354C: u"\u6A58",
-    0x354D: u"\u8A70",
-    0x354E: u"\u7827",
-    0x354F: u"\u6775",
-    0x3550: u"\u9ECD",
-    0x3551: u"\u5374",
-    0x3552: u"\u5BA2",
-    0x3553: u"\u811A",
-    0x3554: u"\u8650",
-    0x3555: u"\u9006",
-    0x3556: u"\u4E18",
-    0x3557: u"\u4E45",
-    0x3558: u"\u4EC7",
-    0x3559: u"\u4F11",
-    0x355A: u"\u53CA",
-    0x355B: u"\u5438",
-    0x355C: u"\u5BAE",
-    0x355D: u"\u5F13",
-    0x355E: u"\u6025",
-    0x355F: u"\u6551",
-    0x3560: u"\u673D",
-    0x3561: u"\u6C42",
-    0x3562: u"\u6C72",
-    0x3563: u"\u6CE3",
-    0x3564: u"\u7078",
-    0x3565: u"\u7403",
-    0x3566: u"\u7A76",
-    0x3567: u"\u7AAE",
-    0x3568: u"\u7B08",
-    0x3569: u"\u7D1A",
-    0x356A: u"\u7CFE",
-    0x356B: u"\u7D66",
-    0x356C: u"\u65E7",
-    0x356D: u"\u725B",
-    0x356E: u"\u53BB",
-    0x356F: u"\u5C45",
-    0x3570: u"\u5DE8",
-    0x3571: u"\u62D2",
-    0x3572: u"\u62E0",
-    0x3573: u"\u6319",
-    0x3574: u"\u6E20",
-    0x3575: u"\u865A",
-    0x3576: u"\u8A31",
-    0x3577: u"\u8DDD",
-    0x3578: u"\u92F8",
-    0x3579: u"\u6F01",
-    0x357A: u"\u79A6",
-    0x357B: u"\u9B5A",
-    0x357C: u"\u4EA8",
-    0x357D: u"\u4EAB",
-    0x357E: u"\u4EAC",
-    0x3621: u"\u4F9B",
-    0x3622: u"\u4FA0",
-    0x3623: u"\u50D1",
-    0x3624: u"\u5147",
-    0x3625: u"\u7AF6",
-    0x3626: u"\u5171",
-    0x3627: u"\u51F6",
-    0x3628: u"\u5354",
-    0x3629: u"\u5321",
-    0x362A: u"\u537F",
-    0x362B: u"\u53EB",
-    0x362C: u"\u55AC",
-    0x362D: u"\u5883",
-    0x362E: u"\u5CE1",
-    0x362F: u"\u5F37",
-    0x3630: u"\u5F4A",
-    0x3631: u"\u602F",
-    0x3632: u"\u6050",
-    0x3633: u"\u606D",
-    0x3634: u"\u631F",
-    0x3635: u"\u6559",
-    0x3636: u"\u6A4B",
-    0x3637: u"\u6CC1",
-    0x3638: u"\u72C2",
-    0x3639: u"\u72ED",
-    0x363A: u"\u77EF",
-    0x363B: u"\u80F8",
-    0x363C: u"\u8105",
-    0x363D: u"\u8208",
-    0x363E: u"\u854E",
-    0x363F: u"\u90F7",
-    0x3640: u"\u93E1",
-    0x3641: u"\u97FF",
-    0x3642: u"\u9957",
-    0x3643: u"\u9A5A",
-    0x3644: u"\u4EF0",
-    0x3645: u"\u51DD",
-    0x3646: u"\u5C2D",
-    0x3647: u"\u6681",
-    0x3648: u"\u696D",
-    0x3649: u"\u5C40",
-    0x364A: u"\u66F2",
-    0x364B: u"\u6975",
-    0x364C: u"\u7389",
-    0x364D: u"\u6850",
-    0x364E: u"\u7C81",
-    0x364F: u"\u50C5",
-    0x3650: u"\u52E4",
-    0x3651: u"\u5747",
-    0x3652: u"\u5DFE",
-    0x3653: u"\u9326",
-    0x3654: u"\u65A4",
-    0x3655: u"\u6B23",
-    0x3656: u"\u6B3D",
-    0x3657: u"\u7434",
-    0x3658: u"\u7981",
-    0x3659: u"\u79BD",
-    0x365A: u"\u7B4B",
-    0x365B: u"\u7DCA",
-    0x365C: u"\u82B9",
-    0x365D: u"\u83CC",
-    0x365E: u"\u887F",
-    0x365F: u"\u895F",
-    0x3660: u"\u8B39",
-    0x3661: u"\u8FD1",
-    0x3662: u"\u91D1",
-    0x3663: u"\u541F",
-    0x3664: u"\u9280",
-    0x3665: u"\u4E5D",
-    0x3666: u"\u5036",
-    0x3667: u"\u53E5",
-    0x3668: u"\u533A",
-    0x3669: u"\u72D7",
-    0x366A: u"\u7396",
-    0x366B: u"\u77E9",
-    0x366C: u"\u82E6",
-    0x366D: u"\u8EAF",
-    0x366E: u"\u99C6",
-    0x366F: u"\u99C8",
-    0x3670: u"\u99D2",
-    0x3671: u"\u5177",
-    0x3672: u"\u611A",
-    0x3673: u"\u865E",
-    0x3674: u"\u55B0",
-    0x3675: u"\u7A7A",
-    0x3676: u"\u5076",
-    0x3677: u"\u5BD3",
-    0x3678: u"\u9047",
-    0x3679: u"\u9685",
-    0x367A: u"\u4E32",
-    0x367B: u"\u6ADB",
-    0x367C: u"\u91E7",
-    0x367D: u"\u5C51",
-    0x367E: u"\u5C48",
-    0x3721: u"\u6398",
-    0x3722: u"\u7A9F",
-    0x3723: u"\u6C93",
-    0x3724: u"\u9774",
-    0x3725: u"\u8F61",
-    0x3726: u"\u7AAA",
-    0x3727: u"\u718A",
-    0x3728: u"\u9688",
-    0x3729: u"\u7C82",
-    0x372A: u"\u6817",
-    0x372B: u"\u7E70",
-    0x372C: u"\u6851",
-    0x372D: u"\u936C",
-    0x372E: u"\u52F2",
-    0x372F: u"\u541B",
-    0x3730: u"\u85AB",
-    0x3731: u"\u8A13",
-    0x3732: u"\u7FA4",
-    0x3733: u"\u8ECD",
-    0x3734: u"\u90E1",
-    0x3735: u"\u5366",
-    0x3736: u"\u8888",
-    0x3737: u"\u7941",
-    0x3738: u"\u4FC2",
-    0x3739: u"\u50BE",
-    0x373A: u"\u5211",
-    0x373B: u"\u5144",
-    0x373C: u"\u5553",
-    0x373D: u"\u572D",
-    0x373E: u"\u73EA",
-    0x373F: u"\u578B",
-    0x3740: u"\u5951",
-    0x3741: u"\u5F62",
-    0x3742: u"\u5F84",
-    0x3743: u"\u6075",
-    0x3744: u"\u6176",
-    0x3745: u"\u6167",
-    0x3746: u"\u61A9",
-    0x3747: u"\u63B2",
-    0x3748: u"\u643A",
-    0x3749: u"\u656C",
-    0x374A: u"\u666F",
-    0x374B: u"\u6842",
-    0x374C: u"\u6E13",
-    0x374D: u"\u7566",
-    0x374E: u"\u7A3D",
-    0x374F: u"\u7CFB",
-    0x3750: u"\u7D4C",
-    0x3751: u"\u7D99",
-    0x3752: u"\u7E4B",
-    0x3753: u"\u7F6B",
-    0x3754: u"\u830E",
-    0x3755: u"\u834A",
-    0x3756: u"\u86CD",
-    0x3757: u"\u8A08",
-    0x3758: u"\u8A63",
-    0x3759: u"\u8B66",
-    0x375A: u"\u8EFD",
-    0x375B: u"\u981A",
-    0x375C: u"\u9D8F",
-    0x375D: u"\u82B8",
-    0x375E: u"\u8FCE",
-    0x375F: u"\u9BE8",
-    0x3760: u"\u5287",
-    0x3761: u"\u621F",
-    0x3762: u"\u6483",
-    0x3763: u"\u6FC0",
-    0x3764: u"\u9699",
-    0x3765: u"\u6841",
-    0x3766: u"\u5091",
-    0x3767: u"\u6B20",
-    0x3768: u"\u6C7A",
-    0x3769: u"\u6F54",
-    0x376A: u"\u7A74",
-    0x376B: u"\u7D50",
-    0x376C: u"\u8840",
-    0x376D: u"\u8A23",
-    0x376E: u"\u6708",
-    0x376F: u"\u4EF6",
-    0x3770: u"\u5039",
-    0x3771: u"\u5026",
-    0x3772: u"\u5065",
-    0x3773: u"\u517C",
-    0x3774: u"\u5238",
-    0x3775: u"\u5263",
-    0x3776: u"\u55A7",
-    0x3777: u"\u570F",
-    0x3778: u"\u5805",
-    0x3779: u"\u5ACC",
-    0x377A: u"\u5EFA",
-    0x377B: u"\u61B2",
-    0x377C: u"\u61F8",
-    0x377D: u"\u62F3",
-    0x377E: u"\u6372",
-    0x3821: u"\u691C",
-    0x3822: u"\u6A29",
-    0x3823: u"\u727D",
-    0x3824: u"\u72AC",
-    0x3825: u"\u732E",
-    0x3826: u"\u7814",
-    0x3827: u"\u786F",
-    0x3828: u"\u7D79",
-    0x3829: u"\u770C",
-    0x382A: u"\u80A9",
-    0x382B: u"\u898B",
-    0x382C: u"\u8B19",
-    0x382D: u"\u8CE2",
-    0x382E: u"\u8ED2",
-    0x382F: u"\u9063",
-    0x3830: u"\u9375",
-    0x3831: u"\u967A",
-    0x3832: u"\u9855",
-    0x3833: u"\u9A13",
-    0x3834: u"\u9E78",
-    0x3835: u"\u5143",
-    0x3836: u"\u539F",
-    0x3837: u"\u53B3",
-    0x3838: u"\u5E7B",
-    0x3839: u"\u5F26",
-    0x383A: u"\u6E1B",
-    0x383B: u"\u6E90",
-    0x383C: u"\u7384",
-    0x383D: u"\u73FE",
-    0x383E: u"\u7D43",
-    0x383F: u"\u8237",
-    0x3840: u"\u8A00",
-    0x3841: u"\u8AFA",
-    0x3842: u"\u9650",
-    0x3843: u"\u4E4E",
-    0x3844: u"\u500B",
-    0x3845: u"\u53E4",
-    0x3846: u"\u547C",
-    0x3847: u"\u56FA",
-    0x3848: u"\u59D1",
-    0x3849: u"\u5B64",
-    0x384A: u"\u5DF1",
-    0x384B: u"\u5EAB",
-    0x384C: u"\u5F27",
-    0x384D: u"\u6238",
-    0x384E: u"\u6545",
-    0x384F: u"\u67AF",
-    0x3850: u"\u6E56",
-    0x3851: u"\u72D0",
-    0x3852: u"\u7CCA",
-    0x3853: u"\u88B4",
-    0x3854: u"\u80A1",
-    0x3855: u"\u80E1",
-    0x3856: u"\u83F0",
-    0x3857: u"\u864E",
-    0x3858: u"\u8A87",
-    0x3859: u"\u8DE8",
-    0x385A: u"\u9237",
-    0x385B: u"\u96C7",
-    0x385C: u"\u9867",
-    0x385D: u"\u9F13",
-    0x385E: u"\u4E94",
-    0x385F: u"\u4E92",
-    0x3860: u"\u4F0D",
-    0x3861: u"\u5348",
-    0x3862: u"\u5449",
-    0x3863: u"\u543E",
-    0x3864: u"\u5A2F",
-    0x3865: u"\u5F8C",
-    0x3866: u"\u5FA1",
-    0x3867: u"\u609F",
-    0x3868: u"\u68A7",
-    0x3869: u"\u6A8E",
-    0x386A: u"\u745A",
-    0x386B: u"\u7881",
-    0x386C: u"\u8A9E",
-    0x386D: u"\u8AA4",
-    0x386E: u"\u8B77",
-    0x386F: u"\u9190",
-    0x3870: u"\u4E5E",
-    0x3871: u"\u9BC9",
-    0x3872: u"\u4EA4",
-    0x3873: u"\u4F7C",
-    0x3874: u"\u4FAF",
-    0x3875: u"\u5019",
-    0x3876: u"\u5016",
-    0x3877: u"\u5149",
-    0x3878: u"\u516C",
-    0x3879: u"\u529F",
-    0x387A: u"\u52B9",
-    0x387B: u"\u52FE",
-    0x387C: u"\u539A",
-    0x387D: u"\u53E3",
-    0x387E: u"\u5411",
-    0x3921: u"\u540E",
-    0x3922: u"\u5589",
-    0x3923: u"\u5751",
-    0x3924: u"\u57A2",
-    0x3925: u"\u597D",
-    0x3926: u"\u5B54",
-    0x3927: u"\u5B5D",
-    0x3928: u"\u5B8F",
-    0x3929: u"\u5DE5",
-    0x392A: u"\u5DE7",
-    0x392B: u"\u5DF7",
-    0x392C: u"\u5E78",
-    0x392D: u"\u5E83",
-    0x392E: u"\u5E9A",
-    0x392F: u"\u5EB7",
-    0x3930: u"\u5F18",
-    0x3931: u"\u6052",
-    0x3932: u"\u614C",
-    0x3933: u"\u6297",
-    0x3934: u"\u62D8",
-    0x3935: u"\u63A7",
-    0x3936: u"\u653B",
-    0x3937: u"\u6602",
-    0x3938: u"\u6643",
-    0x3939: u"\u66F4",
-    0x393A: u"\u676D",
-    0x393B: u"\u6821",
-    0x393C: u"\u6897",
-    0x393D: u"\u69CB",
-    0x393E: u"\u6C5F",
-    0x393F: u"\u6D2A",
-    0x3940: u"\u6D69",
-    0x3941: u"\u6E2F",
-    0x3942: u"\u6E9D",
-    0x3943: u"\u7532",
-    0x3944: u"\u7687",
-    0x3945: u"\u786C",
-    0x3946: u"\u7A3F",
-    0x3947: u"\u7CE0",
-    0x3948: u"\u7D05",
-    0x3949: u"\u7D18",
-    0x394A: u"\u7D5E",
-    0x394B: u"\u7DB1",
-    0x394C: u"\u8015",
-    0x394D: u"\u8003",
-    0x394E: u"\u80AF",
-    0x394F: u"\u80B1",
-    0x3950: u"\u8154",
-    0x3951: u"\u818F",
-    0x3952: u"\u822A",
-    0x3953: u"\u8352",
-    0x3954: u"\u884C",
-    0x3955: u"\u8861",
-    0x3956: u"\u8B1B",
-    0x3957: u"\u8CA2",
-    0x3958: u"\u8CFC",
-    0x3959: u"\u90CA",
-    0x395A: u"\u9175",
-    0x395B: u"\u9271",
-    0x395C: u"\u783F",
-    0x395D: u"\u92FC",
-    0x395E: u"\u95A4",
-    0x395F: u"\u964D",
-    0x3960: u"\u9805",
-    0x3961: u"\u9999",
-    0x3962: u"\u9AD8",
-    0x3963: u"\u9D3B",
-    0x3964: u"\u525B",
-    0x3965: u"\u52AB",
-    0x3966: u"\u53F7",
-    0x3967: u"\u5408",
-    0x3968: u"\u58D5",
-    0x3969: u"\u62F7",
-    0x396A: u"\u6FE0",
-    0x396B: u"\u8C6A",
-    0x396C: u"\u8F5F",
-    0x396D: u"\u9EB9",
-    0x396E: u"\u514B",
-    0x396F: u"\u523B",
-    0x3970: u"\u544A",
-    0x3971: u"\u56FD",
-    0x3972: u"\u7A40",
-    0x3973: u"\u9177",
-    0x3974: u"\u9D60",
-    0x3975: u"\u9ED2",
-    0x3976: u"\u7344",
-    0x3977: u"\u6F09",
-    0x3978: u"\u8170",
-    0x3979: u"\u7511",
-    0x397A: u"\u5FFD",
-    0x397B: u"\u60DA",
-    0x397C: u"\u9AA8",
-    0x397D: u"\u72DB",
-    0x397E: u"\u8FBC",
-    0x3A21: u"\u6B64",
-    0x3A22: u"\u9803",
-    0x3A23: u"\u4ECA",
-    0x3A24: u"\u56F0",
-    0x3A25: u"\u5764",
-    0x3A26: u"\u58BE",
-    0x3A27: u"\u5A5A",
-    0x3A28: u"\u6068",
-    0x3A29: u"\u61C7",
-    0x3A2A: u"\u660F",
-    0x3A2B: u"\u6606",
-    0x3A2C: u"\u6839",
-    0x3A2D: u"\u68B1",
-    0x3A2E: u"\u6DF7",
-    0x3A2F: u"\u75D5",
-    0x3A30: u"\u7D3A",
-    0x3A31: u"\u826E",
-    0x3A32: u"\u9B42",
-    0x3A33: u"\u4E9B",
-    0x3A34: u"\u4F50",
-    0x3A35: u"\u53C9",
-    0x3A36: u"\u5506",
-    0x3A37: u"\u5D6F",
-    0x3A38: u"\u5DE6",
-    0x3A39: u"\u5DEE",
-    0x3A3A: u"\u67FB",
-    0x3A3B: u"\u6C99",
-    0x3A3C: u"\u7473",
-    0x3A3D: u"\u7802",
-    0x3A3E: u"\u8A50",
-    0x3A3F: u"\u9396",
-    0x3A40: u"\u88DF",
-    0x3A41: u"\u5750",
-    0x3A42: u"\u5EA7",
-    0x3A43: u"\u632B",
-    0x3A44: u"\u50B5",
-    0x3A45: u"\u50AC",
-    0x3A46: u"\u518D",
-    0x3A47: u"\u6700",
-    0x3A48: u"\u54C9",
-    0x3A49: u"\u585E",
-    0x3A4A: u"\u59BB",
-    0x3A4B: u"\u5BB0",
-    0x3A4C: u"\u5F69",
-    0x3A4D: u"\u624D",
-    0x3A4E: u"\u63A1",
-    0x3A4F: u"\u683D",
-    0x3A50: u"\u6B73",
-    0x3A51: u"\u6E08",
-    0x3A52: u"\u707D",
-    0x3A53: u"\u91C7",
-    0x3A54: u"\u7280",
-    0x3A55: u"\u7815",
-    0x3A56: u"\u7826",
-    0x3A57: u"\u796D",
-    0x3A58: u"\u658E",
-    0x3A59: u"\u7D30",
-    0x3A5A: u"\u83DC",
-    0x3A5B: u"\u88C1",
-    0x3A5C: u"\u8F09",
-    0x3A5D: u"\u969B",
-    0x3A5E: u"\u5264",
-    0x3A5F: u"\u5728",
-    0x3A60: u"\u6750",
-    0x3A61: u"\u7F6A",
-    0x3A62: u"\u8CA1",
-    0x3A63: u"\u51B4",
-    0x3A64: u"\u5742",
-    0x3A65: u"\u962A",
-    0x3A66: u"\u583A",
-    0x3A67: u"\u698A",
-    0x3A68: u"\u80B4",
-    0x3A69: u"\u54B2",
-    0x3A6A: u"\u5D0E",
-    0x3A6B: u"\u57FC",
-    0x3A6C: u"\u7895",
-    0x3A6D: u"\u9DFA",
-    0x3A6E: u"\u4F5C",
-    0x3A6F: u"\u524A",
-    0x3A70: u"\u548B",
-    0x3A71: u"\u643E",
-    0x3A72: u"\u6628",
-    0x3A73: u"\u6714",
-    0x3A74: u"\u67F5",
-    0x3A75: u"\u7A84",
-    0x3A76: u"\u7B56",
-    0x3A77: u"\u7D22",
-    0x3A78: u"\u932F",
-    0x3A79: u"\u685C",
-    0x3A7A: u"\u9BAD",
-    0x3A7B: u"\u7B39",
-    0x3A7C: u"\u5319",
-    0x3A7D: u"\u518A",
-    0x3A7E: u"\u5237",
-    0x3B21: u"\u5BDF",
-    0x3B22: u"\u62F6",
-    0x3B23: u"\u64AE",
-    0x3B24: u"\u64E6",
-    0x3B25: u"\u672D",
-    0x3B26: u"\u6BBA",
-    0x3B27: u"\u85A9",
-    0x3B28: u"\u96D1",
-    0x3B29: u"\u7690",
-    0x3B2A: u"\u9BD6",
-    0x3B2B: u"\u634C",
-    0x3B2C: u"\u9306",
-    0x3B2D: u"\u9BAB",
-    0x3B2E: u"\u76BF",
-    0x3B2F: u"\u6652",
-    0x3B30: u"\u4E09",
-    0x3B31: u"\u5098",
-    0x3B32: u"\u53C2",
-    0x3B33: u"\u5C71",
-    0x3B34: u"\u60E8",
-    0x3B35: u"\u6492",
-    0x3B36: u"\u6563",
-    0x3B37: u"\u685F",
-    0x3B38: u"\u71E6",
-    0x3B39: u"\u73CA",
-    0x3B3A: u"\u7523",
-    0x3B3B: u"\u7B97",
-    0x3B3C: u"\u7E82",
-    0x3B3D: u"\u8695",
-    0x3B3E: u"\u8B83",
-    0x3B3F: u"\u8CDB",
-    0x3B40: u"\u9178",
-    0x3B41: u"\u9910",
-    0x3B42: u"\u65AC",
-    0x3B43: u"\u66AB",
-    0x3B44: u"\u6B8B",
-    0x3B45: u"\u4ED5",
-    0x3B46: u"\u4ED4",
-    0x3B47: u"\u4F3A",
-    0x3B48: u"\u4F7F",
-    0x3B49: u"\u523A",
-    0x3B4A: u"\u53F8",
-    0x3B4B: u"\u53F2",
-    0x3B4C: u"\u55E3",
-    0x3B4D: u"\u56DB",
-    0x3B4E: u"\u58EB",
-    0x3B4F: u"\u59CB",
-    0x3B50: u"\u59C9",
-    0x3B51: u"\u59FF",
-    0x3B52: u"\u5B50",
-    0x3B53: u"\u5C4D",
-    0x3B54: u"\u5E02",
-    0x3B55: u"\u5E2B",
-    0x3B56: u"\u5FD7",
-    0x3B57: u"\u601D",
-    0x3B58: u"\u6307",
-    0x3B59: u"\u652F",
-    0x3B5A: u"\u5B5C",
-    0x3B5B: u"\u65AF",
-    0x3B5C: u"\u65BD",
-    0x3B5D: u"\u65E8",
-    0x3B5E: u"\u679D",
-    0x3B5F: u"\u6B62",
-    0x3B60: u"\u6B7B",
-    0x3B61: u"\u6C0F",
-    0x3B62: u"\u7345",
-    0x3B63: u"\u7949",
-    0x3B64: u"\u79C1",
-    0x3B65: u"\u7CF8",
-    0x3B66: u"\u7D19",
-    0x3B67: u"\u7D2B",
-    0x3B68: u"\u80A2",
-    0x3B69: u"\u8102",
-    0x3B6A: u"\u81F3",
-    0x3B6B: u"\u8996",
-    0x3B6C: u"\u8A5E",
-    0x3B6D: u"\u8A69",
-    0x3B6E: u"\u8A66",
-    0x3B6F: u"\u8A8C",
-    0x3B70: u"\u8AEE",
-    0x3B71: u"\u8CC7",
-    0x3B72: u"\u8CDC",
-    0x3B73: u"\u96CC",
-    0x3B74: u"\u98FC",
-    0x3B75: u"\u6B6F",
-    0x3B76: u"\u4E8B",
-    0x3B77: u"\u4F3C",
-    0x3B78: u"\u4F8D",
-    0x3B79: u"\u5150",
-    0x3B7A: u"\u5B57",
-    0x3B7B: u"\u5BFA",
-    0x3B7C: u"\u6148",
-    0x3B7D: u"\u6301",
-    0x3B7E: u"\u6642",
-    0x3C21: u"\u6B21",
-    0x3C22: u"\u6ECB",
-    0x3C23: u"\u6CBB",
-    0x3C24: u"\u723E",
-    0x3C25: u"\u74BD",
-    0x3C26: u"\u75D4",
-    0x3C27: u"\u78C1",
-    0x3C28: u"\u793A",
-    0x3C29: u"\u800C",
-    0x3C2A: u"\u8033",
-    0x3C2B: u"\u81EA",
-    0x3C2C: u"\u8494",
-    0x3C2D: u"\u8F9E",
-    0x3C2E: u"\u6C50",
-    0x3C2F: u"\u9E7F",
-    0x3C30: u"\u5F0F",
-    0x3C31: u"\u8B58",
-    0x3C32: u"\u9D2B",
-    0x3C33: u"\u7AFA",
-    0x3C34: u"\u8EF8",
-    0x3C35: u"\u5B8D",
-    0x3C36: u"\u96EB",
-    0x3C37: u"\u4E03",
-    0x3C38: u"\u53F1",
-    0x3C39: u"\u57F7",
-    0x3C3A: u"\u5931",
-    0x3C3B: u"\u5AC9",
-    0x3C3C: u"\u5BA4",
-    0x3C3D: u"\u6089",
-    0x3C3E: u"\u6E7F",
-    0x3C3F: u"\u6F06",
-    0x3C40: u"\u75BE",
-    0x3C41: u"\u8CEA",
-    0x3C42: u"\u5B9F",
-    0x3C43: u"\u8500",
-    0x3C44: u"\u7BE0",
-    0x3C45: u"\u5072",
-    0x3C46: u"\u67F4",
-    0x3C47: u"\u829D",
-    0x3C48: u"\u5C61",
-    0x3C49: u"\u854A",
-    0x3C4A: u"\u7E1E",
-    0x3C4B: u"\u820E",
-    0x3C4C: u"\u5199",
-    0x3C4D: u"\u5C04",
-    0x3C4E: u"\u6368",
-    0x3C4F: u"\u8D66",
-    0x3C50: u"\u659C",
-    0x3C51: u"\u716E",
-    0x3C52: u"\u793E",
-    0x3C53: u"\u7D17",
-    0x3C54: u"\u8005",
-    0x3C55: u"\u8B1D",
-    0x3C56: u"\u8ECA",
-    0x3C57: u"\u906E",
-    0x3C58: u"\u86C7",
-    0x3C59: u"\u90AA",
-    0x3C5A: u"\u501F",
-    0x3C5B: u"\u52FA",
-    0x3C5C: u"\u5C3A",
-    0x3C5D: u"\u6753",
-    0x3C5E: u"\u707C",
-    0x3C5F: u"\u7235",
-    0x3C60: u"\u914C",
-    0x3C61: u"\u91C8",
-    0x3C62: u"\u932B",
-    0x3C63: u"\u82E5",
-    0x3C64: u"\u5BC2",
-    0x3C65: u"\u5F31",
-    0x3C66: u"\u60F9",
-    0x3C67: u"\u4E3B",
-    0x3C68: u"\u53D6",
-    0x3C69: u"\u5B88",
-    0x3C6A: u"\u624B",
-    0x3C6B: u"\u6731",
-    0x3C6C: u"\u6B8A",
-    0x3C6D: u"\u72E9",
-    0x3C6E: u"\u73E0",
-    0x3C6F: u"\u7A2E",
-    0x3C70: u"\u816B",
-    0x3C71: u"\u8DA3",
-    0x3C72: u"\u9152",
-    0x3C73: u"\u9996",
-    0x3C74: u"\u5112",
-    0x3C75: u"\u53D7",
-    0x3C76: u"\u546A",
-    0x3C77: u"\u5BFF",
-    0x3C78: u"\u6388",
-    0x3C79: u"\u6A39",
-    0x3C7A: u"\u7DAC",
-    0x3C7B: u"\u9700",
-    0x3C7C: u"\u56DA",
-    0x3C7D: u"\u53CE",
-    0x3C7E: u"\u5468",
-    0x3D21: u"\u5B97",
-    0x3D22: u"\u5C31",
-    0x3D23: u"\u5DDE",
-    0x3D24: u"\u4FEE",
-    0x3D25: u"\u6101",
-    0x3D26: u"\u62FE",
-    0x3D27: u"\u6D32",
-    0x3D28: u"\u79C0",
-    0x3D29: u"\u79CB",
-    0x3D2A: u"\u7D42",
-    0x3D2B: u"\u7E4D",
-    0x3D2C: u"\u7FD2",
-    0x3D2D: u"\u81ED",
-    0x3D2E: u"\u821F",
-    0x3D2F: u"\u8490",
-    0x3D30: u"\u8846",
-    0x3D31: u"\u8972",
-    0x3D32: u"\u8B90",
-    0x3D33: u"\u8E74",
-    0x3D34: u"\u8F2F",
-    0x3D35: u"\u9031",
-    0x3D36: u"\u914B",
-    0x3D37: u"\u916C",
-    0x3D38: u"\u96C6",
-    0x3D39: u"\u919C",
-    0x3D3A: u"\u4EC0",
-    0x3D3B: u"\u4F4F",
-    0x3D3C: u"\u5145",
-    0x3D3D: u"\u5341",
-    0x3D3E: u"\u5F93",
-    0x3D3F: u"\u620E",
-    0x3D40: u"\u67D4",
-    0x3D41: u"\u6C41",
-    0x3D42: u"\u6E0B",
-    0x3D43: u"\u7363",
-    0x3D44: u"\u7E26",
-    0x3D45: u"\u91CD",
-    0x3D46: u"\u9283",
-    0x3D47: u"\u53D4",
-    0x3D48: u"\u5919",
-    0x3D49: u"\u5BBF",
-    0x3D4A: u"\u6DD1",
-    0x3D4B: u"\u795D",
-    0x3D4C: u"\u7E2E",
-    0x3D4D: u"\u7C9B",
-    0x3D4E: u"\u587E",
-    0x3D4F: u"\u719F",
-    0x3D50: u"\u51FA",
-    0x3D51: u"\u8853",
-    0x3D52: u"\u8FF0",
-    0x3D53: u"\u4FCA",
-    0x3D54: u"\u5CFB",
-    0x3D55: u"\u6625",
-    0x3D56: u"\u77AC",
-    0x3D57: u"\u7AE3",
-    0x3D58: u"\u821C",
-    0x3D59: u"\u99FF",
-    0x3D5A: u"\u51C6",
-    0x3D5B: u"\u5FAA",
-    0x3D5C: u"\u65EC",
-    0x3D5D: u"\u696F",
-    0x3D5E: u"\u6B89",
-    0x3D5F: u"\u6DF3",
-    0x3D60: u"\u6E96",
-    0x3D61: u"\u6F64",
-    0x3D62: u"\u76FE",
-    0x3D63: u"\u7D14",
-    0x3D64: u"\u5DE1",
-    0x3D65: u"\u9075",
-    0x3D66: u"\u9187",
-    0x3D67: u"\u9806",
-    0x3D68: u"\u51E6",
-    0x3D69: u"\u521D",
-    0x3D6A: u"\u6240",
-    0x3D6B: u"\u6691",
-    0x3D6C: u"\u66D9",
-    0x3D6D: u"\u6E1A",
-    0x3D6E: u"\u5EB6",
-    0x3D6F: u"\u7DD2",
-    0x3D70: u"\u7F72",
-    0x3D71: u"\u66F8",
-    0x3D72: u"\u85AF",
-    0x3D73: u"\u85F7",
-    0x3D74: u"\u8AF8",
-    0x3D75: u"\u52A9",
-    0x3D76: u"\u53D9",
-    0x3D77: u"\u5973",
-    0x3D78: u"\u5E8F",
-    0x3D79: u"\u5F90",
-    0x3D7A: u"\u6055",
-    0x3D7B: u"\u92E4",
-    0x3D7C: u"\u9664",
-    0x3D7D: u"\u50B7",
-    0x3D7E: u"\u511F",
-    0x3E21: u"\u52DD",
-    0x3E22: u"\u5320",
-    0x3E23: u"\u5347",
-    0x3E24: u"\u53EC",
-    0x3E25: u"\u54E8",
-    0x3E26: u"\u5546",
-    0x3E27: u"\u5531",
-    0x3E28: u"\u5617",
-    0x3E29: u"\u5968",
-    0x3E2A: u"\u59BE",
-    0x3E2B: u"\u5A3C",
-    0x3E2C: u"\u5BB5",
-    0x3E2D: u"\u5C06",
-    0x3E2E: u"\u5C0F",
-    0x3E2F: u"\u5C11",
-    0x3E30: u"\u5C1A",
-    0x3E31: u"\u5E84",
-    0x3E32: u"\u5E8A",
-    0x3E33: u"\u5EE0",
-    0x3E34: u"\u5F70",
-    0x3E35: u"\u627F",
-    0x3E36: u"\u6284",
-    0x3E37: u"\u62DB",
-    0x3E38: u"\u638C",
-    0x3E39: u"\u6377",
-    0x3E3A: u"\u6607",
-    0x3E3B: u"\u660C",
-    0x3E3C: u"\u662D",
-    0x3E3D: u"\u6676",
-    0x3E3E: u"\u677E",
-    0x3E3F: u"\u68A2",
-    0x3E40: u"\u6A1F",
-    0x3E41: u"\u6A35",
-    0x3E42: u"\u6CBC",
-    0x3E43: u"\u6D88",
-    0x3E44: u"\u6E09",
-    0x3E45: u"\u6E58",
-    0x3E46: u"\u713C",
-    0x3E47: u"\u7126",
-    0x3E48: u"\u7167",
-    0x3E49: u"\u75C7",
-    0x3E4A: u"\u7701",
-    0x3E4B: u"\u785D",
-    0x3E4C: u"\u7901",
-    0x3E4D: u"\u7965",
-    0x3E4E: u"\u79F0",
-    0x3E4F: u"\u7AE0",
-    0x3E50: u"\u7B11",
-    0x3E51: u"\u7CA7",
-    0x3E52: u"\u7D39",
-    0x3E53: u"\u8096",
-    0x3E54: u"\u83D6",
-    0x3E55: u"\u848B",
-    0x3E56: u"\u8549",
-    0x3E57: u"\u885D",
-    0x3E58: u"\u88F3",
-    0x3E59: u"\u8A1F",
-    0x3E5A: u"\u8A3C",
-    0x3E5B: u"\u8A54",
-    0x3E5C: u"\u8A73",
-    0x3E5D: u"\u8C61",
-    0x3E5E: u"\u8CDE",
-    0x3E5F: u"\u91A4",
-    0x3E60: u"\u9266",
-    0x3E61: u"\u937E",
-    0x3E62: u"\u9418",
-    0x3E63: u"\u969C",
-    0x3E64: u"\u9798",
-    0x3E65: u"\u4E0A",
-    0x3E66: u"\u4E08",
-    0x3E67: u"\u4E1E",
-    0x3E68: u"\u4E57",
-    0x3E69: u"\u5197",
-    0x3E6A: u"\u5270",
-    0x3E6B: u"\u57CE",
-    0x3E6C: u"\u5834",
-    0x3E6D: u"\u58CC",
-    0x3E6E: u"\u5B22",
-    0x3E6F: u"\u5E38",
-    0x3E70: u"\u60C5",
-    0x3E71: u"\u64FE",
-    0x3E72: u"\u6761",
-    0x3E73: u"\u6756",
-    0x3E74: u"\u6D44",
-    0x3E75: u"\u72B6",
-    0x3E76: u"\u7573",
-    0x3E77: u"\u7A63",
-    0x3E78: u"\u84B8",
-    0x3E79: u"\u8B72",
-    0x3E7A: u"\u91B8",
-    0x3E7B: u"\u9320",
-    0x3E7C: u"\u5631",
-    0x3E7D: u"\u57F4",
-    0x3E7E: u"\u98FE",
-    0x3F21: u"\u62ED",
-    0x3F22: u"\u690D",
-    0x3F23: u"\u6B96",
-    0x3F24: u"\u71ED",
-    0x3F25: u"\u7E54",
-    0x3F26: u"\u8077",
-    0x3F27: u"\u8272",
-    0x3F28: u"\u89E6",
-    0x3F29: u"\u98DF",
-    0x3F2A: u"\u8755",
-    0x3F2B: u"\u8FB1",
-    0x3F2C: u"\u5C3B",
-    0x3F2D: u"\u4F38",
-    0x3F2E: u"\u4FE1",
-    0x3F2F: u"\u4FB5",
-    0x3F30: u"\u5507",
-    0x3F31: u"\u5A20",
-    0x3F32: u"\u5BDD",
-    0x3F33: u"\u5BE9",
-    0x3F34: u"\u5FC3",
-    0x3F35: u"\u614E",
-    0x3F36: u"\u632F",
-    0x3F37: u"\u65B0",
-    0x3F38: u"\u664B",
-    0x3F39: u"\u68EE",
-    0x3F3A: u"\u699B",
-    0x3F3B: u"\u6D78",
-    0x3F3C: u"\u6DF1",
-    0x3F3D: u"\u7533",
-    0x3F3E: u"\u75B9",
-    0x3F3F: u"\u771F",
-    0x3F40: u"\u795E",
-    0x3F41: u"\u79E6",
-    0x3F42: u"\u7D33",
-    0x3F43: u"\u81E3",
-    0x3F44: u"\u82AF",
-    0x3F45: u"\u85AA",
-    0x3F46: u"\u89AA",
-    0x3F47: u"\u8A3A",
-    0x3F48: u"\u8EAB",
-    0x3F49: u"\u8F9B",
-    0x3F4A: u"\u9032",
-    0x3F4B: u"\u91DD",
-    0x3F4C: u"\u9707",
-    0x3F4D: u"\u4EBA",
-    0x3F4E: u"\u4EC1",
-    0x3F4F: u"\u5203",
-    0x3F50: u"\u5875",
-    0x3F51: u"\u58EC",
-    0x3F52: u"\u5C0B",
-    0x3F53: u"\u751A",
-    0x3F54: u"\u5C3D",
-    0x3F55: u"\u814E",
-    0x3F56: u"\u8A0A",
-    0x3F57: u"\u8FC5",
-    0x3F58: u"\u9663",
-    0x3F59: u"\u976D",
-    0x3F5A: u"\u7B25",
-    0x3F5B: u"\u8ACF",
-    0x3F5C: u"\u9808",
-    0x3F5D: u"\u9162",
-    0x3F5E: u"\u56F3",
-    0x3F5F: u"\u53A8",
-    0x3F60: u"\u9017",
-    0x3F61: u"\u5439",
-    0x3F62: u"\u5782",
-    0x3F63: u"\u5E25",
-    0x3F64: u"\u63A8",
-    0x3F65: u"\u6C34",
-    0x3F66: u"\u708A",
-    0x3F67: u"\u7761",
-    0x3F68: u"\u7C8B",
-    0x3F69: u"\u7FE0",
-    0x3F6A: u"\u8870",
-    0x3F6B: u"\u9042",
-    0x3F6C: u"\u9154",
-    0x3F6D: u"\u9310",
-    0x3F6E: u"\u9318",
-    0x3F6F: u"\u968F",
-    0x3F70: u"\u745E",
-    0x3F71: u"\u9AC4",
-    0x3F72: u"\u5D07",
-    0x3F73: u"\u5D69",
-    0x3F74: u"\u6570",
-    0x3F75: u"\u67A2",
-    0x3F76: u"\u8DA8",
-    0x3F77: u"\u96DB",
-    0x3F78: u"\u636E",
-    0x3F79: u"\u6749",
-    0x3F7A: u"\u6919",
-    0x3F7B: u"\u83C5",
-    0x3F7C: u"\u9817",
-    0x3F7D: u"\u96C0",
-    0x3F7E: u"\u88FE",
-    0x4021: u"\u6F84",
-    0x4022: u"\u647A",
-    0x4023: u"\u5BF8",
-    0x4024: u"\u4E16",
-    0x4025: u"\u702C",
-    0x4026: u"\u755D",
-    0x4027: u"\u662F",
-    0x4028: u"\u51C4",
-    0x4029: u"\u5236",
-    0x402A: u"\u52E2",
-    0x402B: u"\u59D3",
-    0x402C: u"\u5F81",
-    0x402D: u"\u6027",
-    0x402E: u"\u6210",
-    0x402F: u"\u653F",
-    0x4030: u"\u6574",
-    0x4031: u"\u661F",
-    0x4032: u"\u6674",
-    0x4033: u"\u68F2",
-    0x4034: u"\u6816",
-    0x4035: u"\u6B63",
-    0x4036: u"\u6E05",
-    0x4037: u"\u7272",
-    0x4038: u"\u751F",
-    0x4039: u"\u76DB",
-    0x403A: u"\u7CBE",
-    0x403B: u"\u8056",
-    0x403C: u"\u58F0",
-    0x403D: u"\u88FD",
-    0x403E: u"\u897F",
-    0x403F: u"\u8AA0",
-    0x4040: u"\u8A93",
-    0x4041: u"\u8ACB",
-    0x4042: u"\u901D",
-    0x4043: u"\u9192",
-    0x4044: u"\u9752",
-    0x4045: u"\u9759",
-    0x4046: u"\u6589",
-    0x4047: u"\u7A0E",
-    0x4048: u"\u8106",
-    0x4049: u"\u96BB",
-    0x404A: u"\u5E2D",
-    0x404B: u"\u60DC",
-    0x404C: u"\u621A",
-    0x404D: u"\u65A5",
-    0x404E: u"\u6614",
-    0x404F: u"\u6790",
-    0x4050: u"\u77F3",
-    0x4051: u"\u7A4D",
-    0x4052: u"\u7C4D",
-    0x4053: u"\u7E3E",
-    0x4054: u"\u810A",
-    0x4055: u"\u8CAC",
-    0x4056: u"\u8D64",
-    0x4057: u"\u8DE1",
-    0x4058: u"\u8E5F",
-    0x4059: u"\u78A9",
-    0x405A: u"\u5207",
-    0x405B: u"\u62D9",
-    0x405C: u"\u63A5",
-    0x405D: u"\u6442",
-    0x405E: u"\u6298",
-    0x405F: u"\u8A2D",
-    0x4060: u"\u7A83",
-    0x4061: u"\u7BC0",
-    0x4062: u"\u8AAC",
-    0x4063: u"\u96EA",
-    0x4064: u"\u7D76",
-    0x4065: u"\u820C",
-    0x4066: u"\u8749",
-    0x4067: u"\u4ED9",
-    0x4068: u"\u5148",
-    0x4069: u"\u5343",
-    0x406A: u"\u5360",
-    0x406B: u"\u5BA3",
-    0x406C: u"\u5C02",
-    0x406D: u"\u5C16",
-    0x406E: u"\u5DDD",
-    0x406F: u"\u6226",
-    0x4070: u"\u6247",
-    0x4071: u"\u64B0",
-    0x4072: u"\u6813",
-    0x4073: u"\u6834",
-    0x4074: u"\u6CC9",
-    0x4075: u"\u6D45",
-    0x4076: u"\u6D17",
-    0x4077: u"\u67D3",
-    0x4078: u"\u6F5C",
-    0x4079: u"\u714E",
-    0x407A: u"\u717D",
-    0x407B: u"\u65CB",
-    0x407C: u"\u7A7F",
-    0x407D: u"\u7BAD",
-    0x407E: u"\u7DDA",
-    0x4121: u"\u7E4A",
-    0x4122: u"\u7FA8",
-    0x4123: u"\u817A",
-    0x4124: u"\u821B",
-    0x4125: u"\u8239",
-    0x4126: u"\u85A6",
-    0x4127: u"\u8A6E",
-    0x4128: u"\u8CCE",
-    0x4129: u"\u8DF5",
-    0x412A: u"\u9078",
-    0x412B: u"\u9077",
-    0x412C: u"\u92AD",
-    0x412D: u"\u9291",
-    0x412E: u"\u9583",
-    0x412F: u"\u9BAE",
-    0x4130: u"\u524D",
-    0x4131: u"\u5584",
-    0x4132: u"\u6F38",
-    0x4133: u"\u7136",
-    0x4134: u"\u5168",
-    0x4135: u"\u7985",
-    0x4136: u"\u7E55",
-    0x4137: u"\u81B3",
-    0x4138: u"\u7CCE",
-    0x4139: u"\u564C",
-    0x413A: u"\u5851",
-    0x413B: u"\u5CA8",
-    0x413C: u"\u63AA",
-    0x413D: u"\u66FE",
-    0x413E: u"\u66FD",
-    0x413F: u"\u695A",
-    0x4140: u"\u72D9",
-    0x4141: u"\u758F",
-    0x4142: u"\u758E",
-    0x4143: u"\u790E",
-    0x4144: u"\u7956",
-    0x4145: u"\u79DF",
-    0x4146: u"\u7C97",
-    0x4147: u"\u7D20",
-    0x4148: u"\u7D44",
-    0x4149: u"\u8607",
-    0x414A: u"\u8A34",
-    0x414B: u"\u963B",
-    0x414C: u"\u9061",
-    0x414D: u"\u9F20",
-    0x414E: u"\u50E7",
-    0x414F: u"\u5275",
-    0x4150: u"\u53CC",
-    0x4151: u"\u53E2",
-    0x4152: u"\u5009",
-    0x4153: u"\u55AA",
-    0x4154: u"\u58EE",
-    0x4155: u"\u594F",
-    0x4156: u"\u723D",
-    0x4157: u"\u5B8B",
-    0x4158: u"\u5C64",
-    0x4159: u"\u531D",
-    0x415A: u"\u60E3",
-    0x415B: u"\u60F3",
-    0x415C: u"\u635C",
-    0x415D: u"\u6383",
-    0x415E: u"\u633F",
-    0x415F: u"\u63BB",
-    0x4160: u"\u64CD",
-    0x4161: u"\u65E9",
-    0x4162: u"\u66F9",
-    0x4163: u"\u5DE3",
-    0x4164: u"\u69CD",
-    0x4165: u"\u69FD",
-    0x4166: u"\u6F15",
-    0x4167: u"\u71E5",
-    0x4168: u"\u4E89",
-    0x4169: u"\u75E9",
-    0x416A: u"\u76F8",
-    0x416B: u"\u7A93",
-    0x416C: u"\u7CDF",
-    0x416D: u"\u7DCF",
-    0x416E: u"\u7D9C",
-    0x416F: u"\u8061",
-    0x4170: u"\u8349",
-    0x4171: u"\u8358",
-    0x4172: u"\u846C",
-    0x4173: u"\u84BC",
-    0x4174: u"\u85FB",
-    0x4175: u"\u88C5",
-    0x4176: u"\u8D70",
-    0x4177: u"\u9001",
-    0x4178: u"\u906D",
-    0x4179: u"\u9397",
-    0x417A: u"\u971C",
-    0x417B: u"\u9A12",
-    0x417C: u"\u50CF",
-    0x417D: u"\u5897",
-    0x417E: u"\u618E",
-    0x4221: u"\u81D3",
-    0x4222: u"\u8535",
-    0x4223: u"\u8D08",
-    0x4224: u"\u9020",
-    0x4225: u"\u4FC3",
-    0x4226: u"\u5074",
-    0x4227: u"\u5247",
-    0x4228: u"\u5373",
-    0x4229: u"\u606F",
-    0x422A: u"\u6349",
-    0x422B: u"\u675F",
-    0x422C: u"\u6E2C",
-    0x422D: u"\u8DB3",
-    0x422E: u"\u901F",
-    0x422F: u"\u4FD7",
-    0x4230: u"\u5C5E",
-    0x4231: u"\u8CCA",
-    0x4232: u"\u65CF",
-    0x4233: u"\u7D9A",
-    0x4234: u"\u5352",
-    0x4235: u"\u8896",
-    0x4236: u"\u5176",
-    0x4237: u"\u63C3",
-    0x4238: u"\u5B58",
-    0x4239: u"\u5B6B",
-    0x423A: u"\u5C0A",
-    0x423B: u"\u640D",
-    0x423C: u"\u6751",
-    0x423D: u"\u905C",
-    0x423E: u"\u4ED6",
-    0x423F: u"\u591A",
-    0x4240: u"\u592A",
-    0x4241: u"\u6C70",
-    0x4242: u"\u8A51",
-    0x4243: u"\u553E",
-    0x4244: u"\u5815",
-    0x4245: u"\u59A5",
-    0x4246: u"\u60F0",
-    0x4247: u"\u6253",
-    0x4248: u"\u67C1",
-    0x4249: u"\u8235",
-    0x424A: u"\u6955",
-    0x424B: u"\u9640",
-    0x424C: u"\u99C4",
-    0x424D: u"\u9A28",
-    0x424E: u"\u4F53",
-    0x424F: u"\u5806",
-    0x4250: u"\u5BFE",
-    0x4251: u"\u8010",
-    0x4252: u"\u5CB1",
-    0x4253: u"\u5E2F",
-    0x4254: u"\u5F85",
-    0x4255: u"\u6020",
-    0x4256: u"\u614B",
-    0x4257: u"\u6234",
-    0x4258: u"\u66FF",
-    0x4259: u"\u6CF0",
-    0x425A: u"\u6EDE",
-    0x425B: u"\u80CE",
-    0x425C: u"\u817F",
-    0x425D: u"\u82D4",
-    0x425E: u"\u888B",
-    0x425F: u"\u8CB8",
-    0x4260: u"\u9000",
-    0x4261: u"\u902E",
-    0x4262: u"\u968A",
-    0x4263: u"\u9EDB",
-    0x4264: u"\u9BDB",
-    0x4265: u"\u4EE3",
-    0x4266: u"\u53F0",
-    0x4267: u"\u5927",
-    0x4268: u"\u7B2C",
-    0x4269: u"\u918D",
-    0x426A: u"\u984C",
-    0x426B: u"\u9DF9",
-    0x426C: u"\u6EDD",
-    0x426D: u"\u7027",
-    0x426E: u"\u5353",
-    0x426F: u"\u5544",
-    0x4270: u"\u5B85",
-    0x4271: u"\u6258",
-    0x4272: u"\u629E",
-    0x4273: u"\u62D3",
-    0x4274: u"\u6CA2",
-    0x4275: u"\u6FEF",
-    0x4276: u"\u7422",
-    0x4277: u"\u8A17",
-    0x4278: u"\u9438",
-    0x4279: u"\u6FC1",
-    0x427A: u"\u8AFE",
-    0x427B: u"\u8338",
-    0x427C: u"\u51E7",
-    0x427D: u"\u86F8",
-    0x427E: u"\u53EA",
-    0x4321: u"\u53E9",
-    0x4322: u"\u4F46",
-    0x4323: u"\u9054",
-    0x4324: u"\u8FB0",
-    0x4325: u"\u596A",
-    0x4326: u"\u8131",
-    0x4327: u"\u5DFD",
-    0x4328: u"\u7AEA",
-    0x4329: u"\u8FBF",
-    0x432A: u"\u68DA",
-    0x432B: u"\u8C37",
-    0x432C: u"\u72F8",
-    0x432D: u"\u9C48",
-    0x432E: u"\u6A3D",
-    0x432F: u"\u8AB0",
-    0x4330: u"\u4E39",
-    0x4331: u"\u5358",
-    0x4332: u"\u5606",
-    0x4333: u"\u5766",
-    0x4334: u"\u62C5",
-    0x4335: u"\u63A2",
-    0x4336: u"\u65E6",
-    0x4337: u"\u6B4E",
-    0x4338: u"\u6DE1",
-    0x4339: u"\u6E5B",
-    0x433A: u"\u70AD",
-    0x433B: u"\u77ED",
-    0x433C: u"\u7AEF",
-    0x433D: u"\u7BAA",
-    0x433E: u"\u7DBB",
-    0x433F: u"\u803D",
-    0x4340: u"\u80C6",
-    0x4341: u"\u86CB",
-    0x4342: u"\u8A95",
-    0x4343: u"\u935B",
-    0x4344: u"\u56E3",
-    0x4345: u"\u58C7",
-    0x4346: u"\u5F3E",
-    0x4347: u"\u65AD",
-    0x4348: u"\u6696",
-    0x4349: u"\u6A80",
-    0x434A: u"\u6BB5",
-    0x434B: u"\u7537",
-    0x434C: u"\u8AC7",
-    0x434D: u"\u5024",
-    0x434E: u"\u77E5",
-    0x434F: u"\u5730",
-    0x4350: u"\u5F1B",
-    0x4351: u"\u6065",
-    0x4352: u"\u667A",
-    0x4353: u"\u6C60",
-    0x4354: u"\u75F4",
-    0x4355: u"\u7A1A",
-    0x4356: u"\u7F6E",
-    0x4357: u"\u81F4",
-    0x4358: u"\u8718",
-    0x4359: u"\u9045",
-    0x435A: u"\u99B3",
-    0x435B: u"\u7BC9",
-    0x435C: u"\u755C",
-    0x435D: u"\u7AF9",
-    0x435E: u"\u7B51",
-    0x435F: u"\u84C4",
-    0x4360: u"\u9010",
-    0x4361: u"\u79E9",
-    0x4362: u"\u7A92",
-    0x4363: u"\u8336",
-    0x4364: u"\u5AE1",
-    0x4365: u"\u7740",
-    0x4366: u"\u4E2D",
-    0x4367: u"\u4EF2",
-    0x4368: u"\u5B99",
-    0x4369: u"\u5FE0",
-    0x436A: u"\u62BD",
-    0x436B: u"\u663C",
-    0x436C: u"\u67F1",
-    0x436D: u"\u6CE8",
-    0x436E: u"\u866B",
-    0x436F: u"\u8877",
-    0x4370: u"\u8A3B",
-    0x4371: u"\u914E",
-    0x4372: u"\u92F3",
-    0x4373: u"\u99D0",
-    0x4374: u"\u6A17",
-    0x4375: u"\u7026",
-    0x4376: u"\u732A",
-    0x4377: u"\u82E7",
-    0x4378: u"\u8457",
-    0x4379: u"\u8CAF",
-    0x437A: u"\u4E01",
-    0x437B: u"\u5146",
-    0x437C: u"\u51CB",
-    0x437D: u"\u558B",
-    0x437E: u"\u5BF5",
-    0x4421: u"\u5E16",
-    0x4422: u"\u5E33",
-    0x4423: u"\u5E81",
-    0x4424: u"\u5F14",
-    0x4425: u"\u5F35",
-    0x4426: u"\u5F6B",
-    0x4427: u"\u5FB4",
-    0x4428: u"\u61F2",
-    0x4429: u"\u6311",
-    0x442A: u"\u66A2",
-    0x442B: u"\u671D",
-    0x442C: u"\u6F6E",
-    0x442D: u"\u7252",
-    0x442E: u"\u753A",
-    0x442F: u"\u773A",
-    0x4430: u"\u8074",
-    0x4431: u"\u8139",
-    0x4432: u"\u8178",
-    0x4433: u"\u8776",
-    0x4434: u"\u8ABF",
-    0x4435: u"\u8ADC",
-    0x4436: u"\u8D85",
-    0x4437: u"\u8DF3",
-    0x4438: u"\u929A",
-    0x4439: u"\u9577",
-    0x443A: u"\u9802",
-    0x443B: u"\u9CE5",
-    0x443C: u"\u52C5",
-    0x443D: u"\u6357",
-    0x443E: u"\u76F4",
-    0x443F: u"\u6715",
-    0x4440: u"\u6C88",
-    0x4441: u"\u73CD",
-    0x4442: u"\u8CC3",
-    0x4443: u"\u93AE",
-    0x4444: u"\u9673",
-    0x4445: u"\u6D25",
-    0x4446: u"\u589C",
-    0x4447: u"\u690E",
-    0x4448: u"\u69CC",
-    0x4449: u"\u8FFD",
-    0x444A: u"\u939A",
-    0x444B: u"\u75DB",
-    0x444C: u"\u901A",
-    0x444D: u"\u585A",
-    0x444E: u"\u6802",
-    0x444F: u"\u63B4",
-    0x4450: u"\u69FB",
-    0x4451: u"\u4F43",
-    0x4452: u"\u6F2C",
-    0x4453: u"\u67D8",
-    0x4454: u"\u8FBB",
-    0x4455: u"\u8526",
-    0x4456: u"\u7DB4",
-    0x4457: u"\u9354",
-    0x4458: u"\u693F",
-    0x4459: u"\u6F70",
-    0x445A: u"\u576A",
-    0x445B: u"\u58F7",
-    0x445C: u"\u5B2C",
-    0x445D: u"\u7D2C",
-    0x445E: u"\u722A",
-    0x445F: u"\u540A",
-    0x4460: u"\u91E3",
-    0x4461: u"\u9DB4",
-    0x4462: u"\u4EAD",
-    0x4463: u"\u4F4E",
-    0x4464: u"\u505C",
-    0x4465: u"\u5075",
-    0x4466: u"\u5243",
-    0x4467: u"\u8C9E",
-    0x4468: u"\u5448",
-    0x4469: u"\u5824",
-    0x446A: u"\u5B9A",
-    0x446B: u"\u5E1D",
-    0x446C: u"\u5E95",
-    0x446D: u"\u5EAD",
-    0x446E: u"\u5EF7",
-    0x446F: u"\u5F1F",
-    0x4470: u"\u608C",
-    0x4471: u"\u62B5",
-    0x4472: u"\u633A",
-    0x4473: u"\u63D0",
-    0x4474: u"\u68AF",
-    0x4475: u"\u6C40",
-    0x4476: u"\u7887",
-    0x4477: u"\u798E",
-    0x4478: u"\u7A0B",
-    0x4479: u"\u7DE0",
-    0x447A: u"\u8247",
-    0x447B: u"\u8A02",
-    0x447C: u"\u8AE6",
-    0x447D: u"\u8E44",
-    0x447E: u"\u9013",
-    0x4521: u"\u90B8",
-    0x4522: u"\u912D",
-    0x4523: u"\u91D8",
-    0x4524: u"\u9F0E",
-    0x4525: u"\u6CE5",
-    0x4526: u"\u6458",
-    0x4527: u"\u64E2",
-    0x4528: u"\u6575",
-    0x4529: u"\u6EF4",
-    0x452A: u"\u7684",
-    0x452B: u"\u7B1B",
-    0x452C: u"\u9069",
-    0x452D: u"\u93D1",
-    0x452E: u"\u6EBA",
-    0x452F: u"\u54F2",
-    0x4530: u"\u5FB9",
-    0x4531: u"\u64A4",
-    0x4532: u"\u8F4D",
-    0x4533: u"\u8FED",
-    0x4534: u"\u9244",
-    0x4535: u"\u5178",
-    0x4536: u"\u586B",
-    0x4537: u"\u5929",
-    0x4538: u"\u5C55",
-    0x4539: u"\u5E97",
-    0x453A: u"\u6DFB",
-    0x453B: u"\u7E8F",
-    0x453C: u"\u751C",
-    0x453D: u"\u8CBC",
-    0x453E: u"\u8EE2",
-    0x453F: u"\u985B",
-    0x4540: u"\u70B9",
-    0x4541: u"\u4F1D",
-    0x4542: u"\u6BBF",
-    0x4543: u"\u6FB1",
-    0x4544: u"\u7530",
-    0x4545: u"\u96FB",
-    0x4546: u"\u514E",
-    0x4547: u"\u5410",
-    0x4548: u"\u5835",
-    0x4549: u"\u5857",
-    0x454A: u"\u59AC",
-    0x454B: u"\u5C60",
-    0x454C: u"\u5F92",
-    0x454D: u"\u6597",
-    0x454E: u"\u675C",
-    0x454F: u"\u6E21",
-    0x4550: u"\u767B",
-    0x4551: u"\u83DF",
-    0x4552: u"\u8CED",
-    0x4553: u"\u9014",
-    0x4554: u"\u90FD",
-    0x4555: u"\u934D",
-    0x4556: u"\u7825",
-    0x4557: u"\u783A",
-    0x4558: u"\u52AA",
-    0x4559: u"\u5EA6",
-    0x455A: u"\u571F",
-    0x455B: u"\u5974",
-    0x455C: u"\u6012",
-    0x455D: u"\u5012",
-    0x455E: u"\u515A",
-    0x455F: u"\u51AC",
-    0x4560: u"\u51CD",
-    0x4561: u"\u5200",
-    0x4562: u"\u5510",
-    0x4563: u"\u5854",
-    0x4564: u"\u5858",
-    0x4565: u"\u5957",
-    0x4566: u"\u5B95",
-    0x4567: u"\u5CF6",
-    0x4568: u"\u5D8B",
-    0x4569: u"\u60BC",
-    0x456A: u"\u6295",
-    0x456B: u"\u642D",
-    0x456C: u"\u6771",
-    0x456D: u"\u6843",
-    0x456E: u"\u68BC",
-    0x456F: u"\u68DF",
-    0x4570: u"\u76D7",
-    0x4571: u"\u6DD8",
-    0x4572: u"\u6E6F",
-    0x4573: u"\u6D9B",
-    0x4574: u"\u706F",
-    0x4575: u"\u71C8",
-    0x4576: u"\u5F53",
-    0x4577: u"\u75D8",
-    0x4578: u"\u7977",
-    0x4579: u"\u7B49",
-    0x457A: u"\u7B54",
-    0x457B: u"\u7B52",
-    0x457C: u"\u7CD6",
-    0x457D: u"\u7D71",
-    0x457E: u"\u5230",
-    0x4621: u"\u8463",
-    0x4622: u"\u8569",
-    0x4623: u"\u85E4",
-    0x4624: u"\u8A0E",
-    0x4625: u"\u8B04",
-    0x4626: u"\u8C46",
-    0x4627: u"\u8E0F",
-    0x4628: u"\u9003",
-    0x4629: u"\u900F",
-    0x462A: u"\u9419",
-    0x462B: u"\u9676",
-    0x462C: u"\u982D",
-    0x462D: u"\u9A30",
-    0x462E: u"\u95D8",
-    0x462F: u"\u50CD",
-    0x4630: u"\u52D5",
-    0x4631: u"\u540C",
-    0x4632: u"\u5802",
-    0x4633: u"\u5C0E",
-    0x4634: u"\u61A7",
-    0x4635: u"\u649E",
-    0x4636: u"\u6D1E",
-    0x4637: u"\u77B3",
-    0x4638: u"\u7AE5",
-    0x4639: u"\u80F4",
-    0x463A: u"\u8404",
-    0x463B: u"\u9053",
-    0x463C: u"\u9285",
-    0x463D: u"\u5CE0",
-    0x463E: u"\u9D07",
-    0x463F: u"\u533F",
-    0x4640: u"\u5F97",
-    0x4641: u"\u5FB3",
-    0x4642: u"\u6D9C",
-    0x4643: u"\u7279",
-    0x4644: u"\u7763",
-    0x4645: u"\u79BF",
-    0x4646: u"\u7BE4",
-    0x4647: u"\u6BD2",
-    0x4648: u"\u72EC",
-    0x4649: u"\u8AAD",
-    0x464A: u"\u6803",
-    0x464B: u"\u6A61",
-    0x464C: u"\u51F8",
-    0x464D: u"\u7A81",
-    0x464E: u"\u6934",
-    0x464F: u"\u5C4A",
-    0x4650: u"\u9CF6",
-    0x4651: u"\u82EB",
-    0x4652: u"\u5BC5",
-    0x4653: u"\u9149",
-    0x4654: u"\u701E",
-    0x4655: u"\u5678",
-    0x4656: u"\u5C6F",
-    0x4657: u"\u60C7",
-    0x4658: u"\u6566",
-    0x4659: u"\u6C8C",
-    0x465A: u"\u8C5A",
-    0x465B: u"\u9041",
-    0x465C: u"\u9813",
-    0x465D: u"\u5451",
-    0x465E: u"\u66C7",
-    0x465F: u"\u920D",
-    0x4660: u"\u5948",
-    0x4661: u"\u90A3",
-    0x4662: u"\u5185",
-    0x4663: u"\u4E4D",
-    0x4664: u"\u51EA",
-    0x4665: u"\u8599",
-    0x4666: u"\u8B0E",
-    0x4667: u"\u7058",
-    0x4668: u"\u637A",
-    0x4669: u"\u934B",
-    0x466A: u"\u6962",
-    0x466B: u"\u99B4",
-    0x466C: u"\u7E04",
-    0x466D: u"\u7577",
-    0x466E: u"\u5357",
-    0x466F: u"\u6960",
-    0x4670: u"\u8EDF",
-    0x4671: u"\u96E3",
-    0x4672: u"\u6C5D",
-    0x4673: u"\u4E8C",
-    0x4674: u"\u5C3C",
-    0x4675: u"\u5F10",
-    0x4676: u"\u8FE9",
-    0x4677: u"\u5302",
-    0x4678: u"\u8CD1",
-    0x4679: u"\u8089",
-    0x467A: u"\u8679",
-    0x467B: u"\u5EFF",
-    0x467C: u"\u65E5",
-    0x467D: u"\u4E73",
-    0x467E: u"\u5165",
-    0x4721: u"\u5982",
-    0x4722: u"\u5C3F",
-    0x4723: u"\u97EE",
-    0x4724: u"\u4EFB",
-    0x4725: u"\u598A",
-    0x4726: u"\u5FCD",
-    0x4727: u"\u8A8D",
-    0x4728: u"\u6FE1",
-    0x4729: u"\u79B0",
-    0x472A: u"\u7962",
-    0x472B: u"\u5BE7",
-    0x472C: u"\u8471",
-    0x472D: u"\u732B",
-    0x472E: u"\u71B1",
-    0x472F: u"\u5E74",
-    0x4730: u"\u5FF5",
-    0x4731: u"\u637B",
-    0x4732: u"\u649A",
-    0x4733: u"\u71C3",
-    0x4734: u"\u7C98",
-    0x4735: u"\u4E43",
-    0x4736: u"\u5EFC",
-    0x4737: u"\u4E4B",
-    0x4738: u"\u57DC",
-    0x4739: u"\u56A2",
-    0x473A: u"\u60A9",
-    0x473B: u"\u6FC3",
-    0x473C: u"\u7D0D",
-    0x473D: u"\u80FD",
-    0x473E: u"\u8133",
-    0x473F: u"\u81BF",
-    0x4740: u"\u8FB2",
-    0x4741: u"\u8997",
-    0x4742: u"\u86A4",
-    0x4743: u"\u5DF4",
-    0x4744: u"\u628A",
-    0x4745: u"\u64AD",
-    0x4746: u"\u8987",
-    0x4747: u"\u6777",
-    0x4748: u"\u6CE2",
-    0x4749: u"\u6D3E",
-    0x474A: u"\u7436",
-    0x474B: u"\u7834",
-    0x474C: u"\u5A46",
-    0x474D: u"\u7F75",
-    0x474E: u"\u82AD",
-    0x474F: u"\u99AC",
-    0x4750: u"\u4FF3",
-    0x4751: u"\u5EC3",
-    0x4752: u"\u62DD",
-    0x4753: u"\u6392",
-    0x4754: u"\u6557",
-    0x4755: u"\u676F",
-    0x4756: u"\u76C3",
-    0x4757: u"\u724C",
-    0x4758: u"\u80CC",
-    0x4759: u"\u80BA",
-    0x475A: u"\u8F29",
-    0x475B: u"\u914D",
-    0x475C: u"\u500D",
-    0x475D: u"\u57F9",
-    0x475E: u"\u5A92",
-    0x475F: u"\u6885",
-    0x4760: u"\u6973",
-    0x4761: u"\u7164",
-    0x4762: u"\u72FD",
-    0x4763: u"\u8CB7",
-    0x4764: u"\u58F2",
-    0x4765: u"\u8CE0",
-    0x4766: u"\u966A",
-    0x4767: u"\u9019",
-    0x4768: u"\u877F",
-    0x4769: u"\u79E4",
-    0x476A: u"\u77E7",
-    0x476B: u"\u8429",
-    0x476C: u"\u4F2F",
-    0x476D: u"\u5265",
-    0x476E: u"\u535A",
-    0x476F: u"\u62CD",
-    0x4770: u"\u67CF",
-    0x4771: u"\u6CCA",
-    0x4772: u"\u767D",
-    0x4773: u"\u7B94",
-    0x4774: u"\u7C95",
-    0x4775: u"\u8236",
-    0x4776: u"\u8584",
-    0x4777: u"\u8FEB",
-    0x4778: u"\u66DD",
-    0x4779: u"\u6F20",
-    0x477A: u"\u7206",
-    0x477B: u"\u7E1B",
-    0x477C: u"\u83AB",
-    0x477D: u"\u99C1",
-    0x477E: u"\u9EA6",
-    0x4821: u"\u51FD",
-    0x4822: u"\u7BB1",
-    0x4823: u"\u7872",
-    0x4824: u"\u7BB8",
-    0x4825: u"\u8087",
-    0x4826: u"\u7B48",
-    0x4827: u"\u6AE8",
-    0x4828: u"\u5E61",
-    0x4829: u"\u808C",
-    0x482A: u"\u7551",
-    0x482B: u"\u7560",
-    0x482C: u"\u516B",
-    0x482D: u"\u9262",
-    0x482E: u"\u6E8C",
-    0x482F: u"\u767A",
-    0x4830: u"\u9197",
-    0x4831: u"\u9AEA",
-    0x4832: u"\u4F10",
-    0x4833: u"\u7F70",
-    0x4834: u"\u629C",
-    0x4835: u"\u7B4F",
-    0x4836: u"\u95A5",
-    0x4837: u"\u9CE9",
-    0x4838: u"\u567A",
-    0x4839: u"\u5859",
-    0x483A: u"\u86E4",
-    0x483B: u"\u96BC",
-    0x483C: u"\u4F34",
-    0x483D: u"\u5224",
-    0x483E: u"\u534A",
-    0x483F: u"\u53CD",
-    0x4840: u"\u53DB",
-    0x4841: u"\u5E06",
-    0x4842: u"\u642C",
-    0x4843: u"\u6591",
-    0x4844: u"\u677F",
-    0x4845: u"\u6C3E",
-    0x4846: u"\u6C4E",
-    0x4847: u"\u7248",
-    0x4848: u"\u72AF",
-    0x4849: u"\u73ED",
-    0x484A: u"\u7554",
-    0x484B: u"\u7E41",
-    0x484C: u"\u822C",
-    0x484D: u"\u85E9",
-    0x484E: u"\u8CA9",
-    0x484F: u"\u7BC4",
-    0x4850: u"\u91C6",
-    0x4851: u"\u7169",
-    0x4852: u"\u9812",
-    0x4853: u"\u98EF",
-    0x4854: u"\u633D",
-    0x4855: u"\u6669",
-    0x4856: u"\u756A",
-    0x4857: u"\u76E4",
-    0x4858: u"\u78D0",
-    0x4859: u"\u8543",
-    0x485A: u"\u86EE",
-    0x485B: u"\u532A",
-    0x485C: u"\u5351",
-    0x485D: u"\u5426",
-    0x485E: u"\u5983",
-    0x485F: u"\u5E87",
-    0x4860: u"\u5F7C",
-    0x4861: u"\u60B2",
-    0x4862: u"\u6249",
-    0x4863: u"\u6279",
-    0x4864: u"\u62AB",
-    0x4865: u"\u6590",
-    0x4866: u"\u6BD4",
-    0x4867: u"\u6CCC",
-    0x4868: u"\u75B2",
-    0x4869: u"\u76AE",
-    0x486A: u"\u7891",
-    0x486B: u"\u79D8",
-    0x486C: u"\u7DCB",
-    0x486D: u"\u7F77",
-    0x486E: u"\u80A5",
-    0x486F: u"\u88AB",
-    0x4870: u"\u8AB9",
-    0x4871: u"\u8CBB",
-    0x4872: u"\u907F",
-    0x4873: u"\u975E",
-    0x4874: u"\u98DB",
-    0x4875: u"\u6A0B",
-    0x4876: u"\u7C38",
-    0x4877: u"\u5099",
-    0x4878: u"\u5C3E",
-    0x4879: u"\u5FAE",
-    0x487A: u"\u6787",
-    0x487B: u"\u6BD8",
-    0x487C: u"\u7435",
-    0x487D: u"\u7709",
-    0x487E: u"\u7F8E",
-    0x4921: u"\u9F3B",
-    0x4922: u"\u67CA",
-    0x4923: u"\u7A17",
-    0x4924: u"\u5339",
-    0x4925: u"\u758B",
-    0x4926: u"\u9AED",
-    0x4927: u"\u5F66",
-    0x4928: u"\u819D",
-    0x4929: u"\u83F1",
-    0x492A: u"\u8098",
-    0x492B: u"\u5F3C",
-    0x492C: u"\u5FC5",
-    0x492D: u"\u7562",
-    0x492E: u"\u7B46",
-    0x492F: u"\u903C",
-    0x4930: u"\u6867",
-    0x4931: u"\u59EB",
-    0x4932: u"\u5A9B",
-    0x4933: u"\u7D10",
-    0x4934: u"\u767E",
-    0x4935: u"\u8B2C",
-    0x4936: u"\u4FF5",
-    0x4937: u"\u5F6A",
-    0x4938: u"\u6A19",
-    0x4939: u"\u6C37",
-    0x493A: u"\u6F02",
-    0x493B: u"\u74E2",
-    0x493C: u"\u7968",
-    0x493D: u"\u8868",
-    0x493E: u"\u8A55",
-    0x493F: u"\u8C79",
-    0x4940: u"\u5EDF",
-    0x4941: u"\u63CF",
-    0x4942: u"\u75C5",
-    0x4943: u"\u79D2",
-    0x4944: u"\u82D7",
-    0x4945: u"\u9328",
-    0x4946: u"\u92F2",
-    0x4947: u"\u849C",
-    0x4948: u"\u86ED",
-    0x4949: u"\u9C2D",
-    0x494A: u"\u54C1",
-    0x494B: u"\u5F6C",
-    0x494C: u"\u658C",
-    0x494D: u"\u6D5C",
-    0x494E: u"\u7015",
-    0x494F: u"\u8CA7",
-    0x4950: u"\u8CD3",
-    0x4951: u"\u983B",
-    0x4952: u"\u654F",
-    0x4953: u"\u74F6",
-    0x4954: u"\u4E0D",
-    0x4955: u"\u4ED8",
-    0x4956: u"\u57E0",
-    0x4957: u"\u592B",
-    0x4958: u"\u5A66",
-    0x4959: u"\u5BCC",
-    0x495A: u"\u51A8",
-    0x495B: u"\u5E03",
-    0x495C: u"\u5E9C",
-    0x495D: u"\u6016",
-    0x495E: u"\u6276",
-    0x495F: u"\u6577",
-    0x4960: u"\u65A7",
-    0x4961: u"\u666E",
-    0x4962: u"\u6D6E",
-    0x4963: u"\u7236",
-    0x4964: u"\u7B26",
-    0x4965: u"\u8150",
-    0x4966: u"\u819A",
-    0x4967: u"\u8299",
-    0x4968: u"\u8B5C",
-    0x4969: u"\u8CA0",
-    0x496A: u"\u8CE6",
-    0x496B: u"\u8D74",
-    0x496C: u"\u961C",
-    0x496D: u"\u9644",
-    0x496E: u"\u4FAE",
-    0x496F: u"\u64AB",
-    0x4970: u"\u6B66",
-    0x4971: u"\u821E",
-    0x4972: u"\u8461",
-    0x4973: u"\u856A",
-    0x4974: u"\u90E8",
-    0x4975: u"\u5C01",
-    0x4976: u"\u6953",
-    0x4977: u"\u98A8",
-    0x4978: u"\u847A",
-    0x4979: u"\u8557",
-    0x497A: u"\u4F0F",
-    0x497B: u"\u526F",
-    0x497C: u"\u5FA9",
-    0x497D: u"\u5E45",
-    0x497E: u"\u670D",
-    0x4A21: u"\u798F",
-    0x4A22: u"\u8179",
-    0x4A23: u"\u8907",
-    0x4A24: u"\u8986",
-    0x4A25: u"\u6DF5",
-    0x4A26: u"\u5F17",
-    0x4A27: u"\u6255",
-    0x4A28: u"\u6CB8",
-    0x4A29: u"\u4ECF",
-    0x4A2A: u"\u7269",
-    0x4A2B: u"\u9B92",
-    0x4A2C: u"\u5206",
-    0x4A2D: u"\u543B",
-    0x4A2E: u"\u5674",
-    0x4A2F: u"\u58B3",
-    0x4A30: u"\u61A4",
-    0x4A31: u"\u626E",
-    0x4A32: u"\u711A",
-    0x4A33: u"\u596E",
-    0x4A34: u"\u7C89",
-    0x4A35: u"\u7CDE",
-    0x4A36: u"\u7D1B",
-    0x4A37: u"\u96F0",
-    0x4A38: u"\u6587",
-    0x4A39: u"\u805E",
-    0x4A3A: u"\u4E19",
-    0x4A3B: u"\u4F75",
-    0x4A3C: u"\u5175",
-    0x4A3D: u"\u5840",
-    0x4A3E: u"\u5E63",
-    0x4A3F: u"\u5E73",
-    0x4A40: u"\u5F0A",
-    0x4A41: u"\u67C4",
-    0x4A42: u"\u4E26",
-    0x4A43: u"\u853D",
-    0x4A44: u"\u9589",
-    0x4A45: u"\u965B",
-    0x4A46: u"\u7C73",
-    0x4A47: u"\u9801",
-    0x4A48: u"\u50FB",
-    0x4A49: u"\u58C1",
-    0x4A4A: u"\u7656",
-    0x4A4B: u"\u78A7",
-    0x4A4C: u"\u5225",
-    0x4A4D: u"\u77A5",
-    0x4A4E: u"\u8511",
-    0x4A4F: u"\u7B86",
-    0x4A50: u"\u504F",
-    0x4A51: u"\u5909",
-    0x4A52: u"\u7247",
-    0x4A53: u"\u7BC7",
-    0x4A54: u"\u7DE8",
-    0x4A55: u"\u8FBA",
-    0x4A56: u"\u8FD4",
-    0x4A57: u"\u904D",
-    0x4A58: u"\u4FBF",
-    0x4A59: u"\u52C9",
-    0x4A5A: u"\u5A29",
-    0x4A5B: u"\u5F01",
-    0x4A5C: u"\u97AD",
-    0x4A5D: u"\u4FDD",
-    0x4A5E: u"\u8217",
-    0x4A5F: u"\u92EA",
-    0x4A60: u"\u5703",
-    0x4A61: u"\u6355",
-    0x4A62: u"\u6B69",
-    0x4A63: u"\u752B",
-    0x4A64: u"\u88DC",
-    0x4A65: u"\u8F14",
-    0x4A66: u"\u7A42",
-    0x4A67: u"\u52DF",
-    0x4A68: u"\u5893",
-    0x4A69: u"\u6155",
-    0x4A6A: u"\u620A",
-    0x4A6B: u"\u66AE",
-    0x4A6C: u"\u6BCD",
-    0x4A6D: u"\u7C3F",
-    0x4A6E: u"\u83E9",
-    0x4A6F: u"\u5023",
-    0x4A70: u"\u4FF8",
-    0x4A71: u"\u5305",
-    0x4A72: u"\u5446",
-    0x4A73: u"\u5831",
-    0x4A74: u"\u5949",
-    0x4A75: u"\u5B9D",
-    0x4A76: u"\u5CF0",
-    0x4A77: u"\u5CEF",
-    0x4A78: u"\u5D29",
-    0x4A79: u"\u5E96",
-    0x4A7A: u"\u62B1",
-    0x4A7B: u"\u6367",
-    0x4A7C: u"\u653E",
-    0x4A7D: u"\u65B9",
-    0x4A7E: u"\u670B",
-    0x4B21: u"\u6CD5",
-    0x4B22: u"\u6CE1",
-    0x4B23: u"\u70F9",
-    0x4B24: u"\u7832",
-    0x4B25: u"\u7E2B",
-    0x4B26: u"\u80DE",
-    0x4B27: u"\u82B3",
-    0x4B28: u"\u840C",
-    0x4B29: u"\u84EC",
-    0x4B2A: u"\u8702",
-    0x4B2B: u"\u8912",
-    0x4B2C: u"\u8A2A",
-    0x4B2D: u"\u8C4A",
-    0x4B2E: u"\u90A6",
-    0x4B2F: u"\u92D2",
-    0x4B30: u"\u98FD",
-    0x4B31: u"\u9CF3",
-    0x4B32: u"\u9D6C",
-    0x4B33: u"\u4E4F",
-    0x4B34: u"\u4EA1",
-    0x4B35: u"\u508D",
-    0x4B36: u"\u5256",
-    0x4B37: u"\u574A",
-    0x4B38: u"\u59A8",
-    0x4B39: u"\u5E3D",
-    0x4B3A: u"\u5FD8",
-    0x4B3B: u"\u5FD9",
-    0x4B3C: u"\u623F",
-    0x4B3D: u"\u66B4",
-    0x4B3E: u"\u671B",
-    0x4B3F: u"\u67D0",
-    0x4B40: u"\u68D2",
-    0x4B41: u"\u5192",
-    0x4B42: u"\u7D21",
-    0x4B43: u"\u80AA",
-    0x4B44: u"\u81A8",
-    0x4B45: u"\u8B00",
-    0x4B46: u"\u8C8C",
-    0x4B47: u"\u8CBF",
-    0x4B48: u"\u927E",
-    0x4B49: u"\u9632",
-    0x4B4A: u"\u5420",
-    0x4B4B: u"\u982C",
-    0x4B4C: u"\u5317",
-    0x4B4D: u"\u50D5",
-    0x4B4E: u"\u535C",
-    0x4B4F: u"\u58A8",
-    0x4B50: u"\u64B2",
-    0x4B51: u"\u6734",
-    0x4B52: u"\u7267",
-    0x4B53: u"\u7766",
-    0x4B54: u"\u7A46",
-    0x4B55: u"\u91E6",
-    0x4B56: u"\u52C3",
-    0x4B57: u"\u6CA1",
-    0x4B58: u"\u6B86",
-    0x4B59: u"\u5800",
-    0x4B5A: u"\u5E4C",
-    0x4B5B: u"\u5954",
-    0x4B5C: u"\u672C",
-    0x4B5D: u"\u7FFB",
-    0x4B5E: u"\u51E1",
-    0x4B5F: u"\u76C6",
-    0x4B60: u"\u6469",
-    0x4B61: u"\u78E8",
-    0x4B62: u"\u9B54",
-    0x4B63: u"\u9EBB",
-    0x4B64: u"\u57CB",
-    0x4B65: u"\u59B9",
-    0x4B66: u"\u6627",
-    0x4B67: u"\u679A",
-    0x4B68: u"\u6BCE",
-    0x4B69: u"\u54E9",
-    0x4B6A: u"\u69D9",
-    0x4B6B: u"\u5E55",
-    0x4B6C: u"\u819C",
-    0x4B6D: u"\u6795",
-    0x4B6E: u"\u9BAA",
-    0x4B6F: u"\u67FE",
-    0x4B70: u"\u9C52",
-    0x4B71: u"\u685D",
-    0x4B72: u"\u4EA6",
-    0x4B73: u"\u4FE3",
-    0x4B74: u"\u53C8",
-    0x4B75: u"\u62B9",
-    0x4B76: u"\u672B",
-    0x4B77: u"\u6CAB",
-    0x4B78: u"\u8FC4",
-    0x4B79: u"\u4FAD",
-    0x4B7A: u"\u7E6D",
-    0x4B7B: u"\u9EBF",
-    0x4B7C: u"\u4E07",
-    0x4B7D: u"\u6162",
-    0x4B7E: u"\u6E80",
-    0x4C21: u"\u6F2B",
-    0x4C22: u"\u8513",
-    0x4C23: u"\u5473",
-    0x4C24: u"\u672A",
-    0x4C25: u"\u9B45",
-    0x4C26: u"\u5DF3",
-    0x4C27: u"\u7B95",
-    0x4C28: u"\u5CAC",
-    0x4C29: u"\u5BC6",
-    0x4C2A: u"\u871C",
-    0x4C2B: u"\u6E4A",
-    0x4C2C: u"\u84D1",
-    0x4C2D: u"\u7A14",
-    0x4C2E: u"\u8108",
-    0x4C2F: u"\u5999",
-    0x4C30: u"\u7C8D",
-    0x4C31: u"\u6C11",
-    0x4C32: u"\u7720",
-    0x4C33: u"\u52D9",
-    0x4C34: u"\u5922",
-    0x4C35: u"\u7121",
-    0x4C36: u"\u725F",
-    0x4C37: u"\u77DB",
-    0x4C38: u"\u9727",
-    0x4C39: u"\u9D61",
-    0x4C3A: u"\u690B",
-    0x4C3B: u"\u5A7F",
-    0x4C3C: u"\u5A18",
-    0x4C3D: u"\u51A5",
-    0x4C3E: u"\u540D",
-    0x4C3F: u"\u547D",
-    0x4C40: u"\u660E",
-    0x4C41: u"\u76DF",
-    0x4C42: u"\u8FF7",
-    0x4C43: u"\u9298",
-    0x4C44: u"\u9CF4",
-    0x4C45: u"\u59EA",
-    0x4C46: u"\u725D",
-    0x4C47: u"\u6EC5",
-    0x4C48: u"\u514D",
-    0x4C49: u"\u68C9",
-    0x4C4A: u"\u7DBF",
-    0x4C4B: u"\u7DEC",
-    0x4C4C: u"\u9762",
-    0x4C4D: u"\u9EBA",
-    0x4C4E: u"\u6478",
-    0x4C4F: u"\u6A21",
-    0x4C50: u"\u8302",
-    0x4C51: u"\u5984",
-    0x4C52: u"\u5B5F",
-    0x4C53: u"\u6BDB",
-    0x4C54: u"\u731B",
-    0x4C55: u"\u76F2",
-    0x4C56: u"\u7DB2",
-    0x4C57: u"\u8017",
-    0x4C58: u"\u8499",
-    0x4C59: u"\u5132",
-    0x4C5A: u"\u6728",
-    0x4C5B: u"\u9ED9",
-    0x4C5C: u"\u76EE",
-    0x4C5D: u"\u6762",
-    0x4C5E: u"\u52FF",
-    0x4C5F: u"\u9905",
-    0x4C60: u"\u5C24",
-    0x4C61: u"\u623B",
-    0x4C62: u"\u7C7E",
-    0x4C63: u"\u8CB0",
-    0x4C64: u"\u554F",
-    0x4C65: u"\u60B6",
-    0x4C66: u"\u7D0B",
-    0x4C67: u"\u9580",
-    0x4C68: u"\u5301",
-    0x4C69: u"\u4E5F",
-    0x4C6A: u"\u51B6",
-    0x4C6B: u"\u591C",
-    0x4C6C: u"\u723A",
-    0x4C6D: u"\u8036",
-    0x4C6E: u"\u91CE",
-    0x4C6F: u"\u5F25",
-    0x4C70: u"\u77E2",
-    0x4C71: u"\u5384",
-    0x4C72: u"\u5F79",
-    0x4C73: u"\u7D04",
-    0x4C74: u"\u85AC",
-    0x4C75: u"\u8A33",
-    0x4C76: u"\u8E8D",
-    0x4C77: u"\u9756",
-    0x4C78: u"\u67F3",
-    0x4C79: u"\u85AE",
-    0x4C7A: u"\u9453",
-    0x4C7B: u"\u6109",
-    0x4C7C: u"\u6108",
-    0x4C7D: u"\u6CB9",
-    0x4C7E: u"\u7652",
-    0x4D21: u"\u8AED",
-    0x4D22: u"\u8F38",
-    0x4D23: u"\u552F",
-    0x4D24: u"\u4F51",
-    0x4D25: u"\u512A",
-    0x4D26: u"\u52C7",
-    0x4D27: u"\u53CB",
-    0x4D28: u"\u5BA5",
-    0x4D29: u"\u5E7D",
-    0x4D2A: u"\u60A0",
-    0x4D2B: u"\u6182",
-    0x4D2C: u"\u63D6",
-    0x4D2D: u"\u6709",
-    0x4D2E: u"\u67DA",
-    0x4D2F: u"\u6E67",
-    0x4D30: u"\u6D8C",
-    0x4D31: u"\u7336",
-    0x4D32: u"\u7337",
-    0x4D33: u"\u7531",
-    0x4D34: u"\u7950",
-    0x4D35: u"\u88D5",
-    0x4D36: u"\u8A98",
-    0x4D37: u"\u904A",
-    0x4D38: u"\u9091",
-    0x4D39: u"\u90F5",
-    0x4D3A: u"\u96C4",
-    0x4D3B: u"\u878D",
-    0x4D3C: u"\u5915",
-    0x4D3D: u"\u4E88",
-    0x4D3E: u"\u4F59",
-    0x4D3F: u"\u4E0E",
-    0x4D40: u"\u8A89",
-    0x4D41: u"\u8F3F",
-    0x4D42: u"\u9810",
-    0x4D43: u"\u50AD",
-    0x4D44: u"\u5E7C",
-    0x4D45: u"\u5996",
-    0x4D46: u"\u5BB9",
-    0x4D47: u"\u5EB8",
-    0x4D48: u"\u63DA",
-    0x4D49: u"\u63FA",
-    0x4D4A: u"\u64C1",
-    0x4D4B: u"\u66DC",
-    0x4D4C: u"\u694A",
-    0x4D4D: u"\u69D8",
-    0x4D4E: u"\u6D0B",
-    0x4D4F: u"\u6EB6",
-    0x4D50: u"\u7194",
-    0x4D51: u"\u7528",
-    0x4D52: u"\u7AAF",
-    0x4D53: u"\u7F8A",
-    0x4D54: u"\u8000",
-    0x4D55: u"\u8449",
-    0x4D56: u"\u84C9",
-    0x4D57: u"\u8981",
-    0x4D58: u"\u8B21",
-    0x4D59: u"\u8E0A",
-    0x4D5A: u"\u9065",
-    0x4D5B: u"\u967D",
-    0x4D5C: u"\u990A",
-    0x4D5D: u"\u617E",
-    0x4D5E: u"\u6291",
-    0x4D5F: u"\u6B32",
-    0x4D60: u"\u6C83",
-    0x4D61: u"\u6D74",
-    0x4D62: u"\u7FCC",
-    0x4D63: u"\u7FFC",
-    0x4D64: u"\u6DC0",
-    0x4D65: u"\u7F85",
-    0x4D66: u"\u87BA",
-    0x4D67: u"\u88F8",
-    0x4D68: u"\u6765",
-    0x4D69: u"\u83B1",
-    0x4D6A: u"\u983C",
-    0x4D6B: u"\u96F7",
-    0x4D6C: u"\u6D1B",
-    0x4D6D: u"\u7D61",
-    0x4D6E: u"\u843D",
-    0x4D6F: u"\u916A",
-    0x4D70: u"\u4E71",
-    0x4D71: u"\u5375",
-    0x4D72: u"\u5D50",
-    0x4D73: u"\u6B04",
-    0x4D74: u"\u6FEB",
-    0x4D75: u"\u85CD",
-    0x4D76: u"\u862D",
-    0x4D77: u"\u89A7",
-    0x4D78: u"\u5229",
-    0x4D79: u"\u540F",
-    0x4D7A: u"\u5C65",
-    0x4D7B: u"\u674E",
-    0x4D7C: u"\u68A8",
-    0x4D7D: u"\u7406",
-    0x4D7E: u"\u7483",
-    0x4E21: u"\u75E2",
-    0x4E22: u"\u88CF",
-    0x4E23: u"\u88E1",
-    0x4E24: u"\u91CC",
-    0x4E25: u"\u96E2",
-    0x4E26: u"\u9678",
-    0x4E27: u"\u5F8B",
-    0x4E28: u"\u7387",
-    0x4E29: u"\u7ACB",
-    0x4E2A: u"\u844E",
-    0x4E2B: u"\u63A0",
-    0x4E2C: u"\u7565",
-    0x4E2D: u"\u5289",
-    0x4E2E: u"\u6D41",
-    0x4E2F: u"\u6E9C",
-    0x4E30: u"\u7409",
-    0x4E31: u"\u7559",
-    0x4E32: u"\u786B",
-    0x4E33: u"\u7C92",
-    0x4E34: u"\u9686",
-    0x4E35: u"\u7ADC",
-    0x4E36: u"\u9F8D",
-    0x4E37: u"\u4FB6",
-    0x4E38: u"\u616E",
-    0x4E39: u"\u65C5",
-    0x4E3A: u"\u865C",
-    0x4E3B: u"\u4E86",
-    0x4E3C: u"\u4EAE",
-    0x4E3D: u"\u50DA",
-    0x4E3E: u"\u4E21",
-    0x4E3F: u"\u51CC",
-    0x4E40: u"\u5BEE",
-    0x4E41: u"\u6599",
-    0x4E42: u"\u6881",
-    0x4E43: u"\u6DBC",
-    0x4E44: u"\u731F",
-    0x4E45: u"\u7642",
-    0x4E46: u"\u77AD",
-    0x4E47: u"\u7A1C",
-    0x4E48: u"\u7CE7",
-    0x4E49: u"\u826F",
-    0x4E4A: u"\u8AD2",
-    0x4E4B: u"\u907C",
-    0x4E4C: u"\u91CF",
-    0x4E4D: u"\u9675",
-    0x4E4E: u"\u9818",
-    0x4E4F: u"\u529B",
-    0x4E50: u"\u7DD1",
-    0x4E51: u"\u502B",
-    0x4E52: u"\u5398",
-    0x4E53: u"\u6797",
-    0x4E54: u"\u6DCB",
-    0x4E55: u"\u71D0",
-    0x4E56: u"\u7433",
-    0x4E57: u"\u81E8",
-    0x4E58: u"\u8F2A",
-    0x4E59: u"\u96A3",
-    0x4E5A: u"\u9C57",
-    0x4E5B: u"\u9E9F",
-    0x4E5C: u"\u7460",
-    0x4E5D: u"\u5841",
-    0x4E5E: u"\u6D99",
-    0x4E5F: u"\u7D2F",
-    0x4E60: u"\u985E",
-    0x4E61: u"\u4EE4",
-    0x4E62: u"\u4F36",
-    0x4E63: u"\u4F8B",
-    0x4E64: u"\u51B7",
-    0x4E65: u"\u52B1",
-    0x4E66: u"\u5DBA",
-    0x4E67: u"\u601C",
-    0x4E68: u"\u73B2",
-    0x4E69: u"\u793C",
-    0x4E6A: u"\u82D3",
-    0x4E6B: u"\u9234",
-    0x4E6C: u"\u96B7",
-    0x4E6D: u"\u96F6",
-    0x4E6E: u"\u970A",
-    0x4E6F: u"\u9E97",
-    0x4E70: u"\u9F62",
-    0x4E71: u"\u66A6",
-    0x4E72: u"\u6B74",
-    0x4E73: u"\u5217",
-    0x4E74: u"\u52A3",
-    0x4E75: u"\u70C8",
-    0x4E76: u"\u88C2",
-    0x4E77: u"\u5EC9",
-    0x4E78: u"\u604B",
-    0x4E79: u"\u6190",
-    0x4E7A: u"\u6F23",
-    0x4E7B: u"\u7149",
-    0x4E7C: u"\u7C3E",
-    0x4E7D: u"\u7DF4",
-    0x4E7E: u"\u806F",
-    0x4F21: u"\u84EE",
-    0x4F22: u"\u9023",
-    0x4F23: u"\u932C",
-    0x4F24: u"\u5442",
-    0x4F25: u"\u9B6F",
-    0x4F26: u"\u6AD3",
-    0x4F27: u"\u7089",
-    0x4F28: u"\u8CC2",
-    0x4F29: u"\u8DEF",
-    0x4F2A: u"\u9732",
-    0x4F2B: u"\u52B4",
-    0x4F2C: u"\u5A41",
-    0x4F2D: u"\u5ECA",
-    0x4F2E: u"\u5F04",
-    0x4F2F: u"\u6717",
-    0x4F30: u"\u697C",
-    0x4F31: u"\u6994",
-    0x4F32: u"\u6D6A",
-    0x4F33: u"\u6F0F",
-    0x4F34: u"\u7262",
-    0x4F35: u"\u72FC",
-    0x4F36: u"\u7BED",
-    0x4F37: u"\u8001",
-    0x4F38: u"\u807E",
-    0x4F39: u"\u874B",
-    0x4F3A: u"\u90CE",
-    0x4F3B: u"\u516D",
-    0x4F3C: u"\u9E93",
-    0x4F3D: u"\u7984",
-    0x4F3E: u"\u808B",
-    0x4F3F: u"\u9332",
-    0x4F40: u"\u8AD6",
-    0x4F41: u"\u502D",
-    0x4F42: u"\u548C",
-    0x4F43: u"\u8A71",
-    0x4F44: u"\u6B6A",
-    0x4F45: u"\u8CC4",
-    0x4F46: u"\u8107",
-    0x4F47: u"\u60D1",
-    0x4F48: u"\u67A0",
-    0x4F49: u"\u9DF2",
-    0x4F4A: u"\u4E99",
-    0x4F4B: u"\u4E98",
-    0x4F4C: u"\u9C10",
-    0x4F4D: u"\u8A6B",
-    0x4F4E: u"\u85C1",
-    0x4F4F: u"\u8568",
-    0x4F50: u"\u6900",
-    0x4F51: u"\u6E7E",
-    0x4F52: u"\u7897",
-    0x4F53: u"\u8155",
-    0x5021: u"\u5F0C",
-    0x5022: u"\u4E10",
-    0x5023: u"\u4E15",
-    0x5024: u"\u4E2A",
-    0x5025: u"\u4E31",
-    0x5026: u"\u4E36",
-    0x5027: u"\u4E3C",
-    0x5028: u"\u4E3F",
-    0x5029: u"\u4E42",
-    0x502A: u"\u4E56",
-    0x502B: u"\u4E58",
-    0x502C: u"\u4E82",
-    0x502D: u"\u4E85",
-    0x502E: u"\u8C6B",
-    0x502F: u"\u4E8A",
-    0x5030: u"\u8212",
-    0x5031: u"\u5F0D",
-    0x5032: u"\u4E8E",
-    0x5033: u"\u4E9E",
-    0x5034: u"\u4E9F",
-    0x5035: u"\u4EA0",
-    0x5036: u"\u4EA2",
-    0x5037: u"\u4EB0",
-    0x5038: u"\u4EB3",
-    0x5039: u"\u4EB6",
-    0x503A: u"\u4ECE",
-    0x503B: u"\u4ECD",
-    0x503C: u"\u4EC4",
-    0x503D: u"\u4EC6",
-    0x503E: u"\u4EC2",
-    0x503F: u"\u4ED7",
-    0x5040: u"\u4EDE",
-    0x5041: u"\u4EED",
-    0x5042: u"\u4EDF",
-    0x5043: u"\u4EF7",
-    0x5044: u"\u4F09",
-    0x5045: u"\u4F5A",
-    0x5046: u"\u4F30",
-    0x5047: u"\u4F5B",
-    0x5048: u"\u4F5D",
-    0x5049: u"\u4F57",
-    0x504A: u"\u4F47",
-    0x504B: u"\u4F76",
-    0x504C: u"\u4F88",
-    0x504D: u"\u4F8F",
-    0x504E: u"\u4F98",
-    0x504F: u"\u4F7B",
-    0x5050: u"\u4F69",
-    0x5051: u"\u4F70",
-    0x5052: u"\u4F91",
-    0x5053: u"\u4F6F",
-    0x5054: u"\u4F86",
-    0x5055: u"\u4F96",
-    0x5056: u"\u5118",
-    0x5057: u"\u4FD4",
-    0x5058: u"\u4FDF",
-    0x5059: u"\u4FCE",
-    0x505A: u"\u4FD8",
-    0x505B: u"\u4FDB",
-    0x505C: u"\u4FD1",
-    0x505D: u"\u4FDA",
-    0x505E: u"\u4FD0",
-    0x505F: u"\u4FE4",
-    0x5060: u"\u4FE5",
-    0x5061: u"\u501A",
-    0x5062: u"\u5028",
-    0x5063: u"\u5014",
-    0x5064: u"\u502A",
-    0x5065: u"\u5025",
-    0x5066: u"\u5005",
-    0x5067: u"\u4F1C",
-    0x5068: u"\u4FF6",
-    0x5069: u"\u5021",
-    0x506A: u"\u5029",
-    0x506B: u"\u502C",
-    0x506C: u"\u4FFE",
-    0x506D: u"\u4FEF",
-    0x506E: u"\u5011",
-    0x506F: u"\u5006",
-    0x5070: u"\u5043",
-    0x5071: u"\u5047",
-    0x5072: u"\u6703",
-    0x5073: u"\u5055",
-    0x5074: u"\u5050",
-    0x5075: u"\u5048",
-    0x5076: u"\u505A",
-    0x5077: u"\u5056",
-    0x5078: u"\u506C",
-    0x5079: u"\u5078",
-    0x507A: u"\u5080",
-    0x507B: u"\u509A",
-    0x507C: u"\u5085",
-    0x507D: u"\u50B4",
-    0x507E: u"\u50B2",
-    0x5121: u"\u50C9",
-    0x5122: u"\u50CA",
-    0x5123: u"\u50B3",
-    0x5124: u"\u50C2",
-    0x5125: u"\u50D6",
-    0x5126: u"\u50DE",
-    0x5127: u"\u50E5",
-    0x5128: u"\u50ED",
-    0x5129: u"\u50E3",
-    0x512A: u"\u50EE",
-    0x512B: u"\u50F9",
-    0x512C: u"\u50F5",
-    0x512D: u"\u5109",
-    0x512E: u"\u5101",
-    0x512F: u"\u5102",
-    0x5130: u"\u5116",
-    0x5131: u"\u5115",
-    0x5132: u"\u5114",
-    0x5133: u"\u511A",
-    0x5134: u"\u5121",
-    0x5135: u"\u513A",
-    0x5136: u"\u5137",
-    0x5137: u"\u513C",
-    0x5138: u"\u513B",
-    0x5139: u"\u513F",
-    0x513A: u"\u5140",
-    0x513B: u"\u5152",
-    0x513C: u"\u514C",
-    0x513D: u"\u5154",
-    0x513E: u"\u5162",
-    0x513F: u"\u7AF8",
-    0x5140: u"\u5169",
-    0x5141: u"\u516A",
-    0x5142: u"\u516E",
-    0x5143: u"\u5180",
-    0x5144: u"\u5182",
-    0x5145: u"\u56D8",
-    0x5146: u"\u518C",
-    0x5147: u"\u5189",
-    0x5148: u"\u518F",
-    0x5149: u"\u5191",
-    0x514A: u"\u5193",
-    0x514B: u"\u5195",
-    0x514C: u"\u5196",
-    0x514D: u"\u51A4",
-    0x514E: u"\u51A6",
-    0x514F: u"\u51A2",
-    0x5150: u"\u51A9",
-    0x5151: u"\u51AA",
-    0x5152: u"\u51AB",
-    0x5153: u"\u51B3",
-    0x5154: u"\u51B1",
-    0x5155: u"\u51B2",
-    0x5156: u"\u51B0",
-    0x5157: u"\u51B5",
-    0x5158: u"\u51BD",
-    0x5159: u"\u51C5",
-    0x515A: u"\u51C9",
-    0x515B: u"\u51DB",
-    0x515C: u"\u51E0",
-    0x515D: u"\u8655",
-    0x515E: u"\u51E9",
-    0x515F: u"\u51ED",
-    0x5160: u"\u51F0",
-    0x5161: u"\u51F5",
-    0x5162: u"\u51FE",
-    0x5163: u"\u5204",
-    0x5164: u"\u520B",
-    0x5165: u"\u5214",
-    0x5166: u"\u520E",
-    0x5167: u"\u5227",
-    0x5168: u"\u522A",
-    0x5169: u"\u522E",
-    0x516A: u"\u5233",
-    0x516B: u"\u5239",
-    0x516C: u"\u524F",
-    0x516D: u"\u5244",
-    0x516E: u"\u524B",
-    0x516F: u"\u524C",
-    0x5170: u"\u525E",
-    0x5171: u"\u5254",
-    0x5172: u"\u526A",
-    0x5173: u"\u5274",
-    0x5174: u"\u5269",
-    0x5175: u"\u5273",
-    0x5176: u"\u527F",
-    0x5177: u"\u527D",
-    0x5178: u"\u528D",
-    0x5179: u"\u5294",
-    0x517A: u"\u5292",
-    0x517B: u"\u5271",
-    0x517C: u"\u5288",
-    0x517D: u"\u5291",
-    0x517E: u"\u8FA8",
-    0x5221: u"\u8FA7",
-    0x5222: u"\u52AC",
-    0x5223: u"\u52AD",
-    0x5224: u"\u52BC",
-    0x5225: u"\u52B5",
-    0x5226: u"\u52C1",
-    0x5227: u"\u52CD",
-    0x5228: u"\u52D7",
-    0x5229: u"\u52DE",
-    0x522A: u"\u52E3",
-    0x522B: u"\u52E6",
-    0x522C: u"\u98ED",
-    0x522D: u"\u52E0",
-    0x522E: u"\u52F3",
-    0x522F: u"\u52F5",
-    0x5230: u"\u52F8",
-    0x5231: u"\u52F9",
-    0x5232: u"\u5306",
-    0x5233: u"\u5308",
-    0x5234: u"\u7538",
-    0x5235: u"\u530D",
-    0x5236: u"\u5310",
-    0x5237: u"\u530F",
-    0x5238: u"\u5315",
-    0x5239: u"\u531A",
-    0x523A: u"\u5323",
-    0x523B: u"\u532F",
-    0x523C: u"\u5331",
-    0x523D: u"\u5333",
-    0x523E: u"\u5338",
-    0x523F: u"\u5340",
-    0x5240: u"\u5346",
-    0x5241: u"\u5345",
-    0x5242: u"\u4E17",
-    0x5243: u"\u5349",
-    0x5244: u"\u534D",
-    0x5245: u"\u51D6",
-    0x5246: u"\u535E",
-    0x5247: u"\u5369",
-    0x5248: u"\u536E",
-    0x5249: u"\u5918",
-    0x524A: u"\u537B",
-    0x524B: u"\u5377",
-    0x524C: u"\u5382",
-    0x524D: u"\u5396",
-    0x524E: u"\u53A0",
-    0x524F: u"\u53A6",
-    0x5250: u"\u53A5",
-    0x5251: u"\u53AE",
-    0x5252: u"\u53B0",
-    0x5253: u"\u53B6",
-    0x5254: u"\u53C3",
-    0x5255: u"\u7C12",
-    0x5256: u"\u96D9",
-    0x5257: u"\u53DF",
-    0x5258: u"\u66FC",
-    0x5259: u"\u71EE",
-    0x525A: u"\u53EE",
-    0x525B: u"\u53E8",
-    0x525C: u"\u53ED",
-    0x525D: u"\u53FA",
-    0x525E: u"\u5401",
-    0x525F: u"\u543D",
-    0x5260: u"\u5440",
-    0x5261: u"\u542C",
-    0x5262: u"\u542D",
-    0x5263: u"\u543C",
-    0x5264: u"\u542E",
-    0x5265: u"\u5436",
-    0x5266: u"\u5429",
-    0x5267: u"\u541D",
-    0x5268: u"\u544E",
-    0x5269: u"\u548F",
-    0x526A: u"\u5475",
-    0x526B: u"\u548E",
-    0x526C: u"\u545F",
-    0x526D: u"\u5471",
-    0x526E: u"\u5477",
-    0x526F: u"\u5470",
-    0x5270: u"\u5492",
-    0x5271: u"\u547B",
-    0x5272: u"\u5480",
-    0x5273: u"\u5476",
-    0x5274: u"\u5484",
-    0x5275: u"\u5490",
-    0x5276: u"\u5486",
-    0x5277: u"\u54C7",
-    0x5278: u"\u54A2",
-    0x5279: u"\u54B8",
-    0x527A: u"\u54A5",
-    0x527B: u"\u54AC",
-    0x527C: u"\u54C4",
-    0x527D: u"\u54C8",
-    0x527E: u"\u54A8",
-    0x5321: u"\u54AB",
-    0x5322: u"\u54C2",
-    0x5323: u"\u54A4",
-    0x5324: u"\u54BE",
-    0x5325: u"\u54BC",
-    0x5326: u"\u54D8",
-    0x5327: u"\u54E5",
-    0x5328: u"\u54E6",
-    0x5329: u"\u550F",
-    0x532A: u"\u5514",
-    0x532B: u"\u54FD",
-    0x532C: u"\u54EE",
-    0x532D: u"\u54ED",
-    0x532E: u"\u54FA",
-    0x532F: u"\u54E2",
-    0x5330: u"\u5539",
-    0x5331: u"\u5540",
-    0x5332: u"\u5563",
-    0x5333: u"\u554C",
-    0x5334: u"\u552E",
-    0x5335: u"\u555C",
-    0x5336: u"\u5545",
-    0x5337: u"\u5556",
-    0x5338: u"\u5557",
-    0x5339: u"\u5538",
-    0x533A: u"\u5533",
-    0x533B: u"\u555D",
-    0x533C: u"\u5599",
-    0x533D: u"\u5580",
-    0x533E: u"\u54AF",
-    0x533F: u"\u558A",
-    0x5340: u"\u559F",
-    0x5341: u"\u557B",
-    0x5342: u"\u557E",
-    0x5343: u"\u5598",
-    0x5344: u"\u559E",
-    0x5345: u"\u55AE",
-    0x5346: u"\u557C",
-    0x5347: u"\u5583",
-    0x5348: u"\u55A9",
-    0x5349: u"\u5587",
-    0x534A: u"\u55A8",
-    0x534B: u"\u55DA",
-    0x534C: u"\u55C5",
-    0x534D: u"\u55DF",
-    0x534E: u"\u55C4",
-    0x534F: u"\u55DC",
-    0x5350: u"\u55E4",
-    0x5351: u"\u55D4",
-    0x5352: u"\u5614",
-    0x5353: u"\u55F7",
-    0x5354: u"\u5616",
-    0x5355: u"\u55FE",
-    0x5356: u"\u55FD",
-    0x5357: u"\u561B",
-    0x5358: u"\u55F9",
-    0x5359: u"\u564E",
-    0x535A: u"\u5650",
-    0x535B: u"\u71DF",
-    0x535C: u"\u5634",
-    0x535D: u"\u5636",
-    0x535E: u"\u5632",
-    0x535F: u"\u5638",
-    0x5360: u"\u566B",
-    0x5361: u"\u5664",
-    0x5362: u"\u562F",
-    0x5363: u"\u566C",
-    0x5364: u"\u566A",
-    0x5365: u"\u5686",
-    0x5366: u"\u5680",
-    0x5367: u"\u568A",
-    0x5368: u"\u56A0",
-    0x5369: u"\u5694",
-    0x536A: u"\u568F",
-    0x536B: u"\u56A5",
-    0x536C: u"\u56AE",
-    0x536D: u"\u56B6",
-    0x536E: u"\u56B4",
-    0x536F: u"\u56C2",
-    0x5370: u"\u56BC",
-    0x5371: u"\u56C1",
-    0x5372: u"\u56C3",
-    0x5373: u"\u56C0",
-    0x5374: u"\u56C8",
-    0x5375: u"\u56CE",
-    0x5376: u"\u56D1",
-    0x5377: u"\u56D3",
-    0x5378: u"\u56D7",
-    0x5379: u"\u56EE",
-    0x537A: u"\u56F9",
-    0x537B: u"\u5700",
-    0x537C: u"\u56FF",
-    0x537D: u"\u5704",
-    0x537E: u"\u5709",
-    0x5421: u"\u5708",
-    0x5422: u"\u570B",
-    0x5423: u"\u570D",
-    0x5424: u"\u5713",
-    0x5425: u"\u5718",
-    0x5426: u"\u5716",
-    0x5427: u"\u55C7",
-    0x5428: u"\u571C",
-    0x5429: u"\u5726",
-    0x542A: u"\u5737",
-    0x542B: u"\u5738",
-    0x542C: u"\u574E",
-    0x542D: u"\u573B",
-    0x542E: u"\u5740",
-    0x542F: u"\u574F",
-    0x5430: u"\u5769",
-    0x5431: u"\u57C0",
-    0x5432: u"\u5788",
-    0x5433: u"\u5761",
-    0x5434: u"\u577F",
-    0x5435: u"\u5789",
-    0x5436: u"\u5793",
-    0x5437: u"\u57A0",
-    0x5438: u"\u57B3",
-    0x5439: u"\u57A4",
-    0x543A: u"\u57AA",
-    0x543B: u"\u57B0",
-    0x543C: u"\u57C3",
-    0x543D: u"\u57C6",
-    0x543E: u"\u57D4",
-    0x543F: u"\u57D2",
-    0x5440: u"\u57D3",
-    0x5441: u"\u580A",
-    0x5442: u"\u57D6",
-    0x5443: u"\u57E3",
-    0x5444: u"\u580B",
-    0x5445: u"\u5819",
-    0x5446: u"\u581D",
-    0x5447: u"\u5872",
-    0x5448: u"\u5821",
-    0x5449: u"\u5862",
-    0x544A: u"\u584B",
-    0x544B: u"\u5870",
-    0x544C: u"\u6BC0",
-    0x544D: u"\u5852",
-    0x544E: u"\u583D",
-    0x544F: u"\u5879",
-    0x5450: u"\u5885",
-    0x5451: u"\u58B9",
-    0x5452: u"\u589F",
-    0x5453: u"\u58AB",
-    0x5454: u"\u58BA",
-    0x5455: u"\u58DE",
-    0x5456: u"\u58BB",
-    0x5457: u"\u58B8",
-    0x5458: u"\u58AE",
-    0x5459: u"\u58C5",
-    0x545A: u"\u58D3",
-    0x545B: u"\u58D1",
-    0x545C: u"\u58D7",
-    0x545D: u"\u58D9",
-    0x545E: u"\u58D8",
-    0x545F: u"\u58E5",
-    0x5460: u"\u58DC",
-    0x5461: u"\u58E4",
-    0x5462: u"\u58DF",
-    0x5463: u"\u58EF",
-    0x5464: u"\u58FA",
-    0x5465: u"\u58F9",
-    0x5466: u"\u58FB",
-    0x5467: u"\u58FC",
-    0x5468: u"\u58FD",
-    0x5469: u"\u5902",
-    0x546A: u"\u590A",
-    0x546B: u"\u5910",
-    0x546C: u"\u591B",
-    0x546D: u"\u68A6",
-    0x546E: u"\u5925",
-    0x546F: u"\u592C",
-    0x5470: u"\u592D",
-    0x5471: u"\u5932",
-    0x5472: u"\u5938",
-    0x5473: u"\u593E",
-    0x5474: u"\u7AD2",
-    0x5475: u"\u5955",
-    0x5476: u"\u5950",
-    0x5477: u"\u594E",
-    0x5478: u"\u595A",
-    0x5479: u"\u5958",
-    0x547A: u"\u5962",
-    0x547B: u"\u5960",
-    0x547C: u"\u5967",
-    0x547D: u"\u596C",
-    0x547E: u"\u5969",
-    0x5521: u"\u5978",
-    0x5522: u"\u5981",
-    0x5523: u"\u599D",
-    0x5524: u"\u4F5E",
-    0x5525: u"\u4FAB",
-    0x5526: u"\u59A3",
-    0x5527: u"\u59B2",
-    0x5528: u"\u59C6",
-    0x5529: u"\u59E8",
-    0x552A: u"\u59DC",
-    0x552B: u"\u598D",
-    0x552C: u"\u59D9",
-    0x552D: u"\u59DA",
-    0x552E: u"\u5A25",
-    0x552F: u"\u5A1F",
-    0x5530: u"\u5A11",
-    0x5531: u"\u5A1C",
-    0x5532: u"\u5A09",
-    0x5533: u"\u5A1A",
-    0x5534: u"\u5A40",
-    0x5535: u"\u5A6C",
-    0x5536: u"\u5A49",
-    0x5537: u"\u5A35",
-    0x5538: u"\u5A36",
-    0x5539: u"\u5A62",
-    0x553A: u"\u5A6A",
-    0x553B: u"\u5A9A",
-    0x553C: u"\u5ABC",
-    0x553D: u"\u5ABE",
-    0x553E: u"\u5ACB",
-    0x553F: u"\u5AC2",
-    0x5540: u"\u5ABD",
-    0x5541: u"\u5AE3",
-    0x5542: u"\u5AD7",
-    0x5543: u"\u5AE6",
-    0x5544: u"\u5AE9",
-    0x5545: u"\u5AD6",
-    0x5546: u"\u5AFA",
-    0x5547: u"\u5AFB",
-    0x5548: u"\u5B0C",
-    0x5549: u"\u5B0B",
-    0x554A: u"\u5B16",
-    0x554B: u"\u5B32",
-    0x554C: u"\u5AD0",
-    0x554D: u"\u5B2A",
-    0x554E: u"\u5B36",
-    0x554F: u"\u5B3E",
-    0x5550: u"\u5B43",
-    0x5551: u"\u5B45",
-    0x5552: u"\u5B40",
-    0x5553: u"\u5B51",
-    0x5554: u"\u5B55",
-    0x5555: u"\u5B5A",
-    0x5556: u"\u5B5B",
-    0x5557: u"\u5B65",
-    0x5558: u"\u5B69",
-    0x5559: u"\u5B70",
-    0x555A: u"\u5B73",
-    0x555B: u"\u5B75",
-    0x555C: u"\u5B78",
-    0x555D: u"\u6588",
-    0x555E: u"\u5B7A",
-    0x555F: u"\u5B80",
-    0x5560: u"\u5B83",
-    0x5561: u"\u5BA6",
-    0x5562: u"\u5BB8",
-    0x5563: u"\u5BC3",
-    0x5564: u"\u5BC7",
-    0x5565: u"\u5BC9",
-    0x5566: u"\u5BD4",
-    0x5567: u"\u5BD0",
-    0x5568: u"\u5BE4",
-    0x5569: u"\u5BE6",
-    0x556A: u"\u5BE2",
-    0x556B: u"\u5BDE",
-    0x556C: u"\u5BE5",
-    0x556D: u"\u5BEB",
-    0x556E: u"\u5BF0",
-    0x556F: u"\u5BF6",
-    0x5570: u"\u5BF3",
-    0x5571: u"\u5C05",
-    0x5572: u"\u5C07",
-    0x5573: u"\u5C08",
-    0x5574: u"\u5C0D",
-    0x5575: u"\u5C13",
-    0x5576: u"\u5C20",
-    0x5577: u"\u5C22",
-    0x5578: u"\u5C28",
-    0x5579: u"\u5C38",
-    0x557A: u"\u5C39",
-    0x557B: u"\u5C41",
-    0x557C: u"\u5C46",
-    0x557D: u"\u5C4E",
-    0x557E: u"\u5C53",
-    0x5621: u"\u5C50",
-    0x5622: u"\u5C4F",
-    0x5623: u"\u5B71",
-    0x5624: u"\u5C6C",
-    0x5625: u"\u5C6E",
-    0x5626: u"\u4E62",
-    0x5627: u"\u5C76",
-    0x5628: u"\u5C79",
-    0x5629: u"\u5C8C",
-    0x562A: u"\u5C91",
-    0x562B: u"\u5C94",
-    0x562C: u"\u599B",
-    0x562D: u"\u5CAB",
-    0x562E: u"\u5CBB",
-    0x562F: u"\u5CB6",
-    0x5630: u"\u5CBC",
-    0x5631: u"\u5CB7",
-    0x5632: u"\u5CC5",
-    0x5633: u"\u5CBE",
-    0x5634: u"\u5CC7",
-    0x5635: u"\u5CD9",
-    0x5636: u"\u5CE9",
-    0x5637: u"\u5CFD",
-    0x5638: u"\u5CFA",
-    0x5639: u"\u5CED",
-    0x563A: u"\u5D8C",
-    0x563B: u"\u5CEA",
-    0x563C: u"\u5D0B",
-    0x563D: u"\u5D15",
-    0x563E: u"\u5D17",
-    0x563F: u"\u5D5C",
-    0x5640: u"\u5D1F",
-    0x5641: u"\u5D1B",
-    0x5642: u"\u5D11",
-    0x5643: u"\u5D14",
-    0x5644: u"\u5D22",
-    0x5645: u"\u5D1A",
-    0x5646: u"\u5D19",
-    0x5647: u"\u5D18",
-    0x5648: u"\u5D4C",
-    0x5649: u"\u5D52",
-    0x564A: u"\u5D4E",
-    0x564B: u"\u5D4B",
-    0x564C: u"\u5D6C",
-    0x564D: u"\u5D73",
-    0x564E: u"\u5D76",
-    0x564F: u"\u5D87",
-    0x5650: u"\u5D84",
-    0x5651: u"\u5D82",
-    0x5652: u"\u5DA2",
-    0x5653: u"\u5D9D",
-    0x5654: u"\u5DAC",
-    0x5655: u"\u5DAE",
-    0x5656: u"\u5DBD",
-    0x5657: u"\u5D90",
-    0x5658: u"\u5DB7",
-    0x5659: u"\u5DBC",
-    0x565A: u"\u5DC9",
-    0x565B: u"\u5DCD",
-    0x565C: u"\u5DD3",
-    0x565D: u"\u5DD2",
-    0x565E: u"\u5DD6",
-    0x565F: u"\u5DDB",
-    0x5660: u"\u5DEB",
-    0x5661: u"\u5DF2",
-    0x5662: u"\u5DF5",
-    0x5663: u"\u5E0B",
-    0x5664: u"\u5E1A",
-    0x5665: u"\u5E19",
-    0x5666: u"\u5E11",
-    0x5667: u"\u5E1B",
-    0x5668: u"\u5E36",
-    0x5669: u"\u5E37",
-    0x566A: u"\u5E44",
-    0x566B: u"\u5E43",
-    0x566C: u"\u5E40",
-    0x566D: u"\u5E4E",
-    0x566E: u"\u5E57",
-    0x566F: u"\u5E54",
-    0x5670: u"\u5E5F",
-    0x5671: u"\u5E62",
-    0x5672: u"\u5E64",
-    0x5673: u"\u5E47",
-    0x5674: u"\u5E75",
-    0x5675: u"\u5E76",
-    0x5676: u"\u5E7A",
-    0x5677: u"\u9EBC",
-    0x5678: u"\u5E7F",
-    0x5679: u"\u5EA0",
-    0x567A: u"\u5EC1",
-    0x567B: u"\u5EC2",
-    0x567C: u"\u5EC8",
-    0x567D: u"\u5ED0",
-    0x567E: u"\u5ECF",
-    0x5721: u"\u5ED6",
-    0x5722: u"\u5EE3",
-    0x5723: u"\u5EDD",
-    0x5724: u"\u5EDA",
-    0x5725: u"\u5EDB",
-    0x5726: u"\u5EE2",
-    0x5727: u"\u5EE1",
-    0x5728: u"\u5EE8",
-    0x5729: u"\u5EE9",
-    0x572A: u"\u5EEC",
-    0x572B: u"\u5EF1",
-    0x572C: u"\u5EF3",
-    0x572D: u"\u5EF0",
-    0x572E: u"\u5EF4",
-    0x572F: u"\u5EF8",
-    0x5730: u"\u5EFE",
-    0x5731: u"\u5F03",
-    0x5732: u"\u5F09",
-    0x5733: u"\u5F5D",
-    0x5734: u"\u5F5C",
-    0x5735: u"\u5F0B",
-    0x5736: u"\u5F11",
-    0x5737: u"\u5F16",
-    0x5738: u"\u5F29",
-    0x5739: u"\u5F2D",
-    0x573A: u"\u5F38",
-    0x573B: u"\u5F41",
-    0x573C: u"\u5F48",
-    0x573D: u"\u5F4C",
-    0x573E: u"\u5F4E",
-    0x573F: u"\u5F2F",
-    0x5740: u"\u5F51",
-    0x5741: u"\u5F56",
-    0x5742: u"\u5F57",
-    0x5743: u"\u5F59",
-    0x5744: u"\u5F61",
-    0x5745: u"\u5F6D",
-    0x5746: u"\u5F73",
-    0x5747: u"\u5F77",
-    0x5748: u"\u5F83",
-    0x5749: u"\u5F82",
-    0x574A: u"\u5F7F",
-    0x574B: u"\u5F8A",
-    0x574C: u"\u5F88",
-    0x574D: u"\u5F91",
-    0x574E: u"\u5F87",
-    0x574F: u"\u5F9E",
-    0x5750: u"\u5F99",
-    0x5751: u"\u5F98",
-    0x5752: u"\u5FA0",
-    0x5753: u"\u5FA8",
-    0x5754: u"\u5FAD",
-    0x5755: u"\u5FBC",
-    0x5756: u"\u5FD6",
-    0x5757: u"\u5FFB",
-    0x5758: u"\u5FE4",
-    0x5759: u"\u5FF8",
-    0x575A: u"\u5FF1",
-    0x575B: u"\u5FDD",
-    0x575C: u"\u60B3",
-    0x575D: u"\u5FFF",
-    0x575E: u"\u6021",
-    0x575F: u"\u6060",
-    0x5760: u"\u6019",
-    0x5761: u"\u6010",
-    0x5762: u"\u6029",
-    0x5763: u"\u600E",
-    0x5764: u"\u6031",
-    0x5765: u"\u601B",
-    0x5766: u"\u6015",
-    0x5767: u"\u602B",
-    0x5768: u"\u6026",
-    0x5769: u"\u600F",
-    0x576A: u"\u603A",
-    0x576B: u"\u605A",
-    0x576C: u"\u6041",
-    0x576D: u"\u606A",
-    0x576E: u"\u6077",
-    0x576F: u"\u605F",
-    0x5770: u"\u604A",
-    0x5771: u"\u6046",
-    0x5772: u"\u604D",
-    0x5773: u"\u6063",
-    0x5774: u"\u6043",
-    0x5775: u"\u6064",
-    0x5776: u"\u6042",
-    0x5777: u"\u606C",
-    0x5778: u"\u606B",
-    0x5779: u"\u6059",
-    0x577A: u"\u6081",
-    0x577B: u"\u608D",
-    0x577C: u"\u60E7",
-    0x577D: u"\u6083",
-    0x577E: u"\u609A",
-    0x5821: u"\u6084",
-    0x5822: u"\u609B",
-    0x5823: u"\u6096",
-    0x5824: u"\u6097",
-    0x5825: u"\u6092",
-    0x5826: u"\u60A7",
-    0x5827: u"\u608B",
-    0x5828: u"\u60E1",
-    0x5829: u"\u60B8",
-    0x582A: u"\u60E0",
-    0x582B: u"\u60D3",
-    0x582C: u"\u60B4",
-    0x582D: u"\u5FF0",
-    0x582E: u"\u60BD",
-    0x582F: u"\u60C6",
-    0x5830: u"\u60B5",
-    0x5831: u"\u60D8",
-    0x5832: u"\u614D",
-    0x5833: u"\u6115",
-    0x5834: u"\u6106",
-    0x5835: u"\u60F6",
-    0x5836: u"\u60F7",
-    0x5837: u"\u6100",
-    0x5838: u"\u60F4",
-    0x5839: u"\u60FA",
-    0x583A: u"\u6103",
-    0x583B: u"\u6121",
-    0x583C: u"\u60FB",
-    0x583D: u"\u60F1",
-    0x583E: u"\u610D",
-    0x583F: u"\u610E",
-    0x5840: u"\u6147",
-    0x5841: u"\u613E",
-    0x5842: u"\u6128",
-    0x5843: u"\u6127",
-    0x5844: u"\u614A",
-    0x5845: u"\u613F",
-    0x5846: u"\u613C",
-    0x5847: u"\u612C",
-    0x5848: u"\u6134",
-    0x5849: u"\u613D",
-    0x584A: u"\u6142",
-    0x584B: u"\u6144",
-    0x584C: u"\u6173",
-    0x584D: u"\u6177",
-    0x584E: u"\u6158",
-    0x584F: u"\u6159",
-    0x5850: u"\u615A",
-    0x5851: u"\u616B",
-    0x5852: u"\u6174",
-    0x5853: u"\u616F",
-    0x5854: u"\u6165",
-    0x5855: u"\u6171",
-    0x5856: u"\u615F",
-    0x5857: u"\u615D",
-    0x5858: u"\u6153",
-    0x5859: u"\u6175",
-    0x585A: u"\u6199",
-    0x585B: u"\u6196",
-    0x585C: u"\u6187",
-    0x585D: u"\u61AC",
-    0x585E: u"\u6194",
-    0x585F: u"\u619A",
-    0x5860: u"\u618A",
-    0x5861: u"\u6191",
-    0x5862: u"\u61AB",
-    0x5863: u"\u61AE",
-    0x5864: u"\u61CC",
-    0x5865: u"\u61CA",
-    0x5866: u"\u61C9",
-    0x5867: u"\u61F7",
-    0x5868: u"\u61C8",
-    0x5869: u"\u61C3",
-    0x586A: u"\u61C6",
-    0x586B: u"\u61BA",
-    0x586C: u"\u61CB",
-    0x586D: u"\u7F79",
-    0x586E: u"\u61CD",
-    0x586F: u"\u61E6",
-    0x5870: u"\u61E3",
-    0x5871: u"\u61F6",
-    0x5872: u"\u61FA",
-    0x5873: u"\u61F4",
-    0x5874: u"\u61FF",
-    0x5875: u"\u61FD",
-    0x5876: u"\u61FC",
-    0x5877: u"\u61FE",
-    0x5878: u"\u6200",
-    0x5879: u"\u6208",
-    0x587A: u"\u6209",
-    0x587B: u"\u620D",
-    0x587C: u"\u620C",
-    0x587D: u"\u6214",
-    0x587E: u"\u621B",
-    0x5921: u"\u621E",
-    0x5922: u"\u6221",
-    0x5923: u"\u622A",
-    0x5924: u"\u622E",
-    0x5925: u"\u6230",
-    0x5926: u"\u6232",
-    0x5927: u"\u6233",
-    0x5928: u"\u6241",
-    0x5929: u"\u624E",
-    0x592A: u"\u625E",
-    0x592B: u"\u6263",
-    0x592C: u"\u625B",
-    0x592D: u"\u6260",
-    0x592E: u"\u6268",
-    0x592F: u"\u627C",
-    0x5930: u"\u6282",
-    0x5931: u"\u6289",
-    0x5932: u"\u627E",
-    0x5933: u"\u6292",
-    0x5934: u"\u6293",
-    0x5935: u"\u6296",
-    0x5936: u"\u62D4",
-    0x5937: u"\u6283",
-    0x5938: u"\u6294",
-    0x5939: u"\u62D7",
-    0x593A: u"\u62D1",
-    0x593B: u"\u62BB",
-    0x593C: u"\u62CF",
-    0x593D: u"\u62FF",
-    0x593E: u"\u62C6",
-    0x593F: u"\u64D4",
-    0x5940: u"\u62C8",
-    0x5941: u"\u62DC",
-    0x5942: u"\u62CC",
-    0x5943: u"\u62CA",
-    0x5944: u"\u62C2",
-    0x5945: u"\u62C7",
-    0x5946: u"\u629B",
-    0x5947: u"\u62C9",
-    0x5948: u"\u630C",
-    0x5949: u"\u62EE",
-    0x594A: u"\u62F1",
-    0x594B: u"\u6327",
-    0x594C: u"\u6302",
-    0x594D: u"\u6308",
-    0x594E: u"\u62EF",
-    0x594F: u"\u62F5",
-    0x5950: u"\u6350",
-    0x5951: u"\u633E",
-    0x5952: u"\u634D",
-    0x5953: u"\u641C",
-    0x5954: u"\u634F",
-    0x5955: u"\u6396",
-    0x5956: u"\u638E",
-    0x5957: u"\u6380",
-    0x5958: u"\u63AB",
-    0x5959: u"\u6376",
-    0x595A: u"\u63A3",
-    0x595B: u"\u638F",
-    0x595C: u"\u6389",
-    0x595D: u"\u639F",
-    0x595E: u"\u63B5",
-    0x595F: u"\u636B",
-    0x5960: u"\u6369",
-    0x5961: u"\u63BE",
-    0x5962: u"\u63E9",
-    0x5963: u"\u63C0",
-    0x5964: u"\u63C6",
-    0x5965: u"\u63E3",
-    0x5966: u"\u63C9",
-    0x5967: u"\u63D2",
-    0x5968: u"\u63F6",
-    0x5969: u"\u63C4",
-    0x596A: u"\u6416",
-    0x596B: u"\u6434",
-    0x596C: u"\u6406",
-    0x596D: u"\u6413",
-    0x596E: u"\u6426",
-    0x596F: u"\u6436",
-    0x5970: u"\u651D",
-    0x5971: u"\u6417",
-    0x5972: u"\u6428",
-    0x5973: u"\u640F",
-    0x5974: u"\u6467",
-    0x5975: u"\u646F",
-    0x5976: u"\u6476",
-    0x5977: u"\u644E",
-    0x5978: u"\u652A",
-    0x5979: u"\u6495",
-    0x597A: u"\u6493",
-    0x597B: u"\u64A5",
-    0x597C: u"\u64A9",
-    0x597D: u"\u6488",
-    0x597E: u"\u64BC",
-    0x5A21: u"\u64DA",
-    0x5A22: u"\u64D2",
-    0x5A23: u"\u64C5",
-    0x5A24: u"\u64C7",
-    0x5A25: u"\u64BB",
-    0x5A26: u"\u64D8",
-    0x5A27: u"\u64C2",
-    0x5A28: u"\u64F1",
-    0x5A29: u"\u64E7",
-    0x5A2A: u"\u8209",
-    0x5A2B: u"\u64E0",
-    0x5A2C: u"\u64E1",
-    0x5A2D: u"\u62AC",
-    0x5A2E: u"\u64E3",
-    0x5A2F: u"\u64EF",
-    0x5A30: u"\u652C",
-    0x5A31: u"\u64F6",
-    0x5A32: u"\u64F4",
-    0x5A33: u"\u64F2",
-    0x5A34: u"\u64FA",
-    0x5A35: u"\u6500",
-    0x5A36: u"\u64FD",
-    0x5A37: u"\u6518",
-    0x5A38: u"\u651C",
-    0x5A39: u"\u6505",
-    0x5A3A: u"\u6524",
-    0x5A3B: u"\u6523",
-    0x5A3C: u"\u652B",
-    0x5A3D: u"\u6534",
-    0x5A3E: u"\u6535",
-    0x5A3F: u"\u6537",
-    0x5A40: u"\u6536",
-    0x5A41: u"\u6538",
-    0x5A42: u"\u754B",
-    0x5A43: u"\u6548",
-    0x5A44: u"\u6556",
-    0x5A45: u"\u6555",
-    0x5A46: u"\u654D",
-    0x5A47: u"\u6558",
-    0x5A48: u"\u655E",
-    0x5A49: u"\u655D",
-    0x5A4A: u"\u6572",
-    0x5A4B: u"\u6578",
-    0x5A4C: u"\u6582",
-    0x5A4D: u"\u6583",
-    0x5A4E: u"\u8B8A",
-    0x5A4F: u"\u659B",
-    0x5A50: u"\u659F",
-    0x5A51: u"\u65AB",
-    0x5A52: u"\u65B7",
-    0x5A53: u"\u65C3",
-    0x5A54: u"\u65C6",
-    0x5A55: u"\u65C1",
-    0x5A56: u"\u65C4",
-    0x5A57: u"\u65CC",
-    0x5A58: u"\u65D2",
-    0x5A59: u"\u65DB",
-    0x5A5A: u"\u65D9",
-    0x5A5B: u"\u65E0",
-    0x5A5C: u"\u65E1",
-    0x5A5D: u"\u65F1",
-    0x5A5E: u"\u6772",
-    0x5A5F: u"\u660A",
-    0x5A60: u"\u6603",
-    0x5A61: u"\u65FB",
-    0x5A62: u"\u6773",
-    0x5A63: u"\u6635",
-    0x5A64: u"\u6636",
-    0x5A65: u"\u6634",
-    0x5A66: u"\u661C",
-    0x5A67: u"\u664F",
-    0x5A68: u"\u6644",
-    0x5A69: u"\u6649",
-    0x5A6A: u"\u6641",
-    0x5A6B: u"\u665E",
-    0x5A6C: u"\u665D",
-    0x5A6D: u"\u6664",
-    0x5A6E: u"\u6667",
-    0x5A6F: u"\u6668",
-    0x5A70: u"\u665F",
-    0x5A71: u"\u6662",
-    0x5A72: u"\u6670",
-    0x5A73: u"\u6683",
-    0x5A74: u"\u6688",
-    0x5A75: u"\u668E",
-    0x5A76: u"\u6689",
-    0x5A77: u"\u6684",
-    0x5A78: u"\u6698",
-    0x5A79: u"\u669D",
-    0x5A7A: u"\u66C1",
-    0x5A7B: u"\u66B9",
-    0x5A7C: u"\u66C9",
-    0x5A7D: u"\u66BE",
-    0x5A7E: u"\u66BC",
-    0x5B21: u"\u66C4",
-    0x5B22: u"\u66B8",
-    0x5B23: u"\u66D6",
-    0x5B24: u"\u66DA",
-    0x5B25: u"\u66E0",
-    0x5B26: u"\u663F",
-    0x5B27: u"\u66E6",
-    0x5B28: u"\u66E9",
-    0x5B29: u"\u66F0",
-    0x5B2A: u"\u66F5",
-    0x5B2B: u"\u66F7",
-    0x5B2C: u"\u670F",
-    0x5B2D: u"\u6716",
-    0x5B2E: u"\u671E",
-    0x5B2F: u"\u6726",
-    0x5B30: u"\u6727",
-    0x5B31: u"\u9738",
-    0x5B32: u"\u672E",
-    0x5B33: u"\u673F",
-    0x5B34: u"\u6736",
-    0x5B35: u"\u6741",
-    0x5B36: u"\u6738",
-    0x5B37: u"\u6737",
-    0x5B38: u"\u6746",
-    0x5B39: u"\u675E",
-    0x5B3A: u"\u6760",
-    0x5B3B: u"\u6759",
-    0x5B3C: u"\u6763",
-    0x5B3D: u"\u6764",
-    0x5B3E: u"\u6789",
-    0x5B3F: u"\u6770",
-    0x5B40: u"\u67A9",
-    0x5B41: u"\u677C",
-    0x5B42: u"\u676A",
-    0x5B43: u"\u678C",
-    0x5B44: u"\u678B",
-    0x5B45: u"\u67A6",
-    0x5B46: u"\u67A1",
-    0x5B47: u"\u6785",
-    0x5B48: u"\u67B7",
-    0x5B49: u"\u67EF",
-    0x5B4A: u"\u67B4",
-    0x5B4B: u"\u67EC",
-    0x5B4C: u"\u67B3",
-    0x5B4D: u"\u67E9",
-    0x5B4E: u"\u67B8",
-    0x5B4F: u"\u67E4",
-    0x5B50: u"\u67DE",
-    0x5B51: u"\u67DD",
-    0x5B52: u"\u67E2",
-    0x5B53: u"\u67EE",
-    0x5B54: u"\u67B9",
-    0x5B55: u"\u67CE",
-    0x5B56: u"\u67C6",
-    0x5B57: u"\u67E7",
-    0x5B58: u"\u6A9C",
-    0x5B59: u"\u681E",
-    0x5B5A: u"\u6846",
-    0x5B5B: u"\u6829",
-    0x5B5C: u"\u6840",
-    0x5B5D: u"\u684D",
-    0x5B5E: u"\u6832",
-    0x5B5F: u"\u684E",
-    0x5B60: u"\u68B3",
-    0x5B61: u"\u682B",
-    0x5B62: u"\u6859",
-    0x5B63: u"\u6863",
-    0x5B64: u"\u6877",
-    0x5B65: u"\u687F",
-    0x5B66: u"\u689F",
-    0x5B67: u"\u688F",
-    0x5B68: u"\u68AD",
-    0x5B69: u"\u6894",
-    0x5B6A: u"\u689D",
-    0x5B6B: u"\u689B",
-    0x5B6C: u"\u6883",
-    0x5B6D: u"\u6AAE",
-    0x5B6E: u"\u68B9",
-    0x5B6F: u"\u6874",
-    0x5B70: u"\u68B5",
-    0x5B71: u"\u68A0",
-    0x5B72: u"\u68BA",
-    0x5B73: u"\u690F",
-    0x5B74: u"\u688D",
-    0x5B75: u"\u687E",
-    0x5B76: u"\u6901",
-    0x5B77: u"\u68CA",
-    0x5B78: u"\u6908",
-    0x5B79: u"\u68D8",
-    0x5B7A: u"\u6922",
-    0x5B7B: u"\u6926",
-    0x5B7C: u"\u68E1",
-    0x5B7D: u"\u690C",
-    0x5B7E: u"\u68CD",
-    0x5C21: u"\u68D4",
-    0x5C22: u"\u68E7",
-    0x5C23: u"\u68D5",
-    0x5C24: u"\u6936",
-    0x5C25: u"\u6912",
-    0x5C26: u"\u6904",
-    0x5C27: u"\u68D7",
-    0x5C28: u"\u68E3",
-    0x5C29: u"\u6925",
-    0x5C2A: u"\u68F9",
-    0x5C2B: u"\u68E0",
-    0x5C2C: u"\u68EF",
-    0x5C2D: u"\u6928",
-    0x5C2E: u"\u692A",
-    0x5C2F: u"\u691A",
-    0x5C30: u"\u6923",
-    0x5C31: u"\u6921",
-    0x5C32: u"\u68C6",
-    0x5C33: u"\u6979",
-    0x5C34: u"\u6977",
-    0x5C35: u"\u695C",
-    0x5C36: u"\u6978",
-    0x5C37: u"\u696B",
-    0x5C38: u"\u6954",
-    0x5C39: u"\u697E",
-    0x5C3A: u"\u696E",
-    0x5C3B: u"\u6939",
-    0x5C3C: u"\u6974",
-    0x5C3D: u"\u693D",
-    0x5C3E: u"\u6959",
-    0x5C3F: u"\u6930",
-    0x5C40: u"\u6961",
-    0x5C41: u"\u695E",
-    0x5C42: u"\u695D",
-    0x5C43: u"\u6981",
-    0x5C44: u"\u696A",
-    0x5C45: u"\u69B2",
-    0x5C46: u"\u69AE",
-    0x5C47: u"\u69D0",
-    0x5C48: u"\u69BF",
-    0x5C49: u"\u69C1",
-    0x5C4A: u"\u69D3",
-    0x5C4B: u"\u69BE",
-    0x5C4C: u"\u69CE",
-    0x5C4D: u"\u5BE8",
-    0x5C4E: u"\u69CA",
-    0x5C4F: u"\u69DD",
-    0x5C50: u"\u69BB",
-    0x5C51: u"\u69C3",
-    0x5C52: u"\u69A7",
-    0x5C53: u"\u6A2E",
-    0x5C54: u"\u6991",
-    0x5C55: u"\u69A0",
-    0x5C56: u"\u699C",
-    0x5C57: u"\u6995",
-    0x5C58: u"\u69B4",
-    0x5C59: u"\u69DE",
-    0x5C5A: u"\u69E8",
-    0x5C5B: u"\u6A02",
-    0x5C5C: u"\u6A1B",
-    0x5C5D: u"\u69FF",
-    0x5C5E: u"\u6B0A",
-    0x5C5F: u"\u69F9",
-    0x5C60: u"\u69F2",
-    0x5C61: u"\u69E7",
-    0x5C62: u"\u6A05",
-    0x5C63: u"\u69B1",
-    0x5C64: u"\u6A1E",
-    0x5C65: u"\u69ED",
-    0x5C66: u"\u6A14",
-    0x5C67: u"\u69EB",
-    0x5C68: u"\u6A0A",
-    0x5C69: u"\u6A12",
-    0x5C6A: u"\u6AC1",
-    0x5C6B: u"\u6A23",
-    0x5C6C: u"\u6A13",
-    0x5C6D: u"\u6A44",
-    0x5C6E: u"\u6A0C",
-    0x5C6F: u"\u6A72",
-    0x5C70: u"\u6A36",
-    0x5C71: u"\u6A78",
-    0x5C72: u"\u6A47",
-    0x5C73: u"\u6A62",
-    0x5C74: u"\u6A59",
-    0x5C75: u"\u6A66",
-    0x5C76: u"\u6A48",
-    0x5C77: u"\u6A38",
-    0x5C78: u"\u6A22",
-    0x5C79: u"\u6A90",
-    0x5C7A: u"\u6A8D",
-    0x5C7B: u"\u6AA0",
-    0x5C7C: u"\u6A84",
-    0x5C7D: u"\u6AA2",
-    0x5C7E: u"\u6AA3",
-    0x5D21: u"\u6A97",
-    0x5D22: u"\u8617",
-    0x5D23: u"\u6ABB",
-    0x5D24: u"\u6AC3",
-    0x5D25: u"\u6AC2",
-    0x5D26: u"\u6AB8",
-    0x5D27: u"\u6AB3",
-    0x5D28: u"\u6AAC",
-    0x5D29: u"\u6ADE",
-    0x5D2A: u"\u6AD1",
-    0x5D2B: u"\u6ADF",
-    0x5D2C: u"\u6AAA",
-    0x5D2D: u"\u6ADA",
-    0x5D2E: u"\u6AEA",
-    0x5D2F: u"\u6AFB",
-    0x5D30: u"\u6B05",
-    0x5D31: u"\u8616",
-    0x5D32: u"\u6AFA",
-    0x5D33: u"\u6B12",
-    0x5D34: u"\u6B16",
-    0x5D35: u"\u9B31",
-    0x5D36: u"\u6B1F",
-    0x5D37: u"\u6B38",
-    0x5D38: u"\u6B37",
-    0x5D39: u"\u76DC",
-    0x5D3A: u"\u6B39",
-    0x5D3B: u"\u98EE",
-    0x5D3C: u"\u6B47",
-    0x5D3D: u"\u6B43",
-    0x5D3E: u"\u6B49",
-    0x5D3F: u"\u6B50",
-    0x5D40: u"\u6B59",
-    0x5D41: u"\u6B54",
-    0x5D42: u"\u6B5B",
-    0x5D43: u"\u6B5F",
-    0x5D44: u"\u6B61",
-    0x5D45: u"\u6B78",
-    0x5D46: u"\u6B79",
-    0x5D47: u"\u6B7F",
-    0x5D48: u"\u6B80",
-    0x5D49: u"\u6B84",
-    0x5D4A: u"\u6B83",
-    0x5D4B: u"\u6B8D",
-    0x5D4C: u"\u6B98",
-    0x5D4D: u"\u6B95",
-    0x5D4E: u"\u6B9E",
-    0x5D4F: u"\u6BA4",
-    0x5D50: u"\u6BAA",
-    0x5D51: u"\u6BAB",
-    0x5D52: u"\u6BAF",
-    0x5D53: u"\u6BB2",
-    0x5D54: u"\u6BB1",
-    0x5D55: u"\u6BB3",
-    0x5D56: u"\u6BB7",
-    0x5D57: u"\u6BBC",
-    0x5D58: u"\u6BC6",
-    0x5D59: u"\u6BCB",
-    0x5D5A: u"\u6BD3",
-    0x5D5B: u"\u6BDF",
-    0x5D5C: u"\u6BEC",
-    0x5D5D: u"\u6BEB",
-    0x5D5E: u"\u6BF3",
-    0x5D5F: u"\u6BEF",
-    0x5D60: u"\u9EBE",
-    0x5D61: u"\u6C08",
-    0x5D62: u"\u6C13",
-    0x5D63: u"\u6C14",
-    0x5D64: u"\u6C1B",
-    0x5D65: u"\u6C24",
-    0x5D66: u"\u6C23",
-    0x5D67: u"\u6C5E",
-    0x5D68: u"\u6C55",
-    0x5D69: u"\u6C62",
-    0x5D6A: u"\u6C6A",
-    0x5D6B: u"\u6C82",
-    0x5D6C: u"\u6C8D",
-    0x5D6D: u"\u6C9A",
-    0x5D6E: u"\u6C81",
-    0x5D6F: u"\u6C9B",
-    0x5D70: u"\u6C7E",
-    0x5D71: u"\u6C68",
-    0x5D72: u"\u6C73",
-    0x5D73: u"\u6C92",
-    0x5D74: u"\u6C90",
-    0x5D75: u"\u6CC4",
-    0x5D76: u"\u6CF1",
-    0x5D77: u"\u6CD3",
-    0x5D78: u"\u6CBD",
-    0x5D79: u"\u6CD7",
-    0x5D7A: u"\u6CC5",
-    0x5D7B: u"\u6CDD",
-    0x5D7C: u"\u6CAE",
-    0x5D7D: u"\u6CB1",
-    0x5D7E: u"\u6CBE",
-    0x5E21: u"\u6CBA",
-    0x5E22: u"\u6CDB",
-    0x5E23: u"\u6CEF",
-    0x5E24: u"\u6CD9",
-    0x5E25: u"\u6CEA",
-    0x5E26: u"\u6D1F",
-    0x5E27: u"\u884D",
-    0x5E28: u"\u6D36",
-    0x5E29: u"\u6D2B",
-    0x5E2A: u"\u6D3D",
-    0x5E2B: u"\u6D38",
-    0x5E2C: u"\u6D19",
-    0x5E2D: u"\u6D35",
-    0x5E2E: u"\u6D33",
-    0x5E2F: u"\u6D12",
-    0x5E30: u"\u6D0C",
-    0x5E31: u"\u6D63",
-    0x5E32: u"\u6D93",
-    0x5E33: u"\u6D64",
-    0x5E34: u"\u6D5A",
-    0x5E35: u"\u6D79",
-    0x5E36: u"\u6D59",
-    0x5E37: u"\u6D8E",
-    0x5E38: u"\u6D95",
-    0x5E39: u"\u6FE4",
-    0x5E3A: u"\u6D85",
-    0x5E3B: u"\u6DF9",
-    0x5E3C: u"\u6E15",
-    0x5E3D: u"\u6E0A",
-    0x5E3E: u"\u6DB5",
-    0x5E3F: u"\u6DC7",
-    0x5E40: u"\u6DE6",
-    0x5E41: u"\u6DB8",
-    0x5E42: u"\u6DC6",
-    0x5E43: u"\u6DEC",
-    0x5E44: u"\u6DDE",
-    0x5E45: u"\u6DCC",
-    0x5E46: u"\u6DE8",
-    0x5E47: u"\u6DD2",
-    0x5E48: u"\u6DC5",
-    0x5E49: u"\u6DFA",
-    0x5E4A: u"\u6DD9",
-    0x5E4B: u"\u6DE4",
-    0x5E4C: u"\u6DD5",
-    0x5E4D: u"\u6DEA",
-    0x5E4E: u"\u6DEE",
-    0x5E4F: u"\u6E2D",
-    0x5E50: u"\u6E6E",
-    0x5E51: u"\u6E2E",
-    0x5E52: u"\u6E19",
-    0x5E53: u"\u6E72",
-    0x5E54: u"\u6E5F",
-    0x5E55: u"\u6E3E",
-    0x5E56: u"\u6E23",
-    0x5E57: u"\u6E6B",
-    0x5E58: u"\u6E2B",
-    0x5E59: u"\u6E76",
-    0x5E5A: u"\u6E4D",
-    0x5E5B: u"\u6E1F",
-    0x5E5C: u"\u6E43",
-    0x5E5D: u"\u6E3A",
-    0x5E5E: u"\u6E4E",
-    0x5E5F: u"\u6E24",
-    0x5E60: u"\u6EFF",
-    0x5E61: u"\u6E1D",
-    0x5E62: u"\u6E38",
-    0x5E63: u"\u6E82",
-    0x5E64: u"\u6EAA",
-    0x5E65: u"\u6E98",
-    0x5E66: u"\u6EC9",
-    0x5E67: u"\u6EB7",
-    0x5E68: u"\u6ED3",
-    0x5E69: u"\u6EBD",
-    0x5E6A: u"\u6EAF",
-    0x5E6B: u"\u6EC4",
-    0x5E6C: u"\u6EB2",
-    0x5E6D: u"\u6ED4",
-    0x5E6E: u"\u6ED5",
-    0x5E6F: u"\u6E8F",
-    0x5E70: u"\u6EA5",
-    0x5E71: u"\u6EC2",
-    0x5E72: u"\u6E9F",
-    0x5E73: u"\u6F41",
-    0x5E74: u"\u6F11",
-    0x5E75: u"\u704C",
-    0x5E76: u"\u6EEC",
-    0x5E77: u"\u6EF8",
-    0x5E78: u"\u6EFE",
-    0x5E79: u"\u6F3F",
-    0x5E7A: u"\u6EF2",
-    0x5E7B: u"\u6F31",
-    0x5E7C: u"\u6EEF",
-    0x5E7D: u"\u6F32",
-    0x5E7E: u"\u6ECC",
-    0x5F21: u"\u6F3E",
-    0x5F22: u"\u6F13",
-    0x5F23: u"\u6EF7",
-    0x5F24: u"\u6F86",
-    0x5F25: u"\u6F7A",
-    0x5F26: u"\u6F78",
-    0x5F27: u"\u6F81",
-    0x5F28: u"\u6F80",
-    0x5F29: u"\u6F6F",
-    0x5F2A: u"\u6F5B",
-    0x5F2B: u"\u6FF3",
-    0x5F2C: u"\u6F6D",
-    0x5F2D: u"\u6F82",
-    0x5F2E: u"\u6F7C",
-    0x5F2F: u"\u6F58",
-    0x5F30: u"\u6F8E",
-    0x5F31: u"\u6F91",
-    0x5F32: u"\u6FC2",
-    0x5F33: u"\u6F66",
-    0x5F34: u"\u6FB3",
-    0x5F35: u"\u6FA3",
-    0x5F36: u"\u6FA1",
-    0x5F37: u"\u6FA4",
-    0x5F38: u"\u6FB9",
-    0x5F39: u"\u6FC6",
-    0x5F3A: u"\u6FAA",
-    0x5F3B: u"\u6FDF",
-    0x5F3C: u"\u6FD5",
-    0x5F3D: u"\u6FEC",
-    0x5F3E: u"\u6FD4",
-    0x5F3F: u"\u6FD8",
-    0x5F40: u"\u6FF1",
-    0x5F41: u"\u6FEE",
-    0x5F42: u"\u6FDB",
-    0x5F43: u"\u7009",
-    0x5F44: u"\u700B",
-    0x5F45: u"\u6FFA",
-    0x5F46: u"\u7011",
-    0x5F47: u"\u7001",
-    0x5F48: u"\u700F",
-    0x5F49: u"\u6FFE",
-    0x5F4A: u"\u701B",
-    0x5F4B: u"\u701A",
-    0x5F4C: u"\u6F74",
-    0x5F4D: u"\u701D",
-    0x5F4E: u"\u7018",
-    0x5F4F: u"\u701F",
-    0x5F50: u"\u7030",
-    0x5F51: u"\u703E",
-    0x5F52: u"\u7032",
-    0x5F53: u"\u7051",
-    0x5F54: u"\u7063",
-    0x5F55: u"\u7099",
-    0x5F56: u"\u7092",
-    0x5F57: u"\u70AF",
-    0x5F58: u"\u70F1",
-    0x5F59: u"\u70AC",
-    0x5F5A: u"\u70B8",
-    0x5F5B: u"\u70B3",
-    0x5F5C: u"\u70AE",
-    0x5F5D: u"\u70DF",
-    0x5F5E: u"\u70CB",
-    0x5F5F: u"\u70DD",
-    0x5F60: u"\u70D9",
-    0x5F61: u"\u7109",
-    0x5F62: u"\u70FD",
-    0x5F63: u"\u711C",
-    0x5F64: u"\u7119",
-    0x5F65: u"\u7165",
-    0x5F66: u"\u7155",
-    0x5F67: u"\u7188",
-    0x5F68: u"\u7166",
-    0x5F69: u"\u7162",
-    0x5F6A: u"\u714C",
-    0x5F6B: u"\u7156",
-    0x5F6C: u"\u716C",
-    0x5F6D: u"\u718F",
-    0x5F6E: u"\u71FB",
-    0x5F6F: u"\u7184",
-    0x5F70: u"\u7195",
-    0x5F71: u"\u71A8",
-    0x5F72: u"\u71AC",
-    0x5F73: u"\u71D7",
-    0x5F74: u"\u71B9",
-    0x5F75: u"\u71BE",
-    0x5F76: u"\u71D2",
-    0x5F77: u"\u71C9",
-    0x5F78: u"\u71D4",
-    0x5F79: u"\u71CE",
-    0x5F7A: u"\u71E0",
-    0x5F7B: u"\u71EC",
-    0x5F7C: u"\u71E7",
-    0x5F7D: u"\u71F5",
-    0x5F7E: u"\u71FC",
-    0x6021: u"\u71F9",
-    0x6022: u"\u71FF",
-    0x6023: u"\u720D",
-    0x6024: u"\u7210",
-    0x6025: u"\u721B",
-    0x6026: u"\u7228",
-    0x6027: u"\u722D",
-    0x6028: u"\u722C",
-    0x6029: u"\u7230",
-    0x602A: u"\u7232",
-    0x602B: u"\u723B",
-    0x602C: u"\u723C",
-    0x602D: u"\u723F",
-    0x602E: u"\u7240",
-    0x602F: u"\u7246",
-    0x6030: u"\u724B",
-    0x6031: u"\u7258",
-    0x6032: u"\u7274",
-    0x6033: u"\u727E",
-    0x6034: u"\u7282",
-    0x6035: u"\u7281",
-    0x6036: u"\u7287",
-    0x6037: u"\u7292",
-    0x6038: u"\u7296",
-    0x6039: u"\u72A2",
-    0x603A: u"\u72A7",
-    0x603B: u"\u72B9",
-    0x603C: u"\u72B2",
-    0x603D: u"\u72C3",
-    0x603E: u"\u72C6",
-    0x603F: u"\u72C4",
-    0x6040: u"\u72CE",
-    0x6041: u"\u72D2",
-    0x6042: u"\u72E2",
-    0x6043: u"\u72E0",
-    0x6044: u"\u72E1",
-    0x6045: u"\u72F9",
-    0x6046: u"\u72F7",
-    0x6047: u"\u500F",
-    0x6048: u"\u7317",
-    0x6049: u"\u730A",
-    0x604A: u"\u731C",
-    0x604B: u"\u7316",
-    0x604C: u"\u731D",
-    0x604D: u"\u7334",
-    0x604E: u"\u732F",
-    0x604F: u"\u7329",
-    0x6050: u"\u7325",
-    0x6051: u"\u733E",
-    0x6052: u"\u734E",
-    0x6053: u"\u734F",
-    0x6054: u"\u9ED8",
-    0x6055: u"\u7357",
-    0x6056: u"\u736A",
-    0x6057: u"\u7368",
-    0x6058: u"\u7370",
-    0x6059: u"\u7378",
-    0x605A: u"\u7375",
-    0x605B: u"\u737B",
-    0x605C: u"\u737A",
-    0x605D: u"\u73C8",
-    0x605E: u"\u73B3",
-    0x605F: u"\u73CE",
-    0x6060: u"\u73BB",
-    0x6061: u"\u73C0",
-    0x6062: u"\u73E5",
-    0x6063: u"\u73EE",
-    0x6064: u"\u73DE",
-    0x6065: u"\u74A2",
-    0x6066: u"\u7405",
-    0x6067: u"\u746F",
-    0x6068: u"\u7425",
-    0x6069: u"\u73F8",
-    0x606A: u"\u7432",
-    0x606B: u"\u743A",
-    0x606C: u"\u7455",
-    0x606D: u"\u743F",
-    0x606E: u"\u745F",
-    0x606F: u"\u7459",
-    0x6070: u"\u7441",
-    0x6071: u"\u745C",
-    0x6072: u"\u7469",
-    0x6073: u"\u7470",
-    0x6074: u"\u7463",
-    0x6075: u"\u746A",
-    0x6076: u"\u7476",
-    0x6077: u"\u747E",
-    0x6078: u"\u748B",
-    0x6079: u"\u749E",
-    0x607A: u"\u74A7",
-    0x607B: u"\u74CA",
-    0x607C: u"\u74CF",
-    0x607D: u"\u74D4",
-    0x607E: u"\u73F1",
-    0x6121: u"\u74E0",
-    0x6122: u"\u74E3",
-    0x6123: u"\u74E7",
-    0x6124: u"\u74E9",
-    0x6125: u"\u74EE",
-    0x6126: u"\u74F2",
-    0x6127: u"\u74F0",
-    0x6128: u"\u74F1",
-    0x6129: u"\u74F8",
-    0x612A: u"\u74F7",
-    0x612B: u"\u7504",
-    0x612C: u"\u7503",
-    0x612D: u"\u7505",
-    0x612E: u"\u750C",
-    0x612F: u"\u750E",
-    0x6130: u"\u750D",
-    0x6131: u"\u7515",
-    0x6132: u"\u7513",
-    0x6133: u"\u751E",
-    0x6134: u"\u7526",
-    0x6135: u"\u752C",
-    0x6136: u"\u753C",
-    0x6137: u"\u7544",
-    0x6138: u"\u754D",
-    0x6139: u"\u754A",
-    0x613A: u"\u7549",
-    0x613B: u"\u755B",
-    0x613C: u"\u7546",
-    0x613D: u"\u755A",
-    0x613E: u"\u7569",
-    0x613F: u"\u7564",
-    0x6140: u"\u7567",
-    0x6141: u"\u756B",
-    0x6142: u"\u756D",
-    0x6143: u"\u7578",
-    0x6144: u"\u7576",
-    0x6145: u"\u7586",
-    0x6146: u"\u7587",
-    0x6147: u"\u7574",
-    0x6148: u"\u758A",
-    0x6149: u"\u7589",
-    0x614A: u"\u7582",
-    0x614B: u"\u7594",
-    0x614C: u"\u759A",
-    0x614D: u"\u759D",
-    0x614E: u"\u75A5",
-    0x614F: u"\u75A3",
-    0x6150: u"\u75C2",
-    0x6151: u"\u75B3",
-    0x6152: u"\u75C3",
-    0x6153: u"\u75B5",
-    0x6154: u"\u75BD",
-    0x6155: u"\u75B8",
-    0x6156: u"\u75BC",
-    0x6157: u"\u75B1",
-    0x6158: u"\u75CD",
-    0x6159: u"\u75CA",
-    0x615A: u"\u75D2",
-    0x615B: u"\u75D9",
-    0x615C: u"\u75E3",
-    0x615D: u"\u75DE",
-    0x615E: u"\u75FE",
-    0x615F: u"\u75FF",
-    0x6160: u"\u75FC",
-    0x6161: u"\u7601",
-    0x6162: u"\u75F0",
-    0x6163: u"\u75FA",
-    0x6164: u"\u75F2",
-    0x6165: u"\u75F3",
-    0x6166: u"\u760B",
-    0x6167: u"\u760D",
-    0x6168: u"\u7609",
-    0x6169: u"\u761F",
-    0x616A: u"\u7627",
-    0x616B: u"\u7620",
-    0x616C: u"\u7621",
-    0x616D: u"\u7622",
-    0x616E: u"\u7624",
-    0x616F: u"\u7634",
-    0x6170: u"\u7630",
-    0x6171: u"\u763B",
-    0x6172: u"\u7647",
-    0x6173: u"\u7648",
-    0x6174: u"\u7646",
-    0x6175: u"\u765C",
-    0x6176: u"\u7658",
-    0x6177: u"\u7661",
-    0x6178: u"\u7662",
-    0x6179: u"\u7668",
-    0x617A: u"\u7669",
-    0x617B: u"\u766A",
-    0x617C: u"\u7667",
-    0x617D: u"\u766C",
-    0x617E: u"\u7670",
-    0x6221: u"\u7672",
-    0x6222: u"\u7676",
-    0x6223: u"\u7678",
-    0x6224: u"\u767C",
-    0x6225: u"\u7680",
-    0x6226: u"\u7683",
-    0x6227: u"\u7688",
-    0x6228: u"\u768B",
-    0x6229: u"\u768E",
-    0x622A: u"\u7696",
-    0x622B: u"\u7693",
-    0x622C: u"\u7699",
-    0x622D: u"\u769A",
-    0x622E: u"\u76B0",
-    0x622F: u"\u76B4",
-    0x6230: u"\u76B8",
-    0x6231: u"\u76B9",
-    0x6232: u"\u76BA",
-    0x6233: u"\u76C2",
-    0x6234: u"\u76CD",
-    0x6235: u"\u76D6",
-    0x6236: u"\u76D2",
-    0x6237: u"\u76DE",
-    0x6238: u"\u76E1",
-    0x6239: u"\u76E5",
-    0x623A: u"\u76E7",
-    0x623B: u"\u76EA",
-    0x623C: u"\u862F",
-    0x623D: u"\u76FB",
-    0x623E: u"\u7708",
-    0x623F: u"\u7707",
-    0x6240: u"\u7704",
-    0x6241: u"\u7729",
-    0x6242: u"\u7724",
-    0x6243: u"\u771E",
-    0x6244: u"\u7725",
-    0x6245: u"\u7726",
-    0x6246: u"\u771B",
-    0x6247: u"\u7737",
-    0x6248: u"\u7738",
-    0x6249: u"\u7747",
-    0x624A: u"\u775A",
-    0x624B: u"\u7768",
-    0x624C: u"\u776B",
-    0x624D: u"\u775B",
-    0x624E: u"\u7765",
-    0x624F: u"\u777F",
-    0x6250: u"\u777E",
-    0x6251: u"\u7779",
-    0x6252: u"\u778E",
-    0x6253: u"\u778B",
-    0x6254: u"\u7791",
-    0x6255: u"\u77A0",
-    0x6256: u"\u779E",
-    0x6257: u"\u77B0",
-    0x6258: u"\u77B6",
-    0x6259: u"\u77B9",
-    0x625A: u"\u77BF",
-    0x625B: u"\u77BC",
-    0x625C: u"\u77BD",
-    0x625D: u"\u77BB",
-    0x625E: u"\u77C7",
-    0x625F: u"\u77CD",
-    0x6260: u"\u77D7",
-    0x6261: u"\u77DA",
-    0x6262: u"\u77DC",
-    0x6263: u"\u77E3",
-    0x6264: u"\u77EE",
-    0x6265: u"\u77FC",
-    0x6266: u"\u780C",
-    0x6267: u"\u7812",
-    0x6268: u"\u7926",
-    0x6269: u"\u7820",
-    0x626A: u"\u792A",
-    0x626B: u"\u7845",
-    0x626C: u"\u788E",
-    0x626D: u"\u7874",
-    0x626E: u"\u7886",
-    0x626F: u"\u787C",
-    0x6270: u"\u789A",
-    0x6271: u"\u788C",
-    0x6272: u"\u78A3",
-    0x6273: u"\u78B5",
-    0x6274: u"\u78AA",
-    0x6275: u"\u78AF",
-    0x6276: u"\u78D1",
-    0x6277: u"\u78C6",
-    0x6278: u"\u78CB",
-    0x6279: u"\u78D4",
-    0x627A: u"\u78BE",
-    0x627B: u"\u78BC",
-    0x627C: u"\u78C5",
-    0x627D: u"\u78CA",
-    0x627E: u"\u78EC",
-    0x6321: u"\u78E7",
-    0x6322: u"\u78DA",
-    0x6323: u"\u78FD",
-    0x6324: u"\u78F4",
-    0x6325: u"\u7907",
-    0x6326: u"\u7912",
-    0x6327: u"\u7911",
-    0x6328: u"\u7919",
-    0x6329: u"\u792C",
-    0x632A: u"\u792B",
-    0x632B: u"\u7940",
-    0x632C: u"\u7960",
-    0x632D: u"\u7957",
-    0x632E: u"\u795F",
-    0x632F: u"\u795A",
-    0x6330: u"\u7955",
-    0x6331: u"\u7953",
-    0x6332: u"\u797A",
-    0x6333: u"\u797F",
-    0x6334: u"\u798A",
-    0x6335: u"\u799D",
-    0x6336: u"\u79A7",
-    0x6337: u"\u9F4B",
-    0x6338: u"\u79AA",
-    0x6339: u"\u79AE",
-    0x633A: u"\u79B3",
-    0x633B: u"\u79B9",
-    0x633C: u"\u79BA",
-    0x633D: u"\u79C9",
-    0x633E: u"\u79D5",
-    0x633F: u"\u79E7",
-    0x6340: u"\u79EC",
-    0x6341: u"\u79E1",
-    0x6342: u"\u79E3",
-    0x6343: u"\u7A08",
-    0x6344: u"\u7A0D",
-    0x6345: u"\u7A18",
-    0x6346: u"\u7A19",
-    0x6347: u"\u7A20",
-    0x6348: u"\u7A1F",
-    0x6349: u"\u7980",
-    0x634A: u"\u7A31",
-    0x634B: u"\u7A3B",
-    0x634C: u"\u7A3E",
-    0x634D: u"\u7A37",
-    0x634E: u"\u7A43",
-    0x634F: u"\u7A57",
-    0x6350: u"\u7A49",
-    0x6351: u"\u7A61",
-    0x6352: u"\u7A62",
-    0x6353: u"\u7A69",
-    0x6354: u"\u9F9D",
-    0x6355: u"\u7A70",
-    0x6356: u"\u7A79",
-    0x6357: u"\u7A7D",
-    0x6358: u"\u7A88",
-    0x6359: u"\u7A97",
-    0x635A: u"\u7A95",
-    0x635B: u"\u7A98",
-    0x635C: u"\u7A96",
-    0x635D: u"\u7AA9",
-    0x635E: u"\u7AC8",
-    0x635F: u"\u7AB0",
-    0x6360: u"\u7AB6",
-    0x6361: u"\u7AC5",
-    0x6362: u"\u7AC4",
-    0x6363: u"\u7ABF",
-    0x6364: u"\u9083",
-    0x6365: u"\u7AC7",
-    0x6366: u"\u7ACA",
-    0x6367: u"\u7ACD",
-    0x6368: u"\u7ACF",
-    0x6369: u"\u7AD5",
-    0x636A: u"\u7AD3",
-    0x636B: u"\u7AD9",
-    0x636C: u"\u7ADA",
-    0x636D: u"\u7ADD",
-    0x636E: u"\u7AE1",
-    0x636F: u"\u7AE2",
-    0x6370: u"\u7AE6",
-    0x6371: u"\u7AED",
-    0x6372: u"\u7AF0",
-    0x6373: u"\u7B02",
-    0x6374: u"\u7B0F",
-    0x6375: u"\u7B0A",
-    0x6376: u"\u7B06",
-    0x6377: u"\u7B33",
-    0x6378: u"\u7B18",
-    0x6379: u"\u7B19",
-    0x637A: u"\u7B1E",
-    0x637B: u"\u7B35",
-    0x637C: u"\u7B28",
-    0x637D: u"\u7B36",
-    0x637E: u"\u7B50",
-    0x6421: u"\u7B7A",
-    0x6422: u"\u7B04",
-    0x6423: u"\u7B4D",
-    0x6424: u"\u7B0B",
-    0x6425: u"\u7B4C",
-    0x6426: u"\u7B45",
-    0x6427: u"\u7B75",
-    0x6428: u"\u7B65",
-    0x6429: u"\u7B74",
-    0x642A: u"\u7B67",
-    0x642B: u"\u7B70",
-    0x642C: u"\u7B71",
-    0x642D: u"\u7B6C",
-    0x642E: u"\u7B6E",
-    0x642F: u"\u7B9D",
-    0x6430: u"\u7B98",
-    0x6431: u"\u7B9F",
-    0x6432: u"\u7B8D",
-    0x6433: u"\u7B9C",
-    0x6434: u"\u7B9A",
-    0x6435: u"\u7B8B",
-    0x6436: u"\u7B92",
-    0x6437: u"\u7B8F",
-    0x6438: u"\u7B5D",
-    0x6439: u"\u7B99",
-    0x643A: u"\u7BCB",
-    0x643B: u"\u7BC1",
-    0x643C: u"\u7BCC",
-    0x643D: u"\u7BCF",
-    0x643E: u"\u7BB4",
-    0x643F: u"\u7BC6",
-    0x6440: u"\u7BDD",
-    0x6441: u"\u7BE9",
-    0x6442: u"\u7C11",
-    0x6443: u"\u7C14",
-    0x6444: u"\u7BE6",
-    0x6445: u"\u7BE5",
-    0x6446: u"\u7C60",
-    0x6447: u"\u7C00",
-    0x6448: u"\u7C07",
-    0x6449: u"\u7C13",
-    0x644A: u"\u7BF3",
-    0x644B: u"\u7BF7",
-    0x644C: u"\u7C17",
-    0x644D: u"\u7C0D",
-    0x644E: u"\u7BF6",
-    0x644F: u"\u7C23",
-    0x6450: u"\u7C27",
-    0x6451: u"\u7C2A",
-    0x6452: u"\u7C1F",
-    0x6453: u"\u7C37",
-    0x6454: u"\u7C2B",
-    0x6455: u"\u7C3D",
-    0x6456: u"\u7C4C",
-    0x6457: u"\u7C43",
-    0x6458: u"\u7C54",
-    0x6459: u"\u7C4F",
-    0x645A: u"\u7C40",
-    0x645B: u"\u7C50",
-    0x645C: u"\u7C58",
-    0x645D: u"\u7C5F",
-    0x645E: u"\u7C64",
-    0x645F: u"\u7C56",
-    0x6460: u"\u7C65",
-    0x6461: u"\u7C6C",
-    0x6462: u"\u7C75",
-    0x6463: u"\u7C83",
-    0x6464: u"\u7C90",
-    0x6465: u"\u7CA4",
-    0x6466: u"\u7CAD",
-    0x6467: u"\u7CA2",
-    0x6468: u"\u7CAB",
-    0x6469: u"\u7CA1",
-    0x646A: u"\u7CA8",
-    0x646B: u"\u7CB3",
-    0x646C: u"\u7CB2",
-    0x646D: u"\u7CB1",
-    0x646E: u"\u7CAE",
-    0x646F: u"\u7CB9",
-    0x6470: u"\u7CBD",
-    0x6471: u"\u7CC0",
-    0x6472: u"\u7CC5",
-    0x6473: u"\u7CC2",
-    0x6474: u"\u7CD8",
-    0x6475: u"\u7CD2",
-    0x6476: u"\u7CDC",
-    0x6477: u"\u7CE2",
-    0x6478: u"\u9B3B",
-    0x6479: u"\u7CEF",
-    0x647A: u"\u7CF2",
-    0x647B: u"\u7CF4",
-    0x647C: u"\u7CF6",
-    0x647D: u"\u7CFA",
-    0x647E: u"\u7D06",
-    0x6521: u"\u7D02",
-    0x6522: u"\u7D1C",
-    0x6523: u"\u7D15",
-    0x6524: u"\u7D0A",
-    0x6525: u"\u7D45",
-    0x6526: u"\u7D4B",
-    0x6527: u"\u7D2E",
-    0x6528: u"\u7D32",
-    0x6529: u"\u7D3F",
-    0x652A: u"\u7D35",
-    0x652B: u"\u7D46",
-    0x652C: u"\u7D73",
-    0x652D: u"\u7D56",
-    0x652E: u"\u7D4E",
-    0x652F: u"\u7D72",
-    0x6530: u"\u7D68",
-    0x6531: u"\u7D6E",
-    0x6532: u"\u7D4F",
-    0x6533: u"\u7D63",
-    0x6534: u"\u7D93",
-    0x6535: u"\u7D89",
-    0x6536: u"\u7D5B",
-    0x6537: u"\u7D8F",
-    0x6538: u"\u7D7D",
-    0x6539: u"\u7D9B",
-    0x653A: u"\u7DBA",
-    0x653B: u"\u7DAE",
-    0x653C: u"\u7DA3",
-    0x653D: u"\u7DB5",
-    0x653E: u"\u7DC7",
-    0x653F: u"\u7DBD",
-    0x6540: u"\u7DAB",
-    0x6541: u"\u7E3D",
-    0x6542: u"\u7DA2",
-    0x6543: u"\u7DAF",
-    0x6544: u"\u7DDC",
-    0x6545: u"\u7DB8",
-    0x6546: u"\u7D9F",
-    0x6547: u"\u7DB0",
-    0x6548: u"\u7DD8",
-    0x6549: u"\u7DDD",
-    0x654A: u"\u7DE4",
-    0x654B: u"\u7DDE",
-    0x654C: u"\u7DFB",
-    0x654D: u"\u7DF2",
-    0x654E: u"\u7DE1",
-    0x654F: u"\u7E05",
-    0x6550: u"\u7E0A",
-    0x6551: u"\u7E23",
-    0x6552: u"\u7E21",
-    0x6553: u"\u7E12",
-    0x6554: u"\u7E31",
-    0x6555: u"\u7E1F",
-    0x6556: u"\u7E09",
-    0x6557: u"\u7E0B",
-    0x6558: u"\u7E22",
-    0x6559: u"\u7E46",
-    0x655A: u"\u7E66",
-    0x655B: u"\u7E3B",
-    0x655C: u"\u7E35",
-    0x655D: u"\u7E39",
-    0x655E: u"\u7E43",
-    0x655F: u"\u7E37",
-    0x6560: u"\u7E32",
-    0x6561: u"\u7E3A",
-    0x6562: u"\u7E67",
-    0x6563: u"\u7E5D",
-    0x6564: u"\u7E56",
-    0x6565: u"\u7E5E",
-    0x6566: u"\u7E59",
-    0x6567: u"\u7E5A",
-    0x6568: u"\u7E79",
-    0x6569: u"\u7E6A",
-    0x656A: u"\u7E69",
-    0x656B: u"\u7E7C",
-    0x656C: u"\u7E7B",
-    0x656D: u"\u7E83",
-    0x656E: u"\u7DD5",
-    0x656F: u"\u7E7D",
-    0x6570: u"\u8FAE",
-    0x6571: u"\u7E7F",
-    0x6572: u"\u7E88",
-    0x6573: u"\u7E89",
-    0x6574: u"\u7E8C",
-    0x6575: u"\u7E92",
-    0x6576: u"\u7E90",
-    0x6577: u"\u7E93",
-    0x6578: u"\u7E94",
-    0x6579: u"\u7E96",
-    0x657A: u"\u7E8E",
-    0x657B: u"\u7E9B",
-    0x657C: u"\u7E9C",
-    0x657D: u"\u7F38",
-    0x657E: u"\u7F3A",
-    0x6621: u"\u7F45",
-    0x6622: u"\u7F4C",
-    0x6623: u"\u7F4D",
-    0x6624: u"\u7F4E",
-    0x6625: u"\u7F50",
-    0x6626: u"\u7F51",
-    0x6627: u"\u7F55",
-    0x6628: u"\u7F54",
-    0x6629: u"\u7F58",
-    0x662A: u"\u7F5F",
-    0x662B: u"\u7F60",
-    0x662C: u"\u7F68",
-    0x662D: u"\u7F69",
-    0x662E: u"\u7F67",
-    0x662F: u"\u7F78",
-    0x6630: u"\u7F82",
-    0x6631: u"\u7F86",
-    0x6632: u"\u7F83",
-    0x6633: u"\u7F88",
-    0x6634: u"\u7F87",
-    0x6635: u"\u7F8C",
-    0x6636: u"\u7F94",
-    0x6637: u"\u7F9E",
-    0x6638: u"\u7F9D",
-    0x6639: u"\u7F9A",
-    0x663A: u"\u7FA3",
-    0x663B: u"\u7FAF",
-    0x663C: u"\u7FB2",
-    0x663D: u"\u7FB9",
-    0x663E: u"\u7FAE",
-    0x663F: u"\u7FB6",
-    0x6640: u"\u7FB8",
-    0x6641: u"\u8B71",
-    0x6642: u"\u7FC5",
-    0x6643: u"\u7FC6",
-    0x6644: u"\u7FCA",
-    0x6645: u"\u7FD5",
-    0x6646: u"\u7FD4",
-    0x6647: u"\u7FE1",
-    0x6648: u"\u7FE6",
-    0x6649: u"\u7FE9",
-    0x664A: u"\u7FF3",
-    0x664B: u"\u7FF9",
-    0x664C: u"\u98DC",
-    0x664D: u"\u8006",
-    0x664E: u"\u8004",
-    0x664F: u"\u800B",
-    0x6650: u"\u8012",
-    0x6651: u"\u8018",
-    0x6652: u"\u8019",
-    0x6653: u"\u801C",
-    0x6654: u"\u8021",
-    0x6655: u"\u8028",
-    0x6656: u"\u803F",
-    0x6657: u"\u803B",
-    0x6658: u"\u804A",
-    0x6659: u"\u8046",
-    0x665A: u"\u8052",
-    0x665B: u"\u8058",
-    0x665C: u"\u805A",
-    0x665D: u"\u805F",
-    0x665E: u"\u8062",
-    0x665F: u"\u8068",
-    0x6660: u"\u8073",
-    0x6661: u"\u8072",
-    0x6662: u"\u8070",
-    0x6663: u"\u8076",
-    0x6664: u"\u8079",
-    0x6665: u"\u807D",
-    0x6666: u"\u807F",
-    0x6667: u"\u8084",
-    0x6668: u"\u8086",
-    0x6669: u"\u8085",
-    0x666A: u"\u809B",
-    0x666B: u"\u8093",
-    0x666C: u"\u809A",
-    0x666D: u"\u80AD",
-    0x666E: u"\u5190",
-    0x666F: u"\u80AC",
-    0x6670: u"\u80DB",
-    0x6671: u"\u80E5",
-    0x6672: u"\u80D9",
-    0x6673: u"\u80DD",
-    0x6674: u"\u80C4",
-    0x6675: u"\u80DA",
-    0x6676: u"\u80D6",
-    0x6677: u"\u8109",
-    0x6678: u"\u80EF",
-    0x6679: u"\u80F1",
-    0x667A: u"\u811B",
-    0x667B: u"\u8129",
-    0x667C: u"\u8123",
-    0x667D: u"\u812F",
-    0x667E: u"\u814B",
-    0x6721: u"\u968B",
-    0x6722: u"\u8146",
-    0x6723: u"\u813E",
-    0x6724: u"\u8153",
-    0x6725: u"\u8151",
-    0x6726: u"\u80FC",
-    0x6727: u"\u8171",
-    0x6728: u"\u816E",
-    0x6729: u"\u8165",
-    0x672A: u"\u8166",
-    0x672B: u"\u8174",
-    0x672C: u"\u8183",
-    0x672D: u"\u8188",
-    0x672E: u"\u818A",
-    0x672F: u"\u8180",
-    0x6730: u"\u8182",
-    0x6731: u"\u81A0",
-    0x6732: u"\u8195",
-    0x6733: u"\u81A4",
-    0x6734: u"\u81A3",
-    0x6735: u"\u815F",
-    0x6736: u"\u8193",
-    0x6737: u"\u81A9",
-    0x6738: u"\u81B0",
-    0x6739: u"\u81B5",
-    0x673A: u"\u81BE",
-    0x673B: u"\u81B8",
-    0x673C: u"\u81BD",
-    0x673D: u"\u81C0",
-    0x673E: u"\u81C2",
-    0x673F: u"\u81BA",
-    0x6740: u"\u81C9",
-    0x6741: u"\u81CD",
-    0x6742: u"\u81D1",
-    0x6743: u"\u81D9",
-    0x6744: u"\u81D8",
-    0x6745: u"\u81C8",
-    0x6746: u"\u81DA",
-    0x6747: u"\u81DF",
-    0x6748: u"\u81E0",
-    0x6749: u"\u81E7",
-    0x674A: u"\u81FA",
-    0x674B: u"\u81FB",
-    0x674C: u"\u81FE",
-    0x674D: u"\u8201",
-    0x674E: u"\u8202",
-    0x674F: u"\u8205",
-    0x6750: u"\u8207",
-    0x6751: u"\u820A",
-    0x6752: u"\u820D",
-    0x6753: u"\u8210",
-    0x6754: u"\u8216",
-    0x6755: u"\u8229",
-    0x6756: u"\u822B",
-    0x6757: u"\u8238",
-    0x6758: u"\u8233",
-    0x6759: u"\u8240",
-    0x675A: u"\u8259",
-    0x675B: u"\u8258",
-    0x675C: u"\u825D",
-    0x675D: u"\u825A",
-    0x675E: u"\u825F",
-    0x675F: u"\u8264",
-    0x6760: u"\u8262",
-    0x6761: u"\u8268",
-    0x6762: u"\u826A",
-    0x6763: u"\u826B",
-    0x6764: u"\u822E",
-    0x6765: u"\u8271",
-    0x6766: u"\u8277",
-    0x6767: u"\u8278",
-    0x6768: u"\u827E",
-    0x6769: u"\u828D",
-    0x676A: u"\u8292",
-    0x676B: u"\u82AB",
-    0x676C: u"\u829F",
-    0x676D: u"\u82BB",
-    0x676E: u"\u82AC",
-    0x676F: u"\u82E1",
-    0x6770: u"\u82E3",
-    0x6771: u"\u82DF",
-    0x6772: u"\u82D2",
-    0x6773: u"\u82F4",
-    0x6774: u"\u82F3",
-    0x6775: u"\u82FA",
-    0x6776: u"\u8393",
-    0x6777: u"\u8303",
-    0x6778: u"\u82FB",
-    0x6779: u"\u82F9",
-    0x677A: u"\u82DE",
-    0x677B: u"\u8306",
-    0x677C: u"\u82DC",
-    0x677D: u"\u8309",
-    0x677E: u"\u82D9",
-    0x6821: u"\u8335",
-    0x6822: u"\u8334",
-    0x6823: u"\u8316",
-    0x6824: u"\u8332",
-    0x6825: u"\u8331",
-    0x6826: u"\u8340",
-    0x6827: u"\u8339",
-    0x6828: u"\u8350",
-    0x6829: u"\u8345",
-    0x682A: u"\u832F",
-    0x682B: u"\u832B",
-    0x682C: u"\u8317",
-    0x682D: u"\u8318",
-    0x682E: u"\u8385",
-    0x682F: u"\u839A",
-    0x6830: u"\u83AA",
-    0x6831: u"\u839F",
-    0x6832: u"\u83A2",
-    0x6833: u"\u8396",
-    0x6834: u"\u8323",
-    0x6835: u"\u838E",
-    0x6836: u"\u8387",
-    0x6837: u"\u838A",
-    0x6838: u"\u837C",
-    0x6839: u"\u83B5",
-    0x683A: u"\u8373",
-    0x683B: u"\u8375",
-    0x683C: u"\u83A0",
-    0x683D: u"\u8389",
-    0x683E: u"\u83A8",
-    0x683F: u"\u83F4",
-    0x6840: u"\u8413",
-    0x6841: u"\u83EB",
-    0x6842: u"\u83CE",
-    0x6843: u"\u83FD",
-    0x6844: u"\u8403",
-    0x6845: u"\u83D8",
-    0x6846: u"\u840B",
-    0x6847: u"\u83C1",
-    0x6848: u"\u83F7",
-    0x6849: u"\u8407",
-    0x684A: u"\u83E0",
-    0x684B: u"\u83F2",
-    0x684C: u"\u840D",
-    0x684D: u"\u8422",
-    0x684E: u"\u8420",
-    0x684F: u"\u83BD",
-    0x6850: u"\u8438",
-    0x6851: u"\u8506",
-    0x6852: u"\u83FB",
-    0x6853: u"\u846D",
-    0x6854: u"\u842A",
-    0x6855: u"\u843C",
-    0x6856: u"\u855A",
-    0x6857: u"\u8484",
-    0x6858: u"\u8477",
-    0x6859: u"\u846B",
-    0x685A: u"\u84AD",
-    0x685B: u"\u846E",
-    0x685C: u"\u8482",
-    0x685D: u"\u8469",
-    0x685E: u"\u8446",
-    0x685F: u"\u842C",
-    0x6860: u"\u846F",
-    0x6861: u"\u8479",
-    0x6862: u"\u8435",
-    0x6863: u"\u84CA",
-    0x6864: u"\u8462",
-    0x6865: u"\u84B9",
-    0x6866: u"\u84BF",
-    0x6867: u"\u849F",
-    0x6868: u"\u84D9",
-    0x6869: u"\u84CD",
-    0x686A: u"\u84BB",
-    0x686B: u"\u84DA",
-    0x686C: u"\u84D0",
-    0x686D: u"\u84C1",
-    0x686E: u"\u84C6",
-    0x686F: u"\u84D6",
-    0x6870: u"\u84A1",
-    0x6871: u"\u8521",
-    0x6872: u"\u84FF",
-    0x6873: u"\u84F4",
-    0x6874: u"\u8517",
-    0x6875: u"\u8518",
-    0x6876: u"\u852C",
-    0x6877: u"\u851F",
-    0x6878: u"\u8515",
-    0x6879: u"\u8514",
-    0x687A: u"\u84FC",
-    0x687B: u"\u8540",
-    0x687C: u"\u8563",
-    0x687D: u"\u8558",
-    0x687E: u"\u8548",
-    0x6921: u"\u8541",
-    0x6922: u"\u8602",
-    0x6923: u"\u854B",
-    0x6924: u"\u8555",
-    0x6925: u"\u8580",
-    0x6926: u"\u85A4",
-    0x6927: u"\u8588",
-    0x6928: u"\u8591",
-    0x6929: u"\u858A",
-    0x692A: u"\u85A8",
-    0x692B: u"\u856D",
-    0x692C: u"\u8594",
-    0x692D: u"\u859B",
-    0x692E: u"\u85EA",
-    0x692F: u"\u8587",
-    0x6930: u"\u859C",
-    0x6931: u"\u8577",
-    0x6932: u"\u857E",
-    0x6933: u"\u8590",
-    0x6934: u"\u85C9",
-    0x6935: u"\u85BA",
-    0x6936: u"\u85CF",
-    0x6937: u"\u85B9",
-    0x6938: u"\u85D0",
-    0x6939: u"\u85D5",
-    0x693A: u"\u85DD",
-    0x693B: u"\u85E5",
-    0x693C: u"\u85DC",
-    0x693D: u"\u85F9",
-    0x693E: u"\u860A",
-    0x693F: u"\u8613",
-    0x6940: u"\u860B",
-    0x6941: u"\u85FE",
-    0x6942: u"\u85FA",
-    0x6943: u"\u8606",
-    0x6944: u"\u8622",
-    0x6945: u"\u861A",
-    0x6946: u"\u8630",
-    0x6947: u"\u863F",
-    0x6948: u"\u864D",
-    0x6949: u"\u4E55",
-    0x694A: u"\u8654",
-    0x694B: u"\u865F",
-    0x694C: u"\u8667",
-    0x694D: u"\u8671",
-    0x694E: u"\u8693",
-    0x694F: u"\u86A3",
-    0x6950: u"\u86A9",
-    0x6951: u"\u86AA",
-    0x6952: u"\u868B",
-    0x6953: u"\u868C",
-    0x6954: u"\u86B6",
-    0x6955: u"\u86AF",
-    0x6956: u"\u86C4",
-    0x6957: u"\u86C6",
-    0x6958: u"\u86B0",
-    0x6959: u"\u86C9",
-    0x695A: u"\u8823",
-    0x695B: u"\u86AB",
-    0x695C: u"\u86D4",
-    0x695D: u"\u86DE",
-    0x695E: u"\u86E9",
-    0x695F: u"\u86EC",
-    0x6960: u"\u86DF",
-    0x6961: u"\u86DB",
-    0x6962: u"\u86EF",
-    0x6963: u"\u8712",
-    0x6964: u"\u8706",
-    0x6965: u"\u8708",
-    0x6966: u"\u8700",
-    0x6967: u"\u8703",
-    0x6968: u"\u86FB",
-    0x6969: u"\u8711",
-    0x696A: u"\u8709",
-    0x696B: u"\u870D",
-    0x696C: u"\u86F9",
-    0x696D: u"\u870A",
-    0x696E: u"\u8734",
-    0x696F: u"\u873F",
-    0x6970: u"\u8737",
-    0x6971: u"\u873B",
-    0x6972: u"\u8725",
-    0x6973: u"\u8729",
-    0x6974: u"\u871A",
-    0x6975: u"\u8760",
-    0x6976: u"\u875F",
-    0x6977: u"\u8778",
-    0x6978: u"\u874C",
-    0x6979: u"\u874E",
-    0x697A: u"\u8774",
-    0x697B: u"\u8757",
-    0x697C: u"\u8768",
-    0x697D: u"\u876E",
-    0x697E: u"\u8759",
-    0x6A21: u"\u8753",
-    0x6A22: u"\u8763",
-    0x6A23: u"\u876A",
-    0x6A24: u"\u8805",
-    0x6A25: u"\u87A2",
-    0x6A26: u"\u879F",
-    0x6A27: u"\u8782",
-    0x6A28: u"\u87AF",
-    0x6A29: u"\u87CB",
-    0x6A2A: u"\u87BD",
-    0x6A2B: u"\u87C0",
-    0x6A2C: u"\u87D0",
-    0x6A2D: u"\u96D6",
-    0x6A2E: u"\u87AB",
-    0x6A2F: u"\u87C4",
-    0x6A30: u"\u87B3",
-    0x6A31: u"\u87C7",
-    0x6A32: u"\u87C6",
-    0x6A33: u"\u87BB",
-    0x6A34: u"\u87EF",
-    0x6A35: u"\u87F2",
-    0x6A36: u"\u87E0",
-    0x6A37: u"\u880F",
-    0x6A38: u"\u880D",
-    0x6A39: u"\u87FE",
-    0x6A3A: u"\u87F6",
-    0x6A3B: u"\u87F7",
-    0x6A3C: u"\u880E",
-    0x6A3D: u"\u87D2",
-    0x6A3E: u"\u8811",
-    0x6A3F: u"\u8816",
-    0x6A40: u"\u8815",
-    0x6A41: u"\u8822",
-    0x6A42: u"\u8821",
-    0x6A43: u"\u8831",
-    0x6A44: u"\u8836",
-    0x6A45: u"\u8839",
-    0x6A46: u"\u8827",
-    0x6A47: u"\u883B",
-    0x6A48: u"\u8844",
-    0x6A49: u"\u8842",
-    0x6A4A: u"\u8852",
-    0x6A4B: u"\u8859",
-    0x6A4C: u"\u885E",
-    0x6A4D: u"\u8862",
-    0x6A4E: u"\u886B",
-    0x6A4F: u"\u8881",
-    0x6A50: u"\u887E",
-    0x6A51: u"\u889E",
-    0x6A52: u"\u8875",
-    0x6A53: u"\u887D",
-    0x6A54: u"\u88B5",
-    0x6A55: u"\u8872",
-    0x6A56: u"\u8882",
-    0x6A57: u"\u8897",
-    0x6A58: u"\u8892",
-    0x6A59: u"\u88AE",
-    0x6A5A: u"\u8899",
-    0x6A5B: u"\u88A2",
-    0x6A5C: u"\u888D",
-    0x6A5D: u"\u88A4",
-    0x6A5E: u"\u88B0",
-    0x6A5F: u"\u88BF",
-    0x6A60: u"\u88B1",
-    0x6A61: u"\u88C3",
-    0x6A62: u"\u88C4",
-    0x6A63: u"\u88D4",
-    0x6A64: u"\u88D8",
-    0x6A65: u"\u88D9",
-    0x6A66: u"\u88DD",
-    0x6A67: u"\u88F9",
-    0x6A68: u"\u8902",
-    0x6A69: u"\u88FC",
-    0x6A6A: u"\u88F4",
-    0x6A6B: u"\u88E8",
-    0x6A6C: u"\u88F2",
-    0x6A6D: u"\u8904",
-    0x6A6E: u"\u890C",
-    0x6A6F: u"\u890A",
-    0x6A70: u"\u8913",
-    0x6A71: u"\u8943",
-    0x6A72: u"\u891E",
-    0x6A73: u"\u8925",
-    0x6A74: u"\u892A",
-    0x6A75: u"\u892B",
-    0x6A76: u"\u8941",
-    0x6A77: u"\u8944",
-    0x6A78: u"\u893B",
-    0x6A79: u"\u8936",
-    0x6A7A: u"\u8938",
-    0x6A7B: u"\u894C",
-    0x6A7C: u"\u891D",
-    0x6A7D: u"\u8960",
-    0x6A7E: u"\u895E",
-    0x6B21: u"\u8966",
-    0x6B22: u"\u8964",
-    0x6B23: u"\u896D",
-    0x6B24: u"\u896A",
-    0x6B25: u"\u896F",
-    0x6B26: u"\u8974",
-    0x6B27: u"\u8977",
-    0x6B28: u"\u897E",
-    0x6B29: u"\u8983",
-    0x6B2A: u"\u8988",
-    0x6B2B: u"\u898A",
-    0x6B2C: u"\u8993",
-    0x6B2D: u"\u8998",
-    0x6B2E: u"\u89A1",
-    0x6B2F: u"\u89A9",
-    0x6B30: u"\u89A6",
-    0x6B31: u"\u89AC",
-    0x6B32: u"\u89AF",
-    0x6B33: u"\u89B2",
-    0x6B34: u"\u89BA",
-    0x6B35: u"\u89BD",
-    0x6B36: u"\u89BF",
-    0x6B37: u"\u89C0",
-    0x6B38: u"\u89DA",
-    0x6B39: u"\u89DC",
-    0x6B3A: u"\u89DD",
-    0x6B3B: u"\u89E7",
-    0x6B3C: u"\u89F4",
-    0x6B3D: u"\u89F8",
-    0x6B3E: u"\u8A03",
-    0x6B3F: u"\u8A16",
-    0x6B40: u"\u8A10",
-    0x6B41: u"\u8A0C",
-    0x6B42: u"\u8A1B",
-    0x6B43: u"\u8A1D",
-    0x6B44: u"\u8A25",
-    0x6B45: u"\u8A36",
-    0x6B46: u"\u8A41",
-    0x6B47: u"\u8A5B",
-    0x6B48: u"\u8A52",
-    0x6B49: u"\u8A46",
-    0x6B4A: u"\u8A48",
-    0x6B4B: u"\u8A7C",
-    0x6B4C: u"\u8A6D",
-    0x6B4D: u"\u8A6C",
-    0x6B4E: u"\u8A62",
-    0x6B4F: u"\u8A85",
-    0x6B50: u"\u8A82",
-    0x6B51: u"\u8A84",
-    0x6B52: u"\u8AA8",
-    0x6B53: u"\u8AA1",
-    0x6B54: u"\u8A91",
-    0x6B55: u"\u8AA5",
-    0x6B56: u"\u8AA6",
-    0x6B57: u"\u8A9A",
-    0x6B58: u"\u8AA3",
-    0x6B59: u"\u8AC4",
-    0x6B5A: u"\u8ACD",
-    0x6B5B: u"\u8AC2",
-    0x6B5C: u"\u8ADA",
-    0x6B5D: u"\u8AEB",
-    0x6B5E: u"\u8AF3",
-    0x6B5F: u"\u8AE7",
-    0x6B60: u"\u8AE4",
-    0x6B61: u"\u8AF1",
-    0x6B62: u"\u8B14",
-    0x6B63: u"\u8AE0",
-    0x6B64: u"\u8AE2",
-    0x6B65: u"\u8AF7",
-    0x6B66: u"\u8ADE",
-    0x6B67: u"\u8ADB",
-    0x6B68: u"\u8B0C",
-    0x6B69: u"\u8B07",
-    0x6B6A: u"\u8B1A",
-    0x6B6B: u"\u8AE1",
-    0x6B6C: u"\u8B16",
-    0x6B6D: u"\u8B10",
-    0x6B6E: u"\u8B17",
-    0x6B6F: u"\u8B20",
-    0x6B70: u"\u8B33",
-    0x6B71: u"\u97AB",
-    0x6B72: u"\u8B26",
-    0x6B73: u"\u8B2B",
-    0x6B74: u"\u8B3E",
-    0x6B75: u"\u8B28",
-    0x6B76: u"\u8B41",
-    0x6B77: u"\u8B4C",
-    0x6B78: u"\u8B4F",
-    0x6B79: u"\u8B4E",
-    0x6B7A: u"\u8B49",
-    0x6B7B: u"\u8B56",
-    0x6B7C: u"\u8B5B",
-    0x6B7D: u"\u8B5A",
-    0x6B7E: u"\u8B6B",
-    0x6C21: u"\u8B5F",
-    0x6C22: u"\u8B6C",
-    0x6C23: u"\u8B6F",
-    0x6C24: u"\u8B74",
-    0x6C25: u"\u8B7D",
-    0x6C26: u"\u8B80",
-    0x6C27: u"\u8B8C",
-    0x6C28: u"\u8B8E",
-    0x6C29: u"\u8B92",
-    0x6C2A: u"\u8B93",
-    0x6C2B: u"\u8B96",
-    0x6C2C: u"\u8B99",
-    0x6C2D: u"\u8B9A",
-    0x6C2E: u"\u8C3A",
-    0x6C2F: u"\u8C41",
-    0x6C30: u"\u8C3F",
-    0x6C31: u"\u8C48",
-    0x6C32: u"\u8C4C",
-    0x6C33: u"\u8C4E",
-    0x6C34: u"\u8C50",
-    0x6C35: u"\u8C55",
-    0x6C36: u"\u8C62",
-    0x6C37: u"\u8C6C",
-    0x6C38: u"\u8C78",
-    0x6C39: u"\u8C7A",
-    0x6C3A: u"\u8C82",
-    0x6C3B: u"\u8C89",
-    0x6C3C: u"\u8C85",
-    0x6C3D: u"\u8C8A",
-    0x6C3E: u"\u8C8D",
-    0x6C3F: u"\u8C8E",
-    0x6C40: u"\u8C94",
-    0x6C41: u"\u8C7C",
-    0x6C42: u"\u8C98",
-    0x6C43: u"\u621D",
-    0x6C44: u"\u8CAD",
-    0x6C45: u"\u8CAA",
-    0x6C46: u"\u8CBD",
-    0x6C47: u"\u8CB2",
-    0x6C48: u"\u8CB3",
-    0x6C49: u"\u8CAE",
-    0x6C4A: u"\u8CB6",
-    0x6C4B: u"\u8CC8",
-    0x6C4C: u"\u8CC1",
-    0x6C4D: u"\u8CE4",
-    0x6C4E: u"\u8CE3",
-    0x6C4F: u"\u8CDA",
-    0x6C50: u"\u8CFD",
-    0x6C51: u"\u8CFA",
-    0x6C52: u"\u8CFB",
-    0x6C53: u"\u8D04",
-    0x6C54: u"\u8D05",
-    0x6C55: u"\u8D0A",
-    0x6C56: u"\u8D07",
-    0x6C57: u"\u8D0F",
-    0x6C58: u"\u8D0D",
-    0x6C59: u"\u8D10",
-    0x6C5A: u"\u9F4E",
-    0x6C5B: u"\u8D13",
-    0x6C5C: u"\u8CCD",
-    0x6C5D: u"\u8D14",
-    0x6C5E: u"\u8D16",
-    0x6C5F: u"\u8D67",
-    0x6C60: u"\u8D6D",
-    0x6C61: u"\u8D71",
-    0x6C62: u"\u8D73",
-    0x6C63: u"\u8D81",
-    0x6C64: u"\u8D99",
-    0x6C65: u"\u8DC2",
-    0x6C66: u"\u8DBE",
-    0x6C67: u"\u8DBA",
-    0x6C68: u"\u8DCF",
-    0x6C69: u"\u8DDA",
-    0x6C6A: u"\u8DD6",
-    0x6C6B: u"\u8DCC",
-    0x6C6C: u"\u8DDB",
-    0x6C6D: u"\u8DCB",
-    0x6C6E: u"\u8DEA",
-    0x6C6F: u"\u8DEB",
-    0x6C70: u"\u8DDF",
-    0x6C71: u"\u8DE3",
-    0x6C72: u"\u8DFC",
-    0x6C73: u"\u8E08",
-    0x6C74: u"\u8E09",
-    0x6C75: u"\u8DFF",
-    0x6C76: u"\u8E1D",
-    0x6C77: u"\u8E1E",
-    0x6C78: u"\u8E10",
-    0x6C79: u"\u8E1F",
-    0x6C7A: u"\u8E42",
-    0x6C7B: u"\u8E35",
-    0x6C7C: u"\u8E30",
-    0x6C7D: u"\u8E34",
-    0x6C7E: u"\u8E4A",
-    0x6D21: u"\u8E47",
-    0x6D22: u"\u8E49",
-    0x6D23: u"\u8E4C",
-    0x6D24: u"\u8E50",
-    0x6D25: u"\u8E48",
-    0x6D26: u"\u8E59",
-    0x6D27: u"\u8E64",
-    0x6D28: u"\u8E60",
-    0x6D29: u"\u8E2A",
-    0x6D2A: u"\u8E63",
-    0x6D2B: u"\u8E55",
-    0x6D2C: u"\u8E76",
-    0x6D2D: u"\u8E72",
-    0x6D2E: u"\u8E7C",
-    0x6D2F: u"\u8E81",
-    0x6D30: u"\u8E87",
-    0x6D31: u"\u8E85",
-    0x6D32: u"\u8E84",
-    0x6D33: u"\u8E8B",
-    0x6D34: u"\u8E8A",
-    0x6D35: u"\u8E93",
-    0x6D36: u"\u8E91",
-    0x6D37: u"\u8E94",
-    0x6D38: u"\u8E99",
-    0x6D39: u"\u8EAA",
-    0x6D3A: u"\u8EA1",
-    0x6D3B: u"\u8EAC",
-    0x6D3C: u"\u8EB0",
-    0x6D3D: u"\u8EC6",
-    0x6D3E: u"\u8EB1",
-    0x6D3F: u"\u8EBE",
-    0x6D40: u"\u8EC5",
-    0x6D41: u"\u8EC8",
-    0x6D42: u"\u8ECB",
-    0x6D43: u"\u8EDB",
-    0x6D44: u"\u8EE3",
-    0x6D45: u"\u8EFC",
-    0x6D46: u"\u8EFB",
-    0x6D47: u"\u8EEB",
-    0x6D48: u"\u8EFE",
-    0x6D49: u"\u8F0A",
-    0x6D4A: u"\u8F05",
-    0x6D4B: u"\u8F15",
-    0x6D4C: u"\u8F12",
-    0x6D4D: u"\u8F19",
-    0x6D4E: u"\u8F13",
-    0x6D4F: u"\u8F1C",
-    0x6D50: u"\u8F1F",
-    0x6D51: u"\u8F1B",
-    0x6D52: u"\u8F0C",
-    0x6D53: u"\u8F26",
-    0x6D54: u"\u8F33",
-    0x6D55: u"\u8F3B",
-    0x6D56: u"\u8F39",
-    0x6D57: u"\u8F45",
-    0x6D58: u"\u8F42",
-    0x6D59: u"\u8F3E",
-    0x6D5A: u"\u8F4C",
-    0x6D5B: u"\u8F49",
-    0x6D5C: u"\u8F46",
-    0x6D5D: u"\u8F4E",
-    0x6D5E: u"\u8F57",
-    0x6D5F: u"\u8F5C",
-    0x6D60: u"\u8F62",
-    0x6D61: u"\u8F63",
-    0x6D62: u"\u8F64",
-    0x6D63: u"\u8F9C",
-    0x6D64: u"\u8F9F",
-    0x6D65: u"\u8FA3",
-    0x6D66: u"\u8FAD",
-    0x6D67: u"\u8FAF",
-    0x6D68: u"\u8FB7",
-    0x6D69: u"\u8FDA",
-    0x6D6A: u"\u8FE5",
-    0x6D6B: u"\u8FE2",
-    0x6D6C: u"\u8FEA",
-    0x6D6D: u"\u8FEF",
-    0x6D6E: u"\u9087",
-    0x6D6F: u"\u8FF4",
-    0x6D70: u"\u9005",
-    0x6D71: u"\u8FF9",
-    0x6D72: u"\u8FFA",
-    0x6D73: u"\u9011",
-    0x6D74: u"\u9015",
-    0x6D75: u"\u9021",
-    0x6D76: u"\u900D",
-    0x6D77: u"\u901E",
-    0x6D78: u"\u9016",
-    0x6D79: u"\u900B",
-    0x6D7A: u"\u9027",
-    0x6D7B: u"\u9036",
-    0x6D7C: u"\u9035",
-    0x6D7D: u"\u9039",
-    0x6D7E: u"\u8FF8",
-    0x6E21: u"\u904F",
-    0x6E22: u"\u9050",
-    0x6E23: u"\u9051",
-    0x6E24: u"\u9052",
-    0x6E25: u"\u900E",
-    0x6E26: u"\u9049",
-    0x6E27: u"\u903E",
-    0x6E28: u"\u9056",
-    0x6E29: u"\u9058",
-    0x6E2A: u"\u905E",
-    0x6E2B: u"\u9068",
-    0x6E2C: u"\u906F",
-    0x6E2D: u"\u9076",
-    0x6E2E: u"\u96A8",
-    0x6E2F: u"\u9072",
-    0x6E30: u"\u9082",
-    0x6E31: u"\u907D",
-    0x6E32: u"\u9081",
-    0x6E33: u"\u9080",
-    0x6E34: u"\u908A",
-    0x6E35: u"\u9089",
-    0x6E36: u"\u908F",
-    0x6E37: u"\u90A8",
-    0x6E38: u"\u90AF",
-    0x6E39: u"\u90B1",
-    0x6E3A: u"\u90B5",
-    0x6E3B: u"\u90E2",
-    0x6E3C: u"\u90E4",
-    0x6E3D: u"\u6248",
-    0x6E3E: u"\u90DB",
-    0x6E3F: u"\u9102",
-    0x6E40: u"\u9112",
-    0x6E41: u"\u9119",
-    0x6E42: u"\u9132",
-    0x6E43: u"\u9130",
-    0x6E44: u"\u914A",
-    0x6E45: u"\u9156",
-    0x6E46: u"\u9158",
-    0x6E47: u"\u9163",
-    0x6E48: u"\u9165",
-    0x6E49: u"\u9169",
-    0x6E4A: u"\u9173",
-    0x6E4B: u"\u9172",
-    0x6E4C: u"\u918B",
-    0x6E4D: u"\u9189",
-    0x6E4E: u"\u9182",
-    0x6E4F: u"\u91A2",
-    0x6E50: u"\u91AB",
-    0x6E51: u"\u91AF",
-    0x6E52: u"\u91AA",
-    0x6E53: u"\u91B5",
-    0x6E54: u"\u91B4",
-    0x6E55: u"\u91BA",
-    0x6E56: u"\u91C0",
-    0x6E57: u"\u91C1",
-    0x6E58: u"\u91C9",
-    0x6E59: u"\u91CB",
-    0x6E5A: u"\u91D0",
-    0x6E5B: u"\u91D6",
-    0x6E5C: u"\u91DF",
-    0x6E5D: u"\u91E1",
-    0x6E5E: u"\u91DB",
-    0x6E5F: u"\u91FC",
-    0x6E60: u"\u91F5",
-    0x6E61: u"\u91F6",
-    0x6E62: u"\u921E",
-    0x6E63: u"\u91FF",
-    0x6E64: u"\u9214",
-    0x6E65: u"\u922C",
-    0x6E66: u"\u9215",
-    0x6E67: u"\u9211",
-    0x6E68: u"\u925E",
-    0x6E69: u"\u9257",
-    0x6E6A: u"\u9245",
-    0x6E6B: u"\u9249",
-    0x6E6C: u"\u9264",
-    0x6E6D: u"\u9248",
-    0x6E6E: u"\u9295",
-    0x6E6F: u"\u923F",
-    0x6E70: u"\u924B",
-    0x6E71: u"\u9250",
-    0x6E72: u"\u929C",
-    0x6E73: u"\u9296",
-    0x6E74: u"\u9293",
-    0x6E75: u"\u929B",
-    0x6E76: u"\u925A",
-    0x6E77: u"\u92CF",
-    0x6E78: u"\u92B9",
-    0x6E79: u"\u92B7",
-    0x6E7A: u"\u92E9",
-    0x6E7B: u"\u930F",
-    0x6E7C: u"\u92FA",
-    0x6E7D: u"\u9344",
-    0x6E7E: u"\u932E",
-    0x6F21: u"\u9319",
-    0x6F22: u"\u9322",
-    0x6F23: u"\u931A",
-    0x6F24: u"\u9323",
-    0x6F25: u"\u933A",
-    0x6F26: u"\u9335",
-    0x6F27: u"\u933B",
-    0x6F28: u"\u935C",
-    0x6F29: u"\u9360",
-    0x6F2A: u"\u937C",
-    0x6F2B: u"\u936E",
-    0x6F2C: u"\u9356",
-    0x6F2D: u"\u93B0",
-    0x6F2E: u"\u93AC",
-    0x6F2F: u"\u93AD",
-    0x6F30: u"\u9394",
-    0x6F31: u"\u93B9",
-    0x6F32: u"\u93D6",
-    0x6F33: u"\u93D7",
-    0x6F34: u"\u93E8",
-    0x6F35: u"\u93E5",
-    0x6F36: u"\u93D8",
-    0x6F37: u"\u93C3",
-    0x6F38: u"\u93DD",
-    0x6F39: u"\u93D0",
-    0x6F3A: u"\u93C8",
-    0x6F3B: u"\u93E4",
-    0x6F3C: u"\u941A",
-    0x6F3D: u"\u9414",
-    0x6F3E: u"\u9413",
-    0x6F3F: u"\u9403",
-    0x6F40: u"\u9407",
-    0x6F41: u"\u9410",
-    0x6F42: u"\u9436",
-    0x6F43: u"\u942B",
-    0x6F44: u"\u9435",
-    0x6F45: u"\u9421",
-    0x6F46: u"\u943A",
-    0x6F47: u"\u9441",
-    0x6F48: u"\u9452",
-    0x6F49: u"\u9444",
-    0x6F4A: u"\u945B",
-    0x6F4B: u"\u9460",
-    0x6F4C: u"\u9462",
-    0x6F4D: u"\u945E",
-    0x6F4E: u"\u946A",
-    0x6F4F: u"\u9229",
-    0x6F50: u"\u9470",
-    0x6F51: u"\u9475",
-    0x6F52: u"\u9477",
-    0x6F53: u"\u947D",
-    0x6F54: u"\u945A",
-    0x6F55: u"\u947C",
-    0x6F56: u"\u947E",
-    0x6F57: u"\u9481",
-    0x6F58: u"\u947F",
-    0x6F59: u"\u9582",
-    0x6F5A: u"\u9587",
-    0x6F5B: u"\u958A",
-    0x6F5C: u"\u9594",
-    0x6F5D: u"\u9596",
-    0x6F5E: u"\u9598",
-    0x6F5F: u"\u9599",
-    0x6F60: u"\u95A0",
-    0x6F61: u"\u95A8",
-    0x6F62: u"\u95A7",
-    0x6F63: u"\u95AD",
-    0x6F64: u"\u95BC",
-    0x6F65: u"\u95BB",
-    0x6F66: u"\u95B9",
-    0x6F67: u"\u95BE",
-    0x6F68: u"\u95CA",
-    0x6F69: u"\u6FF6",
-    0x6F6A: u"\u95C3",
-    0x6F6B: u"\u95CD",
-    0x6F6C: u"\u95CC",
-    0x6F6D: u"\u95D5",
-    0x6F6E: u"\u95D4",
-    0x6F6F: u"\u95D6",
-    0x6F70: u"\u95DC",
-    0x6F71: u"\u95E1",
-    0x6F72: u"\u95E5",
-    0x6F73: u"\u95E2",
-    0x6F74: u"\u9621",
-    0x6F75: u"\u9628",
-    0x6F76: u"\u962E",
-    0x6F77: u"\u962F",
-    0x6F78: u"\u9642",
-    0x6F79: u"\u964C",
-    0x6F7A: u"\u964F",
-    0x6F7B: u"\u964B",
-    0x6F7C: u"\u9677",
-    0x6F7D: u"\u965C",
-    0x6F7E: u"\u965E",
-    0x7021: u"\u965D",
-    0x7022: u"\u965F",
-    0x7023: u"\u9666",
-    0x7024: u"\u9672",
-    0x7025: u"\u966C",
-    0x7026: u"\u968D",
-    0x7027: u"\u9698",
-    0x7028: u"\u9695",
-    0x7029: u"\u9697",
-    0x702A: u"\u96AA",
-    0x702B: u"\u96A7",
-    0x702C: u"\u96B1",
-    0x702D: u"\u96B2",
-    0x702E: u"\u96B0",
-    0x702F: u"\u96B4",
-    0x7030: u"\u96B6",
-    0x7031: u"\u96B8",
-    0x7032: u"\u96B9",
-    0x7033: u"\u96CE",
-    0x7034: u"\u96CB",
-    0x7035: u"\u96C9",
-    0x7036: u"\u96CD",
-    0x7037: u"\u894D",
-    0x7038: u"\u96DC",
-    0x7039: u"\u970D",
-    0x703A: u"\u96D5",
-    0x703B: u"\u96F9",
-    0x703C: u"\u9704",
-    0x703D: u"\u9706",
-    0x703E: u"\u9708",
-    0x703F: u"\u9713",
-    0x7040: u"\u970E",
-    0x7041: u"\u9711",
-    0x7042: u"\u970F",
-    0x7043: u"\u9716",
-    0x7044: u"\u9719",
-    0x7045: u"\u9724",
-    0x7046: u"\u972A",
-    0x7047: u"\u9730",
-    0x7048: u"\u9739",
-    0x7049: u"\u973D",
-    0x704A: u"\u973E",
-    0x704B: u"\u9744",
-    0x704C: u"\u9746",
-    0x704D: u"\u9748",
-    0x704E: u"\u9742",
-    0x704F: u"\u9749",
-    0x7050: u"\u975C",
-    0x7051: u"\u9760",
-    0x7052: u"\u9764",
-    0x7053: u"\u9766",
-    0x7054: u"\u9768",
-    0x7055: u"\u52D2",
-    0x7056: u"\u976B",
-    0x7057: u"\u9771",
-    0x7058: u"\u9779",
-    0x7059: u"\u9785",
-    0x705A: u"\u977C",
-    0x705B: u"\u9781",
-    0x705C: u"\u977A",
-    0x705D: u"\u9786",
-    0x705E: u"\u978B",
-    0x705F: u"\u978F",
-    0x7060: u"\u9790",
-    0x7061: u"\u979C",
-    0x7062: u"\u97A8",
-    0x7063: u"\u97A6",
-    0x7064: u"\u97A3",
-    0x7065: u"\u97B3",
-    0x7066: u"\u97B4",
-    0x7067: u"\u97C3",
-    0x7068: u"\u97C6",
-    0x7069: u"\u97C8",
-    0x706A: u"\u97CB",
-    0x706B: u"\u97DC",
-    0x706C: u"\u97ED",
-    0x706D: u"\u9F4F",
-    0x706E: u"\u97F2",
-    0x706F: u"\u7ADF",
-    0x7070: u"\u97F6",
-    0x7071: u"\u97F5",
-    0x7072: u"\u980F",
-    0x7073: u"\u980C",
-    0x7074: u"\u9838",
-    0x7075: u"\u9824",
-    0x7076: u"\u9821",
-    0x7077: u"\u9837",
-    0x7078: u"\u983D",
-    0x7079: u"\u9846",
-    0x707A: u"\u984F",
-    0x707B: u"\u984B",
-    0x707C: u"\u986B",
-    0x707D: u"\u986F",
-    0x707E: u"\u9870",
-    0x7121: u"\u9871",
-    0x7122: u"\u9874",
-    0x7123: u"\u9873",
-    0x7124: u"\u98AA",
-    0x7125: u"\u98AF",
-    0x7126: u"\u98B1",
-    0x7127: u"\u98B6",
-    0x7128: u"\u98C4",
-    0x7129: u"\u98C3",
-    0x712A: u"\u98C6",
-    0x712B: u"\u98E9",
-    0x712C: u"\u98EB",
-    0x712D: u"\u9903",
-    0x712E: u"\u9909",
-    0x712F: u"\u9912",
-    0x7130: u"\u9914",
-    0x7131: u"\u9918",
-    0x7132: u"\u9921",
-    0x7133: u"\u991D",
-    0x7134: u"\u991E",
-    0x7135: u"\u9924",
-    0x7136: u"\u9920",
-    0x7137: u"\u992C",
-    0x7138: u"\u992E",
-    0x7139: u"\u993D",
-    0x713A: u"\u993E",
-    0x713B: u"\u9942",
-    0x713C: u"\u9949",
-    0x713D: u"\u9945",
-    0x713E: u"\u9950",
-    0x713F: u"\u994B",
-    0x7140: u"\u9951",
-    0x7141: u"\u9952",
-    0x7142: u"\u994C",
-    0x7143: u"\u9955",
-    0x7144: u"\u9997",
-    0x7145: u"\u9998",
-    0x7146: u"\u99A5",
-    0x7147: u"\u99AD",
-    0x7148: u"\u99AE",
-    0x7149: u"\u99BC",
-    0x714A: u"\u99DF",
-    0x714B: u"\u99DB",
-    0x714C: u"\u99DD",
-    0x714D: u"\u99D8",
-    0x714E: u"\u99D1",
-    0x714F: u"\u99ED",
-    0x7150: u"\u99EE",
-    0x7151: u"\u99F1",
-    0x7152: u"\u99F2",
-    0x7153: u"\u99FB",
-    0x7154: u"\u99F8",
-    0x7155: u"\u9A01",
-    0x7156: u"\u9A0F",
-    0x7157: u"\u9A05",
-    0x7158: u"\u99E2",
-    0x7159: u"\u9A19",
-    0x715A: u"\u9A2B",
-    0x715B: u"\u9A37",
-    0x715C: u"\u9A45",
-    0x715D: u"\u9A42",
-    0x715E: u"\u9A40",
-    0x715F: u"\u9A43",
-    0x7160: u"\u9A3E",
-    0x7161: u"\u9A55",
-    0x7162: u"\u9A4D",
-    0x7163: u"\u9A5B",
-    0x7164: u"\u9A57",
-    0x7165: u"\u9A5F",
-    0x7166: u"\u9A62",
-    0x7167: u"\u9A65",
-    0x7168: u"\u9A64",
-    0x7169: u"\u9A69",
-    0x716A: u"\u9A6B",
-    0x716B: u"\u9A6A",
-    0x716C: u"\u9AAD",
-    0x716D: u"\u9AB0",
-    0x716E: u"\u9ABC",
-    0x716F: u"\u9AC0",
-    0x7170: u"\u9ACF",
-    0x7171: u"\u9AD1",
-    0x7172: u"\u9AD3",
-    0x7173: u"\u9AD4",
-    0x7174: u"\u9ADE",
-    0x7175: u"\u9ADF",
-    0x7176: u"\u9AE2",
-    0x7177: u"\u9AE3",
-    0x7178: u"\u9AE6",
-    0x7179: u"\u9AEF",
-    0x717A: u"\u9AEB",
-    0x717B: u"\u9AEE",
-    0x717C: u"\u9AF4",
-    0x717D: u"\u9AF1",
-    0x717E: u"\u9AF7",
-    0x7221: u"\u9AFB",
-    0x7222: u"\u9B06",
-    0x7223: u"\u9B18",
-    0x7224: u"\u9B1A",
-    0x7225: u"\u9B1F",
-    0x7226: u"\u9B22",
-    0x7227: u"\u9B23",
-    0x7228: u"\u9B25",
-    0x7229: u"\u9B27",
-    0x722A: u"\u9B28",
-    0x722B: u"\u9B29",
-    0x722C: u"\u9B2A",
-    0x722D: u"\u9B2E",
-    0x722E: u"\u9B2F",
-    0x722F: u"\u9B32",
-    0x7230: u"\u9B44",
-    0x7231: u"\u9B43",
-    0x7232: u"\u9B4F",
-    0x7233: u"\u9B4D",
-    0x7234: u"\u9B4E",
-    0x7235: u"\u9B51",
-    0x7236: u"\u9B58",
-    0x7237: u"\u9B74",
-    0x7238: u"\u9B93",
-    0x7239: u"\u9B83",
-    0x723A: u"\u9B91",
-    0x723B: u"\u9B96",
-    0x723C: u"\u9B97",
-    0x723D: u"\u9B9F",
-    0x723E: u"\u9BA0",
-    0x723F: u"\u9BA8",
-    0x7240: u"\u9BB4",
-    0x7241: u"\u9BC0",
-    0x7242: u"\u9BCA",
-    0x7243: u"\u9BB9",
-    0x7244: u"\u9BC6",
-    0x7245: u"\u9BCF",
-    0x7246: u"\u9BD1",
-    0x7247: u"\u9BD2",
-    0x7248: u"\u9BE3",
-    0x7249: u"\u9BE2",
-    0x724A: u"\u9BE4",
-    0x724B: u"\u9BD4",
-    0x724C: u"\u9BE1",
-    0x724D: u"\u9C3A",
-    0x724E: u"\u9BF2",
-    0x724F: u"\u9BF1",
-    0x7250: u"\u9BF0",
-    0x7251: u"\u9C15",
-    0x7252: u"\u9C14",
-    0x7253: u"\u9C09",
-    0x7254: u"\u9C13",
-    0x7255: u"\u9C0C",
-    0x7256: u"\u9C06",
-    0x7257: u"\u9C08",
-    0x7258: u"\u9C12",
-    0x7259: u"\u9C0A",
-    0x725A: u"\u9C04",
-    0x725B: u"\u9C2E",
-    0x725C: u"\u9C1B",
-    0x725D: u"\u9C25",
-    0x725E: u"\u9C24",
-    0x725F: u"\u9C21",
-    0x7260: u"\u9C30",
-    0x7261: u"\u9C47",
-    0x7262: u"\u9C32",
-    0x7263: u"\u9C46",
-    0x7264: u"\u9C3E",
-    0x7265: u"\u9C5A",
-    0x7266: u"\u9C60",
-    0x7267: u"\u9C67",
-    0x7268: u"\u9C76",
-    0x7269: u"\u9C78",
-    0x726A: u"\u9CE7",
-    0x726B: u"\u9CEC",
-    0x726C: u"\u9CF0",
-    0x726D: u"\u9D09",
-    0x726E: u"\u9D08",
-    0x726F: u"\u9CEB",
-    0x7270: u"\u9D03",
-    0x7271: u"\u9D06",
-    0x7272: u"\u9D2A",
-    0x7273: u"\u9D26",
-    0x7274: u"\u9DAF",
-    0x7275: u"\u9D23",
-    0x7276: u"\u9D1F",
-    0x7277: u"\u9D44",
-    0x7278: u"\u9D15",
-    0x7279: u"\u9D12",
-    0x727A: u"\u9D41",
-    0x727B: u"\u9D3F",
-    0x727C: u"\u9D3E",
-    0x727D: u"\u9D46",
-    0x727E: u"\u9D48",
-    0x7321: u"\u9D5D",
-    0x7322: u"\u9D5E",
-    0x7323: u"\u9D64",
-    0x7324: u"\u9D51",
-    0x7325: u"\u9D50",
-    0x7326: u"\u9D59",
-    0x7327: u"\u9D72",
-    0x7328: u"\u9D89",
-    0x7329: u"\u9D87",
-    0x732A: u"\u9DAB",
-    0x732B: u"\u9D6F",
-    0x732C: u"\u9D7A",
-    0x732D: u"\u9D9A",
-    0x732E: u"\u9DA4",
-    0x732F: u"\u9DA9",
-    0x7330: u"\u9DB2",
-    0x7331: u"\u9DC4",
-    0x7332: u"\u9DC1",
-    0x7333: u"\u9DBB",
-    0x7334: u"\u9DB8",
-    0x7335: u"\u9DBA",
-    0x7336: u"\u9DC6",
-    0x7337: u"\u9DCF",
-    0x7338: u"\u9DC2",
-    0x7339: u"\u9DD9",
-    0x733A: u"\u9DD3",
-    0x733B: u"\u9DF8",
-    0x733C: u"\u9DE6",
-    0x733D: u"\u9DED",
-    0x733E: u"\u9DEF",
-    0x733F: u"\u9DFD",
-    0x7340: u"\u9E1A",
-    0x7341: u"\u9E1B",
-    0x7342: u"\u9E1E",
-    0x7343: u"\u9E75",
-    0x7344: u"\u9E79",
-    0x7345: u"\u9E7D",
-    0x7346: u"\u9E81",
-    0x7347: u"\u9E88",
-    0x7348: u"\u9E8B",
-    0x7349: u"\u9E8C",
-    0x734A: u"\u9E92",
-    0x734B: u"\u9E95",
-    0x734C: u"\u9E91",
-    0x734D: u"\u9E9D",
-    0x734E: u"\u9EA5",
-    0x734F: u"\u9EA9",
-    0x7350: u"\u9EB8",
-    0x7351: u"\u9EAA",
-    0x7352: u"\u9EAD",
-    0x7353: u"\u9761",
-    0x7354: u"\u9ECC",
-    0x7355: u"\u9ECE",
-    0x7356: u"\u9ECF",
-    0x7357: u"\u9ED0",
-    0x7358: u"\u9ED4",
-    0x7359: u"\u9EDC",
-    0x735A: u"\u9EDE",
-    0x735B: u"\u9EDD",
-    0x735C: u"\u9EE0",
-    0x735D: u"\u9EE5",
-    0x735E: u"\u9EE8",
-    0x735F: u"\u9EEF",
-    0x7360: u"\u9EF4",
-    0x7361: u"\u9EF6",
-    0x7362: u"\u9EF7",
-    0x7363: u"\u9EF9",
-    0x7364: u"\u9EFB",
-    0x7365: u"\u9EFC",
-    0x7366: u"\u9EFD",
-    0x7367: u"\u9F07",
-    0x7368: u"\u9F08",
-    0x7369: u"\u76B7",
-    0x736A: u"\u9F15",
-    0x736B: u"\u9F21",
-    0x736C: u"\u9F2C",
-    0x736D: u"\u9F3E",
-    0x736E: u"\u9F4A",
-    0x736F: u"\u9F52",
-    0x7370: u"\u9F54",
-    0x7371: u"\u9F63",
-    0x7372: u"\u9F5F",
-    0x7373: u"\u9F60",
-    0x7374: u"\u9F61",
-    0x7375: u"\u9F66",
-    0x7376: u"\u9F67",
-    0x7377: u"\u9F6C",
-    0x7378: u"\u9F6A",
-    0x7379: u"\u9F77",
-    0x737A: u"\u9F72",
-    0x737B: u"\u9F76",
-    0x737C: u"\u9F95",
-    0x737D: u"\u9F9C",
-    0x737E: u"\u9FA0",
-    0x7421: u"\u582F",
-    0x7422: u"\u69C7",
-    0x7423: u"\u9059",
-    0x7424: u"\u7464",
-    0x7425: u"\u51DC",
-    0x7426: u"\u7199",
-}
+# Generated by make_encodings.py from jisx0208.txt; do not edit.
+# Character (row, cell) is at index (row - 1) * 94 + (cell - 1); unassigned
+# code points are U+FFFD.
+jisx0208 = (
+    # row 1
+    u"\u3000\u3001\u3002\uFF0C\uFF0E\u30FB\uFF1A\uFF1B\uFF1F\uFF01\u309B\u309C"
+    u"\u00B4\uFF40\u00A8\uFF3E\uFFE3\uFF3F\u30FD\u30FE\u309D\u309E\u3003\u4EDD"
+    u"\u3005\u3006\u3007\u30FC\u2015\u2010\uFF0F\u005C\u301C\u2016\uFF5C\u2026"
+    u"\u2025\u2018\u2019\u201C\u201D\uFF08\uFF09\u3014\u3015\uFF3B\uFF3D\uFF5B"
+    u"\uFF5D\u3008\u3009\u300A\u300B\u300C\u300D\u300E\u300F\u3010\u3011\uFF0B"
+    u"\u2212\u00B1\u00D7\u00F7\uFF1D\u2260\uFF1C\uFF1E\u2266\u2267\u221E\u2234"
+    u"\u2642\u2640\u00B0\u2032\u2033\u2103\uFFE5\uFF04\u00A2\u00A3\uFF05\uFF03"
+    u"\uFF06\uFF0A\uFF20\u00A7\u2606\u2605\u25CB\u25CF\u25CE\u25C7"
+    # row 2
+    u"\u25C6\u25A1\u25A0\u25B3\u25B2\u25BD\u25BC\u203B\u3012\u2192\u2190\u2191"
+    u"\u2193\u3013\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\u2208\u220B\u2286\u2287\u2282\u2283\u222A\u2229\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\u2227\u2228\u00AC\u21D2\u21D4\u2200\u2203"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\u2220"
+    u"\u22A5\u2312\u2202\u2207\u2261\u2252\u226A\u226B\u221A\u223D\u221D\u2235"
+    u"\u222B\u222C\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\u212B\u2030\u266F"
+    u"\u266D\u266A\u2020\u2021\u00B6\uFFFD\uFFFD\uFFFD\uFFFD\u25EF"
+    # row 3
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFF10\uFF11\uFF12\uFF13\uFF14\uFF15\uFF16\uFF17\uFF18"
+    u"\uFF19\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFF21\uFF22\uFF23\uFF24"
+    u"\uFF25\uFF26\uFF27\uFF28\uFF29\uFF2A\uFF2B\uFF2C\uFF2D\uFF2E\uFF2F\uFF30"
+    u"\uFF31\uFF32\uFF33\uFF34\uFF35\uFF36\uFF37\uFF38\uFF39\uFF3A\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFF41\uFF42\uFF43\uFF44\uFF45\uFF46\uFF47\uFF48"
+    u"\uFF49\uFF4A\uFF4B\uFF4C\uFF4D\uFF4E\uFF4F\uFF50\uFF51\uFF52\uFF53\uFF54"
+    u"\uFF55\uFF56\uFF57\uFF58\uFF59\uFF5A\uFFFD\uFFFD\uFFFD\uFFFD"
+    # row 4
+    u"\u3041\u3042\u3043\u3044\u3045\u3046\u3047\u3048\u3049\u304A\u304B\u304C"
+    u"\u304D\u304E\u304F\u3050\u3051\u3052\u3053\u3054\u3055\u3056\u3057\u3058"
+    u"\u3059\u305A\u305B\u305C\u305D\u305E\u305F\u3060\u3061\u3062\u3063\u3064"
+    u"\u3065\u3066\u3067\u3068\u3069\u306A\u306B\u306C\u306D\u306E\u306F\u3070"
+    u"\u3071\u3072\u3073\u3074\u3075\u3076\u3077\u3078\u3079\u307A\u307B\u307C"
+    u"\u307D\u307E\u307F\u3080\u3081\u3082\u3083\u3084\u3085\u3086\u3087\u3088"
+    u"\u3089\u308A\u308B\u308C\u308D\u308E\u308F\u3090\u3091\u3092\u3093\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    # row 5
+    u"\u30A1\u30A2\u30A3\u30A4\u30A5\u30A6\u30A7\u30A8\u30A9\u30AA\u30AB\u30AC"
+    u"\u30AD\u30AE\u30AF\u30B0\u30B1\u30B2\u30B3\u30B4\u30B5\u30B6\u30B7\u30B8"
+    u"\u30B9\u30BA\u30BB\u30BC\u30BD\u30BE\u30BF\u30C0\u30C1\u30C2\u30C3\u30C4"
+    u"\u30C5\u30C6\u30C7\u30C8\u30C9\u30CA\u30CB\u30CC\u30CD\u30CE\u30CF\u30D0"
+    u"\u30D1\u30D2\u30D3\u30D4\u30D5\u30D6\u30D7\u30D8\u30D9\u30DA\u30DB\u30DC"
+    u"\u30DD\u30DE\u30DF\u30E0\u30E1\u30E2\u30E3\u30E4\u30E5\u30E6\u30E7\u30E8"
+    u"\u30E9\u30EA\u30EB\u30EC\u30ED\u30EE\u30EF\u30F0\u30F1\u30F2\u30F3\u30F4"
+    u"\u30F5\u30F6\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    # row 6
+    u"\u0391\u0392\u0393\u0394\u0395\u0396\u0397\u0398\u0399\u039A\u039B\u039C"
+    u"\u039D\u039E\u039F\u03A0\u03A1\u03A3\u03A4\u03A5\u03A6\u03A7\u03A8\u03A9"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\u03B1\u03B2\u03B3\u03B4"
+    u"\u03B5\u03B6\u03B7\u03B8\u03B9\u03BA\u03BB\u03BC\u03BD\u03BE\u03BF\u03C0"
+    u"\u03C1\u03C3\u03C4\u03C5\u03C6\u03C7\u03C8\u03C9\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    # row 7
+    u"\u0410\u0411\u0412\u0413\u0414\u0415\u0401\u0416\u0417\u0418\u0419\u041A"
+    u"\u041B\u041C\u041D\u041E\u041F\u0420\u0421\u0422\u0423\u0424\u0425\u0426"
+    u"\u0427\u0428\u0429\u042A\u042B\u042C\u042D\u042E\u042F\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\u0430\u0431\u0432\u0433\u0434\u0435\u0451\u0436\u0437\u0438\u0439\u043A"
+    u"\u043B\u043C\u043D\u043E\u043F\u0440\u0441\u0442\u0443\u0444\u0445\u0446"
+    u"\u0447\u0448\u0449\u044A\u044B\u044C\u044D\u044E\u044F\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    # row 8
+    u"\u2500\u2502\u250C\u2510\u2518\u2514\u251C\u252C\u2524\u2534\u253C\u2501"
+    u"\u2503\u250F\u2513\u251B\u2517\u2523\u2533\u252B\u253B\u254B\u2520\u252F"
+    u"\u2528\u2537\u253F\u251D\u2530\u2525\u2538\u2542\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    # row 9
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    # row 10
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    # row 11
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    # row 12
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    # row 13
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    # row 14
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    # row 15
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    # row 16
+    u"\u4E9C\u5516\u5A03\u963F\u54C0\u611B\u6328\u59F6\u9022\u8475\u831C\u7A50"
+    u"\u60AA\u63E1\u6E25\u65ED\u8466\u82A6\u9BF5\u6893\u5727\u65A1\u6271\u5B9B"
+    u"\u59D0\u867B\u98F4\u7D62\u7DBE\u9B8E\u6216\u7C9F\u88B7\u5B89\u5EB5\u6309"
+    u"\u6697\u6848\u95C7\u978D\u674F\u4EE5\u4F0A\u4F4D\u4F9D\u5049\u56F2\u5937"
+    u"\u59D4\u5A01\u5C09\u60DF\u610F\u6170\u6613\u6905\u70BA\u754F\u7570\u79FB"
+    u"\u7DAD\u7DEF\u80C3\u840E\u8863\u8B02\u9055\u907A\u533B\u4E95\u4EA5\u57DF"
+    u"\u80B2\u90C1\u78EF\u4E00\u58F1\u6EA2\u9038\u7A32\u8328\u828B\u9C2F\u5141"
+    u"\u5370\u54BD\u54E1\u56E0\u59FB\u5F15\u98F2\u6DEB\u80E4\u852D"
+    # row 17
+    u"\u9662\u9670\u96A0\u97FB\u540B\u53F3\u5B87\u70CF\u7FBD\u8FC2\u96E8\u536F"
+    u"\u9D5C\u7ABA\u4E11\u7893\u81FC\u6E26\u5618\u5504\u6B1D\u851A\u9C3B\u59E5"
+    u"\u53A9\u6D66\u74DC\u958F\u5642\u4E91\u904B\u96F2\u834F\u990C\u53E1\u55B6"
+    u"\u5B30\u5F71\u6620\u66F3\u6804\u6C38\u6CF3\u6D29\u745B\u76C8\u7A4E\u9834"
+    u"\u82F1\u885B\u8A60\u92ED\u6DB2\u75AB\u76CA\u99C5\u60A6\u8B01\u8D8A\u95B2"
+    u"\u698E\u53AD\u5186\u5712\u5830\u5944\u5BB4\u5EF6\u6028\u63A9\u63F4\u6CBF"
+    u"\u6F14\u708E\u7114\u7159\u71D5\u733F\u7E01\u8276\u82D1\u8597\u9060\u925B"
+    u"\u9D1B\u5869\u65BC\u6C5A\u7525\u51F9\u592E\u5965\u5F80\u5FDC"
+    # row 18
+    u"\u62BC\u65FA\u6A2A\u6B27\u6BB4\u738B\u7FC1\u8956\u9D2C\u9D0E\u9EC4\u5CA1"
+    u"\u6C96\u837B\u5104\u5C4B\u61B6\u81C6\u6876\u7261\u4E59\u4FFA\u5378\u6069"
+    u"\u6E29\u7A4F\u97F3\u4E0B\u5316\u4EEE\u4F55\u4F3D\u4FA1\u4F73\u52A0\u53EF"
+    u"\u5609\u590F\u5AC1\u5BB6\u5BE1\u79D1\u6687\u679C\u67B6\u6B4C\u6CB3\u706B"
+    u"\u73C2\u798D\u79BE\u7A3C\u7B87\u82B1\u82DB\u8304\u8377\u83EF\u83D3\u8766"
+    u"\u8AB2\u5629\u8CA8\u8FE6\u904E\u971E\u868A\u4FC4\u5CE8\u6211\u7259\u753B"
+    u"\u81E5\u82BD\u86FE\u8CC0\u96C5\u9913\u99D5\u4ECB\u4F1A\u89E3\u56DE\u584A"
+    u"\u58CA\u5EFB\u5FEB\u602A\u6094\u6062\u61D0\u6212\u62D0\u6539"
+    # row 19
+    u"\u9B41\u6666\u68B0\u6D77\u7070\u754C\u7686\u7D75\u82A5\u87F9\u958B\u968E"
+    u"\u8C9D\u51F1\u52BE\u5916\u54B3\u5BB3\u5D16\u6168\u6982\u6DAF\u788D\u84CB"
+    u"\u8857\u8A72\u93A7\u9AB8\u6D6C\u99A8\u86D9\u57A3\u67FF\u86CE\u920E\u5283"
+    u"\u5687\u5404\u5ED3\u62E1\u64B9\u683C\u6838\u6BBB\u7372\u78BA\u7A6B\u899A"
+    u"\u89D2\u8D6B\u8F03\u90ED\u95A3\u9694\u9769\u5B66\u5CB3\u697D\u984D\u984E"
+    u"\u639B\u7B20\u6A2B\u6A7F\u68B6\u9C0D\u6F5F\u5272\u559D\u6070\u62EC\u6D3B"
+    u"\u6E07\u6ED1\u845B\u8910\u8F44\u4E14\u9C39\u53F6\u691B\u6A3A\u9784\u682A"
+    u"\u515C\u7AC3\u84B2\u91DC\u938C\u565B\u9D28\u6822\u8305\u8431"
+    # row 20
+    u"\u7CA5\u5208\u82C5\u74E6\u4E7E\u4F83\u51A0\u5BD2\u520A\u52D8\u52E7\u5DFB"
+    u"\u559A\u582A\u59E6\u5B8C\u5B98\u5BDB\u5E72\u5E79\u60A3\u611F\u6163\u61BE"
+    u"\u63DB\u6562\u67D1\u6853\u68FA\u6B3E\u6B53\u6C57\u6F22\u6F97\u6F45\u74B0"
+    u"\u7518\u76E3\u770B\u7AFF\u7BA1\u7C21\u7DE9\u7F36\u7FF0\u809D\u8266\u839E"
+    u"\u89B3\u8ACC\u8CAB\u9084\u9451\u9593\u9591\u95A2\u9665\u97D3\u9928\u8218"
+    u"\u4E38\u542B\u5CB8\u5DCC\u73A9\u764C\u773C\u5CA9\u7FEB\u8D0B\u96C1\u9811"
+    u"\u9854\u9858\u4F01\u4F0E\u5371\u559C\u5668\u57FA\u5947\u5B09\u5BC4\u5C90"
+    u"\u5E0C\u5E7E\u5FCC\u63EE\u673A\u65D7\u65E2\u671F\u68CB\u68C4"
+    # row 21
+    u"\u6A5F\u5E30\u6BC5\u6C17\u6C7D\u757F\u7948\u5B63\u7A00\u7D00\u5FBD\u898F"
+    u"\u8A18\u8CB4\u8D77\u8ECC\u8F1D\u98E2\u9A0E\u9B3C\u4E80\u507D\u5100\u5993"
+    u"\u5B9C\u622F\u6280\u64EC\u6B3A\u72A0\u7591\u7947\u7FA9\u87FB\u8ABC\u8B70"
+    u"\u63AC\u83CA\u97A0\u5409\u5403\u55AB\u6854\u6A58\u8A70\u7827\u6775\u9ECD"
+    u"\u5374\u5BA2\u811A\u8650\u9006\u4E18\u4E45\u4EC7\u4F11\u53CA\u5438\u5BAE"
+    u"\u5F13\u6025\u6551\u673D\u6C42\u6C72\u6CE3\u7078\u7403\u7A76\u7AAE\u7B08"
+    u"\u7D1A\u7CFE\u7D66\u65E7\u725B\u53BB\u5C45\u5DE8\u62D2\u62E0\u6319\u6E20"
+    u"\u865A\u8A31\u8DDD\u92F8\u6F01\u79A6\u9B5A\u4EA8\u4EAB\u4EAC"
+    # row 22
+    u"\u4F9B\u4FA0\u50D1\u5147\u7AF6\u5171\u51F6\u5354\u5321\u537F\u53EB\u55AC"
+    u"\u5883\u5CE1\u5F37\u5F4A\u602F\u6050\u606D\u631F\u6559\u6A4B\u6CC1\u72C2"
+    u"\u72ED\u77EF\u80F8\u8105\u8208\u854E\u90F7\u93E1\u97FF\u9957\u9A5A\u4EF0"
+    u"\u51DD\u5C2D\u6681\u696D\u5C40\u66F2\u6975\u7389\u6850\u7C81\u50C5\u52E4"
+    u"\u5747\u5DFE\u9326\u65A4\u6B23\u6B3D\u7434\u7981\u79BD\u7B4B\u7DCA\u82B9"
+    u"\u83CC\u887F\u895F\u8B39\u8FD1\u91D1\u541F\u9280\u4E5D\u5036\u53E5\u533A"
+    u"\u72D7\u7396\u77E9\u82E6\u8EAF\u99C6\u99C8\u99D2\u5177\u611A\u865E\u55B0"
+    u"\u7A7A\u5076\u5BD3\u9047\u9685\u4E32\u6ADB\u91E7\u5C51\u5C48"
+    # row 23
+    u"\u6398\u7A9F\u6C93\u9774\u8F61\u7AAA\u718A\u9688\u7C82\u6817\u7E70\u6851"
+    u"\u936C\u52F2\u541B\u85AB\u8A13\u7FA4\u8ECD\u90E1\u5366\u8888\u7941\u4FC2"
+    u"\u50BE\u5211\u5144\u5553\u572D\u73EA\u578B\u5951\u5F62\u5F84\u6075\u6176"
+    u"\u6167\u61A9\u63B2\u643A\u656C\u666F\u6842\u6E13\u7566\u7A3D\u7CFB\u7D4C"
+    u"\u7D99\u7E4B\u7F6B\u830E\u834A\u86CD\u8A08\u8A63\u8B66\u8EFD\u981A\u9D8F"
+    u"\u82B8\u8FCE\u9BE8\u5287\u621F\u6483\u6FC0\u9699\u6841\u5091\u6B20\u6C7A"
+    u"\u6F54\u7A74\u7D50\u8840\u8A23\u6708\u4EF6\u5039\u5026\u5065\u517C\u5238"
+    u"\u5263\u55A7\u570F\u5805\u5ACC\u5EFA\u61B2\u61F8\u62F3\u6372"
+    # row 24
+    u"\u691C\u6A29\u727D\u72AC\u732E\u7814\u786F\u7D79\u770C\u80A9\u898B\u8B19"
+    u"\u8CE2\u8ED2\u9063\u9375\u967A\u9855\u9A13\u9E78\u5143\u539F\u53B3\u5E7B"
+    u"\u5F26\u6E1B\u6E90\u7384\u73FE\u7D43\u8237\u8A00\u8AFA\u9650\u4E4E\u500B"
+    u"\u53E4\u547C\u56FA\u59D1\u5B64\u5DF1\u5EAB\u5F27\u6238\u6545\u67AF\u6E56"
+    u"\u72D0\u7CCA\u88B4\u80A1\u80E1\u83F0\u864E\u8A87\u8DE8\u9237\u96C7\u9867"
+    u"\u9F13\u4E94\u4E92\u4F0D\u5348\u5449\u543E\u5A2F\u5F8C\u5FA1\u609F\u68A7"
+    u"\u6A8E\u745A\u7881\u8A9E\u8AA4\u8B77\u9190\u4E5E\u9BC9\u4EA4\u4F7C\u4FAF"
+    u"\u5019\u5016\u5149\u516C\u529F\u52B9\u52FE\u539A\u53E3\u5411"
+    # row 25
+    u"\u540E\u5589\u5751\u57A2\u597D\u5B54\u5B5D\u5B8F\u5DE5\u5DE7\u5DF7\u5E78"
+    u"\u5E83\u5E9A\u5EB7\u5F18\u6052\u614C\u6297\u62D8\u63A7\u653B\u6602\u6643"
+    u"\u66F4\u676D\u6821\u6897\u69CB\u6C5F\u6D2A\u6D69\u6E2F\u6E9D\u7532\u7687"
+    u"\u786C\u7A3F\u7CE0\u7D05\u7D18\u7D5E\u7DB1\u8015\u8003\u80AF\u80B1\u8154"
+    u"\u818F\u822A\u8352\u884C\u8861\u8B1B\u8CA2\u8CFC\u90CA\u9175\u9271\u783F"
+    u"\u92FC\u95A4\u964D\u9805\u9999\u9AD8\u9D3B\u525B\u52AB\u53F7\u5408\u58D5"
+    u"\u62F7\u6FE0\u8C6A\u8F5F\u9EB9\u514B\u523B\u544A\u56FD\u7A40\u9177\u9D60"
+    u"\u9ED2\u7344\u6F09\u8170\u7511\u5FFD\u60DA\u9AA8\u72DB\u8FBC"
+    # row 26
+    u"\u6B64\u9803\u4ECA\u56F0\u5764\u58BE\u5A5A\u6068\u61C7\u660F\u6606\u6839"
+    u"\u68B1\u6DF7\u75D5\u7D3A\u826E\u9B42\u4E9B\u4F50\u53C9\u5506\u5D6F\u5DE6"
+    u"\u5DEE\u67FB\u6C99\u7473\u7802\u8A50\u9396\u88DF\u5750\u5EA7\u632B\u50B5"
+    u"\u50AC\u518D\u6700\u54C9\u585E\u59BB\u5BB0\u5F69\u624D\u63A1\u683D\u6B73"
+    u"\u6E08\u707D\u91C7\u7280\u7815\u7826\u796D\u658E\u7D30\u83DC\u88C1\u8F09"
+    u"\u969B\u5264\u5728\u6750\u7F6A\u8CA1\u51B4\u5742\u962A\u583A\u698A\u80B4"
+    u"\u54B2\u5D0E\u57FC\u7895\u9DFA\u4F5C\u524A\u548B\u643E\u6628\u6714\u67F5"
+    u"\u7A84\u7B56\u7D22\u932F\u685C\u9BAD\u7B39\u5319\u518A\u5237"
+    # row 27
+    u"\u5BDF\u62F6\u64AE\u64E6\u672D\u6BBA\u85A9\u96D1\u7690\u9BD6\u634C\u9306"
+    u"\u9BAB\u76BF\u6652\u4E09\u5098\u53C2\u5C71\u60E8\u6492\u6563\u685F\u71E6"
+    u"\u73CA\u7523\u7B97\u7E82\u8695\u8B83\u8CDB\u9178\u9910\u65AC\u66AB\u6B8B"
+    u"\u4ED5\u4ED4\u4F3A\u4F7F\u523A\u53F8\u53F2\u55E3\u56DB\u58EB\u59CB\u59C9"
+    u"\u59FF\u5B50\u5C4D\u5E02\u5E2B\u5FD7\u601D\u6307\u652F\u5B5C\u65AF\u65BD"
+    u"\u65E8\u679D\u6B62\u6B7B\u6C0F\u7345\u7949\u79C1\u7CF8\u7D19\u7D2B\u80A2"
+    u"\u8102\u81F3\u8996\u8A5E\u8A69\u8A66\u8A8C\u8AEE\u8CC7\u8CDC\u96CC\u98FC"
+    u"\u6B6F\u4E8B\u4F3C\u4F8D\u5150\u5B57\u5BFA\u6148\u6301\u6642"
+    # row 28
+    u"\u6B21\u6ECB\u6CBB\u723E\u74BD\u75D4\u78C1\u793A\u800C\u8033\u81EA\u8494"
+    u"\u8F9E\u6C50\u9E7F\u5F0F\u8B58\u9D2B\u7AFA\u8EF8\u5B8D\u96EB\u4E03\u53F1"
+    u"\u57F7\u5931\u5AC9\u5BA4\u6089\u6E7F\u6F06\u75BE\u8CEA\u5B9F\u8500\u7BE0"
+    u"\u5072\u67F4\u829D\u5C61\u854A\u7E1E\u820E\u5199\u5C04\u6368\u8D66\u659C"
+    u"\u716E\u793E\u7D17\u8005\u8B1D\u8ECA\u906E\u86C7\u90AA\u501F\u52FA\u5C3A"
+    u"\u6753\u707C\u7235\u914C\u91C8\u932B\u82E5\u5BC2\u5F31\u60F9\u4E3B\u53D6"
+    u"\u5B88\u624B\u6731\u6B8A\u72E9\u73E0\u7A2E\u816B\u8DA3\u9152\u9996\u5112"
+    u"\u53D7\u546A\u5BFF\u6388\u6A39\u7DAC\u9700\u56DA\u53CE\u5468"
+    # row 29
+    u"\u5B97\u5C31\u5DDE\u4FEE\u6101\u62FE\u6D32\u79C0\u79CB\u7D42\u7E4D\u7FD2"
+    u"\u81ED\u821F\u8490\u8846\u8972\u8B90\u8E74\u8F2F\u9031\u914B\u916C\u96C6"
+    u"\u919C\u4EC0\u4F4F\u5145\u5341\u5F93\u620E\u67D4\u6C41\u6E0B\u7363\u7E26"
+    u"\u91CD\u9283\u53D4\u5919\u5BBF\u6DD1\u795D\u7E2E\u7C9B\u587E\u719F\u51FA"
+    u"\u8853\u8FF0\u4FCA\u5CFB\u6625\u77AC\u7AE3\u821C\u99FF\u51C6\u5FAA\u65EC"
+    u"\u696F\u6B89\u6DF3\u6E96\u6F64\u76FE\u7D14\u5DE1\u9075\u9187\u9806\u51E6"
+    u"\u521D\u6240\u6691\u66D9\u6E1A\u5EB6\u7DD2\u7F72\u66F8\u85AF\u85F7\u8AF8"
+    u"\u52A9\u53D9\u5973\u5E8F\u5F90\u6055\u92E4\u9664\u50B7\u511F"
+    # row 30
+    u"\u52DD\u5320\u5347\u53EC\u54E8\u5546\u5531\u5617\u5968\u59BE\u5A3C\u5BB5"
+    u"\u5C06\u5C0F\u5C11\u5C1A\u5E84\u5E8A\u5EE0\u5F70\u627F\u6284\u62DB\u638C"
+    u"\u6377\u6607\u660C\u662D\u6676\u677E\u68A2\u6A1F\u6A35\u6CBC\u6D88\u6E09"
+    u"\u6E58\u713C\u7126\u7167\u75C7\u7701\u785D\u7901\u7965\u79F0\u7AE0\u7B11"
+    u"\u7CA7\u7D39\u8096\u83D6\u848B\u8549\u885D\u88F3\u8A1F\u8A3C\u8A54\u8A73"
+    u"\u8C61\u8CDE\u91A4\u9266\u937E\u9418\u969C\u9798\u4E0A\u4E08\u4E1E\u4E57"
+    u"\u5197\u5270\u57CE\u5834\u58CC\u5B22\u5E38\u60C5\u64FE\u6761\u6756\u6D44"
+    u"\u72B6\u7573\u7A63\u84B8\u8B72\u91B8\u9320\u5631\u57F4\u98FE"
+    # row 31
+    u"\u62ED\u690D\u6B96\u71ED\u7E54\u8077\u8272\u89E6\u98DF\u8755\u8FB1\u5C3B"
+    u"\u4F38\u4FE1\u4FB5\u5507\u5A20\u5BDD\u5BE9\u5FC3\u614E\u632F\u65B0\u664B"
+    u"\u68EE\u699B\u6D78\u6DF1\u7533\u75B9\u771F\u795E\u79E6\u7D33\u81E3\u82AF"
+    u"\u85AA\u89AA\u8A3A\u8EAB\u8F9B\u9032\u91DD\u9707\u4EBA\u4EC1\u5203\u5875"
+    u"\u58EC\u5C0B\u751A\u5C3D\u814E\u8A0A\u8FC5\u9663\u976D\u7B25\u8ACF\u9808"
+    u"\u9162\u56F3\u53A8\u9017\u5439\u5782\u5E25\u63A8\u6C34\u708A\u7761\u7C8B"
+    u"\u7FE0\u8870\u9042\u9154\u9310\u9318\u968F\u745E\u9AC4\u5D07\u5D69\u6570"
+    u"\u67A2\u8DA8\u96DB\u636E\u6749\u6919\u83C5\u9817\u96C0\u88FE"
+    # row 32
+    u"\u6F84\u647A\u5BF8\u4E16\u702C\u755D\u662F\u51C4\u5236\u52E2\u59D3\u5F81"
+    u"\u6027\u6210\u653F\u6574\u661F\u6674\u68F2\u6816\u6B63\u6E05\u7272\u751F"
+    u"\u76DB\u7CBE\u8056\u58F0\u88FD\u897F\u8AA0\u8A93\u8ACB\u901D\u9192\u9752"
+    u"\u9759\u6589\u7A0E\u8106\u96BB\u5E2D\u60DC\u621A\u65A5\u6614\u6790\u77F3"
+    u"\u7A4D\u7C4D\u7E3E\u810A\u8CAC\u8D64\u8DE1\u8E5F\u78A9\u5207\u62D9\u63A5"
+    u"\u6442\u6298\u8A2D\u7A83\u7BC0\u8AAC\u96EA\u7D76\u820C\u8749\u4ED9\u5148"
+    u"\u5343\u5360\u5BA3\u5C02\u5C16\u5DDD\u6226\u6247\u64B0\u6813\u6834\u6CC9"
+    u"\u6D45\u6D17\u67D3\u6F5C\u714E\u717D\u65CB\u7A7F\u7BAD\u7DDA"
+    # row 33
+    u"\u7E4A\u7FA8\u817A\u821B\u8239\u85A6\u8A6E\u8CCE\u8DF5\u9078\u9077\u92AD"
+    u"\u9291\u9583\u9BAE\u524D\u5584\u6F38\u7136\u5168\u7985\u7E55\u81B3\u7CCE"
+    u"\u564C\u5851\u5CA8\u63AA\u66FE\u66FD\u695A\u72D9\u758F\u758E\u790E\u7956"
+    u"\u79DF\u7C97\u7D20\u7D44\u8607\u8A34\u963B\u9061\u9F20\u50E7\u5275\u53CC"
+    u"\u53E2\u5009\u55AA\u58EE\u594F\u723D\u5B8B\u5C64\u531D\u60E3\u60F3\u635C"
+    u"\u6383\u633F\u63BB\u64CD\u65E9\u66F9\u5DE3\u69CD\u69FD\u6F15\u71E5\u4E89"
+    u"\u75E9\u76F8\u7A93\u7CDF\u7DCF\u7D9C\u8061\u8349\u8358\u846C\u84BC\u85FB"
+    u"\u88C5\u8D70\u9001\u906D\u9397\u971C\u9A12\u50CF\u5897\u618E"
+    # row 34
+    u"\u81D3\u8535\u8D08\u9020\u4FC3\u5074\u5247\u5373\u606F\u6349\u675F\u6E2C"
+    u"\u8DB3\u901F\u4FD7\u5C5E\u8CCA\u65CF\u7D9A\u5352\u8896\u5176\u63C3\u5B58"
+    u"\u5B6B\u5C0A\u640D\u6751\u905C\u4ED6\u591A\u592A\u6C70\u8A51\u553E\u5815"
+    u"\u59A5\u60F0\u6253\u67C1\u8235\u6955\u9640\u99C4\u9A28\u4F53\u5806\u5BFE"
+    u"\u8010\u5CB1\u5E2F\u5F85\u6020\u614B\u6234\u66FF\u6CF0\u6EDE\u80CE\u817F"
+    u"\u82D4\u888B\u8CB8\u9000\u902E\u968A\u9EDB\u9BDB\u4EE3\u53F0\u5927\u7B2C"
+    u"\u918D\u984C\u9DF9\u6EDD\u7027\u5353\u5544\u5B85\u6258\u629E\u62D3\u6CA2"
+    u"\u6FEF\u7422\u8A17\u9438\u6FC1\u8AFE\u8338\u51E7\u86F8\u53EA"
+    # row 35
+    u"\u53E9\u4F46\u9054\u8FB0\u596A\u8131\u5DFD\u7AEA\u8FBF\u68DA\u8C37\u72F8"
+    u"\u9C48\u6A3D\u8AB0\u4E39\u5358\u5606\u5766\u62C5\u63A2\u65E6\u6B4E\u6DE1"
+    u"\u6E5B\u70AD\u77ED\u7AEF\u7BAA\u7DBB\u803D\u80C6\u86CB\u8A95\u935B\u56E3"
+    u"\u58C7\u5F3E\u65AD\u6696\u6A80\u6BB5\u7537\u8AC7\u5024\u77E5\u5730\u5F1B"
+    u"\u6065\u667A\u6C60\u75F4\u7A1A\u7F6E\u81F4\u8718\u9045\u99B3\u7BC9\u755C"
+    u"\u7AF9\u7B51\u84C4\u9010\u79E9\u7A92\u8336\u5AE1\u7740\u4E2D\u4EF2\u5B99"
+    u"\u5FE0\u62BD\u663C\u67F1\u6CE8\u866B\u8877\u8A3B\u914E\u92F3\u99D0\u6A17"
+    u"\u7026\u732A\u82E7\u8457\u8CAF\u4E01\u5146\u51CB\u558B\u5BF5"
+    # row 36
+    u"\u5E16\u5E33\u5E81\u5F14\u5F35\u5F6B\u5FB4\u61F2\u6311\u66A2\u671D\u6F6E"
+    u"\u7252\u753A\u773A\u8074\u8139\u8178\u8776\u8ABF\u8ADC\u8D85\u8DF3\u929A"
+    u"\u9577\u9802\u9CE5\u52C5\u6357\u76F4\u6715\u6C88\u73CD\u8CC3\u93AE\u9673"
+    u"\u6D25\u589C\u690E\u69CC\u8FFD\u939A\u75DB\u901A\u585A\u6802\u63B4\u69FB"
+    u"\u4F43\u6F2C\u67D8\u8FBB\u8526\u7DB4\u9354\u693F\u6F70\u576A\u58F7\u5B2C"
+    u"\u7D2C\u722A\u540A\u91E3\u9DB4\u4EAD\u4F4E\u505C\u5075\u5243\u8C9E\u5448"
+    u"\u5824\u5B9A\u5E1D\u5E95\u5EAD\u5EF7\u5F1F\u608C\u62B5\u633A\u63D0\u68AF"
+    u"\u6C40\u7887\u798E\u7A0B\u7DE0\u8247\u8A02\u8AE6\u8E44\u9013"
+    # row 37
+    u"\u90B8\u912D\u91D8\u9F0E\u6CE5\u6458\u64E2\u6575\u6EF4\u7684\u7B1B\u9069"
+    u"\u93D1\u6EBA\u54F2\u5FB9\u64A4\u8F4D\u8FED\u9244\u5178\u586B\u5929\u5C55"
+    u"\u5E97\u6DFB\u7E8F\u751C\u8CBC\u8EE2\u985B\u70B9\u4F1D\u6BBF\u6FB1\u7530"
+    u"\u96FB\u514E\u5410\u5835\u5857\u59AC\u5C60\u5F92\u6597\u675C\u6E21\u767B"
+    u"\u83DF\u8CED\u9014\u90FD\u934D\u7825\u783A\u52AA\u5EA6\u571F\u5974\u6012"
+    u"\u5012\u515A\u51AC\u51CD\u5200\u5510\u5854\u5858\u5957\u5B95\u5CF6\u5D8B"
+    u"\u60BC\u6295\u642D\u6771\u6843\u68BC\u68DF\u76D7\u6DD8\u6E6F\u6D9B\u706F"
+    u"\u71C8\u5F53\u75D8\u7977\u7B49\u7B54\u7B52\u7CD6\u7D71\u5230"
+    # row 38
+    u"\u8463\u8569\u85E4\u8A0E\u8B04\u8C46\u8E0F\u9003\u900F\u9419\u9676\u982D"
+    u"\u9A30\u95D8\u50CD\u52D5\u540C\u5802\u5C0E\u61A7\u649E\u6D1E\u77B3\u7AE5"
+    u"\u80F4\u8404\u9053\u9285\u5CE0\u9D07\u533F\u5F97\u5FB3\u6D9C\u7279\u7763"
+    u"\u79BF\u7BE4\u6BD2\u72EC\u8AAD\u6803\u6A61\u51F8\u7A81\u6934\u5C4A\u9CF6"
+    u"\u82EB\u5BC5\u9149\u701E\u5678\u5C6F\u60C7\u6566\u6C8C\u8C5A\u9041\u9813"
+    u"\u5451\u66C7\u920D\u5948\u90A3\u5185\u4E4D\u51EA\u8599\u8B0E\u7058\u637A"
+    u"\u934B\u6962\u99B4\u7E04\u7577\u5357\u6960\u8EDF\u96E3\u6C5D\u4E8C\u5C3C"
+    u"\u5F10\u8FE9\u5302\u8CD1\u8089\u8679\u5EFF\u65E5\u4E73\u5165"
+    # row 39
+    u"\u5982\u5C3F\u97EE\u4EFB\u598A\u5FCD\u8A8D\u6FE1\u79B0\u7962\u5BE7\u8471"
+    u"\u732B\u71B1\u5E74\u5FF5\u637B\u649A\u71C3\u7C98\u4E43\u5EFC\u4E4B\u57DC"
+    u"\u56A2\u60A9\u6FC3\u7D0D\u80FD\u8133\u81BF\u8FB2\u8997\u86A4\u5DF4\u628A"
+    u"\u64AD\u8987\u6777\u6CE2\u6D3E\u7436\u7834\u5A46\u7F75\u82AD\u99AC\u4FF3"
+    u"\u5EC3\u62DD\u6392\u6557\u676F\u76C3\u724C\u80CC\u80BA\u8F29\u914D\u500D"
+    u"\u57F9\u5A92\u6885\u6973\u7164\u72FD\u8CB7\u58F2\u8CE0\u966A\u9019\u877F"
+    u"\u79E4\u77E7\u8429\u4F2F\u5265\u535A\u62CD\u67CF\u6CCA\u767D\u7B94\u7C95"
+    u"\u8236\u8584\u8FEB\u66DD\u6F20\u7206\u7E1B\u83AB\u99C1\u9EA6"
+    # row 40
+    u"\u51FD\u7BB1\u7872\u7BB8\u8087\u7B48\u6AE8\u5E61\u808C\u7551\u7560\u516B"
+    u"\u9262\u6E8C\u767A\u9197\u9AEA\u4F10\u7F70\u629C\u7B4F\u95A5\u9CE9\u567A"
+    u"\u5859\u86E4\u96BC\u4F34\u5224\u534A\u53CD\u53DB\u5E06\u642C\u6591\u677F"
+    u"\u6C3E\u6C4E\u7248\u72AF\u73ED\u7554\u7E41\u822C\u85E9\u8CA9\u7BC4\u91C6"
+    u"\u7169\u9812\u98EF\u633D\u6669\u756A\u76E4\u78D0\u8543\u86EE\u532A\u5351"
+    u"\u5426\u5983\u5E87\u5F7C\u60B2\u6249\u6279\u62AB\u6590\u6BD4\u6CCC\u75B2"
+    u"\u76AE\u7891\u79D8\u7DCB\u7F77\u80A5\u88AB\u8AB9\u8CBB\u907F\u975E\u98DB"
+    u"\u6A0B\u7C38\u5099\u5C3E\u5FAE\u6787\u6BD8\u7435\u7709\u7F8E"
+    # row 41
+    u"\u9F3B\u67CA\u7A17\u5339\u758B\u9AED\u5F66\u819D\u83F1\u8098\u5F3C\u5FC5"
+    u"\u7562\u7B46\u903C\u6867\u59EB\u5A9B\u7D10\u767E\u8B2C\u4FF5\u5F6A\u6A19"
+    u"\u6C37\u6F02\u74E2\u7968\u8868\u8A55\u8C79\u5EDF\u63CF\u75C5\u79D2\u82D7"
+    u"\u9328\u92F2\u849C\u86ED\u9C2D\u54C1\u5F6C\u658C\u6D5C\u7015\u8CA7\u8CD3"
+    u"\u983B\u654F\u74F6\u4E0D\u4ED8\u57E0\u592B\u5A66\u5BCC\u51A8\u5E03\u5E9C"
+    u"\u6016\u6276\u6577\u65A7\u666E\u6D6E\u7236\u7B26\u8150\u819A\u8299\u8B5C"
+    u"\u8CA0\u8CE6\u8D74\u961C\u9644\u4FAE\u64AB\u6B66\u821E\u8461\u856A\u90E8"
+    u"\u5C01\u6953\u98A8\u847A\u8557\u4F0F\u526F\u5FA9\u5E45\u670D"
+    # row 42
+    u"\u798F\u8179\u8907\u8986\u6DF5\u5F17\u6255\u6CB8\u4ECF\u7269\u9B92\u5206"
+    u"\u543B\u5674\u58B3\u61A4\u626E\u711A\u596E\u7C89\u7CDE\u7D1B\u96F0\u6587"
+    u"\u805E\u4E19\u4F75\u5175\u5840\u5E63\u5E73\u5F0A\u67C4\u4E26\u853D\u9589"
+    u"\u965B\u7C73\u9801\u50FB\u58C1\u7656\u78A7\u5225\u77A5\u8511\u7B86\u504F"
+    u"\u5909\u7247\u7BC7\u7DE8\u8FBA\u8FD4\u904D\u4FBF\u52C9\u5A29\u5F01\u97AD"
+    u"\u4FDD\u8217\u92EA\u5703\u6355\u6B69\u752B\u88DC\u8F14\u7A42\u52DF\u5893"
+    u"\u6155\u620A\u66AE\u6BCD\u7C3F\u83E9\u5023\u4FF8\u5305\u5446\u5831\u5949"
+    u"\u5B9D\u5CF0\u5CEF\u5D29\u5E96\u62B1\u6367\u653E\u65B9\u670B"
+    # row 43
+    u"\u6CD5\u6CE1\u70F9\u7832\u7E2B\u80DE\u82B3\u840C\u84EC\u8702\u8912\u8A2A"
+    u"\u8C4A\u90A6\u92D2\u98FD\u9CF3\u9D6C\u4E4F\u4EA1\u508D\u5256\u574A\u59A8"
+    u"\u5E3D\u5FD8\u5FD9\u623F\u66B4\u671B\u67D0\u68D2\u5192\u7D21\u80AA\u81A8"
+    u"\u8B00\u8C8C\u8CBF\u927E\u9632\u5420\u982C\u5317\u50D5\u535C\u58A8\u64B2"
+    u"\u6734\u7267\u7766\u7A46\u91E6\u52C3\u6CA1\u6B86\u5800\u5E4C\u5954\u672C"
+    u"\u7FFB\u51E1\u76C6\u6469\u78E8\u9B54\u9EBB\u57CB\u59B9\u6627\u679A\u6BCE"
+    u"\u54E9\u69D9\u5E55\u819C\u6795\u9BAA\u67FE\u9C52\u685D\u4EA6\u4FE3\u53C8"
+    u"\u62B9\u672B\u6CAB\u8FC4\u4FAD\u7E6D\u9EBF\u4E07\u6162\u6E80"
+    # row 44
+    u"\u6F2B\u8513\u5473\u672A\u9B45\u5DF3\u7B95\u5CAC\u5BC6\u871C\u6E4A\u84D1"
+    u"\u7A14\u8108\u5999\u7C8D\u6C11\u7720\u52D9\u5922\u7121\u725F\u77DB\u9727"
+    u"\u9D61\u690B\u5A7F\u5A18\u51A5\u540D\u547D\u660E\u76DF\u8FF7\u9298\u9CF4"
+    u"\u59EA\u725D\u6EC5\u514D\u68C9\u7DBF\u7DEC\u9762\u9EBA\u6478\u6A21\u8302"
+    u"\u5984\u5B5F\u6BDB\u731B\u76F2\u7DB2\u8017\u8499\u5132\u6728\u9ED9\u76EE"
+    u"\u6762\u52FF\u9905\u5C24\u623B\u7C7E\u8CB0\u554F\u60B6\u7D0B\u9580\u5301"
+    u"\u4E5F\u51B6\u591C\u723A\u8036\u91CE\u5F25\u77E2\u5384\u5F79\u7D04\u85AC"
+    u"\u8A33\u8E8D\u9756\u67F3\u85AE\u9453\u6109\u6108\u6CB9\u7652"
+    # row 45
+    u"\u8AED\u8F38\u552F\u4F51\u512A\u52C7\u53CB\u5BA5\u5E7D\u60A0\u6182\u63D6"
+    u"\u6709\u67DA\u6E67\u6D8C\u7336\u7337\u7531\u7950\u88D5\u8A98\u904A\u9091"
+    u"\u90F5\u96C4\u878D\u5915\u4E88\u4F59\u4E0E\u8A89\u8F3F\u9810\u50AD\u5E7C"
+    u"\u5996\u5BB9\u5EB8\u63DA\u63FA\u64C1\u66DC\u694A\u69D8\u6D0B\u6EB6\u7194"
+    u"\u7528\u7AAF\u7F8A\u8000\u8449\u84C9\u8981\u8B21\u8E0A\u9065\u967D\u990A"
+    u"\u617E\u6291\u6B32\u6C83\u6D74\u7FCC\u7FFC\u6DC0\u7F85\u87BA\u88F8\u6765"
+    u"\u83B1\u983C\u96F7\u6D1B\u7D61\u843D\u916A\u4E71\u5375\u5D50\u6B04\u6FEB"
+    u"\u85CD\u862D\u89A7\u5229\u540F\u5C65\u674E\u68A8\u7406\u7483"
+    # row 46
+    u"\u75E2\u88CF\u88E1\u91CC\u96E2\u9678\u5F8B\u7387\u7ACB\u844E\u63A0\u7565"
+    u"\u5289\u6D41\u6E9C\u7409\u7559\u786B\u7C92\u9686\u7ADC\u9F8D\u4FB6\u616E"
+    u"\u65C5\u865C\u4E86\u4EAE\u50DA\u4E21\u51CC\u5BEE\u6599\u6881\u6DBC\u731F"
+    u"\u7642\u77AD\u7A1C\u7CE7\u826F\u8AD2\u907C\u91CF\u9675\u9818\u529B\u7DD1"
+    u"\u502B\u5398\u6797\u6DCB\u71D0\u7433\u81E8\u8F2A\u96A3\u9C57\u9E9F\u7460"
+    u"\u5841\u6D99\u7D2F\u985E\u4EE4\u4F36\u4F8B\u51B7\u52B1\u5DBA\u601C\u73B2"
+    u"\u793C\u82D3\u9234\u96B7\u96F6\u970A\u9E97\u9F62\u66A6\u6B74\u5217\u52A3"
+    u"\u70C8\u88C2\u5EC9\u604B\u6190\u6F23\u7149\u7C3E\u7DF4\u806F"
+    # row 47
+    u"\u84EE\u9023\u932C\u5442\u9B6F\u6AD3\u7089\u8CC2\u8DEF\u9732\u52B4\u5A41"
+    u"\u5ECA\u5F04\u6717\u697C\u6994\u6D6A\u6F0F\u7262\u72FC\u7BED\u8001\u807E"
+    u"\u874B\u90CE\u516D\u9E93\u7984\u808B\u9332\u8AD6\u502D\u548C\u8A71\u6B6A"
+    u"\u8CC4\u8107\u60D1\u67A0\u9DF2\u4E99\u4E98\u9C10\u8A6B\u85C1\u8568\u6900"
+    u"\u6E7E\u7897\u8155\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    # row 48
+    u"\u5F0C\u4E10\u4E15\u4E2A\u4E31\u4E36\u4E3C\u4E3F\u4E42\u4E56\u4E58\u4E82"
+    u"\u4E85\u8C6B\u4E8A\u8212\u5F0D\u4E8E\u4E9E\u4E9F\u4EA0\u4EA2\u4EB0\u4EB3"
+    u"\u4EB6\u4ECE\u4ECD\u4EC4\u4EC6\u4EC2\u4ED7\u4EDE\u4EED\u4EDF\u4EF7\u4F09"
+    u"\u4F5A\u4F30\u4F5B\u4F5D\u4F57\u4F47\u4F76\u4F88\u4F8F\u4F98\u4F7B\u4F69"
+    u"\u4F70\u4F91\u4F6F\u4F86\u4F96\u5118\u4FD4\u4FDF\u4FCE\u4FD8\u4FDB\u4FD1"
+    u"\u4FDA\u4FD0\u4FE4\u4FE5\u501A\u5028\u5014\u502A\u5025\u5005\u4F1C\u4FF6"
+    u"\u5021\u5029\u502C\u4FFE\u4FEF\u5011\u5006\u5043\u5047\u6703\u5055\u5050"
+    u"\u5048\u505A\u5056\u506C\u5078\u5080\u509A\u5085\u50B4\u50B2"
+    # row 49
+    u"\u50C9\u50CA\u50B3\u50C2\u50D6\u50DE\u50E5\u50ED\u50E3\u50EE\u50F9\u50F5"
+    u"\u5109\u5101\u5102\u5116\u5115\u5114\u511A\u5121\u513A\u5137\u513C\u513B"
+    u"\u513F\u5140\u5152\u514C\u5154\u5162\u7AF8\u5169\u516A\u516E\u5180\u5182"
+    u"\u56D8\u518C\u5189\u518F\u5191\u5193\u5195\u5196\u51A4\u51A6\u51A2\u51A9"
+    u"\u51AA\u51AB\u51B3\u51B1\u51B2\u51B0\u51B5\u51BD\u51C5\u51C9\u51DB\u51E0"
+    u"\u8655\u51E9\u51ED\u51F0\u51F5\u51FE\u5204\u520B\u5214\u520E\u5227\u522A"
+    u"\u522E\u5233\u5239\u524F\u5244\u524B\u524C\u525E\u5254\u526A\u5274\u5269"
+    u"\u5273\u527F\u527D\u528D\u5294\u5292\u5271\u5288\u5291\u8FA8"
+    # row 50
+    u"\u8FA7\u52AC\u52AD\u52BC\u52B5\u52C1\u52CD\u52D7\u52DE\u52E3\u52E6\u98ED"
+    u"\u52E0\u52F3\u52F5\u52F8\u52F9\u5306\u5308\u7538\u530D\u5310\u530F\u5315"
+    u"\u531A\u5323\u532F\u5331\u5333\u5338\u5340\u5346\u5345\u4E17\u5349\u534D"
+    u"\u51D6\u535E\u5369\u536E\u5918\u537B\u5377\u5382\u5396\u53A0\u53A6\u53A5"
+    u"\u53AE\u53B0\u53B6\u53C3\u7C12\u96D9\u53DF\u66FC\u71EE\u53EE\u53E8\u53ED"
+    u"\u53FA\u5401\u543D\u5440\u542C\u542D\u543C\u542E\u5436\u5429\u541D\u544E"
+    u"\u548F\u5475\u548E\u545F\u5471\u5477\u5470\u5492\u547B\u5480\u5476\u5484"
+    u"\u5490\u5486\u54C7\u54A2\u54B8\u54A5\u54AC\u54C4\u54C8\u54A8"
+    # row 51
+    u"\u54AB\u54C2\u54A4\u54BE\u54BC\u54D8\u54E5\u54E6\u550F\u5514\u54FD\u54EE"
+    u"\u54ED\u54FA\u54E2\u5539\u5540\u5563\u554C\u552E\u555C\u5545\u5556\u5557"
+    u"\u5538\u5533\u555D\u5599\u5580\u54AF\u558A\u559F\u557B\u557E\u5598\u559E"
+    u"\u55AE\u557C\u5583\u55A9\u5587\u55A8\u55DA\u55C5\u55DF\u55C4\u55DC\u55E4"
+    u"\u55D4\u5614\u55F7\u5616\u55FE\u55FD\u561B\u55F9\u564E\u5650\u71DF\u5634"
+    u"\u5636\u5632\u5638\u566B\u5664\u562F\u566C\u566A\u5686\u5680\u568A\u56A0"
+    u"\u5694\u568F\u56A5\u56AE\u56B6\u56B4\u56C2\u56BC\u56C1\u56C3\u56C0\u56C8"
+    u"\u56CE\u56D1\u56D3\u56D7\u56EE\u56F9\u5700\u56FF\u5704\u5709"
+    # row 52
+    u"\u5708\u570B\u570D\u5713\u5718\u5716\u55C7\u571C\u5726\u5737\u5738\u574E"
+    u"\u573B\u5740\u574F\u5769\u57C0\u5788\u5761\u577F\u5789\u5793\u57A0\u57B3"
+    u"\u57A4\u57AA\u57B0\u57C3\u57C6\u57D4\u57D2\u57D3\u580A\u57D6\u57E3\u580B"
+    u"\u5819\u581D\u5872\u5821\u5862\u584B\u5870\u6BC0\u5852\u583D\u5879\u5885"
+    u"\u58B9\u589F\u58AB\u58BA\u58DE\u58BB\u58B8\u58AE\u58C5\u58D3\u58D1\u58D7"
+    u"\u58D9\u58D8\u58E5\u58DC\u58E4\u58DF\u58EF\u58FA\u58F9\u58FB\u58FC\u58FD"
+    u"\u5902\u590A\u5910\u591B\u68A6\u5925\u592C\u592D\u5932\u5938\u593E\u7AD2"
+    u"\u5955\u5950\u594E\u595A\u5958\u5962\u5960\u5967\u596C\u5969"
+    # row 53
+    u"\u5978\u5981\u599D\u4F5E\u4FAB\u59A3\u59B2\u59C6\u59E8\u59DC\u598D\u59D9"
+    u"\u59DA\u5A25\u5A1F\u5A11\u5A1C\u5A09\u5A1A\u5A40\u5A6C\u5A49\u5A35\u5A36"
+    u"\u5A62\u5A6A\u5A9A\u5ABC\u5ABE\u5ACB\u5AC2\u5ABD\u5AE3\u5AD7\u5AE6\u5AE9"
+    u"\u5AD6\u5AFA\u5AFB\u5B0C\u5B0B\u5B16\u5B32\u5AD0\u5B2A\u5B36\u5B3E\u5B43"
+    u"\u5B45\u5B40\u5B51\u5B55\u5B5A\u5B5B\u5B65\u5B69\u5B70\u5B73\u5B75\u5B78"
+    u"\u6588\u5B7A\u5B80\u5B83\u5BA6\u5BB8\u5BC3\u5BC7\u5BC9\u5BD4\u5BD0\u5BE4"
+    u"\u5BE6\u5BE2\u5BDE\u5BE5\u5BEB\u5BF0\u5BF6\u5BF3\u5C05\u5C07\u5C08\u5C0D"
+    u"\u5C13\u5C20\u5C22\u5C28\u5C38\u5C39\u5C41\u5C46\u5C4E\u5C53"
+    # row 54
+    u"\u5C50\u5C4F\u5B71\u5C6C\u5C6E\u4E62\u5C76\u5C79\u5C8C\u5C91\u5C94\u599B"
+    u"\u5CAB\u5CBB\u5CB6\u5CBC\u5CB7\u5CC5\u5CBE\u5CC7\u5CD9\u5CE9\u5CFD\u5CFA"
+    u"\u5CED\u5D8C\u5CEA\u5D0B\u5D15\u5D17\u5D5C\u5D1F\u5D1B\u5D11\u5D14\u5D22"
+    u"\u5D1A\u5D19\u5D18\u5D4C\u5D52\u5D4E\u5D4B\u5D6C\u5D73\u5D76\u5D87\u5D84"
+    u"\u5D82\u5DA2\u5D9D\u5DAC\u5DAE\u5DBD\u5D90\u5DB7\u5DBC\u5DC9\u5DCD\u5DD3"
+    u"\u5DD2\u5DD6\u5DDB\u5DEB\u5DF2\u5DF5\u5E0B\u5E1A\u5E19\u5E11\u5E1B\u5E36"
+    u"\u5E37\u5E44\u5E43\u5E40\u5E4E\u5E57\u5E54\u5E5F\u5E62\u5E64\u5E47\u5E75"
+    u"\u5E76\u5E7A\u9EBC\u5E7F\u5EA0\u5EC1\u5EC2\u5EC8\u5ED0\u5ECF"
+    # row 55
+    u"\u5ED6\u5EE3\u5EDD\u5EDA\u5EDB\u5EE2\u5EE1\u5EE8\u5EE9\u5EEC\u5EF1\u5EF3"
+    u"\u5EF0\u5EF4\u5EF8\u5EFE\u5F03\u5F09\u5F5D\u5F5C\u5F0B\u5F11\u5F16\u5F29"
+    u"\u5F2D\u5F38\u5F41\u5F48\u5F4C\u5F4E\u5F2F\u5F51\u5F56\u5F57\u5F59\u5F61"
+    u"\u5F6D\u5F73\u5F77\u5F83\u5F82\u5F7F\u5F8A\u5F88\u5F91\u5F87\u5F9E\u5F99"
+    u"\u5F98\u5FA0\u5FA8\u5FAD\u5FBC\u5FD6\u5FFB\u5FE4\u5FF8\u5FF1\u5FDD\u60B3"
+    u"\u5FFF\u6021\u6060\u6019\u6010\u6029\u600E\u6031\u601B\u6015\u602B\u6026"
+    u"\u600F\u603A\u605A\u6041\u606A\u6077\u605F\u604A\u6046\u604D\u6063\u6043"
+    u"\u6064\u6042\u606C\u606B\u6059\u6081\u608D\u60E7\u6083\u609A"
+    # row 56
+    u"\u6084\u609B\u6096\u6097\u6092\u60A7\u608B\u60E1\u60B8\u60E0\u60D3\u60B4"
+    u"\u5FF0\u60BD\u60C6\u60B5\u60D8\u614D\u6115\u6106\u60F6\u60F7\u6100\u60F4"
+    u"\u60FA\u6103\u6121\u60FB\u60F1\u610D\u610E\u6147\u613E\u6128\u6127\u614A"
+    u"\u613F\u613C\u612C\u6134\u613D\u6142\u6144\u6173\u6177\u6158\u6159\u615A"
+    u"\u616B\u6174\u616F\u6165\u6171\u615F\u615D\u6153\u6175\u6199\u6196\u6187"
+    u"\u61AC\u6194\u619A\u618A\u6191\u61AB\u61AE\u61CC\u61CA\u61C9\u61F7\u61C8"
+    u"\u61C3\u61C6\u61BA\u61CB\u7F79\u61CD\u61E6\u61E3\u61F6\u61FA\u61F4\u61FF"
+    u"\u61FD\u61FC\u61FE\u6200\u6208\u6209\u620D\u620C\u6214\u621B"
+    # row 57
+    u"\u621E\u6221\u622A\u622E\u6230\u6232\u6233\u6241\u624E\u625E\u6263\u625B"
+    u"\u6260\u6268\u627C\u6282\u6289\u627E\u6292\u6293\u6296\u62D4\u6283\u6294"
+    u"\u62D7\u62D1\u62BB\u62CF\u62FF\u62C6\u64D4\u62C8\u62DC\u62CC\u62CA\u62C2"
+    u"\u62C7\u629B\u62C9\u630C\u62EE\u62F1\u6327\u6302\u6308\u62EF\u62F5\u6350"
+    u"\u633E\u634D\u641C\u634F\u6396\u638E\u6380\u63AB\u6376\u63A3\u638F\u6389"
+    u"\u639F\u63B5\u636B\u6369\u63BE\u63E9\u63C0\u63C6\u63E3\u63C9\u63D2\u63F6"
+    u"\u63C4\u6416\u6434\u6406\u6413\u6426\u6436\u651D\u6417\u6428\u640F\u6467"
+    u"\u646F\u6476\u644E\u652A\u6495\u6493\u64A5\u64A9\u6488\u64BC"
+    # row 58
+    u"\u64DA\u64D2\u64C5\u64C7\u64BB\u64D8\u64C2\u64F1\u64E7\u8209\u64E0\u64E1"
+    u"\u62AC\u64E3\u64EF\u652C\u64F6\u64F4\u64F2\u64FA\u6500\u64FD\u6518\u651C"
+    u"\u6505\u6524\u6523\u652B\u6534\u6535\u6537\u6536\u6538\u754B\u6548\u6556"
+    u"\u6555\u654D\u6558\u655E\u655D\u6572\u6578\u6582\u6583\u8B8A\u659B\u659F"
+    u"\u65AB\u65B7\u65C3\u65C6\u65C1\u65C4\u65CC\u65D2\u65DB\u65D9\u65E0\u65E1"
+    u"\u65F1\u6772\u660A\u6603\u65FB\u6773\u6635\u6636\u6634\u661C\u664F\u6644"
+    u"\u6649\u6641\u665E\u665D\u6664\u6667\u6668\u665F\u6662\u6670\u6683\u6688"
+    u"\u668E\u6689\u6684\u6698\u669D\u66C1\u66B9\u66C9\u66BE\u66BC"
+    # row 59
+    u"\u66C4\u66B8\u66D6\u66DA\u66E0\u663F\u66E6\u66E9\u66F0\u66F5\u66F7\u670F"
+    u"\u6716\u671E\u6726\u6727\u9738\u672E\u673F\u6736\u6741\u6738\u6737\u6746"
+    u"\u675E\u6760\u6759\u6763\u6764\u6789\u6770\u67A9\u677C\u676A\u678C\u678B"
+    u"\u67A6\u67A1\u6785\u67B7\u67EF\u67B4\u67EC\u67B3\u67E9\u67B8\u67E4\u67DE"
+    u"\u67DD\u67E2\u67EE\u67B9\u67CE\u67C6\u67E7\u6A9C\u681E\u6846\u6829\u6840"
+    u"\u684D\u6832\u684E\u68B3\u682B\u6859\u6863\u6877\u687F\u689F\u688F\u68AD"
+    u"\u6894\u689D\u689B\u6883\u6AAE\u68B9\u6874\u68B5\u68A0\u68BA\u690F\u688D"
+    u"\u687E\u6901\u68CA\u6908\u68D8\u6922\u6926\u68E1\u690C\u68CD"
+    # row 60
+    u"\u68D4\u68E7\u68D5\u6936\u6912\u6904\u68D7\u68E3\u6925\u68F9\u68E0\u68EF"
+    u"\u6928\u692A\u691A\u6923\u6921\u68C6\u6979\u6977\u695C\u6978\u696B\u6954"
+    u"\u697E\u696E\u6939\u6974\u693D\u6959\u6930\u6961\u695E\u695D\u6981\u696A"
+    u"\u69B2\u69AE\u69D0\u69BF\u69C1\u69D3\u69BE\u69CE\u5BE8\u69CA\u69DD\u69BB"
+    u"\u69C3\u69A7\u6A2E\u6991\u69A0\u699C\u6995\u69B4\u69DE\u69E8\u6A02\u6A1B"
+    u"\u69FF\u6B0A\u69F9\u69F2\u69E7\u6A05\u69B1\u6A1E\u69ED\u6A14\u69EB\u6A0A"
+    u"\u6A12\u6AC1\u6A23\u6A13\u6A44\u6A0C\u6A72\u6A36\u6A78\u6A47\u6A62\u6A59"
+    u"\u6A66\u6A48\u6A38\u6A22\u6A90\u6A8D\u6AA0\u6A84\u6AA2\u6AA3"
+    # row 61
+    u"\u6A97\u8617\u6ABB\u6AC3\u6AC2\u6AB8\u6AB3\u6AAC\u6ADE\u6AD1\u6ADF\u6AAA"
+    u"\u6ADA\u6AEA\u6AFB\u6B05\u8616\u6AFA\u6B12\u6B16\u9B31\u6B1F\u6B38\u6B37"
+    u"\u76DC\u6B39\u98EE\u6B47\u6B43\u6B49\u6B50\u6B59\u6B54\u6B5B\u6B5F\u6B61"
+    u"\u6B78\u6B79\u6B7F\u6B80\u6B84\u6B83\u6B8D\u6B98\u6B95\u6B9E\u6BA4\u6BAA"
+    u"\u6BAB\u6BAF\u6BB2\u6BB1\u6BB3\u6BB7\u6BBC\u6BC6\u6BCB\u6BD3\u6BDF\u6BEC"
+    u"\u6BEB\u6BF3\u6BEF\u9EBE\u6C08\u6C13\u6C14\u6C1B\u6C24\u6C23\u6C5E\u6C55"
+    u"\u6C62\u6C6A\u6C82\u6C8D\u6C9A\u6C81\u6C9B\u6C7E\u6C68\u6C73\u6C92\u6C90"
+    u"\u6CC4\u6CF1\u6CD3\u6CBD\u6CD7\u6CC5\u6CDD\u6CAE\u6CB1\u6CBE"
+    # row 62
+    u"\u6CBA\u6CDB\u6CEF\u6CD9\u6CEA\u6D1F\u884D\u6D36\u6D2B\u6D3D\u6D38\u6D19"
+    u"\u6D35\u6D33\u6D12\u6D0C\u6D63\u6D93\u6D64\u6D5A\u6D79\u6D59\u6D8E\u6D95"
+    u"\u6FE4\u6D85\u6DF9\u6E15\u6E0A\u6DB5\u6DC7\u6DE6\u6DB8\u6DC6\u6DEC\u6DDE"
+    u"\u6DCC\u6DE8\u6DD2\u6DC5\u6DFA\u6DD9\u6DE4\u6DD5\u6DEA\u6DEE\u6E2D\u6E6E"
+    u"\u6E2E\u6E19\u6E72\u6E5F\u6E3E\u6E23\u6E6B\u6E2B\u6E76\u6E4D\u6E1F\u6E43"
+    u"\u6E3A\u6E4E\u6E24\u6EFF\u6E1D\u6E38\u6E82\u6EAA\u6E98\u6EC9\u6EB7\u6ED3"
+    u"\u6EBD\u6EAF\u6EC4\u6EB2\u6ED4\u6ED5\u6E8F\u6EA5\u6EC2\u6E9F\u6F41\u6F11"
+    u"\u704C\u6EEC\u6EF8\u6EFE\u6F3F\u6EF2\u6F31\u6EEF\u6F32\u6ECC"
+    # row 63
+    u"\u6F3E\u6F13\u6EF7\u6F86\u6F7A\u6F78\u6F81\u6F80\u6F6F\u6F5B\u6FF3\u6F6D"
+    u"\u6F82\u6F7C\u6F58\u6F8E\u6F91\u6FC2\u6F66\u6FB3\u6FA3\u6FA1\u6FA4\u6FB9"
+    u"\u6FC6\u6FAA\u6FDF\u6FD5\u6FEC\u6FD4\u6FD8\u6FF1\u6FEE\u6FDB\u7009\u700B"
+    u"\u6FFA\u7011\u7001\u700F\u6FFE\u701B\u701A\u6F74\u701D\u7018\u701F\u7030"
+    u"\u703E\u7032\u7051\u7063\u7099\u7092\u70AF\u70F1\u70AC\u70B8\u70B3\u70AE"
+    u"\u70DF\u70CB\u70DD\u70D9\u7109\u70FD\u711C\u7119\u7165\u7155\u7188\u7166"
+    u"\u7162\u714C\u7156\u716C\u718F\u71FB\u7184\u7195\u71A8\u71AC\u71D7\u71B9"
+    u"\u71BE\u71D2\u71C9\u71D4\u71CE\u71E0\u71EC\u71E7\u71F5\u71FC"
+    # row 64
+    u"\u71F9\u71FF\u720D\u7210\u721B\u7228\u722D\u722C\u7230\u7232\u723B\u723C"
+    u"\u723F\u7240\u7246\u724B\u7258\u7274\u727E\u7282\u7281\u7287\u7292\u7296"
+    u"\u72A2\u72A7\u72B9\u72B2\u72C3\u72C6\u72C4\u72CE\u72D2\u72E2\u72E0\u72E1"
+    u"\u72F9\u72F7\u500F\u7317\u730A\u731C\u7316\u731D\u7334\u732F\u7329\u7325"
+    u"\u733E\u734E\u734F\u9ED8\u7357\u736A\u7368\u7370\u7378\u7375\u737B\u737A"
+    u"\u73C8\u73B3\u73CE\u73BB\u73C0\u73E5\u73EE\u73DE\u74A2\u7405\u746F\u7425"
+    u"\u73F8\u7432\u743A\u7455\u743F\u745F\u7459\u7441\u745C\u7469\u7470\u7463"
+    u"\u746A\u7476\u747E\u748B\u749E\u74A7\u74CA\u74CF\u74D4\u73F1"
+    # row 65
+    u"\u74E0\u74E3\u74E7\u74E9\u74EE\u74F2\u74F0\u74F1\u74F8\u74F7\u7504\u7503"
+    u"\u7505\u750C\u750E\u750D\u7515\u7513\u751E\u7526\u752C\u753C\u7544\u754D"
+    u"\u754A\u7549\u755B\u7546\u755A\u7569\u7564\u7567\u756B\u756D\u7578\u7576"
+    u"\u7586\u7587\u7574\u758A\u7589\u7582\u7594\u759A\u759D\u75A5\u75A3\u75C2"
+    u"\u75B3\u75C3\u75B5\u75BD\u75B8\u75BC\u75B1\u75CD\u75CA\u75D2\u75D9\u75E3"
+    u"\u75DE\u75FE\u75FF\u75FC\u7601\u75F0\u75FA\u75F2\u75F3\u760B\u760D\u7609"
+    u"\u761F\u7627\u7620\u7621\u7622\u7624\u7634\u7630\u763B\u7647\u7648\u7646"
+    u"\u765C\u7658\u7661\u7662\u7668\u7669\u766A\u7667\u766C\u7670"
+    # row 66
+    u"\u7672\u7676\u7678\u767C\u7680\u7683\u7688\u768B\u768E\u7696\u7693\u7699"
+    u"\u769A\u76B0\u76B4\u76B8\u76B9\u76BA\u76C2\u76CD\u76D6\u76D2\u76DE\u76E1"
+    u"\u76E5\u76E7\u76EA\u862F\u76FB\u7708\u7707\u7704\u7729\u7724\u771E\u7725"
+    u"\u7726\u771B\u7737\u7738\u7747\u775A\u7768\u776B\u775B\u7765\u777F\u777E"
+    u"\u7779\u778E\u778B\u7791\u77A0\u779E\u77B0\u77B6\u77B9\u77BF\u77BC\u77BD"
+    u"\u77BB\u77C7\u77CD\u77D7\u77DA\u77DC\u77E3\u77EE\u77FC\u780C\u7812\u7926"
+    u"\u7820\u792A\u7845\u788E\u7874\u7886\u787C\u789A\u788C\u78A3\u78B5\u78AA"
+    u"\u78AF\u78D1\u78C6\u78CB\u78D4\u78BE\u78BC\u78C5\u78CA\u78EC"
+    # row 67
+    u"\u78E7\u78DA\u78FD\u78F4\u7907\u7912\u7911\u7919\u792C\u792B\u7940\u7960"
+    u"\u7957\u795F\u795A\u7955\u7953\u797A\u797F\u798A\u799D\u79A7\u9F4B\u79AA"
+    u"\u79AE\u79B3\u79B9\u79BA\u79C9\u79D5\u79E7\u79EC\u79E1\u79E3\u7A08\u7A0D"
+    u"\u7A18\u7A19\u7A20\u7A1F\u7980\u7A31\u7A3B\u7A3E\u7A37\u7A43\u7A57\u7A49"
+    u"\u7A61\u7A62\u7A69\u9F9D\u7A70\u7A79\u7A7D\u7A88\u7A97\u7A95\u7A98\u7A96"
+    u"\u7AA9\u7AC8\u7AB0\u7AB6\u7AC5\u7AC4\u7ABF\u9083\u7AC7\u7ACA\u7ACD\u7ACF"
+    u"\u7AD5\u7AD3\u7AD9\u7ADA\u7ADD\u7AE1\u7AE2\u7AE6\u7AED\u7AF0\u7B02\u7B0F"
+    u"\u7B0A\u7B06\u7B33\u7B18\u7B19\u7B1E\u7B35\u7B28\u7B36\u7B50"
+    # row 68
+    u"\u7B7A\u7B04\u7B4D\u7B0B\u7B4C\u7B45\u7B75\u7B65\u7B74\u7B67\u7B70\u7B71"
+    u"\u7B6C\u7B6E\u7B9D\u7B98\u7B9F\u7B8D\u7B9C\u7B9A\u7B8B\u7B92\u7B8F\u7B5D"
+    u"\u7B99\u7BCB\u7BC1\u7BCC\u7BCF\u7BB4\u7BC6\u7BDD\u7BE9\u7C11\u7C14\u7BE6"
+    u"\u7BE5\u7C60\u7C00\u7C07\u7C13\u7BF3\u7BF7\u7C17\u7C0D\u7BF6\u7C23\u7C27"
+    u"\u7C2A\u7C1F\u7C37\u7C2B\u7C3D\u7C4C\u7C43\u7C54\u7C4F\u7C40\u7C50\u7C58"
+    u"\u7C5F\u7C64\u7C56\u7C65\u7C6C\u7C75\u7C83\u7C90\u7CA4\u7CAD\u7CA2\u7CAB"
+    u"\u7CA1\u7CA8\u7CB3\u7CB2\u7CB1\u7CAE\u7CB9\u7CBD\u7CC0\u7CC5\u7CC2\u7CD8"
+    u"\u7CD2\u7CDC\u7CE2\u9B3B\u7CEF\u7CF2\u7CF4\u7CF6\u7CFA\u7D06"
+    # row 69
+    u"\u7D02\u7D1C\u7D15\u7D0A\u7D45\u7D4B\u7D2E\u7D32\u7D3F\u7D35\u7D46\u7D73"
+    u"\u7D56\u7D4E\u7D72\u7D68\u7D6E\u7D4F\u7D63\u7D93\u7D89\u7D5B\u7D8F\u7D7D"
+    u"\u7D9B\u7DBA\u7DAE\u7DA3\u7DB5\u7DC7\u7DBD\u7DAB\u7E3D\u7DA2\u7DAF\u7DDC"
+    u"\u7DB8\u7D9F\u7DB0\u7DD8\u7DDD\u7DE4\u7DDE\u7DFB\u7DF2\u7DE1\u7E05\u7E0A"
+    u"\u7E23\u7E21\u7E12\u7E31\u7E1F\u7E09\u7E0B\u7E22\u7E46\u7E66\u7E3B\u7E35"
+    u"\u7E39\u7E43\u7E37\u7E32\u7E3A\u7E67\u7E5D\u7E56\u7E5E\u7E59\u7E5A\u7E79"
+    u"\u7E6A\u7E69\u7E7C\u7E7B\u7E83\u7DD5\u7E7D\u8FAE\u7E7F\u7E88\u7E89\u7E8C"
+    u"\u7E92\u7E90\u7E93\u7E94\u7E96\u7E8E\u7E9B\u7E9C\u7F38\u7F3A"
+    # row 70
+    u"\u7F45\u7F4C\u7F4D\u7F4E\u7F50\u7F51\u7F55\u7F54\u7F58\u7F5F\u7F60\u7F68"
+    u"\u7F69\u7F67\u7F78\u7F82\u7F86\u7F83\u7F88\u7F87\u7F8C\u7F94\u7F9E\u7F9D"
+    u"\u7F9A\u7FA3\u7FAF\u7FB2\u7FB9\u7FAE\u7FB6\u7FB8\u8B71\u7FC5\u7FC6\u7FCA"
+    u"\u7FD5\u7FD4\u7FE1\u7FE6\u7FE9\u7FF3\u7FF9\u98DC\u8006\u8004\u800B\u8012"
+    u"\u8018\u8019\u801C\u8021\u8028\u803F\u803B\u804A\u8046\u8052\u8058\u805A"
+    u"\u805F\u8062\u8068\u8073\u8072\u8070\u8076\u8079\u807D\u807F\u8084\u8086"
+    u"\u8085\u809B\u8093\u809A\u80AD\u5190\u80AC\u80DB\u80E5\u80D9\u80DD\u80C4"
+    u"\u80DA\u80D6\u8109\u80EF\u80F1\u811B\u8129\u8123\u812F\u814B"
+    # row 71
+    u"\u968B\u8146\u813E\u8153\u8151\u80FC\u8171\u816E\u8165\u8166\u8174\u8183"
+    u"\u8188\u818A\u8180\u8182\u81A0\u8195\u81A4\u81A3\u815F\u8193\u81A9\u81B0"
+    u"\u81B5\u81BE\u81B8\u81BD\u81C0\u81C2\u81BA\u81C9\u81CD\u81D1\u81D9\u81D8"
+    u"\u81C8\u81DA\u81DF\u81E0\u81E7\u81FA\u81FB\u81FE\u8201\u8202\u8205\u8207"
+    u"\u820A\u820D\u8210\u8216\u8229\u822B\u8238\u8233\u8240\u8259\u8258\u825D"
+    u"\u825A\u825F\u8264\u8262\u8268\u826A\u826B\u822E\u8271\u8277\u8278\u827E"
+    u"\u828D\u8292\u82AB\u829F\u82BB\u82AC\u82E1\u82E3\u82DF\u82D2\u82F4\u82F3"
+    u"\u82FA\u8393\u8303\u82FB\u82F9\u82DE\u8306\u82DC\u8309\u82D9"
+    # row 72
+    u"\u8335\u8334\u8316\u8332\u8331\u8340\u8339\u8350\u8345\u832F\u832B\u8317"
+    u"\u8318\u8385\u839A\u83AA\u839F\u83A2\u8396\u8323\u838E\u8387\u838A\u837C"
+    u"\u83B5\u8373\u8375\u83A0\u8389\u83A8\u83F4\u8413\u83EB\u83CE\u83FD\u8403"
+    u"\u83D8\u840B\u83C1\u83F7\u8407\u83E0\u83F2\u840D\u8422\u8420\u83BD\u8438"
+    u"\u8506\u83FB\u846D\u842A\u843C\u855A\u8484\u8477\u846B\u84AD\u846E\u8482"
+    u"\u8469\u8446\u842C\u846F\u8479\u8435\u84CA\u8462\u84B9\u84BF\u849F\u84D9"
+    u"\u84CD\u84BB\u84DA\u84D0\u84C1\u84C6\u84D6\u84A1\u8521\u84FF\u84F4\u8517"
+    u"\u8518\u852C\u851F\u8515\u8514\u84FC\u8540\u8563\u8558\u8548"
+    # row 73
+    u"\u8541\u8602\u854B\u8555\u8580\u85A4\u8588\u8591\u858A\u85A8\u856D\u8594"
+    u"\u859B\u85EA\u8587\u859C\u8577\u857E\u8590\u85C9\u85BA\u85CF\u85B9\u85D0"
+    u"\u85D5\u85DD\u85E5\u85DC\u85F9\u860A\u8613\u860B\u85FE\u85FA\u8606\u8622"
+    u"\u861A\u8630\u863F\u864D\u4E55\u8654\u865F\u8667\u8671\u8693\u86A3\u86A9"
+    u"\u86AA\u868B\u868C\u86B6\u86AF\u86C4\u86C6\u86B0\u86C9\u8823\u86AB\u86D4"
+    u"\u86DE\u86E9\u86EC\u86DF\u86DB\u86EF\u8712\u8706\u8708\u8700\u8703\u86FB"
+    u"\u8711\u8709\u870D\u86F9\u870A\u8734\u873F\u8737\u873B\u8725\u8729\u871A"
+    u"\u8760\u875F\u8778\u874C\u874E\u8774\u8757\u8768\u876E\u8759"
+    # row 74
+    u"\u8753\u8763\u876A\u8805\u87A2\u879F\u8782\u87AF\u87CB\u87BD\u87C0\u87D0"
+    u"\u96D6\u87AB\u87C4\u87B3\u87C7\u87C6\u87BB\u87EF\u87F2\u87E0\u880F\u880D"
+    u"\u87FE\u87F6\u87F7\u880E\u87D2\u8811\u8816\u8815\u8822\u8821\u8831\u8836"
+    u"\u8839\u8827\u883B\u8844\u8842\u8852\u8859\u885E\u8862\u886B\u8881\u887E"
+    u"\u889E\u8875\u887D\u88B5\u8872\u8882\u8897\u8892\u88AE\u8899\u88A2\u888D"
+    u"\u88A4\u88B0\u88BF\u88B1\u88C3\u88C4\u88D4\u88D8\u88D9\u88DD\u88F9\u8902"
+    u"\u88FC\u88F4\u88E8\u88F2\u8904\u890C\u890A\u8913\u8943\u891E\u8925\u892A"
+    u"\u892B\u8941\u8944\u893B\u8936\u8938\u894C\u891D\u8960\u895E"
+    # row 75
+    u"\u8966\u8964\u896D\u896A\u896F\u8974\u8977\u897E\u8983\u8988\u898A\u8993"
+    u"\u8998\u89A1\u89A9\u89A6\u89AC\u89AF\u89B2\u89BA\u89BD\u89BF\u89C0\u89DA"
+    u"\u89DC\u89DD\u89E7\u89F4\u89F8\u8A03\u8A16\u8A10\u8A0C\u8A1B\u8A1D\u8A25"
+    u"\u8A36\u8A41\u8A5B\u8A52\u8A46\u8A48\u8A7C\u8A6D\u8A6C\u8A62\u8A85\u8A82"
+    u"\u8A84\u8AA8\u8AA1\u8A91\u8AA5\u8AA6\u8A9A\u8AA3\u8AC4\u8ACD\u8AC2\u8ADA"
+    u"\u8AEB\u8AF3\u8AE7\u8AE4\u8AF1\u8B14\u8AE0\u8AE2\u8AF7\u8ADE\u8ADB\u8B0C"
+    u"\u8B07\u8B1A\u8AE1\u8B16\u8B10\u8B17\u8B20\u8B33\u97AB\u8B26\u8B2B\u8B3E"
+    u"\u8B28\u8B41\u8B4C\u8B4F\u8B4E\u8B49\u8B56\u8B5B\u8B5A\u8B6B"
+    # row 76
+    u"\u8B5F\u8B6C\u8B6F\u8B74\u8B7D\u8B80\u8B8C\u8B8E\u8B92\u8B93\u8B96\u8B99"
+    u"\u8B9A\u8C3A\u8C41\u8C3F\u8C48\u8C4C\u8C4E\u8C50\u8C55\u8C62\u8C6C\u8C78"
+    u"\u8C7A\u8C82\u8C89\u8C85\u8C8A\u8C8D\u8C8E\u8C94\u8C7C\u8C98\u621D\u8CAD"
+    u"\u8CAA\u8CBD\u8CB2\u8CB3\u8CAE\u8CB6\u8CC8\u8CC1\u8CE4\u8CE3\u8CDA\u8CFD"
+    u"\u8CFA\u8CFB\u8D04\u8D05\u8D0A\u8D07\u8D0F\u8D0D\u8D10\u9F4E\u8D13\u8CCD"
+    u"\u8D14\u8D16\u8D67\u8D6D\u8D71\u8D73\u8D81\u8D99\u8DC2\u8DBE\u8DBA\u8DCF"
+    u"\u8DDA\u8DD6\u8DCC\u8DDB\u8DCB\u8DEA\u8DEB\u8DDF\u8DE3\u8DFC\u8E08\u8E09"
+    u"\u8DFF\u8E1D\u8E1E\u8E10\u8E1F\u8E42\u8E35\u8E30\u8E34\u8E4A"
+    # row 77
+    u"\u8E47\u8E49\u8E4C\u8E50\u8E48\u8E59\u8E64\u8E60\u8E2A\u8E63\u8E55\u8E76"
+    u"\u8E72\u8E7C\u8E81\u8E87\u8E85\u8E84\u8E8B\u8E8A\u8E93\u8E91\u8E94\u8E99"
+    u"\u8EAA\u8EA1\u8EAC\u8EB0\u8EC6\u8EB1\u8EBE\u8EC5\u8EC8\u8ECB\u8EDB\u8EE3"
+    u"\u8EFC\u8EFB\u8EEB\u8EFE\u8F0A\u8F05\u8F15\u8F12\u8F19\u8F13\u8F1C\u8F1F"
+    u"\u8F1B\u8F0C\u8F26\u8F33\u8F3B\u8F39\u8F45\u8F42\u8F3E\u8F4C\u8F49\u8F46"
+    u"\u8F4E\u8F57\u8F5C\u8F62\u8F63\u8F64\u8F9C\u8F9F\u8FA3\u8FAD\u8FAF\u8FB7"
+    u"\u8FDA\u8FE5\u8FE2\u8FEA\u8FEF\u9087\u8FF4\u9005\u8FF9\u8FFA\u9011\u9015"
+    u"\u9021\u900D\u901E\u9016\u900B\u9027\u9036\u9035\u9039\u8FF8"
+    # row 78
+    u"\u904F\u9050\u9051\u9052\u900E\u9049\u903E\u9056\u9058\u905E\u9068\u906F"
+    u"\u9076\u96A8\u9072\u9082\u907D\u9081\u9080\u908A\u9089\u908F\u90A8\u90AF"
+    u"\u90B1\u90B5\u90E2\u90E4\u6248\u90DB\u9102\u9112\u9119\u9132\u9130\u914A"
+    u"\u9156\u9158\u9163\u9165\u9169\u9173\u9172\u918B\u9189\u9182\u91A2\u91AB"
+    u"\u91AF\u91AA\u91B5\u91B4\u91BA\u91C0\u91C1\u91C9\u91CB\u91D0\u91D6\u91DF"
+    u"\u91E1\u91DB\u91FC\u91F5\u91F6\u921E\u91FF\u9214\u922C\u9215\u9211\u925E"
+    u"\u9257\u9245\u9249\u9264\u9248\u9295\u923F\u924B\u9250\u929C\u9296\u9293"
+    u"\u929B\u925A\u92CF\u92B9\u92B7\u92E9\u930F\u92FA\u9344\u932E"
+    # row 79
+    u"\u9319\u9322\u931A\u9323\u933A\u9335\u933B\u935C\u9360\u937C\u936E\u9356"
+    u"\u93B0\u93AC\u93AD\u9394\u93B9\u93D6\u93D7\u93E8\u93E5\u93D8\u93C3\u93DD"
+    u"\u93D0\u93C8\u93E4\u941A\u9414\u9413\u9403\u9407\u9410\u9436\u942B\u9435"
+    u"\u9421\u943A\u9441\u9452\u9444\u945B\u9460\u9462\u945E\u946A\u9229\u9470"
+    u"\u9475\u9477\u947D\u945A\u947C\u947E\u9481\u947F\u9582\u9587\u958A\u9594"
+    u"\u9596\u9598\u9599\u95A0\u95A8\u95A7\u95AD\u95BC\u95BB\u95B9\u95BE\u95CA"
+    u"\u6FF6\u95C3\u95CD\u95CC\u95D5\u95D4\u95D6\u95DC\u95E1\u95E5\u95E2\u9621"
+    u"\u9628\u962E\u962F\u9642\u964C\u964F\u964B\u9677\u965C\u965E"
+    # row 80
+    u"\u965D\u965F\u9666\u9672\u966C\u968D\u9698\u9695\u9697\u96AA\u96A7\u96B1"
+    u"\u96B2\u96B0\u96B4\u96B6\u96B8\u96B9\u96CE\u96CB\u96C9\u96CD\u894D\u96DC"
+    u"\u970D\u96D5\u96F9\u9704\u9706\u9708\u9713\u970E\u9711\u970F\u9716\u9719"
+    u"\u9724\u972A\u9730\u9739\u973D\u973E\u9744\u9746\u9748\u9742\u9749\u975C"
+    u"\u9760\u9764\u9766\u9768\u52D2\u976B\u9771\u9779\u9785\u977C\u9781\u977A"
+    u"\u9786\u978B\u978F\u9790\u979C\u97A8\u97A6\u97A3\u97B3\u97B4\u97C3\u97C6"
+    u"\u97C8\u97CB\u97DC\u97ED\u9F4F\u97F2\u7ADF\u97F6\u97F5\u980F\u980C\u9838"
+    u"\u9824\u9821\u9837\u983D\u9846\u984F\u984B\u986B\u986F\u9870"
+    # row 81
+    u"\u9871\u9874\u9873\u98AA\u98AF\u98B1\u98B6\u98C4\u98C3\u98C6\u98E9\u98EB"
+    u"\u9903\u9909\u9912\u9914\u9918\u9921\u991D\u991E\u9924\u9920\u992C\u992E"
+    u"\u993D\u993E\u9942\u9949\u9945\u9950\u994B\u9951\u9952\u994C\u9955\u9997"
+    u"\u9998\u99A5\u99AD\u99AE\u99BC\u99DF\u99DB\u99DD\u99D8\u99D1\u99ED\u99EE"
+    u"\u99F1\u99F2\u99FB\u99F8\u9A01\u9A0F\u9A05\u99E2\u9A19\u9A2B\u9A37\u9A45"
+    u"\u9A42\u9A40\u9A43\u9A3E\u9A55\u9A4D\u9A5B\u9A57\u9A5F\u9A62\u9A65\u9A64"
+    u"\u9A69\u9A6B\u9A6A\u9AAD\u9AB0\u9ABC\u9AC0\u9ACF\u9AD1\u9AD3\u9AD4\u9ADE"
+    u"\u9ADF\u9AE2\u9AE3\u9AE6\u9AEF\u9AEB\u9AEE\u9AF4\u9AF1\u9AF7"
+    # row 82
+    u"\u9AFB\u9B06\u9B18\u9B1A\u9B1F\u9B22\u9B23\u9B25\u9B27\u9B28\u9B29\u9B2A"
+    u"\u9B2E\u9B2F\u9B32\u9B44\u9B43\u9B4F\u9B4D\u9B4E\u9B51\u9B58\u9B74\u9B93"
+    u"\u9B83\u9B91\u9B96\u9B97\u9B9F\u9BA0\u9BA8\u9BB4\u9BC0\u9BCA\u9BB9\u9BC6"
+    u"\u9BCF\u9BD1\u9BD2\u9BE3\u9BE2\u9BE4\u9BD4\u9BE1\u9C3A\u9BF2\u9BF1\u9BF0"
+    u"\u9C15\u9C14\u9C09\u9C13\u9C0C\u9C06\u9C08\u9C12\u9C0A\u9C04\u9C2E\u9C1B"
+    u"\u9C25\u9C24\u9C21\u9C30\u9C47\u9C32\u9C46\u9C3E\u9C5A\u9C60\u9C67\u9C76"
+    u"\u9C78\u9CE7\u9CEC\u9CF0\u9D09\u9D08\u9CEB\u9D03\u9D06\u9D2A\u9D26\u9DAF"
+    u"\u9D23\u9D1F\u9D44\u9D15\u9D12\u9D41\u9D3F\u9D3E\u9D46\u9D48"
+    # row 83
+    u"\u9D5D\u9D5E\u9D64\u9D51\u9D50\u9D59\u9D72\u9D89\u9D87\u9DAB\u9D6F\u9D7A"
+    u"\u9D9A\u9DA4\u9DA9\u9DB2\u9DC4\u9DC1\u9DBB\u9DB8\u9DBA\u9DC6\u9DCF\u9DC2"
+    u"\u9DD9\u9DD3\u9DF8\u9DE6\u9DED\u9DEF\u9DFD\u9E1A\u9E1B\u9E1E\u9E75\u9E79"
+    u"\u9E7D\u9E81\u9E88\u9E8B\u9E8C\u9E92\u9E95\u9E91\u9E9D\u9EA5\u9EA9\u9EB8"
+    u"\u9EAA\u9EAD\u9761\u9ECC\u9ECE\u9ECF\u9ED0\u9ED4\u9EDC\u9EDE\u9EDD\u9EE0"
+    u"\u9EE5\u9EE8\u9EEF\u9EF4\u9EF6\u9EF7\u9EF9\u9EFB\u9EFC\u9EFD\u9F07\u9F08"
+    u"\u76B7\u9F15\u9F21\u9F2C\u9F3E\u9F4A\u9F52\u9F54\u9F63\u9F5F\u9F60\u9F61"
+    u"\u9F66\u9F67\u9F6C\u9F6A\u9F77\u9F72\u9F76\u9F95\u9F9C\u9FA0"
+    # row 84
+    u"\u582F\u69C7\u9059\u7464\u51DC\u7199\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    # row 85
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    # row 86
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    # row 87
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    # row 88
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    # row 89
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    # row 90
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    # row 91
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    # row 92
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    # row 93
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    # row 94
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+    u"\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD\uFFFD"
+)
@@ -3,13 +3,18 @@ import os
 import sys
 
 
-def make_encoding(fn, enc_col, utf8_col, out_f=sys.stdout, name=None):
-    if name is None:
-        name = os.path.split(fn)[1].lower()
-        name = os.path.splitext(name)[0]
-
-    print('{} = {{'.format(name), file=out_f)
-
+# Rows and cells of a 94x94 character set (0x21-0x7e each)
+ROWS = 94
+CELLS = 94
+# Placeholder for unassigned code points in generated tables
+UNDEFINED = 0xfffd
+# Characters per line of generated string literals
+CHARS_PER_LINE = 12
+
+
+def read_mapping(fn, enc_col, utf8_col):
+    '''Read a tab-separated mapping file into {code: unicode code point}'''
+    mapping = {}
     with open(fn, 'rt') as f:
         for line in f.readlines():
             line = line.strip()
@@ -17,11 +22,38 @@ def make_encoding(fn, enc_col, utf8_col, out_f=sys.stdout, name=None):
                 continue
 
             cols = line.split('\t')
-            cols[enc_col]
+            mapping[int(cols[enc_col], 16)] = int(cols[utf8_col], 16)
+    return mapping
+
+
+def make_encoding(fn, enc_col, utf8_col, out_f=sys.stdout, name=None):
+    '''Write a 94x94 decode table as a single string literal
+
+    Character (row, cell), both starting at 1, is at index
+    (row - 1) * 94 + (cell - 1) of the string.
+    '''
+    if name is None:
+        name = os.path.split(fn)[1].lower()
+        name = os.path.splitext(name)[0]
 
-            print('    {}: u"\\u{}",'.format(cols[enc_col], cols[utf8_col][2:]),
-                  file=out_f)
-    print('}', file=out_f)
+    mapping = read_mapping(fn, enc_col, utf8_col)
+
+    print('# Generated by make_encodings.py from {}; do not edit.'
+          ''.format(os.path.split(fn)[1]), file=out_f)
+    print('# Character (row, cell) is at index (row - 1) * {} + (cell - 1); '
+          'unassigned'.format(CELLS), file=out_f)
+    print('# code points are U+{:04X}.'.format(UNDEFINED), file=out_f)
+    print('{} = (\n'.format(name), end='', file=out_f)
+
+    for row in range(ROWS):
+        chars = [mapping.get(((row + 0x21) << 8) | (cell + 0x21), UNDEFINED)
+                 for cell in range(CELLS)]
+        print('    # row {}'.format(row + 1), file=out_f)
+        for start in range(0, CELLS, CHARS_PER_LINE):
+            line = ''.join('\\u{:04X}'.format(ch)
+                           for ch in chars[start:start + CHARS_PER_LINE])
+            print('    u"{}"'.format(line), file=out_f)
+    print(')', file=out_f)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,234 @@
+'''Discovery of books under a directory tree
+
+A `Library` walks a tree for book roots (directories with a CATALOG or
+CATALOGS file), opens the books found in a thread pool and keeps a registry
+of them and their subbook titles. The registry can be saved as JSON; a
+rescan then only lists directories whose mtime changed and only reopens
+books whose catalog changed.
+'''
+from __future__ import print_function
+import os
+import io
+import json
+import logging
+import threading
+from collections import OrderedDict
+
+import six
+
+from .book import Book
+from .util import (_scandir, directory_index, file_key)
+
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:
+    ThreadPoolExecutor = None
+
+
+logger = logging.getLogger(__name__)
+
+catalog_filenames = ('catalog', 'catalogs')
+
+
+def _mtime_ns(st):
+    mtime_ns = getattr(st, 'st_mtime_ns', None)
+    if mtime_ns is None:
+        mtime_ns = int(st.st_mtime * 1e9)
+    return mtime_ns
+
+
+class Library(object):
+    '''Books found under a directory tree
+
+    Parameters
+    ----------
+    root : str
+        Top of the directory tree
+    registry : str, optional
+        JSON file to load the registry from and save it to
+    max_workers : int, optional
+        Threads opening books
+    **book_kwargs
+        Passed on to `Book` (e.g., metadata_cache)
+    '''
+    version = 1
+
+    def __init__(self, root, registry=None, max_workers=8, **book_kwargs):
+        self._root = os.path.abspath(root)
+        self._registry = registry
+        self._max_workers = max_workers
+        self._book_kwargs = book_kwargs
+        self._directories = {}
+        self._books = OrderedDict()
+        self._lock = threading.Lock()
+
+        if registry is not None:
+            self.load()
+
+    @property
+    def root(self):
+        return self._root
+
+    @property
+    def books(self):
+        '''Registered books, as {path: info}
+
+        Each info dict has the catalog 'key' (size, mtime) and either the
+        book 'type', 'encoding' and 'subbooks' (titles), or the 'error'
+        raised on opening it.
+        '''
+        return self._books
+
+    def open(self, path):
+        '''Open a registered book'''
+        return Book(path, **self._book_kwargs)
+
+    def load(self):
+        '''Load the registry file, if it is there and for the same tree'''
+        try:
+            with io.open(self._registry, 'rt', encoding='utf-8') as f:
+                registry = json.load(f, object_pairs_hook=OrderedDict)
+        except (IOError, OSError, ValueError):
+            return False
+
+        if (registry.get('version') != self.version or
+                registry.get('root') != self._root):
+            logger.debug('Ignoring registry %s', self._registry)
+            return False
+
+        self._directories = registry['directories']
+        self._books = registry['books']
+        return True
+
+    def save(self):
+        '''Write the registry file'''
+        registry = OrderedDict([('version', self.version),
+                                ('root', self._root),
+                                ('directories', self._directories),
+                                ('books', self._books),
+                                ])
+        data = json.dumps(registry, ensure_ascii=False, indent=1)
+        temp_path = '{}.{}.tmp'.format(self._registry, os.getpid())
+        with io.open(temp_path, 'wt', encoding='utf-8') as f:
+            f.write(six.text_type(data))
+        os.rename(temp_path, self._registry)
+
+    def _list_directory(self, path, mtime_ns):
+        '''Directory entry for the registry: its book catalog or subdirs'''
+        files, subdirs = _scandir(path)
+        for filename in catalog_filenames:
+            if filename in files:
+                return dict(mtime=mtime_ns, catalog=files[filename],
+                            subdirs=[])
+        return dict(mtime=mtime_ns, catalog=None, subdirs=sorted(subdirs))
+
+    def _walk(self):
+        '''Find book roots, listing only directories that changed
+
+        Returns
+        -------
+        roots : dict
+            {book path: catalog filename}
+        '''
+        directories = {}
+        roots = {}
+        visited = set()
+        stack = [self._root]
+        while stack:
+            path = stack.pop()
+            # directory symlinks are not followed by _scandir, but registries
+            # may still list them; never visit a directory twice
+            real_path = os.path.realpath(path)
+            if real_path in visited:
+                continue
+            visited.add(real_path)
+
+            try:
+                mtime_ns = _mtime_ns(os.stat(path))
+            except OSError:
+                continue
+
+            entry = self._directories.get(path)
+            if entry is None or entry['mtime'] != mtime_ns:
+                try:
+                    entry = self._list_directory(path, mtime_ns)
+                except OSError as ex:
+                    logger.warning('Unable to list %s: %s', path, ex)
+                    continue
+
+            directories[path] = entry
+            if entry['catalog'] is not None:
+                # books do not contain other books
+                roots[path] = entry['catalog']
+            else:
+                stack.extend(entry['subdirs'])
+
+        self._directories = directories
+        return roots
+
+    def _open_book(self, path, catalog, key):
+        info = OrderedDict(key=key)
+        try:
+            book = self.open(path)
+            info['type'] = book.type_
+            info['encoding'] = book.encoding
+            info['subbooks'] = book.subbook_titles
+        except Exception as ex:
+            logger.warning('Unable to open book %s', path, exc_info=ex)
+            info['error'] = '{}: {}'.format(type(ex).__name__, ex)
+        return path, info
+
+    def scan(self):
+        '''Scan the tree, opening new and changed books
+
+        The registry is saved afterwards, if there is a registry file.
+
+        Returns
+        -------
+        added, changed, removed : list of str
+            Paths of books
+        '''
+        with self._lock:
+            roots = self._walk()
+
+            to_open = []
+            for path, catalog in sorted(roots.items()):
+                try:
+                    key = list(file_key(os.path.join(path, catalog)))
+                except OSError:
+                    continue
+
+                info = self._books.get(path)
+                if info is None or info['key'] != key:
+                    to_open.append((path, catalog, key))
+
+            removed = [path for path in self._books if path not in roots]
+            for path in removed:
+                del self._books[path]
+
+            # listings cached by earlier opens may be out of date
+            for path in removed + [path for path, _, _ in to_open]:
+                directory_index.invalidate(path)
+
+            added, changed = [], []
+            for path, info in self._map(self._open_book, to_open):
+                (changed if path in self._books else added).append(path)
+                self._books[path] = info
+
+            self._books = OrderedDict(sorted(self._books.items()))
+            logger.debug('Scanned %s: %d books (%d added, %d changed, %d '
+                         'removed)', self._root, len(self._books),
+                         len(added), len(changed), len(removed))
+
+            if self._registry is not None:
+                self.save()
+
+        return added, changed, removed
+
+    def _map(self, fcn, args_list):
+        if ThreadPoolExecutor is None or self._max_workers <= 1:
+            return [fcn(*args) for args in args_list]
+
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            futures = [executor.submit(fcn, *args) for args in args_list]
+            return [future.result() for future in futures]
@@ -0,0 +1,176 @@
+'''On-disk cache of book metadata
+
+Opening a book parses its language and catalog files, and indexing a
+subbook's text parses its index page. A `MetadataCache` keeps the results
+as one JSON file per book, so later opens (e.g., by a freshly started
+worker) read that instead. Entries are validated by the size and mtime of
+the files they were derived from: the language and catalog files for the
+book itself, and each subbook's text file for its search methods.
+'''
+from __future__ import print_function
+import os
+import io
+import json
+import logging
+import hashlib
+import threading
+from collections import OrderedDict
+
+import six
+
+from .util import file_key
+
+logger = logging.getLogger(__name__)
+
+
+class MetadataCache(object):
+    '''Directory of cached book metadata
+
+    Parameters
+    ----------
+    cache_dir : str
+        Directory holding one entry per book (created on first write)
+    '''
+    version = 1
+
+    def __init__(self, cache_dir):
+        self._cache_dir = cache_dir
+        self._lock = threading.Lock()
+
+    @property
+    def cache_dir(self):
+        return self._cache_dir
+
+    def _entry_path(self, book_path):
+        key = os.path.abspath(book_path).encode('utf-8')
+        return os.path.join(self._cache_dir,
+                            hashlib.sha1(key).hexdigest() + '.json')
+
+    def load(self, book_path):
+        '''Load the entry of a book, if its files have not changed
+
+        Returns
+        -------
+        entry : BookMetadata or None
+        '''
+        path = self._entry_path(book_path)
+        try:
+            with io.open(path, 'rt', encoding='utf-8') as f:
+                entry = json.load(f, object_pairs_hook=OrderedDict)
+        except (IOError, OSError, ValueError):
+            return None
+
+        if entry.get('version') != self.version:
+            return None
+
+        for filename, key in entry['files']:
+            try:
+                if list(file_key(os.path.join(book_path, filename))) != key:
+                    break
+            except OSError:
+                break
+        else:
+            logger.debug('Loaded metadata of %s from %s', book_path, path)
+            return BookMetadata(self, book_path, entry)
+
+        logger.debug('Stale metadata for %s in %s', book_path, path)
+        return None
+
+    def create(self, book_path, filenames, **info):
+        '''Start a new entry for a book
+
+        Parameters
+        ----------
+        book_path : str
+            Root directory of the book
+        filenames : list of str
+            Files the metadata is derived from
+        **info
+            Book-level metadata (e.g., encoding, book type, subbooks)
+        '''
+        files = [(os.path.relpath(fn, book_path),
+                  list(file_key(fn)))
+                 for fn in filenames]
+        entry = OrderedDict(version=self.version, files=files)
+        entry.update(info)
+        entry['searches'] = {}
+        metadata = BookMetadata(self, book_path, entry)
+        metadata.dirty = True
+        return metadata
+
+    def save(self, metadata):
+        '''Write an entry, if it has changes which are not written yet
+
+        Changes made at the same time (e.g., by several subbooks being
+        indexed at once) are written by a single save.
+        '''
+        path = self._entry_path(metadata.book_path)
+        temp_path = '{}.{}.tmp'.format(path, os.getpid())
+        # entries are only changed under the lock, so they are not changed
+        # while being serialized
+        with self._lock:
+            if not metadata.dirty:
+                return
+
+            try:
+                if not os.path.isdir(self._cache_dir):
+                    os.makedirs(self._cache_dir)
+
+                data = json.dumps(metadata.entry, ensure_ascii=False)
+                with io.open(temp_path, 'wt', encoding='utf-8') as f:
+                    f.write(six.text_type(data))
+                os.rename(temp_path, path)
+            except (IOError, OSError) as ex:
+                logger.warning('Unable to write metadata of %s to %s: %s',
+                               metadata.book_path, path, ex)
+            else:
+                metadata.dirty = False
+
+
+def _to_key(key):
+    '''Search key from its JSON form (tuple keys are stored as lists)'''
+    if isinstance(key, list):
+        return tuple(key)
+    return key
+
+
+class BookMetadata(object):
+    '''Cached metadata of a single book'''
+
+    def __init__(self, cache, book_path, entry):
+        self._cache = cache
+        self._book_path = book_path
+        self.entry = entry
+        # changed since it was loaded or last saved
+        self.dirty = False
+
+    @property
+    def book_path(self):
+        return self._book_path
+
+    def __getitem__(self, key):
+        return self.entry[key]
+
+    def get_searches(self, subbook, text_filename):
+        '''Search methods of a subbook, as a list of (key, search)
+
+        Returns None if they are not cached or the text file has changed.
+        '''
+        try:
+            key, searches = self.entry['searches'][str(subbook)]
+        except KeyError:
+            return None
+
+        if list(file_key(text_filename)) != key:
+            return None
+
+        return [(_to_key(search_key), search)
+                for search_key, search in searches]
+
+    def set_searches(self, subbook, text_filename, searches):
+        '''Store the search methods of a subbook and save the entry'''
+        value = [list(file_key(text_filename)), list(searches)]
+        with self._cache._lock:
+            self.entry['searches'][str(subbook)] = value
+            self.dirty = True
+        self._cache.save(self)
@@ -9,24 +9,65 @@ import unicodedata
 
 logger = logging.getLogger(__name__)
 
+# Fullwidth/halfwidth character pairs, as generated by `_scan_width_pairs`
+# (python -m eb.string_util generate)
+_WIDE_CHARS = (
+    u"\u2190\u2191\u2192\u2193\u25A0\u25CB\u3001\u3002\u300C\u300D\u30A1\u30A2"
+    u"\u30A3\u30A4\u30A5\u30A6\u30A7\u30A8\u30A9\u30AA\u30AB\u30AD\u30AF\u30B1"
+    u"\u30B3\u30B5\u30B7\u30B9\u30BB\u30BD\u30BF\u30C1\u30C3\u30C4\u30C6\u30C8"
+    u"\u30CA\u30CB\u30CC\u30CD\u30CE\u30CF\u30D2\u30D5\u30D8\u30DB\u30DE\u30DF"
+    u"\u30E0\u30E1\u30E2\u30E3\u30E4\u30E5\u30E6\u30E7\u30E8\u30E9\u30EA\u30EB"
+    u"\u30EC\u30ED\u30EF\u30F2\u30F3\u30FB\u30FC\u3131\u3132\u3133\u3134\u3135"
+    u"\u3136\u3137\u3138\u3139\u313A\u313B\u313C\u313D\u313E\u313F\u3140\u3141"
+    u"\u3142\u3143\u3144\u3145\u3146\u3147\u3148\u3149\u314A\u314B\u314C\u314D"
+    u"\u314E\u314F\u3150\u3151\u3152\u3153\u3154\u3155\u3156\u3157\u3158\u3159"
+    u"\u315A\u315B\u315C\u315D\u315E\u315F\u3160\u3161\u3162\u3163\u3164\uFF01"
+    u"\uFF02\uFF03\uFF04\uFF05\uFF06\uFF07\uFF08\uFF09\uFF0A\uFF0B\uFF0C\uFF0D"
+    u"\uFF0E\uFF0F\uFF10\uFF11\uFF12\uFF13\uFF14\uFF15\uFF16\uFF17\uFF18\uFF19"
+    u"\uFF1A\uFF1B\uFF1C\uFF1D\uFF1E\uFF1F\uFF20\uFF21\uFF22\uFF23\uFF24\uFF25"
+    u"\uFF26\uFF27\uFF28\uFF29\uFF2A\uFF2B\uFF2C\uFF2D\uFF2E\uFF2F\uFF30\uFF31"
+    u"\uFF32\uFF33\uFF34\uFF35\uFF36\uFF37\uFF38\uFF39\uFF3A\uFF3B\uFF3C\uFF3D"
+    u"\uFF3E\uFF3F\uFF40\uFF41\uFF42\uFF43\uFF44\uFF45\uFF46\uFF47\uFF48\uFF49"
+    u"\uFF4A\uFF4B\uFF4C\uFF4D\uFF4E\uFF4F\uFF50\uFF51\uFF52\uFF53\uFF54\uFF55"
+    u"\uFF56\uFF57\uFF58\uFF59\uFF5A\uFF5B\uFF5C\uFF5D\uFF5E\uFF5F\uFF60\uFFE0"
+    u"\uFFE1\uFFE2\uFFE3\uFFE4\uFFE5\uFFE6"
+)
+_NARROW_CHARS = (
+    u"\uFFE9\uFFEA\uFFEB\uFFEC\uFFED\uFFEE\uFF64\uFF61\uFF62\uFF63\uFF67\uFF71"
+    u"\uFF68\uFF72\uFF69\uFF73\uFF6A\uFF74\uFF6B\uFF75\uFF76\uFF77\uFF78\uFF79"
+    u"\uFF7A\uFF7B\uFF7C\uFF7D\uFF7E\uFF7F\uFF80\uFF81\uFF6F\uFF82\uFF83\uFF84"
+    u"\uFF85\uFF86\uFF87\uFF88\uFF89\uFF8A\uFF8B\uFF8C\uFF8D\uFF8E\uFF8F\uFF90"
+    u"\uFF91\uFF92\uFF93\uFF6C\uFF94\uFF6D\uFF95\uFF6E\uFF96\uFF97\uFF98\uFF99"
+    u"\uFF9A\uFF9B\uFF9C\uFF66\uFF9D\uFF65\uFF70\uFFA1\uFFA2\uFFA3\uFFA4\uFFA5"
+    u"\uFFA6\uFFA7\uFFA8\uFFA9\uFFAA\uFFAB\uFFAC\uFFAD\uFFAE\uFFAF\uFFB0\uFFB1"
+    u"\uFFB2\uFFB3\uFFB4\uFFB5\uFFB6\uFFB7\uFFB8\uFFB9\uFFBA\uFFBB\uFFBC\uFFBD"
+    u"\uFFBE\uFFC2\uFFC3\uFFC4\uFFC5\uFFC6\uFFC7\uFFCA\uFFCB\uFFCC\uFFCD\uFFCE"
+    u"\uFFCF\uFFD2\uFFD3\uFFD4\uFFD5\uFFD6\uFFD7\uFFDA\uFFDB\uFFDC\uFFA0\u0021"
+    u"\u0022\u0023\u0024\u0025\u0026\u0027\u0028\u0029\u002A\u002B\u002C\u002D"
+    u"\u002E\u002F\u0030\u0031\u0032\u0033\u0034\u0035\u0036\u0037\u0038\u0039"
+    u"\u003A\u003B\u003C\u003D\u003E\u003F\u0040\u0041\u0042\u0043\u0044\u0045"
+    u"\u0046\u0047\u0048\u0049\u004A\u004B\u004C\u004D\u004E\u004F\u0050\u0051"
+    u"\u0052\u0053\u0054\u0055\u0056\u0057\u0058\u0059\u005A\u005B\u005C\u005D"
+    u"\u005E\u005F\u0060\u0061\u0062\u0063\u0064\u0065\u0066\u0067\u0068\u0069"
+    u"\u006A\u006B\u006C\u006D\u006E\u006F\u0070\u0071\u0072\u0073\u0074\u0075"
+    u"\u0076\u0077\u0078\u0079\u007A\u007B\u007C\u007D\u007E\u2985\u2986\u00A2"
+    u"\u00A3\u00AC\u00AF\u00A6\u00A5\u20A9"
+)
+
 _wide_to_narrow = None
 _narrow_to_wide = None
 
 
-def _init_cache():
-    '''Creates a mapping of wide->narrow and narrow->wide characters'''
-
-    global _wide_to_narrow
-    global _narrow_to_wide
-
-    _wide_to_narrow = {}
-    _narrow_to_wide = {}
-
-    char_names = {six.unichr(i): unicodedata.name(six.unichr(i), None)
-                  for i in range(0, 65536)
-                  }
+def _scan_width_pairs():
+    '''Find (wide, narrow) character pairs in the Unicode database
 
-    for wide_ch, name in char_names.items():
+    A character is the wide form of another if their names differ only by
+    a FULLWIDTH or HALFWIDTH prefix.
+    '''
+    pairs = []
+    for i in range(0, 65536):
+        wide_ch = six.unichr(i)
+        name = unicodedata.name(wide_ch, None)
         if name is None:
             continue
 
@@ -40,8 +81,34 @@ def _init_cache():
         except KeyError:
             pass
         else:
-            _wide_to_narrow[wide_ch] = half_ch
-            _narrow_to_wide[half_ch] = wide_ch
+            pairs.append((wide_ch, half_ch))
+
+    return pairs
+
+
+def _format_width_pairs(pairs, chars_per_line=12):
+    '''Format pairs as the _WIDE_CHARS and _NARROW_CHARS literals'''
+    lines = []
+    for name, chars in (('_WIDE_CHARS', [wide for wide, _ in pairs]),
+                        ('_NARROW_CHARS', [narrow for _, narrow in pairs])):
+        lines.append('{} = ('.format(name))
+        for i in range(0, len(chars), chars_per_line):
+            lines.append('    u"{}"'.format(''.join(
+                '\\u{:04X}'.format(ord(ch))
+                for ch in chars[i:i + chars_per_line])))
+        lines.append(')')
+    return '\n'.join(lines)
+
+
+def _init_cache():
+    '''Creates translation tables of wide->narrow and narrow->wide characters
+    '''
+
+    global _wide_to_narrow
+    global _narrow_to_wide
+
+    _wide_to_narrow = dict(zip(map(ord, _WIDE_CHARS), _NARROW_CHARS))
+    _narrow_to_wide = dict(zip(map(ord, _NARROW_CHARS), _WIDE_CHARS))
 
     logger.debug('Mapped %d characters from wide<->narrow',
                  len(_wide_to_narrow))
@@ -52,7 +119,7 @@ def to_narrow(s):
     if _wide_to_narrow is None:
         _init_cache()
 
-    return u''.join(_wide_to_narrow.get(ch, ch) for ch in s)
+    return s.translate(_wide_to_narrow)
 
 
 def to_wide(s):
@@ -60,10 +127,16 @@ def to_wide(s):
     if _narrow_to_wide is None:
         _init_cache()
 
-    return u''.join(_narrow_to_wide.get(ch, ch) for ch in s)
+    return s.translate(_narrow_to_wide)
 
 
 if __name__ == '__main__':
+    import sys
+
+    if sys.argv[1:] == ['generate']:
+        print(_format_width_pairs(_scan_width_pairs()))
+        sys.exit(0)
+
     logging.basicConfig(level=logging.DEBUG)
 
     tests = [(u'アイウエオカキクケコサシスセソナニヌネノ',
@@ -1,7 +1,7 @@
 from __future__ import print_function
 import logging
 import pprint
-import time
+import threading
 
 import six
 
@@ -26,7 +26,6 @@ class TextContext(object):
         self.skip_code = None
         self.auto_stop_code = None
         self.info = {}
-        self._struct_cache = {}
         self._keyword_count = 0
 
         # TODO: text context main/optional; readtext.c:1800
@@ -134,44 +133,78 @@ class SubbookText(object):
 
                      }
 
-    def __init__(self, subbook, path, filename):
+    def __init__(self, subbook, path, filename, zio_type=None):
         self._subbook = subbook
         self._path = path
         self._filename = filename
         self._index_page = self._subbook._index_page
 
-        self._zio = zio.open_zio_file(self._path, self._filename)
+        self._zio_file = zio.open_zio_file(self._path, self._filename,
+                                           zio_type=zio_type)
+        materialize_dir = self.book.materialize_dir
+        if (materialize_dir is not None and
+                isinstance(self._zio_file, zio.ZioSlicedFile)):
+            self._zio_file = zio.ZioMaterializedFile(self._zio_file,
+                                                     materialize_dir)
+        # all reads go through the shared page cache
+        self._zio = zio.ZioCachedFile(self._zio_file)
         self._sebxa_settings = {}
         self._load_indices()
 
     def _seek_index(self):
         self._seek_page(self._index_page)
 
+    def _page_position(self, page, offset=0):
+        return (page - 1) * self._page_size + offset
+
     def _seek_page(self, page, offset=0):
-        seek_pos = (page - 1) * self._page_size + offset
+        seek_pos = self._page_position(page, offset)
         logger.debug('Seeking page %d offset %d (pos=%d)', page, offset,
                      seek_pos)
         self._zio.seek_start(seek_pos)
 
-    def _seek_search_page(self, search_key, page_offset=0, offset=0):
+    def _search_page_position(self, search_key, page_offset=0, offset=0):
         method = self._subbook._searches[search_key]
 
-        logger.debug('Seeking start page of search %s (offset page=%d byte '
+        logger.debug('Start page of search %s (offset page=%d byte '
                      'offset=%d)', search_key, page_offset, offset)
-        self._seek_page(method['start_page'] + page_offset,
-                        offset=offset)
+        return self._page_position(method['start_page'] + page_offset,
+                                   offset=offset)
 
     def _load_indices(self):
         self._zio.open()
-        self._seek_index()
 
-        indices = structs.SubbookIndices()
+        metadata = self.book.metadata
+        if metadata is not None:
+            searches = metadata.get_searches(self._subbook._idx,
+                                             self._zio.filename)
+            if searches is None:
+                searches = self._read_indices()
+                metadata.set_searches(self._subbook._idx,
+                                      self._zio.filename, searches)
+        else:
+            searches = self._read_indices()
+
+        self._subbook._reset_searches()
+        for search_type, search in searches:
+            self._subbook._set_search(search_type, search, text=self)
+
+    def _read_indices(self):
+        '''Parse the index page
+
+        Returns
+        -------
+        searches : list of (search_type, search)
+            Search methods, in the order they appear on the index page
+        '''
+        searches = []
+        indices = self._zio.read_struct_at(
+            structs.SubbookIndices, self._page_position(self._index_page))
         if indices.index_count >= (int(self._page_size / 16) - 1):
             logger.debug('Unexpected text where index should be')
-            return
+            return searches
 
         self.indices = indices
-        self._zio.readinto(indices)
         logger.debug('index count %x', indices.index_count)
 
         if indices.global_availability > 2:
@@ -182,7 +215,6 @@ class SubbookText(object):
         glob = indices.global_availability
         logger.debug('global availability %x', glob)
 
-        self._subbook._reset_searches()
         methods = indices.search_methods[:indices.index_count]
 
         for i, method in enumerate(methods):
@@ -212,7 +244,7 @@ class SubbookText(object):
                 search['small_vowel'] = (method.flags & 0x000c00) >> 10
                 search['voiced_consonant'] = (method.flags & 0x000300) >> 8
                 search['p_sound'] = (method.flags & 0x0000c0) >> 6
-            elif method.index_id == 0x70 or search.index_id == 0x90:
+            elif method.index_id == 0x70 or method.index_id == 0x90:
                 search['katakana'] = self._index_style_convert
                 search['lower'] = self._index_style_convert
                 search['mark'] = self._index_style_delete
@@ -243,10 +275,79 @@ class SubbookText(object):
             except KeyError:
                 logger.debug('Unknown search type %d', method.index_id)
             else:
-                self._subbook._set_search(search_type, search)
+                searches.append((search_type, search))
 
             logger.debug('Search method %s', search)
 
+        return searches
+
+    def _search_ranges(self, searches=None):
+        '''(position, length) of the pages of each search method
+
+        Parameters
+        ----------
+        searches : iterable, optional
+            Search keys to include (default: all)
+        '''
+        ranges = []
+        for key, methods in six.iteritems(self._subbook._searches):
+            if searches is not None and key not in searches:
+                continue
+
+            if isinstance(methods, dict):
+                methods = [methods]
+
+            for method in methods:
+                start = self._page_position(method['start_page'])
+                end = self._page_position(method['end_page'] + 1)
+                ranges.append((start, end - start))
+
+        return ranges
+
+    def prefetch(self, searches=None, background=True):
+        '''Read ahead the index pages of search methods
+
+        Parameters
+        ----------
+        searches : iterable, optional
+            Search keys to prefetch (default: all)
+        background : bool, optional
+            Prefetch in a daemon thread
+
+        Returns
+        -------
+        thread : threading.Thread or None
+        '''
+        ranges = self._search_ranges(searches)
+
+        def prefetch_ranges():
+            for pos, nbytes in ranges:
+                try:
+                    self._zio.prefetch(pos, nbytes)
+                except Exception as ex:
+                    logger.warning('Prefetch of %s failed', self._filename,
+                                   exc_info=ex)
+                    return
+
+        if not background:
+            prefetch_ranges()
+            return None
+
+        thread = threading.Thread(target=prefetch_ranges,
+                                  name='prefetch-{}'.format(self._filename))
+        thread.daemon = True
+        thread.start()
+        return thread
+
+    def read_async(self, location=None, **kwargs):
+        '''Coroutine reading text without blocking the event loop
+
+        Takes the same arguments as `read`, returning the list of sections
+        it would yield. Requires Python 3; see `eb.aio`.
+        '''
+        from . import aio
+        return aio.read_text(self, location=location, **kwargs)
+
     @property
     def book(self):
         return self._subbook._book
@@ -257,7 +358,7 @@ class SubbookText(object):
 
     @property
     def is_zio_plain(self):
-        return issubclass(self._zio.__class__, zio.ZioPlainFile)
+        return issubclass(self._zio_file.__class__, zio.ZioPlainFile)
 
     def _sebxa_init(self, index_loc=None, index_base=None):
         # zio_start = self._zio.first_page
@@ -278,14 +379,14 @@ class SubbookText(object):
             raise ValueError('Unknown sebxa key: {}'.format(key))
 
         if 'index_base' in settings and 'index_loc' in settings:
-            self._sebxa_reinit(**settings)
+            self._sebxa_init(**settings)
 
     def _read_character(self, context, header):
         if context['encoding'] == 'iso8859-1':
             # The book is mainly written in ISO 8859 1.
             if ((0x20 <= header.code1 < 0x7f) or
                     (0xa0 <= header.code1 <= 0xff)):
-                self._zio.seek_cur(-1)
+                context.seek_cur(-1)
                 if context.skip_code is None:
                     return chr(header.code1)
             else:
@@ -303,12 +404,8 @@ class SubbookText(object):
                 return bytes_.decode('jisx0208')
 
             elif (0x20 < header.code1 < 0x7f) and (0xa0 < header.code2 < 0xff):
-                # TODO maybe necessary to take (code1 | 0x80)
-                # bytes_ = bytes([0x80 | header.code1, header.code2])
-                # bytes_ = bytearray(bytes_)
-                # bytes_[0] |= 0x80
-                return bytes_.decode('gb2312')
-                return '<gb2312?>'
+                # GB 2312, stored as (code1 & 0x7f, code2)
+                return bytes_.decode('jisx0208-gb2312')
 
             elif (0xa0 < header.code1 < 0xff) and (0x20 < header.code2 < 0x7f):
                 # TODO check for latest section name
@@ -323,21 +420,11 @@ class SubbookText(object):
                     return '<local_wide?>'
 
     def _read_section(self, context, section):
-        f = self._zio
+        f = context.zio
 
         last_section = context.last_section
         handler = section.handler
 
-        def get_struct_instance(cls):
-            if cls is None:
-                return None
-
-            try:
-                return context._struct_cache[cls]
-            except KeyError:
-                context._struct_cache[cls] = inst = cls()
-                return inst
-
         if isinstance(section, tsec.SectionStart):
             cur_item = section.as_data_dict([])
             if cur_item['name'] in ('narrow', ) and context.convert_narrow:
@@ -353,7 +440,7 @@ class SubbookText(object):
                 return
 
             info = {'function': handler.start,
-                    'struct': get_struct_instance(handler.start_struct),
+                    'struct': handler.start_struct,
                     'skip_bytes': handler.start_skip,
                     }
 
@@ -374,7 +461,7 @@ class SubbookText(object):
                 return cur_item
 
             info = {'function': handler.end,
-                    'struct': get_struct_instance(handler.end_struct),
+                    'struct': handler.end_struct,
                     'skip_bytes': handler.end_skip,
                     }
 
@@ -389,7 +476,7 @@ class SubbookText(object):
                 return
 
             info = {'function': handler.start,
-                    'struct': get_struct_instance(handler.struct),
+                    'struct': handler.struct,
                     'skip_bytes': handler.skip_bytes,
                     }
 
@@ -397,12 +484,13 @@ class SubbookText(object):
             raise NotImplementedError('skip codes')
 
         # run the handler callback function
-        struct = info['struct']
+        struct_cls = info['struct']
         handler_fcn = info['function']
         struct_info = {}
-        if struct is not None:
+        if struct_cls is not None:
+            # the structure includes the 2-byte code already read
             f.seek_cur(-2)
-            f.readinto(struct)
+            struct = f.read_struct(struct_cls)
 
             struct_info = struct.info
             if 'info' not in cur_item:
@@ -428,8 +516,7 @@ class SubbookText(object):
                 pprint.pprint(cur_item)
 
             if (context._keyword_count % 100) == 0:
-                print('keyword count', context._keyword_count)
-                time.sleep(0.1)
+                logger.debug('keyword count %d', context._keyword_count)
 
         if cur_item['name'] == 'narrow':
             # TODO this should go elsewhere
@@ -451,21 +538,21 @@ class SubbookText(object):
 
     def read(self, location=None, convert_narrow=True, search=None,
              by='section'):
-        # TODO: have book locking mechanism for multithreaded applications
+        # each read has its own cursor, so readers can share the zio file
+        f = zio.ZioCursor(self._zio)
         if location is not None:
-            self.seek(location)
+            f.seek_start(location)
         elif search is not None:
-            self._seek_search_page(search)
+            f.seek_start(self._search_page_position(search))
 
         header = tsec.TextStruct()
 
         book = self._subbook.book
         encoding = book.encoding
-        f = self._zio
 
         context = TextContext(self)
         context['encoding'] = encoding
-        context.zio = self._zio
+        context.zio = f
         context.new_section = []
         context.sections = []
         context.convert_narrow = convert_narrow
@@ -492,7 +579,7 @@ class SubbookText(object):
                         # break
 
                     if user_sec is not None and by == 'section':
-                        print(context.sections)
+                        logger.debug('Sections: %s', context.sections)
                         yield user_sec
 
             elif not context.sections:
@@ -1,10 +1,112 @@
 from __future__ import print_function
 import os
+import logging
+import threading
+from collections import OrderedDict
+
 from .errors import (ZioFileNotFoundError, )
 
+logger = logging.getLogger(__name__)
+
+
+def _scandir(path):
+    '''List a directory, returning ({lowercase name: name}, [subdirectories])
+
+    Symbolic links to directories are listed, but not returned as
+    subdirectories (as with os.walk), so walks cannot loop.
+    '''
+    files = {}
+    subdirs = []
+    if hasattr(os, 'scandir'):
+        for entry in os.scandir(path):
+            files[entry.name.lower()] = entry.name
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+    else:
+        for fn in os.listdir(path):
+            files[fn.lower()] = fn
+            full_path = os.path.join(path, fn)
+            if os.path.isdir(full_path) and not os.path.islink(full_path):
+                subdirs.append(full_path)
+
+    return files, subdirs
+
+
+class DirectoryIndex(object):
+    '''Cache of case-insensitive directory listings
+
+    Each directory is listed at most once until invalidated. `scan` lists a
+    whole book tree up front, so resolving the paths of every subbook costs
+    no further directory reads.
+    '''
+
+    def __init__(self):
+        self._listings = {}
+        self._lock = threading.Lock()
+
+    def listdir_lower(self, path):
+        key = os.path.abspath(path)
+        try:
+            return self._listings[key]
+        except KeyError:
+            pass
+
+        files, subdirs = _scandir(key)
+        with self._lock:
+            self._listings[key] = files
+        return files
+
+    def scan(self, root):
+        '''List root and every directory below it'''
+        pending = [os.path.abspath(root)]
+        while pending:
+            path = pending.pop()
+            if path in self._listings:
+                continue
+
+            try:
+                files, subdirs = _scandir(path)
+            except OSError as ex:
+                # e.g., lost+found on a mounted disc
+                logger.warning('Unable to list %s: %s', path, ex)
+                continue
+            with self._lock:
+                self._listings[path] = files
+            pending.extend(subdirs)
+
+    def invalidate(self, path=None):
+        '''Forget listings of path and everything below it (default: all)'''
+        with self._lock:
+            if path is None:
+                self._listings.clear()
+                return
+
+            path = os.path.abspath(path)
+            prefix = os.path.join(path, '')
+            for key in list(self._listings):
+                if key == path or key.startswith(prefix):
+                    del self._listings[key]
+
+
+directory_index = DirectoryIndex()
+
 
 def listdir_lower(path):
-    return {fn.lower(): fn for fn in os.listdir(path)}
+    return directory_index.listdir_lower(path)
+
+
+def invalidate_directory_cache(path=None):
+    '''Drop cached directory listings, e.g. after files were added'''
+    directory_index.invalidate(path)
+
+
+def file_key(filename):
+    '''(size, mtime in ns) of a file, used to validate cached metadata'''
+    st = os.stat(filename)
+    mtime_ns = getattr(st, 'st_mtime_ns', None)
+    if mtime_ns is None:
+        mtime_ns = int(st.st_mtime * 1e9)
+    return (st.st_size, mtime_ns)
 
 
 def fix_path_case(path, fn):
@@ -20,3 +122,80 @@ def fix_path_case(path, fn):
         return os.path.join(path, files[fn.lower()])
     except KeyError as ex:
         raise ZioFileNotFoundError(os.path.join(path, fn))
+
+
+class LRUCache(object):
+    '''Thread-safe least-recently-used cache
+
+    Parameters
+    ----------
+    max_items : int, optional
+        Maximum number of entries kept
+    max_bytes : int, optional
+        Maximum total len() of the values kept
+    '''
+
+    def __init__(self, max_items=None, max_bytes=None):
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+        self._nbytes = 0
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    @property
+    def nbytes(self):
+        return self._nbytes
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value = self._items.pop(key)
+            except KeyError:
+                self.misses += 1
+                return default
+
+            # re-insert as most recently used
+            self._items[key] = value
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            try:
+                old = self._items.pop(key)
+            except KeyError:
+                pass
+            else:
+                self._nbytes -= len(old)
+
+            self._items[key] = value
+            self._nbytes += len(value)
+            self._evict()
+
+    def resize(self, max_items=None, max_bytes=None):
+        with self._lock:
+            self.max_items = max_items
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self._nbytes = 0
+
+    def _evict(self):
+        items = self._items
+        while items and ((self.max_items is not None and
+                          len(items) > self.max_items) or
+                         (self.max_bytes is not None and
+                          self._nbytes > self.max_bytes)):
+            key, value = items.popitem(last=False)
+            self._nbytes -= len(value)
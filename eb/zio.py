@@ -3,13 +3,22 @@ import struct
 import logging
 import io
 import os
+import mmap
+import zlib
+import hashlib
+import heapq
 import ctypes
+import weakref
+import threading
+import contextlib
+from collections import OrderedDict
 
 import six
 
 from .structs import (EpwingCatalog, EbCatalog, EpwingSubbookResource)
-from .errors import (ZioFileNotFoundError, CharCodeUnsupportedError, )
-from .util import listdir_lower
+from .errors import (ZioError, ZioFileNotFoundError,
+                     CharCodeUnsupportedError, )
+from .util import (listdir_lower, file_key, LRUCache)
 
 # NOTE: io.open gives a buffered interface to the file, which is default in
 #       python 3 but not python 2
@@ -18,28 +27,200 @@ from .util import listdir_lower
 logger = logging.getLogger(__name__)
 
 
+def _copy_into(buf, data):
+    '''Copy data into a writable buffer (ctypes instance or bytearray)'''
+    nbytes = len(data)
+    if isinstance(buf, _ctypes_types):
+        if not isinstance(data, bytes):
+            data = bytes(data)
+        ctypes.memmove(ctypes.addressof(buf), data, nbytes)
+    else:
+        buf[:nbytes] = data
+    return nbytes
+
+
+_ctypes_types = (ctypes.Structure, ctypes.Union, ctypes.Array,
+                 ctypes._SimpleCData)
+
+
+def _buffer_size(buf):
+    if isinstance(buf, _ctypes_types):
+        return ctypes.sizeof(buf)
+    return len(buf)
+
+
+if hasattr(os, 'pread'):
+    def _pread(f, pos, nbytes, lock=None):
+        '''Read from a file object at a position, leaving its cursor alone'''
+        return os.pread(f.fileno(), nbytes, pos)
+else:
+    def _pread(f, pos, nbytes, lock=None):
+        '''Read from a file object at a position, leaving its cursor alone'''
+        with lock:
+            saved = f.tell()
+            try:
+                f.seek(pos, 0)
+                return f.read(nbytes)
+            finally:
+                f.seek(saved, 0)
+
+
+class ZioFilePool(object):
+    '''Bounded set of open ZIO files
+
+    Handlers open and close their underlying files through the pool. When
+    more than `max_open` files are open, the least recently used ones which
+    are not being read from are closed; handlers reopen them transparently
+    on the next read.
+    '''
+
+    def __init__(self, max_open=None):
+        self.max_open = max_open
+        # weak reference to zio file -> number of reads in progress, least
+        # recently used first. Handlers which are garbage collected close
+        # their files themselves, and are dropped on the next pool access.
+        self._files = OrderedDict()
+        self._dead = []
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        with self._lock:
+            self._prune()
+            return len(self._files)
+
+    def set_max_open(self, max_open):
+        with self._lock:
+            self.max_open = max_open
+            self._evict()
+
+    def _key(self, zio_file):
+        key = zio_file._pool_key
+        if key is None:
+            # appending is safe whenever the callback happens to run
+            key = zio_file._pool_key = weakref.ref(zio_file,
+                                                   self._dead.append)
+        return key
+
+    def _prune(self):
+        while self._dead:
+            self._files.pop(self._dead.pop(), None)
+
+    def _use(self, zio_file, readers):
+        key = self._key(zio_file)
+        while True:
+            with self._lock:
+                users = self._files.pop(key, None)
+                if users is not None or zio_file._f is not None:
+                    self._files[key] = (users or 0) + readers
+                    self._evict()
+                    return
+
+            # open without holding the pool lock, so that reads of files
+            # already open are not held up by a slow open
+            with zio_file._open_lock:
+                if zio_file._f is None:
+                    zio_file._open_file()
+
+    def open(self, zio_file):
+        self._use(zio_file, 0)
+
+    @contextlib.contextmanager
+    def checkout(self, zio_file):
+        '''Use the open file object of a handler, reopening it if necessary
+
+        The file is not closed by the pool while checked out.
+        '''
+        self._use(zio_file, 1)
+
+        try:
+            yield zio_file._f
+        finally:
+            key = self._key(zio_file)
+            with self._lock:
+                if key in self._files:
+                    self._files[key] -= 1
+
+    def close(self, zio_file):
+        key = self._key(zio_file)
+        with self._lock:
+            self._files.pop(key, None)
+            zio_file._close_file()
+
+    def _evict(self):
+        self._prune()
+        if self.max_open is None or len(self._files) <= self.max_open:
+            return
+
+        excess = len(self._files) - self.max_open
+        # never the most recently used file, which is about to be read
+        for key in list(self._files)[:-1]:
+            if excess <= 0:
+                break
+
+            zio_file = key()
+            if zio_file is None:
+                del self._files[key]
+                excess -= 1
+            elif self._files[key] == 0:
+                del self._files[key]
+                zio_file._close_file()
+                excess -= 1
+
+
+_default_max_open_files = 256
+
+file_pool = ZioFilePool(max_open=_default_max_open_files)
+
+
+def set_max_open_files(max_open):
+    '''Set the maximum number of files kept open by ZIO handlers'''
+    file_pool.set_max_open(max_open)
+
+
 class ZioFileBase(object):
     _EXTENSIONS_ = []
+    _ZIO_TYPE_ = None
 
     def __init__(self, filename, mode='rb'):
         self._filename = os.path.abspath(filename)
         self._mode = mode
         self._f = None
+        self._is_open = False
+        self._saved_pos = 0
 
         self._name_ext = os.path.split(filename)[-1]
         self._name = os.path.splitext(self._name_ext)[0]
+        self._identity = None
+        self._read_lock = threading.Lock()
+        self._open_lock = threading.Lock()
+        self._pool_key = None
         self.buf = b''
 
     def open(self):
-        if self._f is not None:
+        if self._is_open:
             return
 
+        file_pool.open(self)
+        self._is_open = True
+
+    def close(self):
+        if self._is_open:
+            file_pool.close(self)
+            self._is_open = False
+            self._saved_pos = 0
+
+    def _open_file(self):
+        '''Open the underlying file (called by the file pool)'''
         logger.debug('Opening file {}'.format(self._filename))
         self._f = io.open(self._filename, mode='rb')
+        if self._saved_pos:
+            self._f.seek(self._saved_pos, 0)
 
-    def close(self):
+    def _close_file(self):
+        '''Close the underlying file, keeping its position for a reopen'''
         if self._f is not None:
             logger.debug('Closing file {}'.format(self._f))
+            self._saved_pos = self._f.tell()
             self._f.close()
             self._f = None
 
@@ -47,6 +228,29 @@ class ZioFileBase(object):
     def filename(self):
         return self._filename
 
+    @property
+    def file_size(self):
+        return os.path.getsize(self._filename)
+
+    @property
+    def identity(self):
+        '''Key identifying the decoded contents of this file
+
+        Handlers reading the same file the same way (plain and mmap handlers
+        included) share an identity, regardless of the path used to reach
+        it.
+        '''
+        if self._identity is None:
+            if isinstance(self, ZioPlainFile):
+                zio_type = ZioPlainFile._ZIO_TYPE_
+            else:
+                zio_type = self._ZIO_TYPE_
+
+            st = os.stat(self._filename)
+            self._identity = (zio_type, st.st_dev, st.st_ino, st.st_size,
+                              st.st_mtime)
+        return self._identity
+
     def seek_start(self, pos):
         raise NotImplementedError()
 
@@ -67,81 +271,1281 @@ class ZioFileBase(object):
     def read(self, nbytes=16):
         raise NotImplementedError()
 
-    def read_uchar(self):
+    def read_at(self, pos, nbytes):
+        '''Read nbytes at pos without using or moving the file cursor'''
         raise NotImplementedError()
 
+    def readinto_at(self, pos, buf):
+        '''Fill buf from pos without using or moving the file cursor'''
+        return _copy_into(buf, self.read_at(pos, _buffer_size(buf)))
+
+    def prefetch(self, pos, nbytes):
+        '''Hint that a range will be read soon
+
+        May read the range synchronously; callers wanting it done in the
+        background should call this from another thread.
+        '''
+        pass
+
+    def read_struct_at(self, cls, pos):
+        '''Read a ctypes structure at pos, overlaid on a private buffer'''
+        buf = bytearray(ctypes.sizeof(cls))
+        self.readinto_at(pos, buf)
+        return cls.from_buffer(buf)
+
+    def read_uchar(self):
+        return struct.unpack('>B', self.read(1))
+
     def read_ushort(self):
-        raise NotImplementedError()
+        return struct.unpack('>H', self.read(2))
+
+    def read_uint(self):
+        return struct.unpack('>I', self.read(4))
 
 
 class ZioPlainFile(ZioFileBase):
     _EXTENSIONS_ = ['.org', '']
+    _ZIO_TYPE_ = 'plain'
 
     def seek_start(self, pos):
-        self._f.seek(pos, 0)
+        with file_pool.checkout(self) as f:
+            f.seek(pos, 0)
 
     seek = seek_start
 
     def seek_cur(self, pos):
-        self._f.seek(pos, 1)
+        with file_pool.checkout(self) as f:
+            f.seek(pos, 1)
 
     def seek_end(self, pos):
-        self._f.seek(pos, 2)
+        with file_pool.checkout(self) as f:
+            f.seek(pos, 2)
 
     def tell(self):
-        return self._f.tell()
+        with file_pool.checkout(self) as f:
+            return f.tell()
 
     def readinto(self, struct, advance=True):
-        if self._f is None:
+        if not self._is_open:
             self.open()
 
-        if advance:
-            return self._f.readinto(struct)
-        else:
-            ret = self._f.readinto(struct)
-            self.seek_cur(-ctypes.sizeof(struct))
+        with file_pool.checkout(self) as f:
+            ret = f.readinto(struct)
+            if not advance:
+                f.seek(-ctypes.sizeof(struct), 1)
             return ret
 
     def read(self, nbytes=16):
-        if self._f is None:
+        if not self._is_open:
             self.open()
 
-        return self._f.read(nbytes)
+        with file_pool.checkout(self) as f:
+            return f.read(nbytes)
 
-    def read_uchar(self):
-        return struct.unpack('>B', self.read(1))
-
-    def read_ushort(self):
-        return struct.unpack('>H', self.read(2))
+    def read_at(self, pos, nbytes):
+        if not self._is_open:
+            self.open()
 
-    def read_uint(self):
-        return struct.unpack('>I', self.read(4))
+        with file_pool.checkout(self) as f:
+            return _pread(f, pos, nbytes, lock=self._read_lock)
 
+    def prefetch(self, pos, nbytes):
+        if not self._is_open:
+            self.open()
 
-class ZioEbzipFile(ZioFileBase):
-    _EXTENSIONS_ = ['.ebz']
+        with file_pool.checkout(self) as f:
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(f.fileno(), pos, nbytes,
+                                 os.POSIX_FADV_WILLNEED)
+            else:
+                # no readahead hint available; read it into the OS cache
+                for offset in range(pos, pos + nbytes, 1 << 20):
+                    _pread(f, offset, min(1 << 20, pos + nbytes - offset),
+                           lock=self._read_lock)
+
+
+class ZioMmapFile(ZioPlainFile):
+    '''Plain file served from a read-only memory mapping
+
+    Reads become slices of the mapping, so the OS page cache acts as the
+    cache and no syscall is made per structure read. A mapping keeps a
+    file descriptor open, so mappings are managed by the file pool like
+    open files: evicted ones are unmapped and mapped again on the next
+    read.
+    '''
+    _EXTENSIONS_ = []
+    _ZIO_TYPE_ = 'mmap'
 
     def __init__(self, *args, **kwargs):
-        super(ZioEbzipFile, self).__init__(*args, **kwargs)
+        super(ZioMmapFile, self).__init__(*args, **kwargs)
+
+        self._pos = 0
+        self._file_size = None
+
+    def _open_file(self):
+        '''Map the underlying file (called by the file pool)'''
+        logger.debug('Mapping file {}'.format(self._filename))
+        with io.open(self._filename, mode='rb') as f:
+            self._file_size = os.fstat(f.fileno()).st_size
+            if self._file_size > 0:
+                self._f = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                # zero-length files cannot be mapped
+                self._f = b''
+
+    def _close_file(self):
+        '''Unmap the underlying file'''
+        if self._f is not None:
+            logger.debug('Unmapping file {}'.format(self._filename))
+            if isinstance(self._f, mmap.mmap):
+                self._f.close()
+            self._f = None
+
+    def close(self):
+        super(ZioMmapFile, self).close()
+        self._pos = 0
+
+    def seek_start(self, pos):
+        self._pos = pos
+
+    seek = seek_start
+
+    def seek_cur(self, pos):
+        self._pos += pos
+
+    @property
+    def file_size(self):
+        if self._file_size is None:
+            self.open()
+
+        return self._file_size
+
+    def seek_end(self, pos):
+        self._pos = self.file_size + pos
+
+    def tell(self):
+        return self._pos
+
+    def readinto(self, struct, advance=True):
+        if not self._is_open:
+            self.open()
+
+        pos = self._pos
+        with file_pool.checkout(self) as mapped:
+            data = mapped[pos:pos + ctypes.sizeof(struct)]
+        if advance:
+            self._pos = pos + len(data)
+        return _copy_into(struct, data)
+
+    def read(self, nbytes=16):
+        if not self._is_open:
+            self.open()
+
+        pos = self._pos
+        with file_pool.checkout(self) as mapped:
+            data = mapped[pos:pos + nbytes]
+        self._pos = pos + len(data)
+        return data
+
+    def read_at(self, pos, nbytes):
+        if not self._is_open:
+            self.open()
+
+        with file_pool.checkout(self) as mapped:
+            return mapped[pos:pos + nbytes]
+
+    def read_struct_at(self, cls, pos):
+        if not self._is_open:
+            self.open()
+
+        with file_pool.checkout(self) as mapped:
+            if pos + ctypes.sizeof(cls) <= len(mapped):
+                # the mapping is read-only, so the structure gets its own
+                # copy
+                return cls.from_buffer_copy(mapped, pos)
+
+        # zero-filled past the end, as for the other handlers
+        return super(ZioMmapFile, self).read_struct_at(cls, pos)
+
+    def prefetch(self, pos, nbytes):
+        if not self._is_open:
+            self.open()
+
+        with file_pool.checkout(self) as mapped:
+            if not isinstance(mapped, mmap.mmap):
+                return
+
+            end = min(pos + nbytes, len(mapped))
+            pos -= pos % mmap.PAGESIZE
+            if pos >= end:
+                return
+
+            if hasattr(mapped, 'madvise'):
+                mapped.madvise(mmap.MADV_WILLNEED, pos, end - pos)
+            else:
+                # touch each page to fault it in
+                for offset in range(pos, end, mmap.PAGESIZE):
+                    mapped[offset]
+
+
+class ZioSlicedFile(ZioFileBase):
+    '''Base for files decoded in fixed-size slices
+
+    Subclasses implement `_open_slices` (header and index parsing, setting
+    the decoded file size) and `_read_slice`, which returns the decoded
+    contents of a single slice. Decoded slices are kept in a bounded LRU
+    cache, so repeated reads of the same area are not decoded again.
+    '''
+    _slice_size = 2048
+    slice_cache_size = 32
+
+    def __init__(self, filename, mode='rb', slice_cache_size=None):
+        super(ZioSlicedFile, self).__init__(filename, mode=mode)
 
         self._pos = 0
         self._file_size = 0
 
+        if slice_cache_size is None:
+            slice_cache_size = self.slice_cache_size
+
+        self._slice_cache = LRUCache(max_items=slice_cache_size)
+        # slice cache key -> Event set once the slice has been read
+        self._slice_loads = {}
+        self._slice_lock = threading.Lock()
+
     def open(self):
+        if self._is_open:
+            return
+
+        super(ZioSlicedFile, self).open()
+        try:
+            self._open_slices()
+        except Exception:
+            self.close()
+            raise
+
+    def close(self):
+        super(ZioSlicedFile, self).close()
+        self._slice_cache.clear()
+
+    def _open_slices(self):
+        raise NotImplementedError()
+
+    def _read_slice(self, index):
         raise NotImplementedError()
 
+    def _read_raw(self, pos, nbytes, exact=True):
+        '''Read bytes from the underlying (undecoded) file'''
+        with file_pool.checkout(self) as f:
+            data = _pread(f, pos, nbytes, lock=self._read_lock)
+        if exact and len(data) != nbytes:
+            raise ZioError('Unexpected end of file {} (read {} of {} bytes '
+                           'at {})'.format(self._filename, len(data), nbytes,
+                                           pos))
+        return data
+
+    @property
+    def file_size(self):
+        '''Size of the decoded file'''
+        if not self._is_open:
+            self.open()
+
+        return self._file_size
+
+    @property
+    def slice_size(self):
+        return self._slice_size
+
+    def _get_slice(self, index):
+        return self._get_cached_slice(index, index)
+
+    def _get_cached_slice(self, key, index):
+        '''Slice from the cache, reading it on a miss
+
+        Concurrent misses of the same slice read it only once; misses of
+        other slices do not wait for each other.
+        '''
+        while True:
+            data = self._slice_cache.get(key)
+            if data is not None:
+                return data
+
+            with self._slice_lock:
+                event = self._slice_loads.get(key)
+                if event is None:
+                    event = self._slice_loads[key] = threading.Event()
+                    break
+
+            # another reader is reading it; use its result, or retry if it
+            # failed or the slice was evicted already
+            event.wait()
+
+        try:
+            data = self._read_slice(index)
+            self._slice_cache.put(key, data)
+        finally:
+            with self._slice_lock:
+                del self._slice_loads[key]
+            event.set()
+        return data
+
+    def _read_range(self, pos, nbytes):
+        if not self._is_open:
+            self.open()
+
+        end = min(pos + nbytes, self._file_size)
+        if pos >= end:
+            return b''
+
+        index, offset = divmod(pos, self._slice_size)
+        data = self._get_slice(index)
+        if end - pos <= len(data) - offset:
+            # common case: the range lies within a single slice
+            return data[offset:offset + end - pos]
+
+        chunks = [data[offset:]]
+        pos += len(chunks[0])
+        while pos < end:
+            index += 1
+            data = self._get_slice(index)
+            chunks.append(data[:end - pos])
+            pos += len(chunks[-1])
+
+        return b''.join(chunks)
+
     def seek_start(self, pos):
         self._pos = pos
 
+    seek = seek_start
+
     def seek_cur(self, pos):
         self._pos += pos
 
     def seek_end(self, pos):
-        self._pos = self._file_size - pos
-        raise NotImplementedError('set filesize properly')
+        self._pos = self.file_size + pos
+
+    def tell(self):
+        return self._pos
+
+    def readinto(self, struct, advance=True):
+        data = self._read_range(self._pos, ctypes.sizeof(struct))
+        if advance:
+            self._pos += len(data)
+        return _copy_into(struct, data)
+
+    def read(self, nbytes=16):
+        data = self._read_range(self._pos, nbytes)
+        self._pos += len(data)
+        return data
+
+    def read_at(self, pos, nbytes):
+        return self._read_range(pos, nbytes)
+
+    def prefetch(self, pos, nbytes):
+        '''Decode the slices of a range into the slice cache'''
+        if not self._is_open:
+            self.open()
+
+        end = min(pos + nbytes, self._file_size)
+        for index in range(pos // self._slice_size,
+                           (end - 1) // self._slice_size + 1):
+            self._get_slice(index)
+
+
+def _unpack_uints(data, width):
+    '''Unpack a sequence of big-endian unsigned integers of a given width'''
+    count = len(data) // width
+    if width == 2:
+        return struct.unpack('>{}H'.format(count), data)
+    elif width == 4:
+        return struct.unpack('>{}I'.format(count), data)
+
+    data = bytearray(data)
+    values = []
+    for i in range(0, count * width, width):
+        value = 0
+        for byte in data[i:i + width]:
+            value = (value << 8) | byte
+        values.append(value)
+    return values
+
+
+# Directory for EBZIP slice index sidecars (None to always parse the index)
+ebzip_index_cache_dir = None
+
+
+def set_ebzip_index_cache_dir(path):
+    '''Set the directory in which parsed EBZIP slice indices are kept'''
+    global ebzip_index_cache_dir
+    ebzip_index_cache_dir = path
+
+
+class ZioEbzipFile(ZioSlicedFile):
+    '''EBZIP compressed file (ebzip1)
+
+    The file starts with a 22-byte header, followed by an index of slice
+    locations and the zlib-compressed slices. A slice which is stored with
+    exactly the slice size is not compressed.
+
+    With an index cache directory set, the parsed slice index is stored
+    there as an array of 64-bit offsets, keyed by the size and mtime of the
+    file, and read in one call on later opens instead of being parsed
+    again.
+    '''
+    _EXTENSIONS_ = ['.ebz']
+    _ZIO_TYPE_ = 'ebzip'
+
+    _header_size = 22
+    _max_level = 5
+
+    _sidecar_magic = b'EBZI'
+    _sidecar_version = 1
+    _sidecar_header = struct.Struct('=4sHHqqq')
+    _sidecar_extension = '.ebzidx'
+
+    def __init__(self, filename, mode='rb', slice_cache_size=None,
+                 index_cache_dir=None):
+        super(ZioEbzipFile, self).__init__(filename, mode=mode,
+                                           slice_cache_size=slice_cache_size)
+
+        self._index_cache_dir = index_cache_dir
+
+    def _open_slices(self):
+        header = self._read_raw(0, self._header_size)
+        mode = bytearray(header[5:6])[0]
+
+        if header[:5] != b'EBZip' or (mode >> 4) != 1:
+            raise ZioError('Not an EBZIP file: {}'.format(self._filename))
+
+        self._level = mode & 0x0f
+        if self._level > self._max_level:
+            raise ZioError('Unsupported EBZIP level {}: {}'
+                           ''.format(self._level, self._filename))
+
+        self._slice_size = 2048 << self._level
+        self._file_size, self._crc, self._mtime = struct.unpack(
+            '>III', header[10:22])
+
+        if self._file_size < (1 << 16):
+            self._index_width = 2
+        elif self._file_size < (1 << 24):
+            self._index_width = 3
+        elif self._file_size < (1 << 32):
+            self._index_width = 4
+        else:
+            self._index_width = 5
+
+        self._slice_count = ((self._file_size + self._slice_size - 1) //
+                             self._slice_size)
+        self._slice_offsets = self._read_slice_index()
+        logger.debug('EBZIP level %d, size %d, %d slices', self._level,
+                     self._file_size, self._slice_count)
+
+    def _read_slice_index(self):
+        cache_dir = self._index_cache_dir
+        if cache_dir is None:
+            cache_dir = ebzip_index_cache_dir
+
+        if cache_dir is None:
+            return self._parse_slice_index()
+
+        key = file_key(self._filename)
+        name = hashlib.sha1(
+            os.path.abspath(self._filename).encode('utf-8')).hexdigest()
+        path = os.path.join(cache_dir, name + self._sidecar_extension)
+
+        offsets = self._load_sidecar(path, key)
+        if offsets is None:
+            offsets = self._parse_slice_index()
+            self._save_sidecar(path, key, offsets)
+        return offsets
+
+    def _parse_slice_index(self):
+        width = self._index_width
+        index = self._read_raw(self._header_size,
+                               (self._slice_count + 1) * width)
+        return _unpack_uints(index, width)
+
+    def _load_sidecar(self, path, key):
+        '''Read a slice index sidecar, if it exists and is up to date
+
+        The sidecar is not kept mapped, which would hold a file descriptor
+        outside of the file pool for as long as the file is open.
+        '''
+        header = self._sidecar_header
+        count = self._slice_count + 1
+        try:
+            with io.open(path, 'rb') as f:
+                data = f.read()
+        except (IOError, OSError):
+            return None
+
+        valid = False
+        if len(data) == header.size + 8 * count:
+            magic, version, itemsize, size, mtime_ns, stored_count = \
+                header.unpack_from(data)
+            valid = ((magic, version, itemsize) ==
+                     (self._sidecar_magic, self._sidecar_version, 8) and
+                     (size, mtime_ns) == key and stored_count == count)
+
+        if not valid:
+            logger.debug('Stale EBZIP index sidecar %s', path)
+            return None
+
+        logger.debug('Read EBZIP index sidecar %s', path)
+        if six.PY2:
+            # no memoryview.cast
+            return struct.unpack_from('={}Q'.format(count), data,
+                                      header.size)
+        return memoryview(data)[header.size:].cast('Q')
+
+    def _save_sidecar(self, path, key, offsets):
+        size, mtime_ns = key
+        # array has no 'Q' typecode on python 2
+        data = struct.pack('={}Q'.format(len(offsets)), *offsets)
+        header = self._sidecar_header.pack(
+            self._sidecar_magic, self._sidecar_version, 8, size, mtime_ns,
+            len(offsets))
+
+        temp_path = '{}.{}.tmp'.format(path, os.getpid())
+        try:
+            if not os.path.isdir(os.path.dirname(path)):
+                os.makedirs(os.path.dirname(path))
+
+            with io.open(temp_path, 'wb') as f:
+                f.write(header)
+                f.write(data)
+            os.rename(temp_path, path)
+        except (IOError, OSError) as ex:
+            logger.warning('Unable to write EBZIP index sidecar %s: %s',
+                           path, ex)
+
+    def _read_slice(self, index):
+        start, end = self._slice_offsets[index:index + 2]
+        data = self._read_raw(start, end - start)
+
+        if end - start != self._slice_size:
+            try:
+                data = zlib.decompress(data)
+            except zlib.error as ex:
+                raise ZioError('Failed to inflate slice {} of {}: {}'
+                               ''.format(index, self._filename, ex))
+
+        # the final slice is padded out to the full slice size
+        slice_end = min(self._slice_size,
+                        self._file_size - index * self._slice_size)
+        return data[:slice_end]
+
+
+def _sort_huffman_leaves(frequencies):
+    '''Order leaves as the EB library's selection sort does
+
+    Leaves are sorted by descending frequency. At each step, the first
+    leaf with the highest remaining frequency is swapped into place, which
+    determines the order of leaves with equal frequencies (and, through
+    that, the shape of the tree). A segment tree keeps this O(n log n).
+
+    Returns
+    -------
+    order : list
+        Original leaf indices in sorted order
+    '''
+    count = len(frequencies)
+    freq = list(frequencies)
+    order = list(range(count))
+
+    size = 1
+    while size < count:
+        size <<= 1
+
+    tree = [-1] * (2 * size)
+
+    def better(a, b):
+        if a < 0:
+            return b
+        elif b < 0:
+            return a
+        elif freq[a] > freq[b] or (freq[a] == freq[b] and a < b):
+            return a
+        return b
+
+    def update(pos, alive=True):
+        node = pos + size
+        tree[node] = pos if alive else -1
+        node >>= 1
+        while node:
+            tree[node] = better(tree[2 * node], tree[2 * node + 1])
+            node >>= 1
+
+    for pos in range(count):
+        tree[pos + size] = pos
+    for node in range(size - 1, 0, -1):
+        tree[node] = better(tree[2 * node], tree[2 * node + 1])
+
+    for i in range(count - 1):
+        j = tree[1]
+        if j != i:
+            freq[i], freq[j] = freq[j], freq[i]
+            order[i], order[j] = order[j], order[i]
+            update(j)
+        update(i, alive=False)
+
+    return order
+
+
+class ZioEpwingFile(ZioSlicedFile):
+    '''EPWING V4/V5 compressed text (HONMON2, zio code 0x11)
+
+    Pages are Huffman coded, with the symbol frequencies stored in the file.
+    The Huffman tree is rebuilt once on open and compiled into a lookup
+    table indexed by the next `table_bits` bits of input, so most symbols
+    are decoded with a single table access. Codes longer than that fall
+    back to walking the tree from the node the table leaves off at.
+    '''
+    _EXTENSIONS_ = []
+    _ZIO_TYPE_ = 'epwing'
+
+    _header_size = 32
+    # pages per index group, and the size of a group's index entry
+    _group_pages = 16
+    _group_size = 4 + 2 * 16
+
+    # bit value which selects the left branch of the tree (as in the EB
+    # library's zio_unzip_slice_epwing)
+    _left_bit = 1
+    table_bits = 12
+
+    def _open_slices(self):
+        header = self._read_raw(0, self._header_size)
+        (self._index_location, self._index_length, self._freq_location,
+         self._freq_length) = struct.unpack('>IIII', header[:16])
+
+        if self._index_length < self._group_size:
+            raise ZioError('Invalid EPWING page index: {}'
+                           ''.format(self._filename))
+
+        self._page_index = self._read_raw(self._index_location,
+                                          self._index_length)
+        group_count = self._index_length // self._group_size
+        self._file_size = (group_count * self._group_pages *
+                           self._slice_size)
+
+        leaves = self._read_leaves(header)
+        self._build_decoder(leaves)
+        logger.debug('EPWING compressed file: %d leaves, %d page groups',
+                     len(leaves), group_count)
+
+    def _read_leaves(self, header):
+        '''Read the Huffman leaves
+
+        Returns
+        -------
+        leaves : list of (value, frequency)
+            value is the bytes a leaf decodes to, or None for end-of-page
+        '''
+        leaf16_count = (self._freq_length - 256 * 2) // 4
+        if leaf16_count < 0:
+            raise ZioError('Invalid EPWING frequency table: {}'
+                           ''.format(self._filename))
+
+        freqs = self._read_raw(self._freq_location, self._freq_length)
+        leaves = [(bytes(freqs[i:i + 2]),
+                   struct.unpack_from('>H', freqs, i + 2)[0])
+                  for i in range(0, leaf16_count * 4, 4)]
+        leaves.extend(self._read_leaf8(freqs, leaf16_count * 4))
+        leaves.append((None, 1))
+        return leaves
+
+    @staticmethod
+    def _read_leaf8(freqs, offset):
+        freq8 = struct.unpack_from('>256H', freqs, offset)
+        return [(six.int2byte(value), freq8[value])
+                for value in range(256)]
+
+    def _build_decoder(self, leaves):
+        order = _sort_huffman_leaves([freq for value, freq in leaves])
+        values = [leaves[i][0] for i in order]
+        freq = [leaves[i][1] for i in order]
+        left = [None] * len(values)
+        right = [None] * len(values)
+
+        # pick the smallest frequency; of equal ones, the last node
+        heap = [(f, -node, node) for node, f in enumerate(freq) if f]
+        heapq.heapify(heap)
+
+        root = None
+        while heap:
+            lfreq, _, lnode = heapq.heappop(heap)
+            if not heap:
+                root = lnode
+                break
+
+            rfreq, _, rnode = heapq.heappop(heap)
+            node = len(values)
+            values.append(None)
+            left.append(lnode)
+            right.append(rnode)
+            heapq.heappush(heap, (lfreq + rfreq, -node, node))
+            root = node
+
+        if root is None:
+            raise ZioError('Empty Huffman tree: {}'.format(self._filename))
+
+        self._values = values
+        self._left = left
+        self._right = right
+        self._root = root
+        self._decode_table = self._build_table(root)
+
+    def _build_table(self, root):
+        '''Map each `table_bits`-bit input prefix to (value, nbits, node)
+
+        node is None when the prefix completes a code (value is the output
+        bytes, None for end-of-page); otherwise it is the tree node reached
+        after consuming all `table_bits` bits.
+        '''
+        bits = self.table_bits
+        table = [None] * (1 << bits)
+        left_bit = self._left_bit
+        stack = [(root, 0, 0)]
+        while stack:
+            node, code, length = stack.pop()
+            is_leaf = self._left[node] is None
+            if is_leaf or length == bits:
+                shift = bits - length
+                if is_leaf:
+                    entry = (self._values[node], length, None)
+                else:
+                    entry = (None, bits, node)
+
+                start = code << shift
+                table[start:start + (1 << shift)] = [entry] * (1 << shift)
+            else:
+                stack.append((self._left[node], (code << 1) | left_bit,
+                              length + 1))
+                stack.append((self._right[node],
+                              (code << 1) | (left_bit ^ 1), length + 1))
+
+        return table
+
+    def _page_location(self, page):
+        group, idx = divmod(page, self._group_pages)
+        base, offset = struct.unpack_from(
+            '>I{}x H'.format(2 * idx), self._page_index,
+            group * self._group_size)
+        return base + offset
+
+    def _read_slice(self, index):
+        location = self._page_location(index)
+        data = self._read_raw(location, 2 * self._slice_size, exact=False)
+        return self._decode_page(location, data)
+
+    def _extend_page(self, data, location, limit):
+        '''Read more compressed data for a page which runs past `limit`'''
+        more = self._read_raw(location + limit, self._slice_size, exact=False)
+        if not more:
+            # end of file: the rest of the page decodes from zero bits
+            more = bytearray(self._slice_size)
+
+        data[limit:] = bytearray(more) + bytearray(3)
+        return limit + len(more)
+
+    def _decode_page(self, location, data):
+        '''Huffman decode a page starting at the compressed data
+
+        Bits are read most significant first, and a set bit (`_left_bit`)
+        follows the left branch. Nodes are paired off from the lowest
+        frequency up; the node taken first (of equal frequencies, the one
+        created last) becomes the left child. For leaves A, B and
+        end-of-page with frequencies 3, 2 and 1, end-of-page and B are
+        paired first, and that node then ties with A, so the codes are
+        A=0, B=10 and end-of-page=11. Encoded by hand (and padded out to
+        the 3-byte window), ABA is 0 10 0 11:
+
+        >>> f = ZioEpwingFile('HONMON2')
+        >>> f._build_decoder([(b'A', 3), (b'B', 2), (None, 1)])
+        >>> page = f._decode_page(0, bytearray([0x4c, 0, 0]))
+        >>> page.rstrip(b'\\0') == b'ABA'
+        True
+
+        Codes longer than `table_bits` are finished by walking the tree,
+        with the same result:
+
+        >>> f.table_bits = 1
+        >>> f._build_decoder([(b'A', 3), (b'B', 2), (None, 1)])
+        >>> page = f._decode_page(0, bytearray([0x4c, 0, 0]))
+        >>> page.rstrip(b'\\0') == b'ABA'
+        True
+        '''
+        size = self._slice_size
+        # different pages may be decoded concurrently
+        out = bytearray(size + 4)
+        table = self._decode_table
+        left, right, values = self._left, self._right, self._values
+        left_bit = self._left_bit
+
+        bits = self.table_bits
+        mask = (1 << bits) - 1
+        window_shift = 24 - bits
+
+        data = bytearray(data) + bytearray(3)
+        limit = len(data) - 3
+        pos = 0
+        o = 0
+        while o < size:
+            i = pos >> 3
+            if i + 2 >= limit:
+                # the window must not run into the padding
+                limit = self._extend_page(data, location, limit)
+
+            window = (data[i] << 16) | (data[i + 1] << 8) | data[i + 2]
+            value, nbits, node = table[(window >> (window_shift - (pos & 7))) &
+                                       mask]
+            pos += nbits
+            if node is not None:
+                # code longer than the table: walk the remainder of the tree
+                while left[node] is not None:
+                    i = pos >> 3
+                    if i >= limit:
+                        limit = self._extend_page(data, location, limit)
+
+                    bit = (data[i] >> (7 - (pos & 7))) & 1
+                    node = left[node] if bit == left_bit else right[node]
+                    pos += 1
+                value = values[node]
+
+            if value is None:
+                # end of page; the remainder is zero-filled
+                out[o:size] = bytearray(size - o)
+                break
+
+            out[o:o + len(value)] = value
+            o += len(value)
+
+        return bytes(out[:size])
+
+
+class ZioEpwing6File(ZioEpwingFile):
+    '''EPWING V6 compressed text (zio code 0x12)
+
+    In addition to the EPWING V4/V5 leaves, the frequency table starts
+    with 32-bit leaves, and each page is preceded by a flag byte which is
+    non-zero for pages stored without compression.
+    '''
+    _ZIO_TYPE_ = 'epwing6'
+
+    _header_size = 48
+    slice_cache_size = 64
+
+    def _read_leaves(self, header):
+        leaf32_count = struct.unpack_from('>I', header, 32)[0]
+        leaf16_count = (self._freq_length - leaf32_count * 6 -
+                        256 * 2) // 4
+        if leaf16_count < 0:
+            raise ZioError('Invalid EPWING6 frequency table: {}'
+                           ''.format(self._filename))
+
+        freqs = self._read_raw(self._freq_location, self._freq_length)
+        leaves = [(bytes(freqs[i:i + 4]),
+                   struct.unpack_from('>H', freqs, i + 4)[0])
+                  for i in range(0, leaf32_count * 6, 6)]
+
+        offset = leaf32_count * 6
+        leaves.extend((bytes(freqs[i:i + 2]),
+                       struct.unpack_from('>H', freqs, i + 2)[0])
+                      for i in range(offset, offset + leaf16_count * 4, 4))
+        leaves.extend(self._read_leaf8(freqs, offset + leaf16_count * 4))
+        leaves.append((None, 1))
+        return leaves
+
+    def _read_slice(self, index):
+        location = self._page_location(index)
+        data = self._read_raw(location, 2 * self._slice_size + 1, exact=False)
+        if bytearray(data[:1]) != bytearray(1):
+            # page stored uncompressed
+            page = data[1:1 + self._slice_size]
+            return page + bytes(bytearray(self._slice_size - len(page)))
+
+        return self._decode_page(location + 1, data[1:])
+
+
+_default_page_cache_bytes = 32 * 1024 * 1024
+
+# Process-wide cache of decoded pages, keyed by (file identity, page)
+page_cache = LRUCache(max_bytes=_default_page_cache_bytes)
+
+
+def set_page_cache_size(max_bytes):
+    '''Set the byte budget of the shared page cache'''
+    page_cache.resize(max_bytes=max_bytes)
+
+
+class ZioCachedFile(ZioSlicedFile):
+    '''Page-granular view of another handler through the shared page cache
+
+    Pages are keyed by the identity of the wrapped file, so every reader of
+    the same file - from any number of Book instances - shares warm pages.
+
+    Parameters
+    ----------
+    zio_file : ZioFileBase
+        The handler to read pages from
+    cache : LRUCache, optional
+        Defaults to the process-wide `page_cache`
+    '''
+    _slice_size = 2048
+
+    def __init__(self, zio_file, cache=None):
+        super(ZioCachedFile, self).__init__(zio_file.filename,
+                                            slice_cache_size=0)
+
+        self._zio = zio_file
+        self._name_ext = zio_file._name_ext
+        self._name = zio_file._name
+        self._slice_cache = page_cache if cache is None else cache
+
+    @property
+    def zio_file(self):
+        return self._zio
+
+    @property
+    def identity(self):
+        return self._zio.identity
+
+    def open(self):
+        if self._is_open:
+            return
+
+        self._zio.open()
+        self._file_size = self._zio.file_size
+        self._is_open = True
+
+    def close(self):
+        if self._is_open:
+            self._zio.close()
+            self._is_open = False
+
+    def _get_slice(self, index):
+        return self._get_cached_slice((self._zio.identity, index), index)
+
+    def _read_slice(self, index):
+        return self._zio.read_at(index * self._slice_size, self._slice_size)
+
+    def prefetch(self, pos, nbytes):
+        '''Warm the shared page cache with a range
+
+        Ranges too large for the cache budget are only passed on as a hint
+        to the wrapped handler.
+        '''
+        max_bytes = self._slice_cache.max_bytes
+        if max_bytes is not None and nbytes > max_bytes // 2:
+            self._zio.prefetch(pos, nbytes)
+        else:
+            super(ZioCachedFile, self).prefetch(pos, nbytes)
+
+
+class ZioMaterializedFile(ZioFileBase):
+    '''Compressed file decompressed once into a plain cache file
+
+    On the first open, the wrapped handler is decompressed in the background
+    into `cache_dir`. Reads are served by the wrapped handler until that
+    finishes and by the default plain handler on the decompressed copy
+    from then on. The copy is named after the identity of the compressed
+    file, so a changed file is decompressed again.
+
+    Parameters
+    ----------
+    zio_file : ZioFileBase
+        The (compressed) handler to materialize
+    cache_dir : str
+        Directory for decompressed copies
+    background : bool, optional
+        Decompress in a daemon thread instead of during `open`
+    '''
+    _chunk_size = 1024 * 1024
+
+    def __init__(self, zio_file, cache_dir, background=True):
+        super(ZioMaterializedFile, self).__init__(zio_file.filename)
+
+        self._zio = zio_file
+        self._name_ext = zio_file._name_ext
+        self._name = zio_file._name
+        self._cache_dir = cache_dir
+        self._background = background
+        self._pos = 0
+        self._plain = None
+        self._thread = None
+        self._stop = threading.Event()
+
+    @property
+    def zio_file(self):
+        return self._zio
+
+    @property
+    def identity(self):
+        return self._zio.identity
+
+    @property
+    def materialized(self):
+        '''The decompressed copy is in use'''
+        return self._plain is not None
+
+    @property
+    def cache_filename(self):
+        key = repr(self._zio.identity).encode('utf-8')
+        return os.path.join(self._cache_dir, '{}-{}'.format(
+            self._name, hashlib.sha1(key).hexdigest()))
+
+    def open(self):
+        if self._is_open:
+            return
+
+        self._zio.open()
+        self._is_open = True
+
+        if self._plain is None and not self._use_copy(self.cache_filename):
+            self._stop.clear()
+            if self._background:
+                self._thread = threading.Thread(
+                    target=self._materialize,
+                    name='materialize-{}'.format(self._name_ext))
+                self._thread.daemon = True
+                self._thread.start()
+            else:
+                self._materialize()
+
+    def close(self):
+        if self._is_open:
+            self._stop.set()
+            if self._thread is not None:
+                self._thread.join()
+                self._thread = None
+
+            if self._plain is not None:
+                self._plain.close()
+                self._plain = None
+
+            self._zio.close()
+            self._is_open = False
+
+    def wait(self, timeout=None):
+        '''Wait for background decompression to finish
+
+        Returns
+        -------
+        materialized : bool
+        '''
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        return self.materialized
+
+    def _use_copy(self, path):
+        '''Switch reads over to a decompressed copy, if it is complete'''
+        if not os.path.exists(path):
+            return False
+
+        plain = _ZioDefaultHandler(path)
+        plain.open()
+        if plain.file_size != self._zio.file_size:
+            logger.warning('Ignoring incomplete copy %s', path)
+            plain.close()
+            return False
+
+        logger.debug('Reading %s from decompressed copy %s', self._filename,
+                     path)
+        self._plain = plain
+        return True
+
+    def _materialize(self):
+        path = self.cache_filename
+        temp_path = '{}.{}.tmp'.format(path, os.getpid())
+        file_size = self._zio.file_size
+
+        logger.debug('Decompressing %s to %s', self._filename, path)
+        try:
+            if not os.path.isdir(self._cache_dir):
+                os.makedirs(self._cache_dir)
+
+            with io.open(temp_path, 'wb') as f:
+                for pos in range(0, file_size, self._chunk_size):
+                    if self._stop.is_set():
+                        break
+                    f.write(self._zio.read_at(pos, self._chunk_size))
+
+            if self._stop.is_set():
+                os.remove(temp_path)
+                return
+
+            os.rename(temp_path, path)
+            self._use_copy(path)
+        except Exception as ex:
+            logger.warning('Unable to decompress %s to %s', self._filename,
+                           path, exc_info=ex)
+
+    def _reader(self):
+        if not self._is_open:
+            self.open()
+
+        plain = self._plain
+        return self._zio if plain is None else plain
+
+    @property
+    def file_size(self):
+        return self._zio.file_size
+
+    def seek_start(self, pos):
+        self._pos = pos
+
+    seek = seek_start
+
+    def seek_cur(self, pos):
+        self._pos += pos
+
+    def seek_end(self, pos):
+        self._pos = self.file_size + pos
+
+    def tell(self):
+        return self._pos
+
+    def readinto(self, struct, advance=True):
+        nbytes = self.readinto_at(self._pos, struct)
+        if advance:
+            self._pos += nbytes
+        return nbytes
+
+    def read(self, nbytes=16):
+        data = self.read_at(self._pos, nbytes)
+        self._pos += len(data)
+        return data
+
+    def read_at(self, pos, nbytes):
+        return self._reader().read_at(pos, nbytes)
+
+    def readinto_at(self, pos, buf):
+        return self._reader().readinto_at(pos, buf)
+
+    def read_struct_at(self, cls, pos):
+        return self._reader().read_struct_at(cls, pos)
+
+    def prefetch(self, pos, nbytes):
+        self._reader().prefetch(pos, nbytes)
+
+
+class ZioCursor(object):
+    '''Independent read position over a shared handler
+
+    Each cursor keeps its own position and reads through the handler's
+    positional API, so any number of cursors (e.g., one per thread) can
+    read from the same handler concurrently.
+
+    The page around the position is loaded once into a private bytearray.
+    Reads within it are served from that buffer, and `read_struct`
+    overlays structures on it with `from_buffer` instead of copying.
+    '''
+
+    def __init__(self, zio_file, pos=0, page_size=2048):
+        self._zio = zio_file
+        self._pos = pos
+        self._page_size = page_size
+        self._page = bytearray()
+        self._page_address = None
+        self._page_start = 0
+
+    def _page_offset(self, nbytes):
+        '''Offset of the current position in the loaded page
+
+        Loads the page containing the position as necessary. Returns None
+        if the nbytes at the position do not fit in a single page.
+        '''
+        offset = self._pos - self._page_start
+        if 0 <= offset and offset + nbytes <= len(self._page):
+            return offset
+
+        page_start = self._pos - (self._pos % self._page_size)
+        offset = self._pos - page_start
+        if offset + nbytes > self._page_size:
+            return None
+
+        # a new buffer each time: structures may still overlay the old one
+        page = bytearray(self._zio.read_at(page_start, self._page_size))
+        self._page = page
+        self._page_address = ctypes.addressof(
+            (ctypes.c_char * len(page)).from_buffer(page))
+        self._page_start = page_start
+        if offset + nbytes > len(self._page):
+            return None
+        return offset
+
+    @property
+    def zio_file(self):
+        return self._zio
+
+    def seek_start(self, pos):
+        self._pos = pos
+
+    seek = seek_start
+
+    def seek_cur(self, pos):
+        self._pos += pos
+
+    def seek_end(self, pos):
+        self._pos = self._zio.file_size + pos
+
+    def tell(self):
+        return self._pos
+
+    def readinto(self, struct, advance=True):
+        nbytes = _buffer_size(struct)
+        offset = self._page_offset(nbytes)
+        if offset is None:
+            ret = self._zio.readinto_at(self._pos, struct)
+        elif isinstance(struct, _ctypes_types):
+            ctypes.memmove(ctypes.addressof(struct),
+                           self._page_address + offset, nbytes)
+            ret = nbytes
+        else:
+            ret = _copy_into(struct, self._page[offset:offset + nbytes])
+
+        if advance:
+            self._pos += ret
+        return ret
+
+    def read(self, nbytes=16):
+        offset = self._page_offset(nbytes)
+        if offset is None:
+            data = self._zio.read_at(self._pos, nbytes)
+        else:
+            data = bytes(self._page[offset:offset + nbytes])
+
+        self._pos += len(data)
+        return data
+
+    def read_struct(self, cls, advance=True):
+        '''Structure at the current position, overlaid on the page buffer'''
+        nbytes = ctypes.sizeof(cls)
+        offset = self._page_offset(nbytes)
+        if offset is None:
+            inst = self._zio.read_struct_at(cls, self._pos)
+        else:
+            inst = cls.from_buffer(self._page, offset)
+
+        if advance:
+            self._pos += nbytes
+        return inst
+
+    def read_uchar(self):
+        return struct.unpack('>B', self.read(1))
+
+    def read_ushort(self):
+        return struct.unpack('>H', self.read(2))
+
+    def read_uint(self):
+        return struct.unpack('>I', self.read(4))
 
 
 _ZioHandlers = {}
+_ZioTypeHandlers = {}
 _ZioDefaultHandler = ZioPlainFile
 
 
@@ -149,40 +1553,89 @@ def _register_zio_handler(class_):
     for ext in class_._EXTENSIONS_:
         _ZioHandlers[ext.lower()] = class_
 
+    if class_._ZIO_TYPE_ is not None:
+        _ZioTypeHandlers[class_._ZIO_TYPE_] = class_
+
 
 _register_zio_handler(ZioPlainFile)
+_register_zio_handler(ZioMmapFile)
 _register_zio_handler(ZioEbzipFile)
+_register_zio_handler(ZioEpwingFile)
+_register_zio_handler(ZioEpwing6File)
 
 
-def open_zio_file(path, name, **kwargs):
-    if isinstance(name, six.string_types):
-        fns = [(''.join([name, ext]), handler)
-               for ext, handler in six.iteritems(_ZioHandlers)]
-        print(path, fns)
-    else:
-        names = name
-        for name in names:
-            try:
-                return open_zio_file(path, name, **kwargs)
-            except ZioFileNotFoundError:
-                err = ('File(s) not found ({}*, {})'.format(
-                    os.path.join(path, '|'.join(names)), kwargs))
+def set_default_zio_handler(handler):
+    '''Set the handler used for uncompressed files
 
-                raise ZioFileNotFoundError(err)
+    Parameters
+    ----------
+    handler : str or ZioPlainFile subclass
+        Handler class or its zio type name (e.g., 'plain' or 'mmap')
+    '''
+    global _ZioDefaultHandler
+
+    if isinstance(handler, six.string_types):
+        handler = _ZioTypeHandlers[handler]
+
+    if not issubclass(handler, ZioPlainFile):
+        raise ValueError('Default handler must read plain files')
+
+    _ZioDefaultHandler = handler
 
-    lower_files = listdir_lower(path)
 
-    for fn, handler in fns:
+def _get_zio_handler(handler, zio_type=None):
+    '''Pick the handler for a file found with the given extension handler'''
+    if zio_type is not None and handler is ZioPlainFile:
+        handler = _ZioTypeHandlers[zio_type]
+
+    if handler is ZioPlainFile:
+        return _ZioDefaultHandler
+
+    return handler
+
+
+def _find_zio_file(lower_files, path, name, zio_type=None, **kwargs):
+    '''Handler for the first variant of a file name in a directory listing
+
+    Parameters
+    ----------
+    lower_files : dict
+        Listing of `path`, as {lowercase name: name}
+
+    Returns
+    -------
+    zio_file : ZioFileBase or None
+        None if no variant of the name is listed
+    '''
+    for ext, handler in six.iteritems(_ZioHandlers):
         try:
-            case_fn = lower_files[fn.lower()]
+            case_fn = lower_files[''.join([name, ext]).lower()]
         except KeyError:
             pass
         else:
             full_path = os.path.join(path, case_fn)
+            handler = _get_zio_handler(handler, zio_type)
             return handler(full_path, **kwargs)
 
-    err = ('File not found ({}*, valid names: {})'.format(
-           os.path.join(path, name), [fn[0] for fn in fns]))
+    return None
+
+
+def open_zio_file(path, name, zio_type=None, **kwargs):
+    if isinstance(name, six.string_types):
+        names = [name]
+    else:
+        names = list(name)
+
+    lower_files = listdir_lower(path)
+    for name in names:
+        logger.debug('Looking for %s* in %s', name, path)
+        zio_file = _find_zio_file(lower_files, path, name, zio_type=zio_type,
+                                  **kwargs)
+        if zio_file is not None:
+            return zio_file
+
+    err = ('File(s) not found ({}*, valid extensions: {})'.format(
+           os.path.join(path, '|'.join(names)), list(_ZioHandlers)))
 
     raise ZioFileNotFoundError(err)
 
@@ -196,7 +1649,7 @@ class ZioBase(object):
             self._f = f
             logger.info('Specified ZioFile: {}'.format(self._f))
             logger.debug('Resetting position')
-            self.seek(0)
+            self._f.seek(0)
         else:
             self._f = open_zio_file(path, name, **kwargs)
             logger.info('Found ZioFile: {}'.format(self._f.filename))
@@ -234,8 +1687,8 @@ class ZioLanguage(ZioBase):
 class ZioCatalog(ZioBase):
     disk_filenames = None
 
-    def __init__(self, book, path, name):
-        super(ZioCatalog, self).__init__(book, path, name)
+    def __init__(self, book, path, name, f=None):
+        super(ZioCatalog, self).__init__(book, path, name, f=f)
 
         self._subbooks = []
 
@@ -245,19 +1698,34 @@ class ZioCatalog(ZioBase):
         cat_cls = self._catalog_cls
         header_cls = cat_cls.header_class
 
-        self._header = header_cls()
-        self._f.readinto(self._header)
+        # read the whole catalog at once; entries are overlaid on the buffer
+        self._data = data = bytearray(self._f.read_at(0, self._f.file_size))
+
+        header_size = ctypes.sizeof(header_cls)
+        if len(data) < header_size:
+            raise ZioError('Catalog {} truncated (header of {} bytes)'
+                           ''.format(self._f.filename, len(data)))
+
+        self._header = header_cls.from_buffer(data)
 
         self._subbook_count = self._header.subbook_count
         logger.debug('Subbook count {}'.format(self._subbook_count))
 
+        entry_size = ctypes.sizeof(cat_cls)
+        self._entries_end = header_size + self._subbook_count * entry_size
+        if len(data) < self._entries_end:
+            raise ZioError('Catalog {} truncated ({} subbooks in {} bytes)'
+                           ''.format(self._f.filename, self._subbook_count,
+                                     len(data)))
+
         encoding = self._book.encoding
-        catalog_entry = cat_cls()
 
         self._subbooks = []
-        for subbook in range(1, self._subbook_count + 1):
+        for subbook, offset in enumerate(range(header_size,
+                                               self._entries_end,
+                                               entry_size), 1):
             logger.debug('Subbook #%d', subbook)
-            self._f.readinto(catalog_entry)
+            catalog_entry = cat_cls.from_buffer(data, offset)
 
             catalog_entry.set_default_encoding(encoding)
             cat_info = catalog_entry.info_dict
@@ -291,17 +1759,24 @@ class ZioEpwingCatalog(ZioCatalog):
         self._epwing_version = self._header.epwing_version
         logger.debug('EPWing version {}'.format(self._epwing_version))
 
-        sbs = EpwingSubbookResource()
-        sbs.set_default_encoding(self._book.encoding)
-
-        for i, subbook in enumerate(self._subbooks):
-            self._f.readinto(sbs)
+        data = self._data
+        resource_size = ctypes.sizeof(EpwingSubbookResource)
+        offsets = range(self._entries_end, len(data) - resource_size + 1,
+                        resource_size)
+        if len(offsets) < len(self._subbooks):
+            logger.debug('Resource records for %d of %d subbooks',
+                         len(offsets), len(self._subbooks))
+
+        for i, (subbook, offset) in enumerate(zip(self._subbooks, offsets)):
+            sbs = EpwingSubbookResource.from_buffer(data, offset)
+            sbs.set_default_encoding(self._book.encoding)
             logger.debug('Sub-book %d filename: %s', i + 1,
                          sbs.text_filename)
 
             if sbs.is_valid:
                 resources = sbs.resources
                 subbook['text_filename'] = sbs.text_filename
+                subbook['text_zio_type'] = sbs.zio_types[2]
                 if resources:
                     logger.debug('Found resources: %s', resources)
 
@@ -317,18 +1792,18 @@ def _class_by_filename(types, attr='disk_filenames'):
     def instantiate(book, path, **kwargs):
         all_filenames = []
 
+        # one listing decides the class; its file is opened only once
+        lower_files = listdir_lower(path)
         for class_ in types:
             filenames = getattr(class_, attr)
             all_filenames.extend(filenames)
             for filename in filenames:
-                try:
-                    open_zio_file(path, filename)
-                except ZioFileNotFoundError:
-                    pass
-                else:
+                zio_file = _find_zio_file(lower_files, path, filename)
+                if zio_file is not None:
                     logger.info('Filename %s -> %s',
                                 filename, class_)
-                    return class_(book, path, filename, **kwargs)
+                    return class_(book, path, filename, f=zio_file,
+                                  **kwargs)
 
         err = ('File(s) not found ({}*, {})'.format(
             os.path.join(path, '|'.join(all_filenames)), kwargs))